@@ -56,4 +56,21 @@ class ModelPricing:
             "llama-3.1-8b": ModelPrice(0.0001, 0.0005, date(2024, 1, 1)),
             "llama-3.1-70b": ModelPrice(0.0003, 0.0015, date(2024, 1, 1)),
         },
-    }
\ No newline at end of file
+    }
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Provider prompt caching — rates as a multiple of the model's input rate.
+# Anthropic: cache writes 1.25x, cache reads 0.1x.
+# OpenAI: cached prefix tokens billed at 0.5x, no write surcharge.
+# DeepSeek: cache-hit tokens billed at ~0.1x, no write surcharge.
+# ─────────────────────────────────────────────────────────────────────────────
+
+CACHE_READ_MULTIPLIER: Dict[str, float] = {
+    "anthropic": 0.1,
+    "openai": 0.5,
+    "deepseek": 0.1,
+}
+
+CACHE_WRITE_MULTIPLIER: Dict[str, float] = {
+    "anthropic": 1.25,
+}
@@ -0,0 +1,28 @@
+"""011 — Flag LLM response-cache hits in llm_call_logs.
+
+Revision ID: 011_llm_cache_hit
+Revises: 010_content_type
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "011_llm_cache_hit"
+down_revision: Union[str, Sequence[str], None] = "010_content_type"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_call_logs",
+        sa.Column("cache_hit", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+    )
+    op.create_index("idx_llm_calls_cache_hit", "llm_call_logs", ["run_id"],
+                    postgresql_where=sa.text("cache_hit"))
+
+
+def downgrade() -> None:
+    op.drop_index("idx_llm_calls_cache_hit", "llm_call_logs")
+    op.drop_column("llm_call_logs", "cache_hit")
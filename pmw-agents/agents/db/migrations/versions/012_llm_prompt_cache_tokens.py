@@ -0,0 +1,30 @@
+"""012 — Track provider prompt-cache tokens in llm_call_logs.
+
+Revision ID: 012_llm_prompt_cache_tokens
+Revises: 011_llm_cache_hit
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "012_llm_prompt_cache_tokens"
+down_revision: Union[str, Sequence[str], None] = "011_llm_cache_hit"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_call_logs",
+        sa.Column("cache_read_tokens", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "llm_call_logs",
+        sa.Column("cache_write_tokens", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("llm_call_logs", "cache_write_tokens")
+    op.drop_column("llm_call_logs", "cache_read_tokens")
@@ -0,0 +1,31 @@
+"""013 — Local daily precious-metals price history.
+
+Revision ID: 013_metal_price_history
+Revises: 012_llm_prompt_cache_tokens
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "013_metal_price_history"
+down_revision: Union[str, Sequence[str], None] = "012_llm_prompt_cache_tokens"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metal_price_history",
+        sa.Column("metal", sa.String(20), nullable=False),
+        sa.Column("currency", sa.CHAR(3), nullable=False),
+        sa.Column("price_date", sa.Date(), nullable=False),
+        sa.Column("price", sa.Numeric(14, 4), nullable=False),
+        sa.Column("source", sa.String(50), nullable=True),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.PrimaryKeyConstraint("metal", "currency", "price_date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("metal_price_history")
@@ -0,0 +1,34 @@
+"""014 — WordPress sync high-water marks.
+
+One row per synced WordPress resource (e.g. 'pmw_topic'): the
+(modified_gmt, post id) of the newest post already upserted, and when
+deletions were last reconciled.
+
+Revision ID: 014_wp_sync_state
+Revises: 013_metal_price_history
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "014_wp_sync_state"
+down_revision: Union[str, Sequence[str], None] = "013_metal_price_history"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "wp_sync_state",
+        sa.Column("resource", sa.String(50), nullable=False),
+        sa.Column("modified_gmt", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_id", sa.Integer(), nullable=True),
+        sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.PrimaryKeyConstraint("resource"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("wp_sync_state")
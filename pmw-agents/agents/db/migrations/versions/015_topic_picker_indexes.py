@@ -0,0 +1,32 @@
+"""015 — Indexes behind the SQL-side topic picker.
+
+TopicService.pick_batch() walks active topics in (priority, run_count, id)
+order and probes the lock and exhaustion conditions per candidate, so it
+stops after N eligible rows however large topics grows.
+
+Revision ID: 015_topic_picker_indexes
+Revises: 014_wp_sync_state
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "015_topic_picker_indexes"
+down_revision: Union[str, Sequence[str], None] = "014_wp_sync_state"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_topics_pick_order", "topics", ["priority", "run_count", "id"],
+                    postgresql_where=sa.text("status = 'active'"))
+    op.create_index("idx_workflow_runs_topic_lock", "workflow_runs", ["topic_id", "lock_expires_at"],
+                    postgresql_where=sa.text("status = 'running'"))
+    op.create_index("idx_topic_briefs_topic_status", "topic_briefs", ["topic_wp_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_topic_briefs_topic_status", "topic_briefs")
+    op.drop_index("idx_workflow_runs_topic_lock", "workflow_runs")
+    op.drop_index("idx_topics_pick_order", "topics")
@@ -0,0 +1,59 @@
+"""016 — Incremental affiliate intelligence counters.
+
+affiliate_intelligence_counters keeps one running count per affiliate per
+objection / motivation / verbatim phrase / PAA question, so Stage 9 adds
+only the new run's delta instead of re-reading the whole ledger.
+affiliate_intelligence_summary.incremental marks summaries whose counters
+have been (re)built from the ledger; others are rebuilt once on their
+next run.
+
+Revision ID: 016_affiliate_intel_counters
+Revises: 015_topic_picker_indexes
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "016_affiliate_intel_counters"
+down_revision: Union[str, Sequence[str], None] = "015_topic_picker_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "affiliate_intelligence_counters",
+        sa.Column("affiliate_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("item_key", sa.Text(), nullable=False),
+        sa.Column("label", sa.Text(), nullable=False),
+        sa.Column("run_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("first_seen", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("sources", postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("compliance_review_required", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.PrimaryKeyConstraint("affiliate_id", "kind", "item_key"),
+        sa.ForeignKeyConstraint(["affiliate_id"], ["affiliates.id"]),
+    )
+    op.execute(
+        "CREATE INDEX idx_affiliate_counters_top ON affiliate_intelligence_counters "
+        "(affiliate_id, kind, run_count DESC, first_seen, item_key)"
+    )
+    op.create_index(
+        "idx_affiliate_runs_pending_review", "affiliate_intelligence_runs", ["affiliate_id"],
+        postgresql_where=sa.text("compliance_review_required AND compliance_reviewed_at IS NULL"),
+    )
+    op.create_index("idx_affiliate_runs_latest", "affiliate_intelligence_runs", ["affiliate_id", "ran_at"])
+    op.add_column(
+        "affiliate_intelligence_summary",
+        sa.Column("incremental", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("affiliate_intelligence_summary", "incremental")
+    op.drop_index("idx_affiliate_runs_latest", "affiliate_intelligence_runs")
+    op.drop_index("idx_affiliate_runs_pending_review", "affiliate_intelligence_runs")
+    op.execute("DROP INDEX IF EXISTS idx_affiliate_counters_top")
+    op.drop_table("affiliate_intelligence_counters")
@@ -0,0 +1,125 @@
+"""
+Backfill metal_price_history — the Python counterpart of scripts/load*History.ts.
+
+Incremental: for each metal/currency it loads the days after the latest
+stored price plus every hole longer than a long weekend since --since
+(PriceSeries.gaps), so it is safe to re-run daily — and still loads the
+history when the worker has already stored a few recent spot prices.
+
+Sources:
+  - USD: bulk JSON endpoints returning [{date, price}] (or {"data": [...]})
+      gold      FREEGOLDAPI_URL (default https://freegoldapi.com/data/latest.json)
+      silver    SILVER_API_URL
+      platinum  PLATINUM_API_URL
+      palladium PALLADIUM_API_URL
+  - Other currencies, or a metal with no bulk URL: MetalPriceAPI /timeframe
+    (needs METAL_PRICE_API_KEY)
+
+Run: python -m db.seeds.backfill_price_history [--metal gold] [--currency GBP] [--since 1990-01-01]
+"""
+import argparse
+import asyncio
+import logging
+import os
+from datetime import date, timedelta
+
+from infrastructure import get_infrastructure
+
+log = logging.getLogger("pmw.seeds.price_history")
+
+METALS = ("gold", "silver", "platinum", "palladium")
+CURRENCIES = ("USD", "GBP")
+DEFAULT_SINCE = date(1990, 1, 1)
+
+BULK_URLS = {
+    "gold":      os.environ.get("FREEGOLDAPI_URL", "https://freegoldapi.com/data/latest.json"),
+    "silver":    os.environ.get("SILVER_API_URL", ""),
+    "platinum":  os.environ.get("PLATINUM_API_URL", ""),
+    "palladium": os.environ.get("PALLADIUM_API_URL", ""),
+}
+
+
+async def _fetch_bulk(http, url: str, since: date) -> list[tuple[date, float]]:
+    """[{date, price}] records on or after `since` from a bulk JSON endpoint."""
+    data = (await http.get(url)).json()
+    records = data if isinstance(data, list) else (data or {}).get("data")
+    if not isinstance(records, list):
+        raise ValueError(f"{url} did not return an array of {{date, price}}")
+
+    points = []
+    for r in records:
+        try:
+            day = date.fromisoformat(str(r["date"])[:10])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if day >= since and isinstance(r.get("price"), (int, float)):
+            points.append((day, float(r["price"])))
+    return points
+
+
+async def backfill(metal: str, currency: str, since: date) -> int:
+    infra = get_infrastructure()
+    store = infra.price_history
+
+    end = date.today()
+    ranges = _ranges_to_load(await store.series(metal, currency), since, end)
+    if not ranges:
+        print(f"[{metal}/{currency}] up to date ({await store.latest_date(metal, currency)})")
+        return 0
+
+    bulk_url = BULK_URLS.get(metal) if currency == "USD" else ""
+    if bulk_url:
+        source = "freegoldapi" if metal == "gold" else f"{metal}_api"
+        points = [
+            p for p in await _fetch_bulk(infra.http, bulk_url, ranges[0][0])
+            if any(a <= p[0] <= b for a, b in ranges)
+        ]
+    else:
+        source = "metalpriceapi"
+        points = []
+        for a, b in ranges:
+            points.extend(await infra.price.fetch_timeframe(metal, currency, a, b))
+
+    written = await store.upsert(metal, currency, points, source=source)
+    print(f"[{metal}/{currency}] {len(ranges)} range(s) {ranges[0][0]} → {ranges[-1][1]}: "
+          f"{written} days written from {source}")
+    return written
+
+
+def _ranges_to_load(series, since: date, end: date) -> list[tuple[date, date]]:
+    """Holes in the stored series since `since`, plus every day after its newest price."""
+    ranges = series.gaps(since, end)
+    last = series.last_date()
+    if last is not None and last < end and not (ranges and ranges[-1][1] == end):
+        ranges.append((last + timedelta(days=1), end))
+    return ranges
+
+
+async def main(metals: list[str], currencies: list[str], since: date) -> None:
+    infra = get_infrastructure()
+    await infra.connect()
+    try:
+        total = 0
+        for metal in metals:
+            for currency in currencies:
+                try:
+                    total += await backfill(metal, currency, since)
+                except Exception as exc:
+                    print(f"[{metal}/{currency}] failed: {exc}")
+        print(f"\nDone. {total} days written.")
+    finally:
+        await infra.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--metal", choices=METALS, help="default: all metals")
+    parser.add_argument("--currency", help="default: USD and GBP")
+    parser.add_argument("--since", type=date.fromisoformat, default=DEFAULT_SINCE)
+    args = parser.parse_args()
+
+    asyncio.run(main(
+        metals     = [args.metal] if args.metal else list(METALS),
+        currencies = [args.currency.upper()] if args.currency else list(CURRENCIES),
+        since      = args.since,
+    ))
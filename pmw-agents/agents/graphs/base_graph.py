@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import os
 import logging
 from abc import ABC, abstractmethod
 from typing import Type
@@ -66,30 +64,13 @@ class BaseGraph(ABC):
     @classmethod
     async def create(cls) -> "BaseGraph":
         """
-        Build, compile, and return a ready-to-run graph using a new connection pool.
-        For production, prefer create_with_checkpointer when the caller provides
-        a checkpointer (e.g. from AsyncPostgresSaver.from_conn_string context).
+        Build, compile, and return a ready-to-run graph on the shared
+        checkpointer pool (infra.pools). The worker uses GraphRuntime
+        instead, which also reuses one compiled graph across every cycle.
         """
-        from psycopg_pool import AsyncConnectionPool
-        from psycopg.rows import dict_row
+        from graphs.runtime import open_checkpointer
 
-        db_url = os.environ.get("DATABASE_URL", "")
-        if db_url.startswith("postgres://"):
-            db_url = db_url.replace("postgres://", "postgresql://", 1)
-
-        connection_kwargs = {"autocommit": True, "row_factory": dict_row}
-        pool = AsyncConnectionPool(
-            conninfo=db_url, max_size=20, kwargs=connection_kwargs, open=False
-        )
-        await pool.open()
-        checkpointer = AsyncPostgresSaver(pool)
-        setup_result = checkpointer.setup()
-        if setup_result is not None and hasattr(setup_result, "__aenter__"):
-            async with setup_result:
-                pass
-        elif asyncio.iscoroutine(setup_result):
-            await setup_result
-        return await cls.create_with_checkpointer(checkpointer)
+        return await cls.create_with_checkpointer(await open_checkpointer())
 
     # ── Public run interface ──────────────────────────────────────────
 
@@ -167,9 +148,14 @@ class BaseGraph(ABC):
         """
         Stable thread_id for checkpointing. Uses run_id (workflow_runs.id)
         plus phase name so each subgraph has its own checkpoint namespace.
+        An optional thread_key (e.g. topic id) separates per-bundle runs of
+        the same phase that execute concurrently.
         """
         run_id     = input_data.get("run_id", 0)
         phase_name = self.__class__.__name__.lower().replace("graph", "")
+        thread_key = input_data.get("thread_key")
+        if thread_key is not None:
+            return f"{run_id}:{phase_name}:{thread_key}"
         return f"{run_id}:{phase_name}"
 
     # ── Builder proxies — cleaner than self._builder.add_node() ───────
@@ -10,11 +10,20 @@ Top-level orchestrator — multi-topic.
 Checkpointing between nodes means: if the process crashes after
 research completes, it resumes at process_bundles with the full
 list of bundles intact. That's the real value of LangGraph here.
+
+Pipelined mode (PIPELINED_EXECUTION, off by default): each bundle is handed to
+planning → generation the moment research_briefs finishes it, so a
+fast authority brief no longer waits behind the slowest affiliate
+brief. Planning and generation each have their own concurrency limit.
+The research node then returns all three phases' results and the graph
+routes straight to END; a crash mid-cycle re-runs the research node,
+losing the per-phase resume described above.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
@@ -25,6 +34,7 @@ from graphs.research_graph import ResearchGraph
 from graphs.planning_graph import PlanningGraph
 from graphs.generation_graph import GenerationGraph
 from state.pipeline_state import PipelineState
+from config.settings import settings
 
 log = logging.getLogger(__name__)
 
@@ -51,30 +61,6 @@ class MainGraph(BaseGraph):
         log.info("MainGraph compiled")
         return instance
 
-    @classmethod
-    async def create(cls) -> "MainGraph":
-        import os
-        from psycopg_pool import AsyncConnectionPool
-        from psycopg.rows import dict_row
-
-        db_url = os.environ.get("DATABASE_URL", "")
-        if db_url.startswith("postgres://"):
-            db_url = db_url.replace("postgres://", "postgresql://", 1)
-
-        pool = AsyncConnectionPool(
-            conninfo=db_url, max_size=20,
-            kwargs={"autocommit": True, "row_factory": dict_row}, open=False,
-        )
-        await pool.open()
-        checkpointer = AsyncPostgresSaver(pool)
-        result = checkpointer.setup()
-        if result is not None and hasattr(result, "__aenter__"):
-            async with result:
-                pass
-        elif asyncio.iscoroutine(result):
-            await result
-        return await cls.create_with_checkpointer(checkpointer)
-
     # ── Graph structure ───────────────────────────────────────────────
 
     def _build_nodes(self):
@@ -84,7 +70,8 @@ class MainGraph(BaseGraph):
     def _build_edges(self):
         self.add_edge(self.START, "research")
         self.add_conditional_edges("research", self._route_after_research,
-            {"process": "process_bundles", "empty": self.END, "failed": self.END})
+            {"process": "process_bundles", "done": self.END,
+             "empty": self.END, "failed": self.END})
         self.add_edge("process_bundles", self.END)
 
     # ── Input / output ────────────────────────────────────────────────
@@ -131,11 +118,16 @@ class MainGraph(BaseGraph):
     def _route_after_research(state: dict) -> str:
         if state.get("status") == "failed":
             return "failed"
+        if state.get("phase_statuses", {}).get("generation") == "complete":
+            return "done"       # pipelined mode already planned + generated
         return "process" if state.get("research_bundles") else "empty"
 
     # ── Phase nodes ───────────────────────────────────────────────────
 
     async def _research_node(self, state: PipelineState) -> dict:
+        if settings.PIPELINED_EXECUTION:
+            return await self._research_pipelined(state)
+
         result = await self._research.run({
             "run_id":       state["run_id"],
             "triggered_by": state.get("triggered_by", "scheduler"),
@@ -153,6 +145,57 @@ class MainGraph(BaseGraph):
             "status":           "running" if bundles else ("complete" if not result.errors else "failed"),
         }
 
+    async def _research_pipelined(self, state: PipelineState) -> dict:
+        """Research with each finished bundle streamed into planning → generation."""
+        run_id = state["run_id"]
+        plan_sem = asyncio.Semaphore(max(1, settings.PLANNING_CONCURRENCY))
+        gen_sem = asyncio.Semaphore(max(1, settings.GENERATION_CONCURRENCY))
+        tasks: list[asyncio.Task] = []
+
+        def on_bundle(bundle: dict) -> None:
+            tasks.append(asyncio.create_task(
+                self._process_bundle(run_id, bundle, plan_sem, gen_sem)
+            ))
+
+        try:
+            result = await self._research.run({
+                "run_id":       run_id,
+                "triggered_by": state.get("triggered_by", "scheduler"),
+            }, on_bundle=on_bundle)
+            outcomes = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        bundles = result.output if result.succeeded and isinstance(result.output, list) else []
+        cost = state.get("total_cost_usd", 0.0) + result.cost_usd
+        errors = list(state.get("errors", [])) + result.errors
+        planned, generated = [], []
+        for outcome in outcomes:
+            cost += outcome["cost_usd"]
+            errors.extend(outcome["errors"])
+            if outcome["planned"]:
+                planned.append(outcome["planned"])
+            if outcome["generated"]:
+                generated.append(outcome["generated"])
+
+        log.info(f"Pipelined: {len(tasks)} streamed, {len(planned)} planned, "
+                 f"{len(generated)} generated")
+
+        return {
+            "run_id":             run_id,
+            "research_bundles":   bundles,
+            "planning_results":   planned,
+            "generation_results": generated,
+            "total_cost_usd":     cost,
+            "errors":             errors,
+            "phase_statuses":     {**state.get("phase_statuses", {}),
+                                   "research": "complete" if bundles else result.status,
+                                   "planning": "complete", "generation": "complete"},
+            "status":             "complete" if tasks or not result.errors else "failed",
+        }
+
     async def _process_bundles_node(self, state: PipelineState) -> dict:
         """Run planning → generation for each research bundle."""
         run_id = state["run_id"]
@@ -168,45 +211,13 @@ class MainGraph(BaseGraph):
             title = bundle.get("topic", {}).get("title", f"Bundle #{i}")
             log.info(f"━━━ [{i+1}/{len(bundles)}] '{title}' ━━━")
 
-            # ── Planning ──────────────────────────────────────────
-            try:
-                p_result = await self._planning.run({
-                    "run_id": run_id,
-                    "research_bundle": bundle,
-                })
-                cost += p_result.cost_usd
-
-                if not p_result.succeeded:
-                    errors.append({"phase": "planning", "topic_title": title,
-                                   "error": str(p_result.errors)})
-                    continue
-
-                planned.append({"topic_title": title, "content_plan": p_result.output,
-                                "cost_usd": p_result.cost_usd})
-            except Exception as exc:
-                errors.append({"phase": "planning", "topic_title": title, "error": str(exc)})
-                continue
-
-            # ── Generation ────────────────────────────────────────
-            try:
-                g_result = await self._generation.run({
-                    "run_id": run_id,
-                    "research_bundle": bundle,
-                    "content_plan": p_result.output,
-                })
-                cost += g_result.cost_usd
-
-                if g_result.succeeded:
-                    generated.append({
-                        "topic_title": title,
-                        "wp_post_id": (g_result.output or {}).get("wp_post_id"),
-                        "cost_usd": g_result.cost_usd,
-                    })
-                else:
-                    errors.append({"phase": "generation", "topic_title": title,
-                                   "error": str(g_result.errors)})
-            except Exception as exc:
-                errors.append({"phase": "generation", "topic_title": title, "error": str(exc)})
+            outcome = await self._process_bundle(run_id, bundle)
+            cost += outcome["cost_usd"]
+            errors.extend(outcome["errors"])
+            if outcome["planned"]:
+                planned.append(outcome["planned"])
+            if outcome["generated"]:
+                generated.append(outcome["generated"])
 
         log.info(f"Done: {len(planned)} planned, {len(generated)} generated")
 
@@ -219,4 +230,67 @@ class MainGraph(BaseGraph):
             "phase_statuses":     {**state.get("phase_statuses", {}),
                                    "planning": "complete", "generation": "complete"},
             "status":             "complete",
-        }
\ No newline at end of file
+        }
+
+    async def _process_bundle(
+        self,
+        run_id: int,
+        bundle: dict,
+        plan_sem: asyncio.Semaphore | None = None,
+        gen_sem: asyncio.Semaphore | None = None,
+    ) -> dict:
+        """
+        Planning → generation for one bundle. Never raises.
+        Returns {"planned", "generated", "errors", "cost_usd"}.
+        """
+        topic = bundle.get("topic", {})
+        title = topic.get("title", "Untitled")
+        # Per-topic checkpoint thread — bundles may be in flight concurrently
+        thread_key = topic.get("id") or title
+        outcome = {"planned": None, "generated": None, "errors": [], "cost_usd": 0.0}
+
+        # ── Planning ──────────────────────────────────────────
+        try:
+            async with plan_sem or contextlib.nullcontext():
+                p_result = await self._planning.run({
+                    "run_id": run_id,
+                    "research_bundle": bundle,
+                    "thread_key": thread_key,
+                })
+            outcome["cost_usd"] += p_result.cost_usd
+
+            if not p_result.succeeded:
+                outcome["errors"].append({"phase": "planning", "topic_title": title,
+                                          "error": str(p_result.errors)})
+                return outcome
+
+            outcome["planned"] = {"topic_title": title, "content_plan": p_result.output,
+                                  "cost_usd": p_result.cost_usd}
+        except Exception as exc:
+            outcome["errors"].append({"phase": "planning", "topic_title": title, "error": str(exc)})
+            return outcome
+
+        # ── Generation ────────────────────────────────────────
+        try:
+            async with gen_sem or contextlib.nullcontext():
+                g_result = await self._generation.run({
+                    "run_id": run_id,
+                    "research_bundle": bundle,
+                    "content_plan": p_result.output,
+                    "thread_key": thread_key,
+                })
+            outcome["cost_usd"] += g_result.cost_usd
+
+            if g_result.succeeded:
+                outcome["generated"] = {
+                    "topic_title": title,
+                    "wp_post_id": (g_result.output or {}).get("wp_post_id"),
+                    "cost_usd": g_result.cost_usd,
+                }
+            else:
+                outcome["errors"].append({"phase": "generation", "topic_title": title,
+                                          "error": str(g_result.errors)})
+        except Exception as exc:
+            outcome["errors"].append({"phase": "generation", "topic_title": title, "error": str(exc)})
+
+        return outcome
@@ -9,12 +9,16 @@ LangGraph handles 3 nodes only (phase lifecycle + checkpointing):
 
 The inner per-brief processing (stages 2-8) uses asyncio.gather via
 nodes/research/pipeline.py — no LangGraph overhead for that work.
+run(..., on_bundle=cb) streams each bundle to cb as soon as it completes
+(used by MainGraph's pipelined mode).
 
 This graph checkpoints between nodes, so if the process crashes after
 load_data but before research, it resumes from build_briefs.
 """
 
 import logging
+from typing import Callable
+
 from graphs.base_graph import BaseGraph
 from graphs.phase_result import PhaseResult
 from state.research_state import ResearchState
@@ -36,7 +40,23 @@ class ResearchGraph(BaseGraph):
         log.info("ResearchGraph created")
         return instance
 
+    async def run(
+        self,
+        input_data: dict,
+        on_bundle: Callable[[dict], None] | None = None,
+    ) -> PhaseResult:
+        """Run the phase; on_bundle is called with each bundle as it completes."""
+        run_id = input_data.get("run_id")
+        if on_bundle is not None:
+            self._bundle_listeners[run_id] = on_bundle
+        try:
+            return await super().run(input_data)
+        finally:
+            self._bundle_listeners.pop(run_id, None)
+
     def _build_nodes(self):
+        # run_id → on_bundle callback. Callbacks cannot live in checkpointed state.
+        self._bundle_listeners: dict[int, Callable[[dict], None]] = {}
         self._topic_loader = TopicLoader()
         self._affiliate_loader = AffiliateLoader()
         self._brief_builder = BriefBuilder()
@@ -77,6 +97,7 @@ class ResearchGraph(BaseGraph):
             locked_briefs=locked,
             run_id=state["run_id"],
             triggered_by=state.get("triggered_by", "scheduler"),
+            on_bundle=self._bundle_listeners.get(state["run_id"]),
         )
 
         return {
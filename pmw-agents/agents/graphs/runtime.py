@@ -0,0 +1,79 @@
+# graphs/runtime.py
+"""
+GraphRuntime — worker-lifetime home for the checkpointer and compiled graphs.
+
+Owns:
+  - The AsyncPostgresSaver on infra.pools' psycopg pool, set up once per worker
+  - The compiled MainGraph (and its Research / Planning / Generation
+    subgraphs), reused by every pipeline cycle
+
+Does NOT own:
+  - workflow_runs bookkeeping — orchestrator.run_single_workflow does that
+  - Any connection pool — PoolManager owns both the asyncpg and psycopg
+    pools and closes them in Infrastructure.close()
+
+Compiled graphs hold no per-run state (run data lives in checkpointed
+state keyed by thread_id), so one instance serves every cycle.
+
+Usage (from main.py):
+    runtime = await GraphRuntime.start()
+    try:
+        await run_pipeline_loop(triggered_by="scheduler", runtime=runtime)
+    finally:
+        await runtime.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+from infrastructure import get_infrastructure
+
+log = logging.getLogger(__name__)
+
+
+async def open_checkpointer() -> AsyncPostgresSaver:
+    """A set-up AsyncPostgresSaver on the shared psycopg pool."""
+    pool = await get_infrastructure().pools.psycopg()
+    checkpointer = AsyncPostgresSaver(pool)
+    setup_result = checkpointer.setup()
+    if setup_result is not None and hasattr(setup_result, "__aenter__"):
+        async with setup_result:
+            pass
+    elif asyncio.iscoroutine(setup_result):
+        await setup_result
+    return checkpointer
+
+
+class GraphRuntime:
+
+    def __init__(self, checkpointer: AsyncPostgresSaver, main_graph) -> None:
+        self.checkpointer = checkpointer
+        self.main_graph = main_graph
+        self.cycles = 0
+        self._closed = False
+
+    @classmethod
+    async def start(cls) -> "GraphRuntime":
+        """Set up the checkpointer and compile every graph once."""
+        from graphs.main_graph import MainGraph
+
+        checkpointer = await open_checkpointer()
+        main_graph = await MainGraph.create_with_checkpointer(checkpointer)
+        log.info("GraphRuntime ready — graphs compiled once for this worker")
+        return cls(checkpointer, main_graph)
+
+    async def run(self, input_data: dict):
+        """Run one pipeline cycle on the shared MainGraph."""
+        self.cycles += 1
+        return await self.main_graph.run(input_data)
+
+    async def close(self) -> None:
+        """Release the compiled graphs; the psycopg pool stays with infra.pools."""
+        if not self._closed:
+            self._closed = True
+            self.main_graph = None
+            log.info(f"GraphRuntime closed after {self.cycles} cycle(s)")
@@ -0,0 +1,215 @@
+"""
+LLMResponseCache — content-addressed cache for LLM responses.
+
+Owns:
+  - Cache key derivation from (provider, model, temperature, max_tokens,
+    system prompt, prompt hash)
+  - Tier 1: in-process LRU, bounded by entry count and total bytes
+  - Tier 2: Redis (via the shared RedisClient), bounded by per-key TTL
+  - Hit / miss counters for monitoring
+
+Does NOT own:
+  - Deciding whether a stage may use the cache — BaseAgent owns that
+  - Validating cached text — BaseAgent re-runs validate_output() on hits
+  - Cost accounting — CostTrackingService records hits as zero-cost rows
+
+Only responses that passed the calling agent's validation are stored, so a
+retried or re-run brief with byte-identical prompts returns in milliseconds.
+
+Usage (from BaseAgent.call_llm):
+    key = infra.llm_cache.make_key(provider, model, temperature,
+                                   max_tokens, system_prompt, prompt)
+    hit = await infra.llm_cache.get(key)
+    ...
+    await infra.llm_cache.set(key, response, ttl=86_400)
+
+Never raises — a cache failure degrades to a normal provider call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+
+from infrastructure.llm.llm_client import RawLLMResponse
+
+log = logging.getLogger("pmw.infra.llm_cache")
+
+KEY_PREFIX = "pmw:llm:resp:"
+
+
+def prompt_hash(prompt: str) -> str:
+    """Full SHA-256 of a prompt — the content address used in cache keys."""
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-tier response cache. Redis is optional — without it the cache
+    still works in-process for the lifetime of the worker.
+    """
+
+    def __init__(
+        self,
+        redis=None,                       # RedisClient — injected by Infrastructure
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entry_bytes: int = 512 * 1024,
+        default_ttl: int = 86_400,
+    ) -> None:
+        self._redis = redis
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self.default_ttl = default_ttl
+
+        # key → (expires_at, payload_json)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._memory_bytes = 0
+
+        self.hits_memory = 0
+        self.hits_redis = 0
+        self.misses = 0
+
+    def set_redis(self, redis) -> None:
+        """Called by Infrastructure after RedisClient is connected."""
+        self._redis = redis
+
+    # ── Keys ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+        prompt: str,
+    ) -> str:
+        """
+        Derive the cache key for one request. Any change to the model,
+        sampling parameters, system prompt or prompt text yields a new key.
+        """
+        parts = json.dumps(
+            [
+                provider.lower(),
+                model,
+                round(float(temperature), 4),
+                int(max_tokens),
+                prompt_hash(system_prompt or ""),
+                prompt_hash(prompt),
+            ],
+            separators=(",", ":"),
+        )
+        return KEY_PREFIX + hashlib.sha256(parts.encode()).hexdigest()
+
+    # ── Read / write ───────────────────────────────────────────────────────
+
+    async def get(self, key: str) -> RawLLMResponse | None:
+        """Return the cached response for key, or None on miss/expiry."""
+        payload = self._memory_get(key)
+        if payload is not None:
+            self.hits_memory += 1
+            return self._decode(payload)
+
+        if self._redis is not None:
+            try:
+                payload = await self._redis.get(key)
+                response = self._decode(payload) if payload else None
+            except Exception as exc:
+                log.debug(f"LLM cache Redis read failed: {exc}")
+                response = None
+            if response is not None:
+                self.hits_redis += 1
+                # Promote to memory with a short local TTL; Redis stays authoritative
+                self._memory_put(key, payload, ttl=min(self.default_ttl, 3_600))
+                return response
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, response: RawLLMResponse, ttl: int | None = None) -> None:
+        """Store a validated response in both tiers."""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        payload = json.dumps({
+            "text":          response.text,
+            "input_tokens":  response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "model":         response.model,
+            "provider":      response.provider,
+        })
+        if len(payload) > self._max_entry_bytes:
+            log.debug("LLM cache entry too large — not cached", extra={"bytes": len(payload)})
+            return
+
+        self._memory_put(key, payload, ttl)
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, payload, ex=int(ttl))
+            except Exception as exc:
+                log.debug(f"LLM cache Redis write failed: {exc}")
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a key from both tiers (e.g. a cached response failed validation)."""
+        self._memory_pop(key)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(key)
+            except Exception as exc:
+                log.debug(f"LLM cache Redis delete failed: {exc}")
+
+    def stats(self) -> dict:
+        """Counters for monitoring / end-of-run logging."""
+        return {
+            "hits_memory":   self.hits_memory,
+            "hits_redis":    self.hits_redis,
+            "misses":        self.misses,
+            "entries":       len(self._memory),
+            "memory_bytes":  self._memory_bytes,
+        }
+
+    # ── In-process LRU ─────────────────────────────────────────────────────
+
+    def _memory_get(self, key: str) -> str | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            self._memory_pop(key)
+            return None
+        self._memory.move_to_end(key)
+        return payload
+
+    def _memory_put(self, key: str, payload: str, ttl: int) -> None:
+        self._memory_pop(key)
+        self._memory[key] = (time.monotonic() + ttl, payload)
+        self._memory_bytes += len(payload)
+        while self._memory and (
+            len(self._memory) > self._max_entries or self._memory_bytes > self._max_bytes
+        ):
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _memory_pop(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry[1])
+
+    @staticmethod
+    def _decode(payload: str) -> RawLLMResponse:
+        data = json.loads(payload)
+        return RawLLMResponse(
+            text=data["text"],
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            model=data.get("model", ""),
+            provider=data.get("provider", ""),
+        )
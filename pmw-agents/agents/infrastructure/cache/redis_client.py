@@ -6,8 +6,10 @@ import os
 log = logging.getLogger("pmw.infra.redis")
 
 class RedisClient:
-    def __init__(self):
+    def __init__(self, max_connections: int | None = None, pool_timeout: float = 10.0):
         self._url = os.environ.get("REDIS_URL", "trolley.proxy.rlwy.net:21995")
+        self._max_connections = max_connections
+        self._pool_timeout = pool_timeout
         self._client = None
 
     # ── Lifecycle ──────────────────────────────────────────────────────────
@@ -25,13 +27,19 @@ class RedisClient:
             raise ImportError(
                 "redis[asyncio] is not installed. Run: pip install redis[asyncio]"
             )
-        self._client = aioredis.from_url(
+        # Blocking pool: once max_connections are checked out, callers wait
+        # up to pool_timeout for one instead of failing with "Too many
+        # connections" (the plain ConnectionPool's behaviour)
+        pool = aioredis.BlockingConnectionPool.from_url(
             self._url,
             decode_responses=True,
             socket_connect_timeout=5,
             socket_timeout=5,
             retry_on_timeout=True,
+            max_connections=self._max_connections or 50,
+            timeout=self._pool_timeout,
         )
+        self._client = aioredis.Redis(connection_pool=pool)
         await self._client.ping()
         # Log URL with credentials stripped for safety
         safe_url = self._url.split("@")[-1] if "@" in self._url else self._url
@@ -44,6 +52,11 @@ class RedisClient:
             self._client = None
             log.info("RedisClient closed")
  
+    @property
+    def raw_client(self):
+        """The redis.asyncio client if connected, else None."""
+        return self._client
+
     def _get(self):
         """Return the client, raising clearly if connect() was never called."""
         if self._client is None:
@@ -64,6 +77,20 @@ class RedisClient:
             await infra.redis.publish("pmw:events", json.dumps(event_payload))
         """
         return await self._get().publish(channel, message)
+
+    async def publish_many(self, messages: list[tuple[str, str]]) -> None:
+        """
+        Publish several (channel, message) pairs in one pipelined round-trip.
+
+        Usage:
+            await infra.redis.publish_many([("pmw:events", a), ("pmw:events", b)])
+        """
+        if not messages:
+            return
+        pipe = self._get().pipeline(transaction=False)
+        for channel, message in messages:
+            pipe.publish(channel, message)
+        await pipe.execute()
  
     # ── Key/value ──────────────────────────────────────────────────────────
  
@@ -0,0 +1,152 @@
+"""
+ModelPriceTable — in-memory, interval-indexed LLM price lookup.
+
+Owns:
+  - Loading every model_prices row at Infrastructure.connect() and again
+    every refresh_secs (refreshed in the background; lookups never wait)
+  - config/pricing.py prices as the second tier, for models with no
+    matching model_prices interval
+  - O(log n) lookup of the rate in effect at a timestamp (bisect over the
+    sorted effective_from starts per provider/model)
+
+Does NOT own:
+  - Cost arithmetic and llm_call_logs rows — CostTrackingService does that
+  - Hard-coded last-resort prices — CostTrackingService._FALLBACK_PRICES
+
+Usage (from CostTrackingService):
+    price = infra.model_prices.lookup("anthropic", "claude-sonnet-4-6", ts)
+    price["input"], price["output"]     # USD per 1K tokens, or None if unknown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timezone
+
+from config.pricing import ModelPricing
+
+log = logging.getLogger("pmw.infra.model_prices")
+
+
+def _utc_naive(value: date | datetime | None) -> datetime | None:
+    """Normalise DB timestamptz / config dates / naive UTC datetimes for comparison."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        return datetime.combine(value, datetime.min.time())
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class _IntervalIndex:
+    """Per (provider, model): intervals sorted by start, searched with bisect."""
+
+    def __init__(self, rows: list[tuple[str, str, datetime, datetime | None, float, float]]) -> None:
+        grouped: dict[tuple[str, str], list[tuple]] = {}
+        for provider, model, start, end, input_rate, output_rate in rows:
+            grouped.setdefault((provider, model), []).append((start, end, input_rate, output_rate))
+        self._starts: dict[tuple[str, str], list[datetime]] = {}
+        self._intervals: dict[tuple[str, str], list[tuple]] = {}
+        for key, intervals in grouped.items():
+            intervals.sort(key=lambda i: i[0])
+            self._starts[key] = [i[0] for i in intervals]
+            self._intervals[key] = intervals
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._intervals.values())
+
+    def lookup(self, provider: str, model: str, ts: datetime) -> tuple[float, float] | None:
+        """Rates of the latest-starting interval containing ts."""
+        key = (provider, model)
+        starts = self._starts.get(key)
+        if not starts:
+            return None
+        intervals = self._intervals[key]
+        # Walk back from the last start <= ts; overlaps are rare, so this is
+        # almost always a single step.
+        for i in range(bisect_right(starts, ts) - 1, -1, -1):
+            _, end, input_rate, output_rate = intervals[i]
+            if end is None or end > ts:
+                return input_rate, output_rate
+        return None
+
+
+class ModelPriceTable:
+
+    def __init__(self, postgres=None, refresh_secs: float = 3600) -> None:
+        self._postgres = postgres
+        self._refresh_secs = refresh_secs
+        self._db = _IntervalIndex([])
+        self._config = _IntervalIndex(self._config_rows())
+        self._loaded_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    # ── Loading ────────────────────────────────────────────────────────────
+
+    async def load(self) -> None:
+        """Reload model_prices. Never raises — keeps the previous table on failure."""
+        try:
+            rows = await self._postgres.fetch(
+                """
+                SELECT provider, model, input_rate_per_1k, output_rate_per_1k,
+                       effective_from, effective_to
+                FROM model_prices
+                """
+            )
+            self._db = _IntervalIndex([
+                (r["provider"], r["model"],
+                 _utc_naive(r["effective_from"]), _utc_naive(r["effective_to"]),
+                 float(r["input_rate_per_1k"]), float(r["output_rate_per_1k"]))
+                for r in rows
+            ])
+            log.info(f"Model price table loaded: {len(self._db)} interval(s)")
+        except Exception as exc:
+            log.warning(f"model_prices load failed — using previous/config prices: {exc}")
+        finally:
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force a background reload on the next lookup."""
+        self._loaded_at = None
+
+    @staticmethod
+    def _config_rows() -> list[tuple]:
+        return [
+            (provider, model, _utc_naive(p.effective_from), _utc_naive(p.effective_to),
+             p.input_rate, p.output_rate)
+            for provider, models in ModelPricing._prices.items()
+            for model, p in models.items()
+        ]
+
+    # ── Lookup ─────────────────────────────────────────────────────────────
+
+    def lookup(self, provider: str, model: str, ts: datetime | None = None) -> dict | None:
+        """
+        Rates (USD per 1K tokens) in effect at ts, from model_prices first
+        and config/pricing.py second. None if neither knows the model.
+        """
+        self._maybe_refresh()
+        provider = getattr(provider, "value", provider)
+        ts = _utc_naive(ts) or datetime.utcnow()
+
+        for source, index in (("db", self._db), ("config", self._config)):
+            rates = index.lookup(provider, model, ts)
+            if rates:
+                return {"input": rates[0], "output": rates[1], "source": source}
+        return None
+
+    def _maybe_refresh(self) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self._refresh_secs:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._loaded_at = time.monotonic()      # one refresh per interval, even if it fails
+        self._refresh_task = loop.create_task(self.load())
@@ -0,0 +1,166 @@
+"""
+PoolManager — every Postgres and Redis connection the worker holds.
+
+Owns:
+  - One Postgres connection budget (DB_CONNECTION_BUDGET) split between
+    the asyncpg pool (PostgresClient — services, telemetry, task queue,
+    workflow_runs) and the psycopg pool (LangGraph's AsyncPostgresSaver)
+  - The Redis client's connection-pool limit (REDIS_MAX_CONNECTIONS) —
+    a blocking pool, so commands beyond it wait (REDIS_POOL_TIMEOUT_SECS)
+  - Opening and closing all three pools
+  - Utilisation reporting across them
+
+Does NOT own:
+  - Query helpers — PostgresClient / RedisClient provide those
+  - Checkpointer setup — graphs/runtime.py does that on the psycopg pool
+
+Lifecycle:
+    infra.pools is instantiated in Infrastructure.__init__; infra.postgres
+    and infra.redis are its clients. connect() opens asyncpg + Redis; the
+    psycopg pool opens on first psycopg() call (only the worker needs it).
+
+Usage:
+    await infra.pools.asyncpg()     # raw asyncpg.Pool
+    await infra.pools.psycopg()     # psycopg AsyncConnectionPool for LangGraph
+    infra.pools.stats()             # {"asyncpg": {...}, "psycopg": {...}, "redis": {...}}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+
+from infrastructure.cache.redis_client import RedisClient
+from infrastructure.database.postgres_client import PostgresClient, _normalise_dsn
+
+log = logging.getLogger("pmw.infra.pools")
+
+
+@dataclass(frozen=True)
+class PoolBudget:
+    asyncpg_min: int
+    asyncpg_max: int
+    psycopg_max: int
+    redis_max:   int
+
+    @classmethod
+    def split(cls, total: int, checkpoint_share: float, redis_max: int) -> "PoolBudget":
+        """Divide `total` Postgres connections between asyncpg and psycopg."""
+        total = max(total, 3)
+        psycopg_max = max(1, round(total * checkpoint_share))
+        asyncpg_max = max(2, total - psycopg_max)
+        return cls(
+            asyncpg_min = min(2, asyncpg_max),
+            asyncpg_max = asyncpg_max,
+            psycopg_max = psycopg_max,
+            redis_max   = max(1, redis_max),
+        )
+
+
+class PoolManager:
+
+    def __init__(self, dsn: str, budget: PoolBudget, redis_pool_timeout: float = 10.0) -> None:
+        self.budget = budget
+        self._dsn = dsn
+        self.postgres = PostgresClient(
+            dsn=dsn, min_size=budget.asyncpg_min, max_size=budget.asyncpg_max,
+        )
+        self.redis = RedisClient(max_connections=budget.redis_max, pool_timeout=redis_pool_timeout)
+        self._psycopg = None
+        self._psycopg_lock: asyncio.Lock | None = None
+
+    # ── Lifecycle ──────────────────────────────────────────────────────────
+
+    async def connect(self) -> None:
+        await self.postgres.connect()
+        await self.redis.connect()
+        log.info("Connection pools ready", extra=asdict(self.budget))
+
+    async def close(self) -> None:
+        for name, method in [
+            ("psycopg",  self._close_psycopg),
+            ("redis",    self.redis.close),
+            ("postgres", self.postgres.close),
+        ]:
+            try:
+                await method()
+            except Exception as exc:
+                log.error(f"Error closing {name} pool: {exc}")
+
+    # ── Pools ──────────────────────────────────────────────────────────────
+
+    async def asyncpg(self):
+        """The shared asyncpg pool (connecting lazily if needed)."""
+        return await self.postgres.pool()
+
+    async def psycopg(self):
+        """The shared psycopg AsyncConnectionPool, opened on first use."""
+        if self._psycopg is not None:
+            return self._psycopg
+        if self._psycopg_lock is None:
+            self._psycopg_lock = asyncio.Lock()
+        async with self._psycopg_lock:
+            if self._psycopg is None:
+                from psycopg_pool import AsyncConnectionPool
+                from psycopg.rows import dict_row
+
+                pool = AsyncConnectionPool(
+                    conninfo=_normalise_dsn(self._dsn).replace("postgresql+asyncpg://", "postgresql://", 1),
+                    min_size=1,
+                    max_size=self.budget.psycopg_max,
+                    kwargs={"autocommit": True, "row_factory": dict_row},
+                    open=False,
+                )
+                await pool.open()
+                self._psycopg = pool
+                log.info(f"psycopg pool opened (max {self.budget.psycopg_max})")
+        return self._psycopg
+
+    async def _close_psycopg(self) -> None:
+        if self._psycopg is not None:
+            await self._psycopg.close()
+            self._psycopg = None
+
+    # ── Reporting ──────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Connections in use / open / max per pool. Never raises."""
+        return {
+            "asyncpg": self._asyncpg_stats(),
+            "psycopg": self._psycopg_stats(),
+            "redis":   self._redis_stats(),
+        }
+
+    def _asyncpg_stats(self) -> dict:
+        pool = self.postgres.raw_pool
+        if pool is None:
+            return _usage(0, 0, self.budget.asyncpg_max)
+        size = pool.get_size()
+        return _usage(size - pool.get_idle_size(), size, self.budget.asyncpg_max)
+
+    def _psycopg_stats(self) -> dict:
+        if self._psycopg is None:
+            return _usage(0, 0, self.budget.psycopg_max)
+        s = self._psycopg.get_stats()
+        size = s.get("pool_size", 0)
+        usage = _usage(size - s.get("pool_available", 0), size, self.budget.psycopg_max)
+        usage["waiting"] = s.get("requests_waiting", 0)
+        return usage
+
+    def _redis_stats(self) -> dict:
+        pool = getattr(self.redis.raw_client, "connection_pool", None)
+        if pool is None:
+            return _usage(0, 0, self.budget.redis_max)
+        in_use = len(getattr(pool, "_in_use_connections", ()))
+        idle = len(getattr(pool, "_available_connections", ()))
+        return _usage(in_use, in_use + idle, self.budget.redis_max)
+
+
+def _usage(in_use: int, size: int, max_size: int) -> dict:
+    return {
+        "in_use":      in_use,
+        "open":        size,
+        "max":         max_size,
+        "utilisation": round(in_use / max_size, 3) if max_size else 0.0,
+    }
@@ -2,12 +2,22 @@ from __future__ import annotations
  
 import logging
 import os
+import re
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, Sequence
  
 import asyncpg
  
 log = logging.getLogger("pmw.infra.postgres")
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _ident(name: str) -> str:
+    """Guard table / column names interpolated into bulk_upsert SQL."""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
  
  
 def _normalise_dsn(url: str) -> str:
@@ -77,6 +87,15 @@ class PostgresClient:
             await self.connect()
         return self._pool  # type: ignore[return-value]
 
+    async def pool(self) -> asyncpg.Pool:
+        """The underlying asyncpg pool, for callers that manage connections themselves."""
+        return await self._get_pool()
+
+    @property
+    def raw_pool(self) -> asyncpg.Pool | None:
+        """The pool if connected, else None (never connects)."""
+        return self._pool
+
      # ── Context managers ───────────────────────────────────────────────────
  
     @asynccontextmanager
@@ -178,4 +197,106 @@ class PostgresClient:
         """
         pool = await self._get_pool()
         async with pool.acquire() as conn:
-            await conn.executemany(query, args_list)
\ No newline at end of file
+            await conn.executemany(query, args_list)
+
+    # ── Bulk upsert ─────────────────────────────────────────────────────────
+
+    async def bulk_upsert(
+        self,
+        table: str,
+        rows: Sequence[dict],
+        conflict_cols: Sequence[str],
+        update_cols: Sequence[str] | None = None,
+        isolate_failures: bool = False,
+    ) -> list[str]:
+        """
+        Upsert many rows in one round-trip: COPY them into a temp table,
+        then merge with a single INSERT ... ON CONFLICT.
+
+        Every row must have the same keys; values must already be the
+        column's Python type (COPY is binary — no implicit casts).
+        Duplicate conflict keys within `rows` are collapsed, last one wins.
+        update_cols defaults to every non-conflict column; pass [] for
+        ON CONFLICT DO NOTHING.
+
+        Returns one outcome per input row, in order:
+            "inserted" | "updated" | "skipped" (duplicate superseded, or
+            conflict with DO NOTHING) | "failed" (only with isolate_failures)
+
+        With isolate_failures, a failing batch is split in half and retried
+        until the bad rows are isolated, instead of raising.
+
+        Usage:
+            outcomes = await infra.postgres.bulk_upsert(
+                "affiliates", rows, conflict_cols=["wp_dealer_id"],
+            )
+        """
+        if not rows:
+            return []
+        if not isolate_failures:
+            return await self._bulk_upsert(table, rows, conflict_cols, update_cols)
+        try:
+            return await self._bulk_upsert(table, rows, conflict_cols, update_cols)
+        except Exception as exc:
+            if len(rows) == 1:
+                log.warning(f"bulk_upsert into {table} failed for row {dict(rows[0])}: {exc}")
+                return ["failed"]
+            mid = len(rows) // 2
+            return (
+                await self.bulk_upsert(table, rows[:mid], conflict_cols, update_cols, True)
+                + await self.bulk_upsert(table, rows[mid:], conflict_cols, update_cols, True)
+            )
+
+    async def _bulk_upsert(
+        self,
+        table: str,
+        rows: Sequence[dict],
+        conflict_cols: Sequence[str],
+        update_cols: Sequence[str] | None,
+    ) -> list[str]:
+        columns = [_ident(c) for c in rows[0]]
+        conflict = [_ident(c) for c in conflict_cols]
+        if update_cols is None:
+            update_cols = [c for c in columns if c not in conflict]
+        table = _ident(table)
+        tmp = f"_bulk_{table}"
+        col_list = ", ".join(columns)
+        key_list = ", ".join(conflict)
+
+        if update_cols:
+            on_conflict = "DO UPDATE SET " + ", ".join(
+                f"{_ident(c)} = EXCLUDED.{c}" for c in update_cols
+            )
+        else:
+            on_conflict = "DO NOTHING"
+
+        records = [tuple(r[c] for c in columns) + (i,) for i, r in enumerate(rows)]
+
+        async with self.transaction() as conn:
+            await conn.execute(
+                f"CREATE TEMP TABLE {tmp} ON COMMIT DROP AS "
+                f"SELECT {col_list}, 0::int AS _bulk_ord FROM {table} WITH NO DATA"
+            )
+            await conn.copy_records_to_table(tmp, records=records, columns=columns + ["_bulk_ord"])
+            returned = await conn.fetch(
+                f"""
+                INSERT INTO {table} ({col_list})
+                SELECT {col_list} FROM (
+                    SELECT DISTINCT ON ({key_list}) * FROM {tmp}
+                    ORDER BY {key_list}, _bulk_ord DESC
+                ) latest
+                ON CONFLICT ({key_list}) {on_conflict}
+                RETURNING {key_list}, (xmax = 0) AS _bulk_inserted
+                """
+            )
+
+        written = {
+            tuple(r[c] for c in conflict): "inserted" if r["_bulk_inserted"] else "updated"
+            for r in returned
+        }
+        last_index = {tuple(r[c] for c in conflict): i for i, r in enumerate(rows)}
+        outcomes = []
+        for i, r in enumerate(rows):
+            key = tuple(r[c] for c in conflict)
+            outcomes.append(written.get(key, "skipped") if last_index[key] == i else "skipped")
+        return outcomes
@@ -0,0 +1,118 @@
+"""
+SchemaCapabilities — which tables and columns exist in the connected database.
+
+Owns:
+  - One information_schema introspection of every table and column, run at
+    Infrastructure.connect()
+  - The Alembic revision that snapshot was taken at, so a later migration
+    can be detected and the snapshot refreshed
+  - Cheap synchronous feature flags for services that adapt their SQL to
+    the migration level (e.g. pre/post migration 007 affiliates)
+
+Does NOT own:
+  - Running migrations — main.py / db/run_migrations.py do that
+
+Before load() succeeds every check returns False — the same answer the old
+per-call information_schema checks gave when the query failed.
+
+Usage:
+    schema = get_infrastructure().schema
+    if schema.has_column("topics", "content_type"): ...
+    col = schema.llm_attempt_column
+    await schema.refresh_if_migrated()     # once per pipeline cycle
+"""
+
+from __future__ import annotations
+
+import logging
+
+log = logging.getLogger("pmw.infra.schema")
+
+
+class SchemaCapabilities:
+
+    def __init__(self, postgres=None) -> None:
+        self._postgres = postgres
+        self._columns: dict[str, frozenset[str]] = {}
+        self.revision: str | None = None
+        self.loaded = False
+
+    # ── Introspection ──────────────────────────────────────────────────────
+
+    async def load(self) -> None:
+        """Snapshot every table/column in the current schema. Never raises."""
+        try:
+            rows = await self._postgres.fetch(
+                """
+                SELECT table_name, column_name
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                """
+            )
+            columns: dict[str, set[str]] = {}
+            for r in rows:
+                columns.setdefault(r["table_name"], set()).add(r["column_name"])
+            self._columns = {t: frozenset(c) for t, c in columns.items()}
+            self.revision = await self._current_revision()
+            self.loaded = True
+            log.info(
+                f"Schema capabilities loaded: {len(self._columns)} tables "
+                f"at revision {self.revision}"
+            )
+        except Exception as exc:
+            log.warning(f"Schema introspection failed: {exc}")
+
+    async def refresh_if_migrated(self) -> bool:
+        """Reload if the Alembic revision changed since the last load. Never raises."""
+        try:
+            revision = await self._current_revision()
+        except Exception as exc:
+            log.debug(f"Schema revision check failed: {exc}")
+            return False
+        if self.loaded and revision == self.revision:
+            return False
+        await self.load()
+        return True
+
+    async def _current_revision(self) -> str | None:
+        if "alembic_version" not in self._columns:
+            return None
+        return await self._postgres.fetchval("SELECT version_num FROM alembic_version LIMIT 1")
+
+    # ── Checks ─────────────────────────────────────────────────────────────
+
+    def has_table(self, table: str) -> bool:
+        return table in self._columns
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column in self._columns.get(table, ())
+
+    def columns(self, table: str) -> frozenset[str]:
+        return self._columns.get(table, frozenset())
+
+    # ── Feature flags ──────────────────────────────────────────────────────
+
+    @property
+    def affiliates_wp_sync(self) -> bool:
+        """Migration 007 — affiliates synced from WordPress dealers."""
+        return self.has_column("affiliates", "wp_dealer_id")
+
+    @property
+    def topics_content_type(self) -> bool:
+        """Migration 010 — topics.content_type."""
+        return self.has_column("topics", "content_type")
+
+    @property
+    def wp_sync_state(self) -> bool:
+        """Migration 014 — incremental WordPress sync high-water marks."""
+        return self.has_table("wp_sync_state")
+
+    @property
+    def affiliate_intel_counters(self) -> bool:
+        """Migration 016 — incremental affiliate intelligence counters."""
+        return self.has_table("affiliate_intelligence_counters")
+
+    @property
+    def llm_attempt_column(self) -> str:
+        """llm_call_logs attempt column — 'attempt_number' after migration 008."""
+        return "attempt_number" if self.has_column("llm_call_logs", "attempt_number") else "attempt"
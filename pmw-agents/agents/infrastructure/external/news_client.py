@@ -26,6 +26,8 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import quote_plus
 
+from infrastructure.http.single_flight import SingleFlight
+
 log = logging.getLogger("pmw.infra.news")
 
 NEWSAPI_BASE = "https://newsapi.org/v2/everything"
@@ -41,6 +43,8 @@ class NewsClient:
     def __init__(self, http=None, api_key: str | None = None) -> None:
         self._http = http
         self._api_key = api_key or os.environ.get("NEWS_API_KEY", "")
+        # Concurrent briefs running the same query share one search
+        self.flights = SingleFlight("news")
 
     def set_http(self, http) -> None:
         """Called by Infrastructure after HTTPClient is connected."""
@@ -76,6 +80,19 @@ class NewsClient:
         Returns:
             List of article dicts with title, source, date, summary, url.
         """
+        articles = await self.flights.do(
+            (" ".join(keyword.lower().split()), geography, days_back, max_results),
+            lambda: self._search(keyword, geography, days_back, max_results),
+        )
+        return [dict(a) for a in articles]
+
+    async def _search(
+        self,
+        keyword: str,
+        geography: str,
+        days_back: int,
+        max_results: int,
+    ) -> list[dict]:
         if self._api_key:
             return await self._search_newsapi(keyword, geography, days_back, max_results)
         else:
@@ -151,6 +168,7 @@ class NewsClient:
             resp = await http.get(
                 url,
                 headers={"User-Agent": "PMW-Research-Agent/1.0"},
+                cache=True,
             )
             xml_text = resp.text
 
@@ -3,7 +3,8 @@ PriceClient — precious metals price API transport.
 
 Owns:
   - Live spot price fetching
-  - Historical price data for trend calculations
+  - Historical price data for trend calculations — answered from the local
+    PriceHistoryStore; the API is only asked for days the store is missing
   - Response normalisation to standard dicts
 
 Supports multiple price APIs via configuration:
@@ -15,8 +16,9 @@ Does NOT own:
   - Market stance derivation (MarketService owns that)
 
 Lifecycle:
-    infra.price is instantiated in Infrastructure.__init__
-    No connect()/close() needed — uses infra.http for transport.
+    infra.price is instantiated in Infrastructure.__init__ with the shared
+    PriceHistoryStore. No connect()/close() needed — uses infra.http for
+    transport.
 
 Usage:
     price = await infra.price.get_spot_price("gold", "uk")
@@ -27,9 +29,11 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
+from infrastructure.http.single_flight import SingleFlight
+
 log = logging.getLogger("pmw.infra.price")
 
 # API endpoints
@@ -44,6 +48,9 @@ ASSET_SYMBOLS = {
     "palladium": "XPD",
 }
 
+# MetalPriceAPI /timeframe accepts at most this many days per request
+TIMEFRAME_MAX_DAYS = 365
+
 # Currency mapping by geography
 GEO_CURRENCY = {
     "uk": "GBP",
@@ -59,15 +66,22 @@ class PriceClient:
     to GoldAPI.io or returns unavailable status.
     """
 
-    def __init__(self, http=None) -> None:
+    def __init__(self, http=None, history=None) -> None:
         self._http = http
+        self._history = history           # PriceHistoryStore — optional
         self._metal_price_key = os.environ.get("METAL_PRICE_API_KEY", "")
         self._goldapi_key = os.environ.get("GOLDAPI_KEY", "")
+        # Concurrent briefs on the same metal share one spot / history lookup
+        self.flights = SingleFlight("price")
 
     def set_http(self, http) -> None:
         """Called by Infrastructure after HTTPClient is connected."""
         self._http = http
 
+    @property
+    def history(self):
+        return self._history
+
     def _require_http(self):
         if self._http is None:
             raise RuntimeError(
@@ -96,6 +110,12 @@ class PriceClient:
                 "fetched_at": str (ISO),
             }
         """
+        return dict(await self.flights.do(
+            ("spot", asset_class.lower(), geography.lower()),
+            lambda: self._get_spot_price(asset_class, geography),
+        ))
+
+    async def _get_spot_price(self, asset_class: str, geography: str) -> dict:
         symbol = ASSET_SYMBOLS.get(asset_class.lower())
         currency = GEO_CURRENCY.get(geography.lower(), "GBP")
 
@@ -107,12 +127,14 @@ class PriceClient:
         if self._metal_price_key:
             result = await self._fetch_metalprice(symbol, currency)
             if result:
+                await self._record_spot(asset_class, currency, result)
                 return result
 
         # Fallback to GoldAPI
         if self._goldapi_key:
             result = await self._fetch_goldapi(symbol, currency)
             if result:
+                await self._record_spot(asset_class, currency, result)
                 return result
 
         log.warning(f"No price API configured for {asset_class}")
@@ -139,15 +161,36 @@ class PriceClient:
                 "low": float | None,
             }
         """
+        return dict(await self.flights.do(
+            ("historical", asset_class.lower(), days, geography.lower()),
+            lambda: self._get_historical(asset_class, days, geography),
+        ))
+
+    async def _get_historical(self, asset_class: str, days: int, geography: str) -> dict:
         symbol = ASSET_SYMBOLS.get(asset_class.lower())
         currency = GEO_CURRENCY.get(geography.lower(), "GBP")
 
         if not symbol:
             return self._empty_trend(days)
 
+        metal = asset_class.lower()
+        if self._history is not None:
+            end = date.today()
+            start = end - timedelta(days=days)
+            series = await self._history.window(metal, currency, days, end=end)
+
+            if not series.covers(start, end) and self._metal_price_key:
+                await self._fill_history_gaps(metal, symbol, currency, series, start, end)
+                series = await self._history.window(metal, currency, days, end=end)
+
+            if series.covers(start, end):
+                return series.trend_summary(days)
+
         # Try MetalPriceAPI historical endpoint
         if self._metal_price_key:
             result = await self._fetch_historical_metalprice(symbol, currency, days)
+            # Two endpoint prices — returned, never stored: they would make
+            # the window look covered without the days in between
             if result:
                 return result
 
@@ -155,6 +198,73 @@ class PriceClient:
         log.warning(f"No historical price data available for {asset_class}")
         return self._empty_trend(days)
 
+    async def fetch_timeframe(
+        self,
+        asset_class: str,
+        currency: str,
+        start: date,
+        end: date,
+    ) -> list[tuple[date, float]]:
+        """
+        Daily prices for [start, end] from MetalPriceAPI /timeframe, chunked
+        to the API's 365-day limit. Returns [] if unavailable.
+        """
+        symbol = ASSET_SYMBOLS.get(asset_class.lower())
+        if not symbol or not self._metal_price_key:
+            return []
+        http = self._require_http()
+
+        points: list[tuple[date, float]] = []
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=TIMEFRAME_MAX_DAYS - 1), end)
+            try:
+                resp = await http.get(
+                    f"{METALS_API_BASE}/timeframe",
+                    params={
+                        "api_key": self._metal_price_key,
+                        "start_date": chunk_start.isoformat(),
+                        "end_date": chunk_end.isoformat(),
+                        "base": currency,
+                        "currencies": symbol,
+                    },
+                )
+                data = resp.json()
+            except Exception as exc:
+                log.warning(f"MetalPriceAPI timeframe fetch failed: {exc}")
+                return points
+
+            if not data.get("success"):
+                log.warning(f"MetalPriceAPI timeframe error: {data.get('error', {})}")
+                return points
+
+            for day, rates in (data.get("rates") or {}).items():
+                rate = (rates or {}).get(symbol)
+                if rate and rate > 0:
+                    points.append((date.fromisoformat(day), round(1.0 / rate, 4)))
+            chunk_start = chunk_end + timedelta(days=1)
+
+        return points
+
+    async def _fill_history_gaps(
+        self, metal: str, symbol: str, currency: str, series, start: date, end: date,
+    ) -> None:
+        """Fetch only the days missing from [start, end] (edges and holes) and store them."""
+        for range_start, range_end in series.missing_ranges(start, end):
+            points = await self.fetch_timeframe(metal, currency, range_start, range_end)
+            await self._history.upsert(metal, currency, points, source="metalpriceapi")
+
+    async def _record_spot(self, asset_class: str, currency: str, result: dict) -> None:
+        """Store today's spot price so the local series stays current."""
+        if self._history is None:
+            return
+        price = result.get("price_gbp") if currency == "GBP" else result.get("price_usd")
+        if price:
+            await self._history.upsert(
+                asset_class.lower(), currency, [(date.today(), price)],
+                source=result.get("source", "spot"),
+            )
+
     # ── MetalPriceAPI implementation ───────────────────────────────────────
 
     async def _fetch_metalprice(self, symbol: str, currency: str) -> dict | None:
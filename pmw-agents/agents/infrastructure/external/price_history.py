@@ -0,0 +1,287 @@
+"""
+PriceHistoryStore — local daily price history for PriceClient.
+
+Owns:
+  - The metal_price_history table (one row per metal, currency, day)
+  - An in-memory NumPy series per (metal, currency), loaded once per process
+    and kept in step with every upsert
+  - Gap detection (missing edges and interior holes) so PriceClient only
+    asks the API for missing days
+  - PriceSeries: trend %, high, low, volatility and moving averages over
+    any window
+
+Does NOT own:
+  - Fetching prices from APIs — PriceClient does that
+  - The bulk historical load — db/seeds/backfill_price_history.py
+
+Usage (from PriceClient.get_historical):
+    series = await self._history.window("gold", "GBP", days=30)
+    series.trend_pct(), series.high(), series.volatility_pct()
+    series.moving_average(7)[-1]
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from typing import Iterable
+
+import numpy as np
+
+log = logging.getLogger("pmw.infra.price_history")
+
+# A window edge may be this many days from the nearest stored price and
+# still count as covered. Markets close at weekends and on bank holidays.
+EDGE_TOLERANCE_DAYS = 4
+
+# Share of a window's weekdays that must have a stored price for the window
+# to count as covered — leaves room for bank holidays, not for sparse data.
+MIN_WEEKDAY_DENSITY = 0.8
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+class PriceSeries:
+    """Immutable daily price series — dates (datetime64[D]) and prices (float64)."""
+
+    __slots__ = ("dates", "prices")
+
+    def __init__(self, dates: np.ndarray, prices: np.ndarray) -> None:
+        self.dates = dates
+        self.prices = prices
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        return cls(np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64))
+
+    @classmethod
+    def from_points(cls, points: Iterable[tuple[date, float]]) -> "PriceSeries":
+        pts = sorted(points)
+        if not pts:
+            return cls.empty()
+        return cls(
+            np.array([p[0] for p in pts], dtype="datetime64[D]"),
+            np.array([float(p[1]) for p in pts], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    # ── Slicing / merging ──────────────────────────────────────────────────
+
+    def between(self, start: date, end: date) -> "PriceSeries":
+        """Points with start <= date <= end (binary search, no copy of the data)."""
+        lo = np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        return PriceSeries(self.dates[lo:hi], self.prices[lo:hi])
+
+    def merge(self, other: "PriceSeries") -> "PriceSeries":
+        """Union of two series; on duplicate dates `other` wins."""
+        if not len(other):
+            return self
+        dates = np.concatenate([other.dates, self.dates])
+        prices = np.concatenate([other.prices, self.prices])
+        # np.unique keeps the first occurrence — i.e. the value from `other`
+        dates, idx = np.unique(dates, return_index=True)
+        return PriceSeries(dates, prices[idx])
+
+    def first_date(self) -> date | None:
+        return self.dates[0].astype(date) if len(self) else None
+
+    def last_date(self) -> date | None:
+        return self.dates[-1].astype(date) if len(self) else None
+
+    def covers(self, start: date, end: date) -> bool:
+        """
+        True if stored prices reach both edges of [start, end], leave no
+        hole longer than EDGE_TOLERANCE_DAYS, and price at least
+        MIN_WEEKDAY_DENSITY of the window's weekdays.
+        """
+        window = self.between(start, end)
+        if len(window) < 2:
+            return False
+        tol = timedelta(days=EDGE_TOLERANCE_DAYS)
+        if window.first_date() > start + tol or window.last_date() < end - tol:
+            return False
+        if int(np.diff(window.dates).astype(int).max()) > EDGE_TOLERANCE_DAYS:
+            return False
+        return len(window) >= MIN_WEEKDAY_DENSITY * _weekdays(start, end)
+
+    def missing_ranges(self, start: date, end: date) -> list[tuple[date, date]]:
+        """
+        Date ranges inside [start, end] to fetch so the window is complete:
+        each missing edge, plus one span over every interior hole that
+        skips a weekday (one request rather than one per hole).
+        """
+        window = self.between(start, end)
+        if not len(window):
+            return [(start, end)]
+        first, last = window.first_date(), window.last_date()
+        ranges = []
+        if first > start:
+            ranges.append((start, first - timedelta(days=1)))
+
+        holes = [
+            (a.astype(date) + timedelta(days=1), b.astype(date) - timedelta(days=1))
+            for a, b in zip(window.dates[:-1], window.dates[1:])
+            if _weekdays(a.astype(date) + timedelta(days=1), b.astype(date) - timedelta(days=1))
+        ]
+        if holes:
+            ranges.append((holes[0][0], holes[-1][1]))
+
+        if last < end:
+            ranges.append((last + timedelta(days=1), end))
+        return ranges
+
+    def gaps(self, start: date, end: date) -> list[tuple[date, date]]:
+        """
+        Each run of more than EDGE_TOLERANCE_DAYS days in [start, end]
+        with no stored price, edges included — real holes, not weekends
+        or bank holidays. Used by the bulk backfill, which must find the
+        history missing before a few recent spot prices.
+        """
+        window = self.between(start, end)
+        if not len(window):
+            return [(start, end)]
+        bounds = np.concatenate([
+            [np.datetime64(start - timedelta(days=1), "D")],
+            window.dates,
+            [np.datetime64(end + timedelta(days=1), "D")],
+        ])
+        return [
+            (a.astype(date) + timedelta(days=1), b.astype(date) - timedelta(days=1))
+            for a, b in zip(bounds[:-1], bounds[1:])
+            if int((b - a).astype(int)) - 1 > EDGE_TOLERANCE_DAYS
+        ]
+
+    # ── Statistics ─────────────────────────────────────────────────────────
+
+    def trend_pct(self) -> float | None:
+        if len(self) < 2 or self.prices[0] == 0:
+            return None
+        return round(float((self.prices[-1] - self.prices[0]) / self.prices[0] * 100), 2)
+
+    def high(self) -> float | None:
+        return round(float(self.prices.max()), 2) if len(self) else None
+
+    def low(self) -> float | None:
+        return round(float(self.prices.min()), 2) if len(self) else None
+
+    def volatility_pct(self, annualise: bool = True) -> float | None:
+        """Standard deviation of daily log returns, in percent."""
+        if len(self) < 3:
+            return None
+        returns = np.diff(np.log(self.prices))
+        vol = float(np.std(returns, ddof=1))
+        if annualise:
+            vol *= np.sqrt(TRADING_DAYS_PER_YEAR)
+        return round(vol * 100, 2)
+
+    def moving_average(self, window: int) -> np.ndarray:
+        """Simple moving average over `window` points (empty if too short)."""
+        if window <= 0 or len(self) < window:
+            return np.array([], dtype=np.float64)
+        csum = np.cumsum(np.insert(self.prices, 0, 0.0))
+        return (csum[window:] - csum[:-window]) / window
+
+    def trend_summary(self, days: int) -> dict:
+        """The get_historical() result shape, plus series-only statistics."""
+        ma_7 = self.moving_average(7)
+        ma_30 = self.moving_average(30)
+        return {
+            "trend_pct":      self.trend_pct(),
+            "period_days":    days,
+            "start_price":    round(float(self.prices[0]), 2) if len(self) else None,
+            "end_price":      round(float(self.prices[-1]), 2) if len(self) else None,
+            "high":           self.high(),
+            "low":            self.low(),
+            "volatility_pct": self.volatility_pct(),
+            "ma_7":           round(float(ma_7[-1]), 2) if len(ma_7) else None,
+            "ma_30":          round(float(ma_30[-1]), 2) if len(ma_30) else None,
+            "data_points":    len(self),
+            "source":         "local",
+        }
+
+
+def _weekdays(start: date, end: date) -> int:
+    """Weekdays in [start, end] inclusive."""
+    if end < start:
+        return 0
+    return int(np.busday_count(np.datetime64(start, "D"), np.datetime64(end, "D") + 1))
+
+
+class PriceHistoryStore:
+    """Postgres-backed daily prices with an in-process NumPy cache."""
+
+    def __init__(self, postgres=None) -> None:
+        self._postgres = postgres
+        self._series: dict[tuple[str, str], PriceSeries] = {}
+
+    async def series(self, metal: str, currency: str) -> PriceSeries:
+        """Full stored series for a metal/currency (loaded from Postgres once)."""
+        key = (metal.lower(), currency.upper())
+        cached = self._series.get(key)
+        if cached is not None:
+            return cached
+        try:
+            rows = await self._postgres.fetch(
+                """
+                SELECT price_date, price FROM metal_price_history
+                WHERE metal = $1 AND currency = $2
+                ORDER BY price_date
+                """,
+                key[0], key[1],
+            )
+            series = PriceSeries.from_points((r["price_date"], float(r["price"])) for r in rows)
+        except Exception as exc:
+            # Not cached — the next call retries the load
+            log.warning(f"Price history load failed for {key}: {exc}")
+            return PriceSeries.empty()
+        self._series[key] = series
+        return series
+
+    async def window(
+        self, metal: str, currency: str, days: int, end: date | None = None,
+    ) -> PriceSeries:
+        end = end or date.today()
+        return (await self.series(metal, currency)).between(end - timedelta(days=days), end)
+
+    async def latest_date(self, metal: str, currency: str) -> date | None:
+        return (await self.series(metal, currency)).last_date()
+
+    async def upsert(
+        self,
+        metal: str,
+        currency: str,
+        points: list[tuple[date, float]],
+        source: str,
+    ) -> int:
+        """Insert or update daily prices; returns the number of points written."""
+        if not points:
+            return 0
+        key = (metal.lower(), currency.upper())
+        try:
+            await self._postgres.executemany(
+                """
+                INSERT INTO metal_price_history (metal, currency, price_date, price, source)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (metal, currency, price_date)
+                DO UPDATE SET price = EXCLUDED.price, source = EXCLUDED.source,
+                              fetched_at = NOW()
+                """,
+                [(key[0], key[1], d, float(p), source) for d, p in points],
+            )
+        except Exception as exc:
+            log.warning(f"Price history upsert failed for {key}: {exc}")
+            return 0
+
+        if key in self._series:
+            self._series[key] = self._series[key].merge(PriceSeries.from_points(points))
+        return len(points)
+
+    def invalidate(self, metal: str | None = None, currency: str | None = None) -> None:
+        """Drop cached series so the next read reloads from Postgres."""
+        if metal is None:
+            self._series.clear()
+            return
+        self._series.pop((metal.lower(), (currency or "").upper()), None)
@@ -3,6 +3,11 @@ RedditClient — Reddit JSON API transport for community sentiment research.
 
 Owns:
   - Reddit JSON API requests via the shared HTTPClient
+  - Politeness towards reddit.com: at most max_concurrency requests in
+    flight and request starts spaced min_interval apart, across every
+    caller in the worker
+  - Concurrent multi-subreddit search, deduplicated by post ID
+  - Optional comment expansion for the highest-scoring posts
   - Subreddit allow-list enforcement (PMW approved subs only)
   - Response parsing to clean dicts
 
@@ -12,6 +17,8 @@ Does NOT own:
 
 Services use:
     posts = await infra.reddit.search("gold IRA reviews", subreddits=["personalfinance"])
+    posts = await infra.reddit.search("gold ISA", subreddits=[...], expand_comments=3)
+    posts[0]["top_comments"]   # [{"id", "body", "score", "created_utc"}, ...]
     top   = await infra.reddit.top_posts("Silverbugs", limit=10)
 
 Approved subreddits (precious metals + UK personal finance only):
@@ -21,8 +28,13 @@ Approved subreddits (precious metals + UK personal finance only):
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from infrastructure.http.single_flight import SingleFlight
 
 log = logging.getLogger("pmw.infra.reddit")
 
@@ -51,8 +63,21 @@ class RedditClient:
     No OAuth — uses the public `.json` endpoint which is free and unauthenticated.
     """
 
-    def __init__(self, http=None) -> None:
+    def __init__(
+        self,
+        http=None,
+        max_concurrency: int = 4,
+        min_interval: float = 0.25,
+    ) -> None:
         self._http = http   # HTTPClient — injected by Infrastructure
+        # Concurrent briefs running the same search share one set of requests
+        self.flights = SingleFlight("reddit")
+        self._max_concurrency = max(1, max_concurrency)
+        self._min_interval = min_interval
+        # Created on first use, inside the worker's event loop
+        self._slots: asyncio.Semaphore | None = None
+        self._spacing: asyncio.Lock | None = None
+        self._next_start = 0.0
 
     def set_http(self, http) -> None:
         """Called by Infrastructure after HTTPClient is connected."""
@@ -66,6 +91,26 @@ class RedditClient:
             )
         return self._http
 
+    @asynccontextmanager
+    async def _polite(self) -> AsyncIterator[None]:
+        """Hold a reddit.com request slot, starting no sooner than min_interval after the last."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_concurrency)
+            self._spacing = asyncio.Lock()
+        async with self._slots:
+            async with self._spacing:
+                wait = self._next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = time.monotonic() + self._min_interval
+            yield
+
+    async def _get_json(self, url: str, params: dict[str, Any]) -> Any:
+        http = self._require_http()
+        async with self._polite():
+            resp = await http.get(url, params=params, headers={"User-Agent": USER_AGENT})
+        return resp.json()
+
     def _validate_subreddit(self, sub: str) -> str:
         """Raise if sub is not in the approved list."""
         if sub not in ALLOWED_SUBREDDITS:
@@ -100,10 +145,15 @@ class RedditClient:
         sort: str = "relevance",
         time_filter: str = "year",
         limit: int = 5,
+        expand_comments: int = 0,
+        comments_per_post: int = 5,
     ) -> list[dict[str, Any]]:
         """
         Search across one or more subreddits for posts matching `query`.
 
+        Subreddits are fetched concurrently (within the politeness limits),
+        so the search takes about as long as the slowest subreddit.
+
         Args:
             query:       Search string
             subreddits:  List of subreddits to search. Defaults to the PMW
@@ -111,44 +161,96 @@ class RedditClient:
             sort:        Reddit sort: "relevance" | "new" | "top" | "comments"
             time_filter: "hour" | "day" | "week" | "month" | "year" | "all"
             limit:       Results per subreddit (max 25)
+            expand_comments:   Attach "top_comments" to this many of the
+                               highest-scoring posts (0 = none)
+            comments_per_post: Max comments fetched per expanded post
 
         Returns:
-            Flat list of post dicts sorted by score descending.
+            Flat list of post dicts, one per post ID, sorted by score descending.
         """
-        http = self._require_http()
-
         # Default subreddits — the three most relevant for PMW content
         if not subreddits:
             subreddits = ["Gold", "PreciousMetals", "UKPersonalFinance"]
 
-        headers = {"User-Agent": USER_AGENT}
-        all_posts: list[dict] = []
+        posts = await self.flights.do(
+            (
+                "search", " ".join(query.lower().split()), tuple(subreddits),
+                sort, time_filter, limit, expand_comments, comments_per_post,
+            ),
+            lambda: self._search(query, subreddits, sort, time_filter, limit, expand_comments, comments_per_post),
+        )
+        return [_copy_post(p) for p in posts]
 
+    async def _search(
+        self,
+        query: str,
+        subreddits: list[str],
+        sort: str,
+        time_filter: str,
+        limit: int,
+        expand_comments: int,
+        comments_per_post: int,
+    ) -> list[dict[str, Any]]:
+        self._require_http()
         for sub in subreddits:
             self._validate_subreddit(sub)
-            url = f"{REDDIT_BASE}/r/{sub}/search.json"
-            params = {
-                "q":          query,
-                "restrict_sr": 1,
-                "sort":       sort,
-                "t":          time_filter,
-                "limit":      min(limit, 25),
-            }
-            try:
-                resp = await http.get(url, params=params, headers=headers)
-                children = resp.json().get("data", {}).get("children", [])
-                all_posts.extend(self._parse_post(c) for c in children)
-                log.debug(f"Reddit r/{sub}: {len(children)} results for '{query}'")
-            except Exception as exc:
-                log.warning(
-                    f"Reddit r/{sub} fetch failed",
-                    extra={"query": query, "error": str(exc)},
-                )
+
+        results = await asyncio.gather(
+            *(self._search_subreddit(sub, query, sort, time_filter, limit) for sub in dict.fromkeys(subreddits))
+        )
+
+        # Crossposts and repeated subreddits can return the same post twice
+        by_id: dict[str, dict] = {}
+        for post in (p for sub_posts in results for p in sub_posts):
+            key = post["id"] or post["url"]
+            if key not in by_id or post["score"] > by_id[key]["score"]:
+                by_id[key] = post
 
         # Sort by score so highest-signal posts come first
-        all_posts.sort(key=lambda p: p["score"], reverse=True)
+        all_posts = sorted(by_id.values(), key=lambda p: p["score"], reverse=True)
+
+        if expand_comments > 0:
+            await self._expand_comments(all_posts[:expand_comments], comments_per_post)
         return all_posts
 
+    async def _search_subreddit(
+        self,
+        sub: str,
+        query: str,
+        sort: str,
+        time_filter: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        url = f"{REDDIT_BASE}/r/{sub}/search.json"
+        params = {
+            "q":          query,
+            "restrict_sr": 1,
+            "sort":       sort,
+            "t":          time_filter,
+            "limit":      min(limit, 25),
+        }
+        try:
+            data = await self._get_json(url, params)
+            children = data.get("data", {}).get("children", [])
+            log.debug(f"Reddit r/{sub}: {len(children)} results for '{query}'")
+            return [self._parse_post(c) for c in children]
+        except Exception as exc:
+            log.warning(
+                f"Reddit r/{sub} fetch failed",
+                extra={"query": query, "error": str(exc)},
+            )
+            return []
+
+    async def _expand_comments(self, posts: list[dict[str, Any]], comments_per_post: int) -> None:
+        """Attach "top_comments" to each post (in place), fetched concurrently."""
+        expandable = [p for p in posts if p["id"] and p["subreddit"] in ALLOWED_SUBREDDITS]
+        comments = await asyncio.gather(
+            *(self.post_comments(p["subreddit"], p["id"], limit=comments_per_post) for p in expandable)
+        )
+        for post, post_comments in zip(expandable, comments):
+            post_comments.sort(key=lambda c: c["score"], reverse=True)
+            post["top_comments"] = post_comments[:comments_per_post]
+
     async def top_posts(
         self,
         subreddit: str,
@@ -166,16 +268,15 @@ class RedditClient:
         Returns:
             List of post dicts sorted by score descending.
         """
-        http = self._require_http()
+        self._require_http()
         self._validate_subreddit(subreddit)
 
         url = f"{REDDIT_BASE}/r/{subreddit}/top.json"
         params = {"t": time_filter, "limit": min(limit, 25)}
-        headers = {"User-Agent": USER_AGENT}
 
         try:
-            resp = await http.get(url, params=params, headers=headers)
-            children = resp.json().get("data", {}).get("children", [])
+            data = await self._get_json(url, params)
+            children = data.get("data", {}).get("children", [])
             return [self._parse_post(c) for c in children]
         except Exception as exc:
             log.error(
@@ -203,16 +304,14 @@ class RedditClient:
         Returns:
             List of comment dicts with keys: id, body, score, created_utc
         """
-        http = self._require_http()
+        self._require_http()
         self._validate_subreddit(subreddit)
 
         url = f"{REDDIT_BASE}/r/{subreddit}/comments/{post_id}.json"
         params = {"limit": min(limit, 50)}
-        headers = {"User-Agent": USER_AGENT}
 
         try:
-            resp = await http.get(url, params=params, headers=headers)
-            data = resp.json()
+            data = await self._get_json(url, params)
             # Reddit returns [post_listing, comment_listing]
             if not isinstance(data, list) or len(data) < 2:
                 return []
@@ -233,4 +332,12 @@ class RedditClient:
                 "Reddit comments fetch failed",
                 extra={"subreddit": subreddit, "post_id": post_id, "error": str(exc)},
             )
-            return []
\ No newline at end of file
+            return []
+
+
+def _copy_post(post: dict[str, Any]) -> dict[str, Any]:
+    """A caller-owned copy — coalesced callers must not share mutable dicts."""
+    copy = dict(post)
+    if "top_comments" in copy:
+        copy["top_comments"] = [dict(c) for c in copy["top_comments"]]
+    return copy
@@ -10,8 +10,15 @@ Does NOT own:
   - HTTP connection management (HTTPClient owns that)
   - Business logic — callers decide what to do with results
 
+  - SerpSnapshot cache — one paid SerpAPI request per (query, gl, hl, num),
+    shared by every caller (Stage 2 keyword research, Stage 5 competitor
+    analysis) until the snapshot expires
+
 Services use:
     results = await infra.serp.search("best gold IRA UK", gl="uk", hl="en")
+    snap    = await infra.serp.snapshot("best gold ISA UK", gl="uk")
+    organic = snap.organic_results()
+    paa     = snap.people_also_ask()
     organic = await infra.serp.organic_results("buy gold bullion UK")
     paa     = await infra.serp.people_also_ask("gold price today")
 """
@@ -20,12 +27,75 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
+from infrastructure.http.single_flight import SingleFlight
+
 log = logging.getLogger("pmw.infra.serp")
 
 SERP_API_BASE = "https://serpapi.com/search"
 
+# Snapshots live long enough to cover one pipeline cycle (stages 2 and 5 of
+# every brief) but not so long that rankings go stale between cycles.
+DEFAULT_SNAPSHOT_TTL_SECS = 900
+DEFAULT_SNAPSHOT_MAX_ENTRIES = 256
+
+
+@dataclass
+class SerpSnapshot:
+    """
+    One raw SerpAPI response, parsed into section views on demand.
+
+    The raw JSON is fetched exactly once; organic_results(),
+    people_also_ask() and related_searches() are cheap, pure views over it.
+    """
+    query:      str
+    gl:         str
+    hl:         str
+    num:        int
+    raw:        dict[str, Any]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.monotonic() - self.fetched_at
+
+    def organic_results(self) -> list[dict[str, Any]]:
+        """Organic results as dicts with position, title, link, snippet, displayed_link."""
+        return [
+            {
+                "position":       r.get("position"),
+                "title":          r.get("title", ""),
+                "link":           r.get("link", ""),
+                "snippet":        r.get("snippet", ""),
+                "displayed_link": r.get("displayed_link", ""),
+            }
+            for r in self.raw.get("organic_results", [])
+        ]
+
+    def people_also_ask(self) -> list[dict[str, Any]]:
+        """People Also Ask items as dicts with question, snippet, title, link."""
+        return [
+            {
+                "question": r.get("question", ""),
+                "snippet":  r.get("snippet", ""),
+                "title":    r.get("title", ""),
+                "link":     r.get("link", ""),
+            }
+            for r in self.raw.get("related_questions", [])
+        ]
+
+    def related_searches(self) -> list[str]:
+        """Related search queries as a plain list of strings."""
+        return [
+            r.get("query", "")
+            for r in self.raw.get("related_searches", [])
+            if r.get("query")
+        ]
+
 
 class SerpClient:
     """
@@ -36,9 +106,16 @@ class SerpClient:
         self,
         http=None,                     # HTTPClient — injected by Infrastructure
         api_key: str | None = None,
+        snapshot_ttl: float = DEFAULT_SNAPSHOT_TTL_SECS,
+        snapshot_max_entries: int = DEFAULT_SNAPSHOT_MAX_ENTRIES,
     ) -> None:
         self._http = http
         self._api_key = api_key or os.environ.get("SERP_API_KEY", "")
+        self._snapshot_ttl = snapshot_ttl
+        self._snapshot_max_entries = snapshot_max_entries
+        # key → completed snapshot (LRU order); in-flight fetches coalesce in flights
+        self._snapshots: OrderedDict[tuple, SerpSnapshot] = OrderedDict()
+        self.flights = SingleFlight("serp")
 
     def set_http(self, http) -> None:
         """Called by Infrastructure after HTTPClient is connected."""
@@ -104,6 +181,55 @@ class SerpClient:
             log.error("SerpAPI search failed", extra={"query": query, "error": str(exc)})
             raise
 
+    # ── Snapshots ──────────────────────────────────────────────────────────
+
+    async def snapshot(
+        self,
+        query: str,
+        gl: str = "uk",
+        hl: str = "en",
+        num: int = 10,
+        refresh: bool = False,
+    ) -> SerpSnapshot:
+        """
+        Return a SerpSnapshot for (query, gl, hl, num), fetching at most once.
+
+        Concurrent callers for the same key await the same in-flight request,
+        and later callers reuse the cached snapshot until it is older than
+        the snapshot TTL. Failed fetches are never cached.
+
+        Usage:
+            snap = await infra.serp.snapshot("best gold ISA UK", gl="uk")
+            organic = snap.organic_results()
+            paa     = snap.people_also_ask()
+        """
+        key = (query.strip().lower(), gl, hl, num)
+
+        if not refresh:
+            cached = self._snapshots.get(key)
+            if cached is not None and cached.age() < self._snapshot_ttl:
+                self._snapshots.move_to_end(key)
+                log.debug("SerpAPI snapshot hit", extra={"query": query})
+                return cached
+
+        async def fetch() -> SerpSnapshot:
+            raw = await self.search(query, gl=gl, hl=hl, num=num)
+            snap = SerpSnapshot(query=query, gl=gl, hl=hl, num=num, raw=raw)
+            self._store_snapshot(key, snap)
+            return snap
+
+        return await self.flights.do(key, fetch)
+
+    def clear_snapshots(self) -> None:
+        """Drop every cached snapshot (in-flight fetches are unaffected)."""
+        self._snapshots.clear()
+
+    def _store_snapshot(self, key: tuple, snap: SerpSnapshot) -> None:
+        self._snapshots[key] = snap
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self._snapshot_max_entries:
+            self._snapshots.popitem(last=False)
+
     # ── Parsed helpers ─────────────────────────────────────────────────────
 
     async def organic_results(
@@ -124,18 +250,8 @@ class SerpClient:
             for r in results:
                 print(r["position"], r["title"], r["link"])
         """
-        raw = await self.search(query, gl=gl, hl=hl, num=num)
-        items = raw.get("organic_results", [])
-        return [
-            {
-                "position":       r.get("position"),
-                "title":          r.get("title", ""),
-                "link":           r.get("link", ""),
-                "snippet":        r.get("snippet", ""),
-                "displayed_link": r.get("displayed_link", ""),
-            }
-            for r in items
-        ]
+        snap = await self.snapshot(query, gl=gl, hl=hl, num=num)
+        return snap.organic_results()
 
     async def people_also_ask(
         self,
@@ -154,17 +270,8 @@ class SerpClient:
             for item in paa:
                 print(item["question"])
         """
-        raw = await self.search(query, gl=gl, hl=hl, num=10)
-        items = raw.get("related_questions", [])
-        return [
-            {
-                "question": r.get("question", ""),
-                "snippet":  r.get("snippet", ""),
-                "title":    r.get("title", ""),
-                "link":     r.get("link", ""),
-            }
-            for r in items
-        ]
+        snap = await self.snapshot(query, gl=gl, hl=hl, num=10)
+        return snap.people_also_ask()
 
     async def related_searches(
         self,
@@ -177,9 +284,5 @@ class SerpClient:
 
         Returns a plain list of query strings.
         """
-        raw = await self.search(query, gl=gl, hl=hl, num=10)
-        return [
-            r.get("query", "")
-            for r in raw.get("related_searches", [])
-            if r.get("query")
-        ]
\ No newline at end of file
+        snap = await self.snapshot(query, gl=gl, hl=hl, num=10)
+        return snap.related_searches()
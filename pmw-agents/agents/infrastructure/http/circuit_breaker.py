@@ -0,0 +1,218 @@
+"""
+CircuitBreaker — per-host fail-fast for HTTPClient.
+
+Owns:
+  - One breaker per host: closed → open → half-open → closed
+  - Opening on a rolling window's error rate, or on its p95 latency once
+    the window holds enough calls for a p95 to mean something
+  - Half-open probing: after open_secs a single request is let through;
+    success closes the breaker, failure re-opens it
+  - Per-host policies (thresholds and the default deadline budget)
+  - State reporting for monitoring
+
+Does NOT own:
+  - Classifying responses — HTTPClient records transport errors, timeouts,
+    5xx and (unless the host's policy says otherwise) 429 as failures;
+    other 4xx are the caller's problem, not the host's
+  - Retrying — callers already fall back to empty results on errors
+
+A failing optional source (MSE, Reddit, a price API) then costs every brief
+one immediate CircuitOpenError instead of a full timeout.
+
+Usage (from HTTPClient):
+    breaker = breakers.get(host)
+    if not breaker.allow():
+        raise CircuitOpenError(host, breaker.retry_in())
+    ...
+    breaker.record(ok, latency_secs)
+    breakers.stats()     # {"www.reddit.com": {"state": "open", ...}}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, fields, replace
+
+log = logging.getLogger("pmw.infra.http.breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host} — retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    error_rate:        float = 0.5          # open when ≥ this share of the window failed
+    slow_p95_secs:     float | None = 8.0   # … or when the window's p95 latency reaches this (None: never)
+    min_calls:         int = 5              # no error-rate verdict on fewer calls than this
+    min_latency_calls: int = 20             # no p95 verdict on fewer calls than this
+    window:            int = 20             # most recent calls considered
+    window_secs:       float = 300.0        # … and only those this recent
+    open_secs:         float = 30.0         # how long to fail fast before probing
+    deadline_secs:     float | None = None  # default per-call budget for this host
+    count_429:         bool = True          # a 429 counts as a host failure
+
+
+# Optional research sources: a slow answer is worth less than a fast empty one.
+# Core paid APIs (SerpAPI, the price APIs) are slow by nature and answer 429
+# for quota, not ill health — only repeated errors open their breakers.
+DEFAULT_HOST_POLICIES: dict[str, dict] = {
+    "forums.moneysavingexpert.com": {"deadline_secs": 8.0},
+    "www.reddit.com":               {"deadline_secs": 8.0},
+    "news.google.com":              {"deadline_secs": 8.0},
+    "serpapi.com":                  {"slow_p95_secs": None, "count_429": False, "min_calls": 10},
+    "api.metalpriceapi.com":        {"slow_p95_secs": None, "count_429": False},
+    "www.goldapi.io":               {"slow_p95_secs": None, "count_429": False},
+}
+
+
+class CircuitBreaker:
+
+    def __init__(self, host: str, policy: BreakerPolicy) -> None:
+        self.host = host
+        self.policy = policy
+        self.state = CLOSED
+        # (finished_at, ok, latency_secs)
+        self._calls: deque[tuple[float, bool, float]] = deque(maxlen=policy.window)
+        self._opened_at = 0.0
+        self._probing = False
+        self.opens = 0
+        self.rejected = 0
+
+    # ── Gate ───────────────────────────────────────────────────────────────
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (counts a rejection if not)."""
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.policy.open_secs:
+            self.state = HALF_OPEN
+            self._probing = False
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.policy.open_secs - (time.monotonic() - self._opened_at))
+
+    # ── Outcomes ───────────────────────────────────────────────────────────
+
+    def record(self, ok: bool, latency: float) -> None:
+        if self.state == HALF_OPEN:
+            self._probing = False
+            if ok and not self._slow(latency):
+                self._close()
+            else:
+                self._open(f"probe {'slow' if ok else 'failed'} ({latency:.1f}s)")
+            return
+
+        self._calls.append((time.monotonic(), ok, latency))
+        if self.state == CLOSED:
+            error_rate, p95, n = self._window()
+            if n >= self.policy.min_calls and error_rate >= self.policy.error_rate:
+                self._open(f"error rate {error_rate:.0%} over {n} calls")
+            elif n >= self.policy.min_latency_calls and self._slow(p95):
+                self._open(f"p95 latency {p95:.1f}s over {n} calls")
+
+    def _slow(self, latency: float) -> bool:
+        return self.policy.slow_p95_secs is not None and latency >= self.policy.slow_p95_secs
+
+    def abandon(self) -> None:
+        """A permitted request ended without a verdict (e.g. cancelled)."""
+        if self.state == HALF_OPEN:
+            self._probing = False
+
+    def _open(self, reason: str) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self.opens += 1
+        log.warning(f"Circuit opened for {self.host}: {reason}")
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self._calls.clear()
+        log.info(f"Circuit closed for {self.host}: probe succeeded")
+
+    def _window(self) -> tuple[float, float, int]:
+        """(error rate, p95 latency, call count) over the recent window."""
+        cutoff = time.monotonic() - self.policy.window_secs
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+        n = len(self._calls)
+        if not n:
+            return 0.0, 0.0, 0
+        failures = sum(1 for _, ok, _ in self._calls if not ok)
+        latencies = sorted(latency for _, _, latency in self._calls)
+        return failures / n, latencies[math.ceil(0.95 * n) - 1], n
+
+    def snapshot(self) -> dict:
+        error_rate, p95, n = self._window()
+        return {
+            "state":      self.state,
+            "calls":      n,
+            "error_rate": round(error_rate, 3),
+            "p95_secs":   round(p95, 3),
+            "opens":      self.opens,
+            "rejected":   self.rejected,
+            "retry_in":   round(self.retry_in(), 1),
+        }
+
+
+class BreakerRegistry:
+    """Breakers created on first use per host, each with its host's policy."""
+
+    def __init__(
+        self,
+        default: BreakerPolicy | None = None,
+        host_policies: dict[str, dict] | None = None,
+    ) -> None:
+        self.default = default or BreakerPolicy()
+        self._overrides = {**DEFAULT_HOST_POLICIES, **(host_policies or {})}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_json(cls, host_policies: str = "", **default_kwargs) -> "BreakerRegistry":
+        """Build with per-host overrides from a JSON string (settings)."""
+        overrides: dict[str, dict] = {}
+        if host_policies:
+            try:
+                known = {f.name for f in fields(BreakerPolicy)}
+                overrides = {
+                    str(host): {k: v for k, v in policy.items() if k in known}
+                    for host, policy in json.loads(host_policies).items()
+                }
+            except (ValueError, AttributeError, TypeError) as exc:
+                log.warning(f"Ignoring invalid HTTP_BREAKER_HOST_POLICIES: {exc}")
+        return cls(default=BreakerPolicy(**default_kwargs), host_policies=overrides)
+
+    def get(self, host: str) -> CircuitBreaker:
+        host = (host or "").lower()
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            policy = replace(self.default, **self._overrides.get(host, {}))
+            breaker = self._breakers[host] = CircuitBreaker(host, policy)
+        return breaker
+
+    def stats(self) -> dict[str, dict]:
+        """Per-host breaker state, for monitoring / end-of-cycle logging."""
+        return {host: b.snapshot() for host, b in sorted(self._breakers.items())}
+
+    def open_hosts(self) -> list[str]:
+        return [host for host, b in self._breakers.items() if b.state != CLOSED]
@@ -5,6 +5,16 @@ Owns:
   - A single persistent httpx.AsyncClient (connection-pooling, keep-alive)
   - Default headers, timeouts, and retry transport
   - Convenience get/post helpers
+  - Opt-in response caching for GETs (get(..., cache=True)): fresh entries
+    are served locally, expired ones revalidated with If-None-Match /
+    If-Modified-Since so unchanged pages come back as 304s
+  - Coalescing identical concurrent GETs (SingleFlight) — concurrent
+    briefs asking for the same URL share one request
+  - Per-host circuit breakers (BreakerRegistry): a host that keeps failing
+    or answering slowly is refused with CircuitOpenError until a half-open
+    probe succeeds; with a cached copy, cache=True GETs get that instead
+  - Deadline budgets: get/post(deadline=…) or the host policy's
+    deadline_secs caps the whole call, retries included
 
 SerpClient, RedditClient, and any future external clients receive
 this client via dependency injection from Infrastructure — they never
@@ -13,15 +23,26 @@ create their own httpx sessions.
 Lifecycle (called by Infrastructure):
     await client.connect()   # startup  — creates the underlying session
     await client.close()     # shutdown — drains and closes the session
+
+Usage:
+    resp = await infra.http.get(url, cache=True)   # HTTPResponseCache, if configured
+    resp = await infra.http.get(url, deadline=5.0)  # httpx.TimeoutException after 5s
+    infra.http.stats()                             # {"cache": {...}, "coalesced": {...}, "breakers": {...}}
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import httpx
 
+from infrastructure.http.circuit_breaker import BreakerRegistry, CircuitOpenError
+from infrastructure.http.response_cache import CachedResponse, HTTPResponseCache
+from infrastructure.http.single_flight import SingleFlight
+
 log = logging.getLogger("pmw.infra.http")
 
 # Retry on transient network errors (not 4xx/5xx — callers decide those)
@@ -40,10 +61,16 @@ class HTTPClient:
         self,
         timeout: float = 20.0,
         user_agent: str = "PMW-Agents/1.0",
+        cache: HTTPResponseCache | None = None,
+        breakers: BreakerRegistry | None = None,
     ) -> None:
+        self._timeout_secs = timeout
         self._timeout = httpx.Timeout(timeout, connect=10.0)
         self._user_agent = user_agent
         self._client: httpx.AsyncClient | None = None
+        self.cache = cache
+        self.flights = SingleFlight("http")
+        self.breakers = breakers
 
     # ── Lifecycle ──────────────────────────────────────────────────────────
 
@@ -81,32 +108,187 @@ class HTTPClient:
         url: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        cache: bool = False,
+        coalesce: bool = True,
+        deadline: float | None = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
-        HTTP GET. Raises httpx.HTTPStatusError on 4xx/5xx.
+        HTTP GET. Raises httpx.HTTPStatusError on 4xx/5xx, httpx.TimeoutException
+        when the deadline budget runs out, and CircuitOpenError (without
+        sending anything) while the host's breaker is open.
+
+        cache=True serves / stores the response through HTTPResponseCache
+        (a no-op when no cache is configured). Only use it for pages where
+        a response up to the host's TTL old is acceptable.
+
+        deadline caps the whole call in seconds; it defaults to the host
+        policy's deadline_secs, then to the client timeout.
+
+        Identical concurrent GETs (same URL, params, headers and deadline,
+        no extra httpx kwargs) share one request unless coalesce=False;
+        every caller gets the same response (or the same exception).
 
         Usage:
             resp = await infra.http.get("https://serpapi.com/search", params={...})
             data = resp.json()
         """
-        response = await self._get().get(url, params=params, headers=headers, **kwargs)
+        if coalesce and not kwargs:
+            key = (str(httpx.URL(url, params=params)), tuple(sorted((headers or {}).items())), cache, deadline)
+            return await self.flights.do(key, lambda: self._fetch(url, params, headers, cache, deadline))
+        return await self._fetch(url, params, headers, cache, deadline, **kwargs)
+
+    async def _fetch(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        cache: bool,
+        deadline: float | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        full_url = httpx.URL(url, params=params)
+        if cache and self.cache is not None:
+            return await self._cached_get(full_url, headers, deadline, **kwargs)
+        response = await self._send("GET", full_url, headers, deadline, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def _cached_get(
+        self,
+        full_url: httpx.URL,
+        headers: dict[str, str] | None,
+        deadline: float | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        cache = self.cache
+        ttl = cache.ttl_for(full_url.host)
+        if ttl <= 0:
+            response = await self._send("GET", full_url, headers, deadline, **kwargs)
+            response.raise_for_status()
+            return response
+
+        key = cache.make_key(str(full_url))
+        entry = await cache.get(key)
+        if entry is not None and entry.fresh:
+            cache.hits += 1
+            cache.bytes_saved += len(entry.body)
+            return self._replay(entry, full_url)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        try:
+            response = await self._send("GET", full_url, request_headers, deadline, **kwargs)
+        except (CircuitOpenError, httpx.TransportError) as exc:
+            if entry is None:
+                raise
+            # The host is down — an expired copy beats no page at all
+            cache.stale_served += 1
+            log.info(f"Serving stale cached response for {full_url.host}: {exc}")
+            return self._replay(entry, full_url)
+
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated += 1
+            cache.bytes_saved += len(entry.body)
+            entry = entry.refreshed(response, ttl)
+            await cache.put(key, entry)
+            return self._replay(entry, full_url)
+
         response.raise_for_status()
+        cache.misses += 1
+        if cache.cacheable(response):
+            await cache.put(key, CachedResponse.from_response(str(full_url), response, ttl))
+        else:
+            cache.uncacheable += 1
         return response
 
+    @staticmethod
+    def _replay(entry: CachedResponse, url: httpx.URL) -> httpx.Response:
+        """An httpx.Response rebuilt from a cache entry."""
+        return httpx.Response(
+            status_code=entry.status_code,
+            headers=entry.headers,
+            content=entry.body,
+            request=httpx.Request("GET", url),
+        )
+
     async def post(
         self,
         url: str,
         json: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        deadline: float | None = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
-        HTTP POST. Raises httpx.HTTPStatusError on 4xx/5xx.
+        HTTP POST. Raises httpx.HTTPStatusError on 4xx/5xx; deadline and
+        circuit breaking as for get().
         """
-        response = await self._get().post(
-            url, json=json, data=data, headers=headers, **kwargs
+        response = await self._send(
+            "POST", httpx.URL(url), headers, deadline, json=json, data=data, **kwargs
         )
         response.raise_for_status()
-        return response
\ No newline at end of file
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: httpx.URL,
+        headers: dict[str, str] | None,
+        deadline: float | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """One request through the host's breaker, within its deadline budget."""
+        breaker = self.breakers.get(url.host) if self.breakers is not None else None
+        if breaker is not None:
+            if not breaker.allow():
+                raise CircuitOpenError(url.host, breaker.retry_in())
+            if deadline is None:
+                deadline = breaker.policy.deadline_secs
+        if deadline is not None and "timeout" not in kwargs:
+            budget = min(deadline, self._timeout_secs)
+            kwargs["timeout"] = httpx.Timeout(budget, connect=min(budget, 10.0))
+
+        started = time.monotonic()
+        try:
+            if deadline is None:
+                response = await self._get().request(method, url, headers=headers, **kwargs)
+            else:
+                # httpx timeouts are per phase; this bounds the whole call
+                async with asyncio.timeout(deadline):
+                    response = await self._get().request(method, url, headers=headers, **kwargs)
+        except (httpx.TransportError, TimeoutError) as exc:
+            if breaker is not None:
+                breaker.record(False, time.monotonic() - started)
+            if isinstance(exc, TimeoutError):
+                raise httpx.TimeoutException(
+                    f"{method} {url.host}: deadline of {deadline}s exceeded"
+                ) from exc
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.abandon()
+            raise
+
+        if breaker is not None:
+            failed = response.status_code >= 500 or (
+                response.status_code == 429 and breaker.policy.count_429
+            )
+            breaker.record(not failed, time.monotonic() - started)
+        return response
+
+    # ── Reporting ──────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Counters for monitoring / end-of-cycle logging."""
+        return {
+            "cache":     self.cache.stats() if self.cache is not None else None,
+            "coalesced": self.flights.stats(),
+            "breakers":  self.breakers.stats() if self.breakers is not None else None,
+        }
@@ -0,0 +1,380 @@
+"""
+HTTPResponseCache — opt-in cache of GET responses for HTTPClient.
+
+Owns:
+  - Cache keys (method + full URL including query params)
+  - Per-host freshness TTLs (exact host, then parent domains, then "*")
+  - Tier 1: in-process LRU, bounded by entry count and total bytes
+  - Tier 2: Redis (shared across workers) or a local directory, both
+    bounded by a per-entry size cap; the directory is also LRU-evicted
+    to a total byte budget
+  - Keeping ETag / Last-Modified so expired entries can be revalidated
+  - Hit / revalidation / miss counters for monitoring
+
+Does NOT own:
+  - The request itself or If-None-Match / If-Modified-Since headers —
+    HTTPClient.get(cache=True) does that
+  - Deciding which calls are cacheable — callers opt in per request
+
+An entry is fresh for its host's TTL. After that it is kept for
+`stale_secs` more so a conditional GET can turn it into a 304 instead of
+a full download — or, while the host is down, be served as is.
+
+Usage (from HTTPClient):
+    entry = await cache.get(key)
+    if entry and entry.fresh: ...
+    await cache.put(key, CachedResponse.from_response(url, resp, ttl))
+
+Never raises — a cache failure degrades to a normal fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+log = logging.getLogger("pmw.infra.http_cache")
+
+KEY_PREFIX = "pmw:http:resp:"
+
+# Freshness per host (seconds). Scraped pages change slowly; news feeds don't.
+DEFAULT_HOST_TTLS: dict[str, int] = {
+    "news.google.com":               900,
+    "forums.moneysavingexpert.com":  3_600,
+    "*":                             6 * 3_600,
+}
+
+# Response headers worth replaying on a hit (the body is stored decoded)
+_KEPT_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "date")
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    expires_at: float                       # wall clock — shared across workers
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @classmethod
+    def from_response(cls, url: str, response, ttl: int) -> "CachedResponse":
+        return cls(
+            url=url,
+            status_code=response.status_code,
+            headers={k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+            body=response.content,
+            expires_at=time.time() + ttl,
+        )
+
+    def refreshed(self, response, ttl: int) -> "CachedResponse":
+        """This entry after a 304 — new expiry, validators updated if sent."""
+        headers = dict(self.headers)
+        for k in ("etag", "last-modified", "cache-control", "date"):
+            if k in response.headers:
+                headers[k] = response.headers[k]
+        return CachedResponse(
+            url=self.url, status_code=self.status_code, headers=headers,
+            body=self.body, expires_at=time.time() + ttl,
+        )
+
+    def encode(self) -> str:
+        return json.dumps({
+            "url":        self.url,
+            "status":     self.status_code,
+            "headers":    self.headers,
+            "body":       base64.b64encode(self.body).decode(),
+            "expires_at": self.expires_at,
+            "stored_at":  self.stored_at,
+        })
+
+    @classmethod
+    def decode(cls, payload: str) -> "CachedResponse":
+        data = json.loads(payload)
+        return cls(
+            url=data["url"],
+            status_code=data["status"],
+            headers=data["headers"],
+            body=base64.b64decode(data["body"]),
+            expires_at=data["expires_at"],
+            stored_at=data.get("stored_at", 0.0),
+        )
+
+
+class HTTPResponseCache:
+    """
+    Two-tier response cache. The second tier is Redis (backend="redis"),
+    a directory (backend="disk"), or nothing (backend="memory").
+    """
+
+    def __init__(
+        self,
+        backend: str = "redis",
+        redis=None,                       # RedisClient — injected by Infrastructure
+        directory: str | None = None,
+        host_ttls: dict[str, int] | None = None,
+        stale_secs: int = 7 * 86_400,
+        max_entries: int = 1_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.backend = backend
+        self._redis = redis
+        self._disk = _DiskStore(directory, disk_max_bytes) if backend == "disk" and directory else None
+        self._host_ttls = {**DEFAULT_HOST_TTLS, **(host_ttls or {})}
+        self._stale_secs = stale_secs
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+
+        # key → encoded CachedResponse
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._memory_bytes = 0
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self.uncacheable = 0
+        self.stale_served = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def from_json(cls, host_ttls: str = "", **kwargs) -> "HTTPResponseCache":
+        """Build with per-host TTL overrides from a JSON string (settings)."""
+        overrides: dict[str, int] = {}
+        if host_ttls:
+            try:
+                overrides = {str(k): int(v) for k, v in json.loads(host_ttls).items()}
+            except (ValueError, AttributeError, TypeError) as exc:
+                log.warning(f"Ignoring invalid HTTP_CACHE_HOST_TTLS: {exc}")
+        return cls(host_ttls=overrides, **kwargs)
+
+    def set_redis(self, redis) -> None:
+        """Called by Infrastructure after RedisClient is connected."""
+        self._redis = redis
+
+    # ── Policy ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        return KEY_PREFIX + hashlib.sha256(f"GET {url}".encode()).hexdigest()
+
+    def ttl_for(self, host: str) -> int:
+        """Freshness TTL for host — exact match, then parent domains, then "*"."""
+        host = (host or "").lower()
+        parts = host.split(".")
+        for i in range(len(parts) - 1):
+            ttl = self._host_ttls.get(".".join(parts[i:]))
+            if ttl is not None:
+                return ttl
+        return self._host_ttls.get("*", 0)
+
+    def cacheable(self, response) -> bool:
+        """Only complete 200s that allow storage and fit the per-entry cap."""
+        if response.status_code != 200:
+            return False
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return False
+        return len(response.content) <= self._max_entry_bytes
+
+    # ── Read / write ───────────────────────────────────────────────────────
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """The stored entry (fresh or revalidatable), or None."""
+        payload = self._memory_get(key)
+        if payload is None:
+            payload = await self._store_get(key)
+            if payload is not None:
+                self._memory_put(key, payload)
+        if payload is None:
+            return None
+        try:
+            return CachedResponse.decode(payload)
+        except Exception as exc:
+            log.debug(f"HTTP cache entry unreadable — dropping: {exc}")
+            await self.invalidate(key)
+            return None
+
+    async def put(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry in both tiers until expiry + the revalidation window."""
+        payload = entry.encode()
+        if len(payload) > self._max_entry_bytes * 2:    # base64 + headers overhead
+            return
+        ex = max(1, int(entry.expires_at - time.time()) + self._stale_secs)
+        self._memory_put(key, payload)
+        self.stores += 1
+        try:
+            if self.backend == "redis" and self._redis is not None:
+                await self._redis.set(key, payload, ex=ex)
+            elif self._disk is not None:
+                await asyncio.to_thread(self._disk.put, key, payload, ex)
+        except Exception as exc:
+            log.debug(f"HTTP cache write failed: {exc}")
+
+    async def invalidate(self, key: str) -> None:
+        self._memory_pop(key)
+        try:
+            if self.backend == "redis" and self._redis is not None:
+                await self._redis.delete(key)
+            elif self._disk is not None:
+                await asyncio.to_thread(self._disk.delete, key)
+        except Exception as exc:
+            log.debug(f"HTTP cache delete failed: {exc}")
+
+    async def _store_get(self, key: str) -> str | None:
+        try:
+            if self.backend == "redis" and self._redis is not None:
+                return await self._redis.get(key)
+            if self._disk is not None:
+                return await asyncio.to_thread(self._disk.get, key)
+        except Exception as exc:
+            log.debug(f"HTTP cache read failed: {exc}")
+        return None
+
+    def stats(self) -> dict:
+        """Counters for monitoring / end-of-cycle logging."""
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "backend":      self.backend,
+            "hits":         self.hits,
+            "revalidated":  self.revalidated,
+            "misses":       self.misses,
+            "hit_rate":     round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0,
+            "stores":       self.stores,
+            "uncacheable":  self.uncacheable,
+            "stale_served": self.stale_served,
+            "bytes_saved":  self.bytes_saved,
+            "entries":      len(self._memory),
+            "memory_bytes": self._memory_bytes,
+        }
+
+    # ── In-process LRU ─────────────────────────────────────────────────────
+
+    def _memory_get(self, key: str) -> str | None:
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._memory.move_to_end(key)
+        return payload
+
+    def _memory_put(self, key: str, payload: str) -> None:
+        self._memory_pop(key)
+        self._memory[key] = payload
+        self._memory_bytes += len(payload)
+        while self._memory and (
+            len(self._memory) > self._max_entries or self._memory_bytes > self._max_bytes
+        ):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _memory_pop(self, key: str) -> None:
+        payload = self._memory.pop(key, None)
+        if payload is not None:
+            self._memory_bytes -= len(payload)
+
+
+class _DiskStore:
+    """
+    One file per key under `directory`, LRU-evicted to `max_bytes` by
+    access order (mtime). Blocking — HTTPResponseCache calls it via
+    asyncio.to_thread, so calls run concurrently on worker threads; one
+    lock serialises each call's file write and index/byte bookkeeping.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self._dir = directory
+        self._max_bytes = max_bytes
+        self._index: OrderedDict[str, int] | None = None    # filename → size, oldest first
+        self._bytes = 0
+        self._lock = threading.RLock()    # re-entrant: an expired get() deletes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, key.removeprefix(KEY_PREFIX))
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            os.makedirs(self._dir, exist_ok=True)
+            entries = sorted(
+                (e for e in os.scandir(self._dir) if e.is_file() and not e.name.endswith(".tmp")),
+                key=lambda e: e.stat().st_mtime,
+            )
+            self._index = OrderedDict((e.name, e.stat().st_size) for e in entries)
+            self._bytes = sum(self._index.values())
+        return self._index
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        with self._lock:
+            index = self._load_index()
+            try:
+                with open(path, encoding="utf-8") as f:
+                    payload = f.read()
+            except FileNotFoundError:
+                return None
+            payload, _, deadline = payload.rpartition("\n")
+            if time.time() > float(deadline or 0):
+                self.delete(key)
+                return None
+            os.utime(path)
+            name = os.path.basename(path)
+            if name in index:
+                index.move_to_end(name)
+            return payload
+
+    def put(self, key: str, payload: str, ex: int) -> None:
+        """Write payload, kept for `ex` seconds (the deadline trails the payload)."""
+        path = self._path(key)
+        name = os.path.basename(path)
+        data = f"{payload}\n{time.time() + ex}".encode()
+        with self._lock:
+            index = self._load_index()
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+            self._bytes -= index.pop(name, 0)
+            index[name] = len(data)
+            self._bytes += len(data)
+            while index and self._bytes > self._max_bytes:
+                evicted, size = index.popitem(last=False)
+                self._bytes -= size
+                try:
+                    os.remove(os.path.join(self._dir, evicted))
+                except FileNotFoundError:
+                    pass
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            index = self._load_index()
+            self._bytes -= index.pop(os.path.basename(path), 0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
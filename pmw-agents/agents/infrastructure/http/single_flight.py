@@ -0,0 +1,84 @@
+"""
+SingleFlight — keyed in-flight request coalescing.
+
+Owns:
+  - One shared task per key while a call is in flight: concurrent callers
+    with the same key await it instead of issuing their own request
+  - Counters: calls made, callers coalesced onto another's call, failures
+
+Does NOT own:
+  - Caching completed results — once the task finishes the key is free
+    and the next caller starts a new call (SerpClient's snapshot cache,
+    HTTPResponseCache and MarketSnapshotService keep results)
+  - Deciding what is safe to share — callers pick keys that identify
+    idempotent reads only
+
+The call runs as its own task and every caller awaits it through
+asyncio.shield, so one cancelled brief never cancels the request the
+others are waiting for. Failures propagate to every waiting caller and
+are never kept.
+
+Usage (from HTTPClient / PriceClient / NewsClient / RedditClient / SerpClient):
+    self.flights = SingleFlight("reddit")
+    posts = await self.flights.do(("search", query, subs), lambda: self._search(...))
+    self.flights.stats()     # {"calls": 12, "coalesced": 7, "failures": 0, "in_flight": 0}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+log = logging.getLogger("pmw.infra.single_flight")
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn() — or the identical call already in flight for key."""
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.get_running_loop().create_task(fn())
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+            log.debug(f"{self.name}: coalesced onto in-flight call", extra={"key": _fingerprint(key)})
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Reading the exception also marks it retrieved if nobody awaited it
+        if not task.cancelled() and task.exception() is not None:
+            self.failures += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for monitoring / end-of-cycle logging."""
+        return {
+            "calls":     self.calls,
+            "coalesced": self.coalesced,
+            "failures":  self.failures,
+            "in_flight": len(self._inflight),
+        }
+
+
+def _fingerprint(key: Hashable) -> str:
+    """
+    Short stable hash of a key for logs. Keys can carry full URLs with
+    query params (SerpAPI's api_key) and request headers, so the key
+    itself is never logged.
+    """
+    return hashlib.sha256(repr(key).encode()).hexdigest()[:12]
@@ -5,19 +5,29 @@ import os
 
 # LLM Client
 from infrastructure.llm.llm_client import LLMClient
+from infrastructure.llm.rate_limiter import LLMRateLimiter
 # HTTP Client
+from infrastructure.http.circuit_breaker import BreakerRegistry
 from infrastructure.http.http_client import HTTPClient
+from infrastructure.http.response_cache import HTTPResponseCache
 # Postgres Client
-from infrastructure.database.postgres_client import PostgresClient
+from infrastructure.database.pool_manager import PoolBudget, PoolManager
+from infrastructure.database.schema_capabilities import SchemaCapabilities
+from infrastructure.database.model_price_table import ModelPriceTable
+# HTML extraction
+from infrastructure.parsing.html_extractor import HTMLExtractor
 # Cache Client
-from infrastructure.cache.redis_client import RedisClient
+from infrastructure.cache.llm_response_cache import LLMResponseCache
 # Owned Clients
 from infrastructure.owned.wordpress.wp_db_client import WordpressClient
 # External Clients
 from infrastructure.external.news_client import NewsClient
 from infrastructure.external.price_client import PriceClient
+from infrastructure.external.price_history import PriceHistoryStore
 from infrastructure.external.reddit_client import RedditClient
 from infrastructure.external.serp_client import SerpClient
+# Telemetry
+from infrastructure.telemetry.telemetry_sink import TelemetrySink
 
 from config import settings
 
@@ -39,31 +49,91 @@ class Infrastructure:
             openai_api_key=settings.OPENAI_API_KEY,
             deepseek_api_key=settings.DEEPSEEK_API_KEY,
             huggingface_api_key=settings.HUGGINGFACE_API_KEY,
+            rate_limiter=LLMRateLimiter.from_json(settings.LLM_RATE_LIMITS),
         )
-        self.http = HTTPClient()
-        self.postgres = PostgresClient(
+        self.http = HTTPClient(
+            cache=HTTPResponseCache.from_json(
+                settings.HTTP_CACHE_HOST_TTLS,
+                backend=settings.HTTP_CACHE_BACKEND,
+                directory=settings.HTTP_CACHE_DIR,
+                max_entries=settings.HTTP_CACHE_MAX_ENTRIES,
+                max_bytes=settings.HTTP_CACHE_MAX_MB * 1024 * 1024,
+                max_entry_bytes=settings.HTTP_CACHE_MAX_ENTRY_KB * 1024,
+                disk_max_bytes=settings.HTTP_CACHE_DISK_MAX_MB * 1024 * 1024,
+            ) if settings.HTTP_CACHE_ENABLED else None,
+            breakers=BreakerRegistry.from_json(
+                settings.HTTP_BREAKER_HOST_POLICIES,
+                error_rate=settings.HTTP_BREAKER_ERROR_RATE,
+                slow_p95_secs=settings.HTTP_BREAKER_SLOW_P95_SECS,
+                min_calls=settings.HTTP_BREAKER_MIN_CALLS,
+                min_latency_calls=settings.HTTP_BREAKER_MIN_LATENCY_CALLS,
+                window=settings.HTTP_BREAKER_WINDOW,
+                open_secs=settings.HTTP_BREAKER_OPEN_SECS,
+            ) if settings.HTTP_BREAKER_ENABLED else None,
+        )
+        self.html = HTMLExtractor(
+            max_workers=settings.HTML_EXTRACT_WORKERS,
+            max_bytes=settings.HTML_EXTRACT_MAX_KB * 1024,
+            timeout=settings.HTML_EXTRACT_TIMEOUT_SECS,
+        )
+        # Every Postgres / Redis connection comes from one budget
+        self.pools = PoolManager(
             dsn=settings.DATABASE_URL,
+            budget=PoolBudget.split(
+                total=settings.DB_CONNECTION_BUDGET,
+                checkpoint_share=settings.CHECKPOINT_POOL_SHARE,
+                redis_max=settings.REDIS_MAX_CONNECTIONS,
+            ),
+            redis_pool_timeout=settings.REDIS_POOL_TIMEOUT_SECS,
+        )
+        self.postgres = self.pools.postgres
+        self.redis = self.pools.redis
+        self.schema = SchemaCapabilities(self.postgres)
+        self.model_prices = ModelPriceTable(
+            self.postgres, refresh_secs=settings.MODEL_PRICES_REFRESH_SECS,
+        )
+        self.llm_cache = LLMResponseCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            max_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024,
+            default_ttl=settings.LLM_CACHE_DEFAULT_TTL_SECONDS,
+        )
+        self.telemetry = TelemetrySink(
+            postgres=self.postgres,
+            redis=self.redis,
+            max_queue=settings.TELEMETRY_QUEUE_MAX,
+            batch_size=settings.TELEMETRY_BATCH_SIZE,
+            flush_interval=settings.TELEMETRY_FLUSH_INTERVAL_SECS,
         )
-        self.redis = RedisClient()
 
         # External clients — HTTP injected in connect()
         self.news   = NewsClient(http=None, api_key=settings.NEWS_API_KEY)
-        self.price  = PriceClient(http=None)
-        self.reddit = RedditClient(http=None)
-        self.serp   = SerpClient(http=None, api_key=settings.SERP_API_KEY)
+        self.price_history = PriceHistoryStore(self.postgres)
+        self.price  = PriceClient(http=None, history=self.price_history)
+        self.reddit = RedditClient(
+            http=None,
+            max_concurrency=settings.REDDIT_MAX_CONCURRENCY,
+            min_interval=settings.REDDIT_MIN_INTERVAL_SECS,
+        )
+        self.serp   = SerpClient(
+            http=None,
+            api_key=settings.SERP_API_KEY,
+            snapshot_ttl=settings.SERP_SNAPSHOT_TTL_SECONDS,
+        )
 
         # Owned clients
         self.wordpress = WordpressClient(
             base_url=settings.WORDPRESS_URL,
             username=settings.WORDPRESS_USERNAME,
             password=settings.WORDPRESS_PASSWORD,
+            page_size=settings.WP_GRAPHQL_PAGE_SIZE,
         )
 
     async def connect(self) -> None:
         log.info("Infrastructure connecting...")
 
-        await self.postgres.connect()
-        await self.redis.connect()
+        await self.pools.connect()
+        await self.schema.load()
+        await self.model_prices.load()
         await self.llm.connect()
         await self.http.connect()
 
@@ -73,17 +143,28 @@ class Infrastructure:
         self.news.set_http(self.http)
         self.price.set_http(self.http)
 
+        # Shared tier for the LLM and HTTP response caches
+        self.llm_cache.set_redis(self.redis)
+        if self.http.cache is not None:
+            self.http.cache.set_redis(self.redis)
+
         log.info("Infrastructure ready")
 
     async def close(self) -> None:
         log.info("Infrastructure shutting down...")
 
+        # Drain queued telemetry while Postgres and Redis are still open
+        try:
+            await self.telemetry.close()
+        except Exception as exc:
+            log.error(f"Error draining telemetry: {exc}")
+
         for name, client, method in [
-            ("postgres",  self.postgres,  self.postgres.close),
-            ("redis",     self.redis,     self.redis.close),
             ("llm",       self.llm,       self.llm.close),
             ("http",      self.http,      self.http.close),
+            ("html",      self.html,      self.html.close),
             ("wordpress", self.wordpress, self.wordpress.close),
+            ("pools",     self.pools,     self.pools.close),
         ]:
             try:
                 await method()
@@ -4,8 +4,22 @@ LLMClient — unified async LLM interface for all providers.
 Owns:
   - SDK initialisation for Anthropic, OpenAI, DeepSeek, HuggingFace
   - API key injection from environment
-  - Transport-level retries (tenacity)
+  - Transport-level retries (tenacity) of network errors and provider
+    5xx / overload responses — the SDKs' own retries are disabled so every
+    attempt, and every 429, is seen by the rate limiter
   - Raw response normalisation to RawLLMResponse
+  - Provider prompt caching: the system prompt (the static instruction
+    block of a PromptRegistry template) is marked cacheable for Anthropic
+    once it reaches the model's minimum cacheable length, and is sent as
+    the leading system message for OpenAI/DeepSeek, whose prefix caching
+    is automatic. Cache read/write token counts are reported on
+    RawLLMResponse. NOTE: every current template's system prompt is
+    roughly 75–380 tokens, below the 1024-token minimum of both
+    providers, so no prompt is cached today — this only takes effect
+    once a template's shared prefix grows past the minimum.
+  - Provider rate limits: every call waits for its (provider, model)
+    RPM / TPM budget in LLMRateLimiter, which adapts from the providers'
+    rate-limit response headers and pauses the queue after a 429
 
 Does NOT own:
   - Cost calculation — that stays in CostTrackingService
@@ -38,25 +52,56 @@ from typing import Any
 
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
 
+from infrastructure.llm.rate_limiter import (
+    LLMRateLimiter,
+    estimate_tokens,
+    is_rate_limit_error,
+    is_transient_error,
+    retry_after_secs,
+)
+
 log = logging.getLogger("pmw.infra.llm")
 
+_PROVIDERS = ("anthropic", "openai", "deepseek", "huggingface")
+
+# Attempts per generate() call when the provider answers 429. Each retry
+# re-queues in the rate limiter, which is paused for the retry-after.
+_RATE_LIMIT_ATTEMPTS = 3
+
+# Anthropic only caches prefixes of at least this many tokens; shorter
+# prefixes marked with cache_control are silently sent uncached. No
+# current template reaches this, so cache_control is not sent today.
+_CACHE_MIN_TOKENS = 1024
+_CACHE_MIN_TOKENS_HAIKU = 2048
+
+
+def _cacheable(model: str, system_prompt: str) -> bool:
+    """True if the system prompt is long enough for Anthropic to cache."""
+    minimum = _CACHE_MIN_TOKENS_HAIKU if "haiku" in model.lower() else _CACHE_MIN_TOKENS
+    return estimate_tokens(system_prompt) >= minimum
+
 
 @dataclass
 class RawLLMResponse:
     """
     Normalised response from any provider SDK.
     No cost is attached here — CostTrackingService handles that separately.
+
+    input_tokens excludes prompt-cache tokens: cache_read_tokens were served
+    from the provider's prompt cache, cache_write_tokens were written to it.
     """
     text: str
     input_tokens: int
     output_tokens: int
     model: str
     provider: str
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 class LLMClient:
@@ -73,6 +118,7 @@ class LLMClient:
         openai_api_key: str | None = None,
         deepseek_api_key: str | None = None,
         huggingface_api_key: str | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
     ) -> None:
         # Keys — fall back to env vars if not explicitly provided
         self._anthropic_key   = anthropic_api_key   or os.environ.get("ANTHROPIC_API_KEY", "")
@@ -86,6 +132,9 @@ class LLMClient:
         self._deepseek_client  = None
         self._hf_client        = None
 
+        # Shared per-(provider, model) budgets for every caller in the worker
+        self.rate_limiter = rate_limiter or LLMRateLimiter()
+
     # ── Lifecycle ──────────────────────────────────────────────────────────
 
     async def connect(self) -> None:
@@ -99,7 +148,8 @@ class LLMClient:
             try:
                 import anthropic
                 self._anthropic_client = anthropic.AsyncAnthropic(
-                    api_key=self._anthropic_key
+                    api_key=self._anthropic_key,
+                    max_retries=0,
                 )
                 active.append("anthropic")
             except ImportError:
@@ -108,7 +158,7 @@ class LLMClient:
         if self._openai_key:
             try:
                 from openai import AsyncOpenAI
-                self._openai_client = AsyncOpenAI(api_key=self._openai_key)
+                self._openai_client = AsyncOpenAI(api_key=self._openai_key, max_retries=0)
                 active.append("openai")
             except ImportError:
                 log.warning("openai package not installed — provider unavailable")
@@ -119,6 +169,7 @@ class LLMClient:
                 self._deepseek_client = AsyncOpenAI(
                     api_key=self._deepseek_key,
                     base_url="https://api.deepseek.com",
+                    max_retries=0,
                 )
                 active.append("deepseek")
             except ImportError:
@@ -148,12 +199,6 @@ class LLMClient:
 
     # ── Main interface ─────────────────────────────────────────────────────
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((TimeoutError, ConnectionError)),
-        reraise=True,
-    )
     async def generate(
         self,
         provider: str,
@@ -183,6 +228,56 @@ class LLMClient:
             RuntimeError: Provider not configured (missing API key)
         """
         p = provider.lower()
+        if p not in _PROVIDERS:
+            raise ValueError(
+                f"Unknown provider: {provider!r}. "
+                "Must be one of: anthropic, openai, deepseek, huggingface"
+            )
+
+        limiter = self.rate_limiter.for_model(p, model)
+        input_estimate = estimate_tokens(system_prompt, prompt)
+        for attempt in range(1, _RATE_LIMIT_ATTEMPTS + 1):
+            # Reserve the expected output, not max_tokens; settle() corrects it
+            reservation = await limiter.acquire(
+                input_tokens=input_estimate,
+                output_tokens=limiter.output_estimate(max_tokens),
+            )
+            try:
+                response = await self._dispatch(
+                    p, model, prompt, temperature, max_tokens, system_prompt
+                )
+            except Exception as exc:
+                limiter.release(reservation)
+                if not is_rate_limit_error(exc):
+                    raise
+                limiter.on_rate_limited(retry_after_secs(exc))
+                if attempt == _RATE_LIMIT_ATTEMPTS:
+                    raise
+                continue
+
+            limiter.settle(
+                reservation,
+                input_tokens=response.input_tokens + response.cache_write_tokens,
+                output_tokens=response.output_tokens,
+            )
+            return response
+
+    # Transport retries run inside one rate-limit reservation
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(is_transient_error),
+        reraise=True,
+    )
+    async def _dispatch(
+        self,
+        p: str,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> RawLLMResponse:
         if p == "anthropic":
             return await self._call_anthropic(
                 model, prompt, temperature, max_tokens, system_prompt
@@ -197,13 +292,10 @@ class LLMClient:
                 self._deepseek_client, "deepseek",
                 model, prompt, temperature, max_tokens, system_prompt,
             )
-        elif p == "huggingface":
-            return await self._call_huggingface(model, prompt, temperature, max_tokens)
         else:
-            raise ValueError(
-                f"Unknown provider: {provider!r}. "
-                "Must be one of: anthropic, openai, deepseek, huggingface"
-            )
+            if system_prompt:
+                prompt = f"{system_prompt}\n\n{prompt}"
+            return await self._call_huggingface(model, prompt, temperature, max_tokens)
 
     # ── Provider implementations ───────────────────────────────────────────
 
@@ -225,16 +317,29 @@ class LLMClient:
             "temperature": temperature,
             "messages": [{"role": "user", "content": prompt}],
         }
-        if system_prompt:
+        if system_prompt and _cacheable(model, system_prompt):
+            # Static template prefix — cacheable across calls
+            kwargs["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+        elif system_prompt:
             kwargs["system"] = system_prompt
 
-        response = await self._anthropic_client.messages.create(**kwargs)
+        # with_raw_response exposes the rate-limit headers alongside the body
+        raw = await self._anthropic_client.messages.with_raw_response.create(**kwargs)
+        self.rate_limiter.for_model("anthropic", model).observe_headers(raw.headers)
+        response = raw.parse()
+        usage = response.usage
         return RawLLMResponse(
             text=response.content[0].text,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
             model=model,
             provider="anthropic",
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
         )
 
     async def _call_openai_compat(
@@ -257,20 +362,38 @@ class LLMClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = await client.chat.completions.create(
+        raw = await client.chat.completions.with_raw_response.create(
             model=model,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
+        self.rate_limiter.for_model(provider_name, model).observe_headers(raw.headers)
+        response = raw.parse()
+        usage = response.usage
+        cached = self._openai_cached_tokens(usage)
         return RawLLMResponse(
             text=response.choices[0].message.content,
-            input_tokens=response.usage.prompt_tokens,
-            output_tokens=response.usage.completion_tokens,
+            input_tokens=usage.prompt_tokens - cached,
+            output_tokens=usage.completion_tokens,
             model=model,
             provider=provider_name,
+            cache_read_tokens=cached,
         )
 
+    @staticmethod
+    def _openai_cached_tokens(usage: Any) -> int:
+        """
+        Prompt tokens served from the automatic prefix cache.
+        OpenAI reports prompt_tokens_details.cached_tokens; DeepSeek reports
+        prompt_cache_hit_tokens. Both are included in prompt_tokens.
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) if details else None
+        if cached is None:
+            cached = getattr(usage, "prompt_cache_hit_tokens", None)
+        return int(cached or 0)
+
     async def _call_huggingface(
         self,
         model: str,
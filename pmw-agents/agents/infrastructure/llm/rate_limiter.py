@@ -0,0 +1,329 @@
+"""
+LLMRateLimiter — per-provider/model token buckets shared by every caller.
+
+Owns:
+  - Requests-per-minute, input-tokens-per-minute and output-tokens-per-minute
+    budgets for each (provider, model)
+  - Pre-call token estimation and reservation; post-call settlement against
+    the provider's reported usage. Output is reserved at the model's recent
+    average (not max_tokens), so a 4096-token ceiling does not hold a
+    whole minute's output budget
+  - Fair FIFO queueing — callers are admitted in arrival order
+  - Adapting budgets from provider rate-limit response headers and pausing
+    the model's queue on a 429 until the provider's retry-after elapses
+
+Does NOT own:
+  - Retrying — BaseAgent / tenacity decide whether to call again; when they
+    do, the retry waits in the queue instead of hitting another 429
+
+LLMClient owns one instance, so every concurrent brief in the worker
+draws from the same budgets.
+
+Usage (from LLMClient.generate):
+    limiter = self._limits.for_model("anthropic", "claude-sonnet-4-6")
+    reservation = await limiter.acquire(input_tokens=1_200, output_tokens=4_096)
+    ...
+    limiter.settle(reservation, input_tokens=1_150, output_tokens=730)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+log = logging.getLogger("pmw.infra.llm.rate_limit")
+
+
+@dataclass
+class RateLimits:
+    """Per-minute budgets. None means the dimension is not limited."""
+    rpm:        int | None = None
+    input_tpm:  int | None = None
+    output_tpm: int | None = None
+
+
+# Starting budgets at typical paid-tier limits (Anthropic tier 2). Real
+# limits are learned from response headers after the first call, and a 429
+# pauses the queue, so these only shape the very first burst. Override with
+# LLM_RATE_LIMITS for lower tiers.
+DEFAULT_LIMITS: dict[str, RateLimits] = {
+    "anthropic":   RateLimits(rpm=1_000, input_tpm=450_000, output_tpm=90_000),
+    "openai":      RateLimits(rpm=500,   input_tpm=200_000, output_tpm=None),
+    "deepseek":    RateLimits(),
+    "huggingface": RateLimits(rpm=60),
+}
+
+# Header → (bucket, field). Anthropic reports input and output separately;
+# OpenAI reports one combined token budget, which is applied to input.
+_HEADER_MAP: dict[str, tuple[str, str]] = {
+    "anthropic-ratelimit-requests-limit":          ("rpm",        "limit"),
+    "anthropic-ratelimit-requests-remaining":      ("rpm",        "remaining"),
+    "anthropic-ratelimit-input-tokens-limit":      ("input_tpm",  "limit"),
+    "anthropic-ratelimit-input-tokens-remaining":  ("input_tpm",  "remaining"),
+    "anthropic-ratelimit-output-tokens-limit":     ("output_tpm", "limit"),
+    "anthropic-ratelimit-output-tokens-remaining": ("output_tpm", "remaining"),
+    "x-ratelimit-limit-requests":                  ("rpm",        "limit"),
+    "x-ratelimit-remaining-requests":              ("rpm",        "remaining"),
+    "x-ratelimit-limit-tokens":                    ("input_tpm",  "limit"),
+    "x-ratelimit-remaining-tokens":                ("input_tpm",  "remaining"),
+}
+
+CHARS_PER_TOKEN = 4
+
+# Output reservation before a model's first settled call, and the margin
+# kept over its running average afterwards. Settlement corrects both ways.
+DEFAULT_OUTPUT_ESTIMATE = 1_024
+OUTPUT_HEADROOM = 1.25
+_OUTPUT_EWMA_ALPHA = 0.2
+
+
+def estimate_tokens(*texts: str | None) -> int:
+    """Cheap pre-call token estimate (~4 characters per token)."""
+    return sum(len(t) for t in texts if t) // CHARS_PER_TOKEN + 1
+
+
+class _Bucket:
+    """Continuous-refill token bucket sized in units per minute."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.level = min(self.capacity, self.level + elapsed * self.capacity / 60.0)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available. Oversized requests wait for a full bucket."""
+        self._refill(now)
+        needed = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) * 60.0 / self.capacity
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+    def set_capacity(self, per_minute: float) -> None:
+        if per_minute > 0 and per_minute != self.capacity:
+            self.level = min(self.level, per_minute)
+            self.capacity = float(per_minute)
+
+    def cap_remaining(self, remaining: float, now: float) -> None:
+        """The provider's view of what is left wins if it is lower than ours."""
+        self._refill(now)
+        self.level = min(self.level, remaining)
+
+
+@dataclass
+class Reservation:
+    input_tokens:  int
+    output_tokens: int
+
+
+class ModelRateLimiter:
+    """Budgets and FIFO admission queue for one (provider, model)."""
+
+    def __init__(self, name: str, limits: RateLimits) -> None:
+        self.name = name
+        self._buckets: dict[str, _Bucket] = {}
+        for dim in ("rpm", "input_tpm", "output_tpm"):
+            value = getattr(limits, dim)
+            if value:
+                self._buckets[dim] = _Bucket(value)
+        # asyncio.Lock wakes waiters in FIFO order — the head of the queue
+        # sleeps while holding it, so later callers cannot jump ahead.
+        self._queue = asyncio.Lock()
+        self._paused_until = 0.0
+        self._output_avg: float | None = None
+
+        self.admitted = 0
+        self.waited_secs = 0.0
+        self.rate_limited = 0
+
+    async def acquire(self, input_tokens: int, output_tokens: int) -> Reservation:
+        """Wait in line until the request fits every budget, then reserve it."""
+        wanted = {"rpm": 1, "input_tpm": input_tokens, "output_tpm": output_tokens}
+        started = time.monotonic()
+        async with self._queue:
+            while True:
+                now = time.monotonic()
+                wait = max(
+                    [self._paused_until - now]
+                    + [b.wait_time(wanted[dim], now) for dim, b in self._buckets.items()]
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            for dim, bucket in self._buckets.items():
+                bucket.take(wanted[dim])
+
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.waited_secs += waited
+        if waited > 1.0:
+            log.debug(f"{self.name}: queued {waited:.1f}s for rate budget")
+        return Reservation(input_tokens=input_tokens, output_tokens=output_tokens)
+
+    def output_estimate(self, max_tokens: int) -> int:
+        """Output tokens to reserve for a call capped at max_tokens."""
+        average = self._output_avg if self._output_avg is not None else DEFAULT_OUTPUT_ESTIMATE
+        return max(1, min(max_tokens, int(average * OUTPUT_HEADROOM)))
+
+    def settle(self, reservation: Reservation, input_tokens: int, output_tokens: int) -> None:
+        """Correct the reservation to actual usage and learn the output average."""
+        self._correct(reservation, input_tokens, output_tokens)
+        if self._output_avg is None:
+            self._output_avg = float(output_tokens)
+        else:
+            self._output_avg += _OUTPUT_EWMA_ALPHA * (output_tokens - self._output_avg)
+
+    def release(self, reservation: Reservation) -> None:
+        """Refund the token reservation of a call that produced no usage."""
+        self._correct(reservation, 0, 0)
+
+    def _correct(self, reservation: Reservation, input_tokens: int, output_tokens: int) -> None:
+        """Refund over-reservation; charge under-reservation (the bucket may go negative)."""
+        for dim, reserved, actual in (
+            ("input_tpm",  reservation.input_tokens,  input_tokens),
+            ("output_tpm", reservation.output_tokens, output_tokens),
+        ):
+            bucket = self._buckets.get(dim)
+            if bucket is None:
+                continue
+            if actual < reserved:
+                bucket.give(reserved - actual)
+            else:
+                bucket.take(actual - reserved)
+
+    def observe_headers(self, headers: Mapping[str, str] | None) -> None:
+        """Learn real limits / remaining budget from provider response headers."""
+        if not headers:
+            return
+        now = time.monotonic()
+        for header, (dim, kind) in _HEADER_MAP.items():
+            raw = headers.get(header)
+            if raw is None:
+                continue
+            try:
+                value = float(raw)
+            except (TypeError, ValueError):
+                continue
+            bucket = self._buckets.get(dim)
+            if kind == "limit":
+                if bucket is None:
+                    self._buckets[dim] = _Bucket(int(value))
+                else:
+                    bucket.set_capacity(value)
+            elif bucket is not None:
+                bucket.cap_remaining(value, now)
+
+    def on_rate_limited(self, retry_after: float | None) -> None:
+        """Pause admission after a 429 so queued callers wait instead of retrying blind."""
+        self.rate_limited += 1
+        pause = retry_after if retry_after and retry_after > 0 else 5.0
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        log.warning(f"{self.name}: provider rate limit hit — pausing {pause:.1f}s")
+
+    def stats(self) -> dict:
+        return {
+            "admitted":     self.admitted,
+            "waited_secs":  round(self.waited_secs, 2),
+            "rate_limited": self.rate_limited,
+            "output_avg":   round(self._output_avg) if self._output_avg is not None else None,
+            "budgets": {
+                dim: {"capacity": int(b.capacity), "available": int(max(b.level, 0))}
+                for dim, b in self._buckets.items()
+            },
+        }
+
+
+class LLMRateLimiter:
+    """Registry of ModelRateLimiters, created lazily per (provider, model)."""
+
+    def __init__(self, overrides: dict[str, RateLimits] | None = None) -> None:
+        self._limits = {**DEFAULT_LIMITS, **(overrides or {})}
+        self._models: dict[tuple[str, str], ModelRateLimiter] = {}
+
+    @classmethod
+    def from_json(cls, raw: str | None) -> "LLMRateLimiter":
+        """
+        Build from a JSON override string, e.g. settings.LLM_RATE_LIMITS:
+            {"anthropic": {"rpm": 1000, "input_tpm": 400000, "output_tpm": 80000}}
+        Invalid JSON is logged and ignored.
+        """
+        overrides: dict[str, RateLimits] = {}
+        if raw:
+            try:
+                for provider, values in json.loads(raw).items():
+                    overrides[provider.lower()] = RateLimits(**values)
+            except Exception as exc:
+                log.error(f"Invalid LLM_RATE_LIMITS — using defaults: {exc}")
+        return cls(overrides)
+
+    def for_model(self, provider: str, model: str) -> ModelRateLimiter:
+        key = (provider.lower(), model)
+        limiter = self._models.get(key)
+        if limiter is None:
+            limits = self._limits.get(key[0], RateLimits())
+            limiter = ModelRateLimiter(f"{key[0]}/{model}", limits)
+            self._models[key] = limiter
+        return limiter
+
+    def stats(self) -> dict:
+        return {limiter.name: limiter.stats() for limiter in self._models.values()}
+
+
+# ── Provider error helpers ─────────────────────────────────────────────────
+
+# Provider statuses worth retrying at the transport level (529: Anthropic overloaded)
+_TRANSIENT_STATUSES = frozenset({408, 409, 500, 502, 503, 504, 529})
+_TRANSIENT_ERRORS = frozenset({"APIConnectionError", "APITimeoutError", "InternalServerError"})
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    return getattr(exc, "status_code", None) == 429 or type(exc).__name__ == "RateLimitError"
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Network failures and provider 5xx / overload responses. The SDKs'
+    own retries are disabled, so LLMClient retries these itself; 429s are
+    not transient — they go through the rate limiter instead.
+    """
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return (
+        type(exc).__name__ in _TRANSIENT_ERRORS
+        or getattr(exc, "status_code", None) in _TRANSIENT_STATUSES
+    )
+
+
+def retry_after_secs(exc: BaseException) -> float | None:
+    """Read retry-after (seconds or HTTP date) from a provider error's response."""
+    response: Any = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    raw = headers.get("retry-after")
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(raw).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -9,6 +9,8 @@ Owns:
   - Authentication (Application Password → Basic Auth header)
   - Response parsing and error handling
   - High-level helpers matching the operations topic_service and page_service need
+  - Cursor pagination over WPGraphQL connections (pageInfo.endCursor),
+    with the next page requested while the current one is normalised
 
 Does NOT own:
   - Business logic (services own that)
@@ -29,14 +31,21 @@ Usage:
     )
     topics = await client.query_topics(status="PUBLISH")
     dealers = await client.query_dealers(active_only=True)
+
+    # Streaming — one normalised page at a time, bounded memory:
+    async for page in client.iter_topics(status="PUBLISH"):
+        ...
     await client.close()
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import aclosing
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
@@ -44,6 +53,10 @@ from config import settings
 
 logger = logging.getLogger("pmw.infra.wordpress")
 
+# WPGraphQL caps `first` at 100 unless graphql_connection_max_query_amount
+# is raised on the WordPress side.
+MAX_PAGE_SIZE = 100
+
 
 # ── Exceptions ─────────────────────────────────────────────────────────────
 
@@ -86,8 +99,10 @@ class WordpressClient:
         password: str,
         graphql_path: str = "/graphql",
         timeout: int = 30,
+        page_size: int = MAX_PAGE_SIZE,
     ):
         self.base_url = base_url.rstrip("/")
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
         self.graphql_url = f"{self.base_url}{graphql_path}"
         self.auth = (username, password)
         self.client = httpx.AsyncClient(
@@ -176,19 +191,154 @@ class WordpressClient:
 
         return body.get("data", {})
 
+    async def paginate(
+        self,
+        query: str,
+        connection: str,
+        variables: dict | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Yield the `nodes` of a WPGraphQL connection one page at a time.
+
+        The query must declare `$first: Int` and `$after: String`, pass them
+        to the connection, and select `pageInfo { hasNextPage endCursor }`.
+        The next page is requested before the current one is yielded, so
+        the round-trip overlaps with the caller's processing. A caller that
+        stops early should aclose() the iterator so the prefetch is
+        cancelled and awaited rather than left pending.
+        """
+        first = max(1, min(page_size or self.page_size, MAX_PAGE_SIZE))
+
+        def fetch(after: str | None) -> asyncio.Task:
+            return asyncio.ensure_future(self.execute(
+                query, variables={**(variables or {}), "first": first, "after": after},
+            ))
+
+        pending = fetch(None)
+        try:
+            while pending is not None:
+                data = await pending
+                conn = data.get(connection) or {}
+                page_info = conn.get("pageInfo") or {}
+                cursor = page_info.get("endCursor")
+                pending = fetch(cursor) if page_info.get("hasNextPage") and cursor else None
+                nodes = conn.get("nodes") or []
+                if nodes:
+                    yield nodes
+        finally:
+            # Consumer stopped early (or a page failed) — drop the prefetch
+            if pending is not None and not pending.done():
+                pending.cancel()
+                await asyncio.wait([pending])
+
     # ══════════════════════════════════════════════════════════════════════
     # HIGH-LEVEL HELPERS
     # ══════════════════════════════════════════════════════════════════════
 
     # ── Topics (pmw_topic CPT) ─────────────────────────────────────────────
 
-    async def query_topics(
+    _TOPIC_FIELDS = """
+                    databaseId
+                    modifiedGmt
+                    title
+                    status
+                    pmwTargetKeyword
+                    pmwSummary
+                    pmwIncludeKeywords
+                    pmwExcludeKeywords
+                    pmwAssetClass
+                    pmwProductType
+                    pmwGeography
+                    pmwIsBuySide
+                    pmwIntentStage
+                    pmwPriority
+                    pmwScheduleCron
+                    pmwAgentStatus
+                    pmwLastRunAt
+                    pmwRunCount
+                    pmwLastRunId
+                    pmwLastWpPostId
+                    pmwWpCategoryId
+                    pmwAffiliatePageId
+                    pmwContentType
+    """
+
+    _TOPICS_QUERY = """
+        query GetTopics($status: PostStatusEnum, $first: Int, $after: String) {
+            pmwTopics(
+                where: { status: $status }
+                first: $first
+                after: $after
+            ) {
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                nodes {%s}
+            }
+        }
+    """ % _TOPIC_FIELDS
+
+    # dateQuery is day-granular, so this returns everything modified on or
+    # after the given day, oldest first; callers filter to the exact mark.
+    _TOPICS_CHANGED_QUERY = """
+        query GetChangedTopics(
+            $status: PostStatusEnum, $year: Int, $month: Int, $day: Int,
+            $first: Int, $after: String
+        ) {
+            pmwTopics(
+                where: {
+                    status: $status
+                    dateQuery: {
+                        column: MODIFIED
+                        inclusive: true
+                        after: { year: $year, month: $month, day: $day }
+                    }
+                    orderby: [{ field: MODIFIED, order: ASC }]
+                }
+                first: $first
+                after: $after
+            ) {
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                nodes {%s}
+            }
+        }
+    """ % _TOPIC_FIELDS
+
+    _TOPIC_IDS_QUERY = """
+        query GetTopicIds($status: PostStatusEnum, $first: Int, $after: String) {
+            pmwTopics(
+                where: { status: $status }
+                first: $first
+                after: $after
+            ) {
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                nodes {
+                    databaseId
+                }
+            }
+        }
+    """
+
+    async def iter_topics(
         self,
         status: str = "PUBLISH",
-        first: int = 100,
-    ) -> list[dict]:
+        page_size: int | None = None,
+        modified_since: date | None = None,
+    ) -> AsyncIterator[list[dict]]:
         """
-        Fetch published pmw_topic posts with all meta fields.
+        Stream pmw_topic posts with all meta fields, one normalised page
+        (up to page_size topics) at a time, following every cursor.
+
+        With modified_since, only posts modified on or after that day are
+        requested (oldest first) — the incremental-sync path.
 
         Requires WPGraphQL registration of the pmw_topic CPT with:
           'show_in_graphql' => true,
@@ -196,118 +346,100 @@ class WordpressClient:
           'graphql_plural_name' => 'pmwTopics',
 
         And register_graphql_field() for each pmw_ meta field.
-
-        Returns:
-            List of topic dicts matching the old REST API shape.
         """
-        query = """
-            query GetTopics($status: PostStatusEnum, $first: Int) {
-                pmwTopics(
-                    where: { status: $status }
-                    first: $first
-                ) {
-                    nodes {
-                        databaseId
-                        title
-                        status
-                        pmwTargetKeyword
-                        pmwSummary
-                        pmwIncludeKeywords
-                        pmwExcludeKeywords
-                        pmwAssetClass
-                        pmwProductType
-                        pmwGeography
-                        pmwIsBuySide
-                        pmwIntentStage
-                        pmwPriority
-                        pmwScheduleCron
-                        pmwAgentStatus
-                        pmwLastRunAt
-                        pmwRunCount
-                        pmwLastRunId
-                        pmwLastWpPostId
-                        pmwWpCategoryId
-                        pmwAffiliatePageId
-                        pmwContentType
-                    }
-                }
+        if modified_since is None:
+            query, variables = self._TOPICS_QUERY, {"status": status}
+        else:
+            query, variables = self._TOPICS_CHANGED_QUERY, {
+                "status": status,
+                "year":   modified_since.year,
+                "month":  modified_since.month,
+                "day":    modified_since.day,
             }
-        """
-        data = await self.execute(query, variables={
-            "status": status,
-            "first": first,
-        })
-
-        nodes = (data.get("pmwTopics") or {}).get("nodes", [])
-
-        # Normalise to the same shape topic_service expects
-        topics = []
-        for node in nodes:
-            topics.append({
-                "id": node.get("databaseId"),
-                "title": {"rendered": node.get("title", "")},
-                "meta": {
-                    "pmw_target_keyword": node.get("pmwTargetKeyword", ""),
-                    "pmw_summary": node.get("pmwSummary", ""),
-                    "pmw_content_type": node.get("pmwContentType", "affiliate"),
-                    "pmw_include_keywords": node.get("pmwIncludeKeywords", ""),
-                    "pmw_exclude_keywords": node.get("pmwExcludeKeywords", ""),
-                    "pmw_asset_class": node.get("pmwAssetClass", ""),
-                    "pmw_product_type": node.get("pmwProductType", ""),
-                    "pmw_geography": node.get("pmwGeography", "uk"),
-                    "pmw_is_buy_side": node.get("pmwIsBuySide", False),
-                    "pmw_intent_stage": node.get("pmwIntentStage", "consideration"),
-                    "pmw_priority": node.get("pmwPriority", 5),
-                    "pmw_schedule_cron": node.get("pmwScheduleCron", ""),
-                    "pmw_agent_status": node.get("pmwAgentStatus", "idle"),
-                    "pmw_last_run_at": node.get("pmwLastRunAt", ""),
-                    "pmw_run_count": node.get("pmwRunCount", 0),
-                    "pmw_last_run_id": node.get("pmwLastRunId", 0),
-                    "pmw_last_wp_post_id": node.get("pmwLastWpPostId", 0),
-                    "pmw_wp_category_id": node.get("pmwWpCategoryId", 0),
-                    "pmw_affiliate_page_id": node.get("pmwAffiliatePageId", 0),
-                },
-            })
-
-        logger.info(f"GraphQL: fetched {len(topics)} topics (status={status})")
-        return topics
 
-    # ── Dealers / Affiliates (dealer CPT) ──────────────────────────────────
+        total = 0
+        async with aclosing(self.paginate(query, "pmwTopics", variables, page_size)) as pages:
+            async for nodes in pages:
+                topics = [self._normalise_topic(node) for node in nodes]
+                total += len(topics)
+                yield topics
+        logger.info(
+            f"GraphQL: fetched {total} topics (status={status}"
+            + (f", modified_since={modified_since})" if modified_since else ")")
+        )
 
-    async def query_dealers(
+    async def iter_topic_ids(
         self,
         status: str = "PUBLISH",
-        active_only: bool = True,
-        first: int = 100,
+        page_size: int | None = None,
+    ) -> AsyncIterator[list[int]]:
+        """Stream just the database IDs of pmw_topic posts (for deletion checks)."""
+        async with aclosing(self.paginate(
+            self._TOPIC_IDS_QUERY, "pmwTopics", {"status": status}, page_size,
+        )) as pages:
+            async for nodes in pages:
+                yield [n["databaseId"] for n in nodes if n.get("databaseId") is not None]
+
+    async def query_topics(
+        self,
+        status: str = "PUBLISH",
+        first: int | None = None,
     ) -> list[dict]:
         """
-        Fetch dealer CPT posts with affiliate pipeline meta fields via GraphQL.
+        Fetch every pmw_topic post as one list (`first` is the page size).
+        Prefer iter_topics() for large syncs.
 
-        The dealer CPT has 'show_in_graphql' => true with
-        graphql_single_name='dealer', graphql_plural_name='dealers'.
+        Returns:
+            List of topic dicts matching the old REST API shape.
+        """
+        topics: list[dict] = []
+        async for page in self.iter_topics(status=status, page_size=first):
+            topics.extend(page)
+        return topics
 
-        Affiliate-specific meta fields are registered by
-        pmw_register_dealer_affiliate_graphql() in pmw-core.php.
+    @staticmethod
+    def _normalise_topic(node: dict) -> dict:
+        """Normalise to the same shape topic_service expects."""
+        return {
+            "id": node.get("databaseId"),
+            "modified_gmt": node.get("modifiedGmt"),
+            "title": {"rendered": node.get("title", "")},
+            "meta": {
+                "pmw_target_keyword": node.get("pmwTargetKeyword", ""),
+                "pmw_summary": node.get("pmwSummary", ""),
+                "pmw_content_type": node.get("pmwContentType", "affiliate"),
+                "pmw_include_keywords": node.get("pmwIncludeKeywords", ""),
+                "pmw_exclude_keywords": node.get("pmwExcludeKeywords", ""),
+                "pmw_asset_class": node.get("pmwAssetClass", ""),
+                "pmw_product_type": node.get("pmwProductType", ""),
+                "pmw_geography": node.get("pmwGeography", "uk"),
+                "pmw_is_buy_side": node.get("pmwIsBuySide", False),
+                "pmw_intent_stage": node.get("pmwIntentStage", "consideration"),
+                "pmw_priority": node.get("pmwPriority", 5),
+                "pmw_schedule_cron": node.get("pmwScheduleCron", ""),
+                "pmw_agent_status": node.get("pmwAgentStatus", "idle"),
+                "pmw_last_run_at": node.get("pmwLastRunAt", ""),
+                "pmw_run_count": node.get("pmwRunCount", 0),
+                "pmw_last_run_id": node.get("pmwLastRunId", 0),
+                "pmw_last_wp_post_id": node.get("pmwLastWpPostId", 0),
+                "pmw_wp_category_id": node.get("pmwWpCategoryId", 0),
+                "pmw_affiliate_page_id": node.get("pmwAffiliatePageId", 0),
+            },
+        }
 
-        Args:
-            status: WP post status filter (default PUBLISH).
-            active_only: If True, only return dealers with pmwAffiliateActive=true.
-            first: Max results to fetch.
+    # ── Dealers / Affiliates (dealer CPT) ──────────────────────────────────
 
-        Returns:
-            List of affiliate dicts normalised for the Postgres affiliates table.
-            Each dict has keys matching the affiliates table columns:
-                wp_dealer_id, name, partner_key, url, value_prop,
-                commission_type, commission_rate, cookie_days, geo_focus,
-                min_transaction, faq_url, asset_classes, product_types,
-                buy_side, sell_side, intent_stages, active
-        """
-        query = """
-        query GetDealers($status: PostStatusEnum, $first: Int) {
+    _DEALERS_QUERY = """
+        query GetDealers($status: PostStatusEnum, $first: Int, $after: String) {
             dealers(
                 where: { status: $status }
                 first: $first
+                after: $after
             ) {
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
                 nodes {
                     databaseId
                     title
@@ -330,47 +462,92 @@ class WordpressClient:
                 }
             }
         }
+    """
+
+    async def iter_dealers(
+        self,
+        status: str = "PUBLISH",
+        active_only: bool = True,
+        page_size: int | None = None,
+    ) -> AsyncIterator[list[dict]]:
         """
-        data = await self.execute(query, variables={
-            "status": status,
-            "first": first,
-        })
-
-        nodes = (data.get("dealers") or {}).get("nodes", [])
-
-        dealers = []
-        for node in nodes:
-            raw_active = node.get("pmwAffiliateActive")
-            is_active = True if raw_active is None else bool(raw_active)
-            if active_only and not is_active:
-                continue
-
-            dealers.append({
-                "wp_dealer_id":    node.get("databaseId"),
-                "name":            node.get("title", ""),
-                "partner_key":     node.get("pmwPartnerKey", ""),
-                "url":             node.get("pmwAffiliateUrl", ""),
-                "value_prop":      node.get("pmwValueProp", ""),
-                "commission_type": node.get("pmwCommissionType", ""),
-                "commission_rate": node.get("pmwCommissionRate", 0.0),
-                "cookie_days":     node.get("pmwCookieDays", 0),
-                "geo_focus":       node.get("pmwGeoFocus", ""),
-                "min_transaction": node.get("pmwMinTransaction", 0.0),
-                "faq_url":         node.get("pmwFaqUrl", ""),
-                "asset_classes":   node.get("pmwAssetClasses", ""),
-                "product_types":   node.get("pmwProductTypes", ""),
-                "buy_side":        node.get("pmwBuySide", True),
-                "sell_side":       node.get("pmwSellSide", False),
-                "intent_stages":   node.get("pmwIntentStages", ""),
-                "active":          is_active,
-            })
+        Stream dealer CPT posts with affiliate pipeline meta fields, one
+        normalised page at a time, following every cursor.
+
+        The dealer CPT has 'show_in_graphql' => true with
+        graphql_single_name='dealer', graphql_plural_name='dealers'.
+
+        Affiliate-specific meta fields are registered by
+        pmw_register_dealer_affiliate_graphql() in pmw-core.php.
+
+        Args:
+            status: WP post status filter (default PUBLISH).
+            active_only: If True, only yield dealers with pmwAffiliateActive=true.
+            page_size: Dealers per GraphQL request (default: client page_size).
+
+        Yields:
+            Lists of affiliate dicts normalised for the Postgres affiliates table.
+            Each dict has keys matching the affiliates table columns:
+                wp_dealer_id, name, partner_key, url, value_prop,
+                commission_type, commission_rate, cookie_days, geo_focus,
+                min_transaction, faq_url, asset_classes, product_types,
+                buy_side, sell_side, intent_stages, active
+        """
+        total = 0
+        async with aclosing(self.paginate(
+            self._DEALERS_QUERY, "dealers", {"status": status}, page_size,
+        )) as pages:
+            async for nodes in pages:
+                dealers = [self._normalise_dealer(node) for node in nodes]
+                if active_only:
+                    dealers = [d for d in dealers if d["active"]]
+                total += len(dealers)
+                if dealers:
+                    yield dealers
 
         logger.info(
-            f"GraphQL: fetched {len(dealers)} dealer(s) "
+            f"GraphQL: fetched {total} dealer(s) "
             f"(status={status}, active_only={active_only})"
         )
+
+    async def query_dealers(
+        self,
+        status: str = "PUBLISH",
+        active_only: bool = True,
+        first: int | None = None,
+    ) -> list[dict]:
+        """
+        Fetch every dealer as one list (`first` is the page size).
+        Prefer iter_dealers() for large syncs.
+        """
+        dealers: list[dict] = []
+        async for page in self.iter_dealers(status=status, active_only=active_only, page_size=first):
+            dealers.extend(page)
         return dealers
 
+    @staticmethod
+    def _normalise_dealer(node: dict) -> dict:
+        raw_active = node.get("pmwAffiliateActive")
+        return {
+            "wp_dealer_id":    node.get("databaseId"),
+            "name":            node.get("title", ""),
+            "partner_key":     node.get("pmwPartnerKey", ""),
+            "url":             node.get("pmwAffiliateUrl", ""),
+            "value_prop":      node.get("pmwValueProp", ""),
+            "commission_type": node.get("pmwCommissionType", ""),
+            "commission_rate": node.get("pmwCommissionRate", 0.0),
+            "cookie_days":     node.get("pmwCookieDays", 0),
+            "geo_focus":       node.get("pmwGeoFocus", ""),
+            "min_transaction": node.get("pmwMinTransaction", 0.0),
+            "faq_url":         node.get("pmwFaqUrl", ""),
+            "asset_classes":   node.get("pmwAssetClasses", ""),
+            "product_types":   node.get("pmwProductTypes", ""),
+            "buy_side":        node.get("pmwBuySide", True),
+            "sell_side":       node.get("pmwSellSide", False),
+            "intent_stages":   node.get("pmwIntentStages", ""),
+            "active":          True if raw_active is None else bool(raw_active),
+        }
+
     async def get_topic_meta(self, topic_id: int) -> dict:
         """
         Fetch a single topic's meta fields by database ID.
@@ -0,0 +1,293 @@
+"""
+HTMLExtractor — off-loop HTML text extraction for scraped pages.
+
+Owns:
+  - A bounded ProcessPoolExecutor that parses HTML away from the event
+    loop (and across cores), created on first use
+  - The byte cap applied before parsing (HTML_EXTRACT_MAX_KB)
+  - Parser backends: selectolax when installed, otherwise BeautifulSoup on
+    the lxml tree builder, otherwise BeautifulSoup's html.parser
+  - Main-text extraction (title, text, word count) and CSS-selector field
+    extraction for listing pages
+
+Does NOT own:
+  - Fetching — callers pass the body they got from infra.http
+  - Which tags / selectors count as boilerplate — callers pass those
+
+Lifecycle:
+    infra.html is instantiated in Infrastructure.__init__; the worker pool
+    starts lazily and is shut down in Infrastructure.close(). A parse that
+    times out has its pool's workers terminated and the pool replaced, so
+    a pathological page can't keep a worker busy after its caller gave up.
+    With max_workers=0 (or if the pool breaks) parsing runs in a thread
+    instead.
+
+Usage:
+    page = await infra.html.extract(resp.text, drop_tags=("nav", "footer"), max_words=5000)
+    page["title"], page["text"], page["word_count"]
+    rows = await infra.html.select(resp.text, ".Result", {"title": "a", "excerpt": ".Excerpt"}, limit=5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+log = logging.getLogger("pmw.infra.html")
+
+DEFAULT_DROP_TAGS = ("nav", "header", "footer", "script", "style", "aside", "form")
+
+
+class HTMLExtractor:
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_bytes: int = 1024 * 1024,
+        timeout: float = 10.0,
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_bytes = max_bytes
+        self._timeout = timeout
+        self._pool: ProcessPoolExecutor | None = None
+        # Bounds queued work so a burst of large pages can't pile up in memory
+        self._slots: asyncio.Semaphore | None = None
+        # Calls handed to the pool at once (≤ max_workers, so none queue there)
+        self._running: asyncio.Semaphore | None = None
+
+        self.extracted = 0
+        self.capped = 0
+        self.failures = 0
+        self.recycled = 0
+        self.parse_secs = 0.0
+
+    # ── Public interface ───────────────────────────────────────────────────
+
+    async def extract(
+        self,
+        html: str | bytes,
+        drop_tags: tuple[str, ...] = DEFAULT_DROP_TAGS,
+        drop_selectors: tuple[str, ...] = (),
+        max_words: int | None = None,
+    ) -> dict:
+        """
+        Main text of a page with boilerplate removed.
+
+        Returns:
+            {
+                "title": str,
+                "text": str (one line per block, or space-joined and cut
+                             to max_words when max_words is given),
+                "word_count": int (words in text),
+                "total_words": int (words before the max_words cut),
+                "capped": bool (input exceeded the byte cap),
+                "parser": str,
+            }
+        """
+        body, capped = self._cap(html)
+        result = await self._run(_extract_worker, body, tuple(drop_tags), tuple(drop_selectors), max_words)
+        result["capped"] = capped
+        return result
+
+    async def select(
+        self,
+        html: str | bytes,
+        item_selector: str,
+        fields: dict[str, str],
+        limit: int | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        One dict per element matching item_selector (up to limit), with the
+        stripped text of the first match of each field selector inside it.
+        """
+        body, _ = self._cap(html)
+        return await self._run(_select_worker, body, item_selector, dict(fields), limit)
+
+    async def close(self) -> None:
+        """Shut the worker pool down (Infrastructure.close)."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+            log.info("HTML extractor pool closed")
+
+    def stats(self) -> dict:
+        return {
+            "extracted":  self.extracted,
+            "capped":     self.capped,
+            "failures":   self.failures,
+            "recycled":   self.recycled,
+            "parse_secs": round(self.parse_secs, 3),
+            "workers":    self._max_workers,
+        }
+
+    # ── Internals ──────────────────────────────────────────────────────────
+
+    def _cap(self, html: str | bytes) -> tuple[bytes, bool]:
+        body = html.encode("utf-8", errors="replace") if isinstance(html, str) else html
+        if len(body) > self._max_bytes:
+            self.capped += 1
+            return body[: self._max_bytes], True
+        return body, False
+
+    async def _run(self, fn, *args):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, self._max_workers) * 4)
+            self._running = asyncio.Semaphore(max(1, self._max_workers))
+        started = time.monotonic()
+        async with self._slots:
+            try:
+                result = await self._submit(fn, *args)
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.parse_secs += time.monotonic() - started
+        self.extracted += 1
+        return result
+
+    async def _submit(self, fn, *args):
+        """
+        Run fn with the timeout covering the parse only. At most
+        max_workers calls are handed to the pool at once, so none waits in
+        the executor's queue — and a timeout can't be charged to the calls
+        queued behind a slow page.
+        """
+        while True:
+            if self._get_pool() is None:
+                return await asyncio.wait_for(asyncio.to_thread(fn, *args), self._timeout)
+            async with self._running:
+                pool = self._get_pool()
+                if pool is None:
+                    continue
+                future = asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+                try:
+                    return await asyncio.wait_for(future, self._timeout)
+                except asyncio.TimeoutError:
+                    # wait_for only abandons the future — the worker keeps parsing
+                    self._recycle(pool)
+                    raise
+                except BrokenProcessPool:
+                    if self._pool is pool:
+                        log.warning("HTML extractor pool broke — falling back to a thread")
+                        self._pool = None
+                        self._max_workers = 0
+            # The pool was recycled (another call timed out) or broke — run again
+
+    def _recycle(self, pool: ProcessPoolExecutor) -> None:
+        """Terminate a pool's workers and let the next call start a fresh pool."""
+        if self._pool is pool:
+            self._pool = None
+        self.recycled += 1
+        # No public way to stop a busy worker before Python 3.14. Work still
+        # on the pool fails with BrokenProcessPool and is resubmitted.
+        for proc in list((getattr(pool, "_processes", None) or {}).values()):
+            proc.terminate()
+        pool.shutdown(wait=False)
+        log.warning("HTML extraction timed out — worker pool recycled")
+
+    def _get_pool(self) -> ProcessPoolExecutor | None:
+        if self._pool is None and self._max_workers > 0:
+            # spawn, not fork: the worker process must not inherit the event
+            # loop, open sockets or pool connections
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            log.info(f"HTML extractor pool started ({self._max_workers} worker(s))")
+        return self._pool
+
+
+# ── Worker functions (run in the pool; module-level so they pickle) ────────
+
+def _extract_worker(
+    body: bytes,
+    drop_tags: tuple[str, ...],
+    drop_selectors: tuple[str, ...],
+    max_words: int | None,
+) -> dict:
+    html = body.decode("utf-8", errors="ignore")
+    try:
+        title, raw = _extract_selectolax(html, drop_tags, drop_selectors)
+        parser = "selectolax"
+    except ImportError:
+        title, raw, parser = _extract_bs4(html, drop_tags, drop_selectors)
+
+    lines = [line.strip() for line in raw.split("\n") if line.strip()]
+    text = "\n".join(lines)
+    words = text.split()
+    if max_words is not None:
+        text = " ".join(words[:max_words])
+    return {
+        "title":       title,
+        "text":        text,
+        "word_count":  min(len(words), max_words) if max_words is not None else len(words),
+        "total_words": len(words),
+        "parser":      parser,
+    }
+
+
+def _select_worker(
+    body: bytes,
+    item_selector: str,
+    fields: dict[str, str],
+    limit: int | None,
+) -> list[dict[str, str]]:
+    html = body.decode("utf-8", errors="ignore")
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        soup = _soup(html)[0]
+        return [
+            {name: _bs4_text(item.select_one(sel)) for name, sel in fields.items()}
+            for item in soup.select(item_selector)[:limit]
+        ]
+    tree = HTMLParser(html)
+    return [
+        {name: _lax_text(item.css_first(sel)) for name, sel in fields.items()}
+        for item in tree.css(item_selector)[:limit]
+    ]
+
+
+def _extract_selectolax(html: str, drop_tags, drop_selectors) -> tuple[str, str]:
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(html)
+    title = _lax_text(tree.css_first("title"))
+    for selector in (*drop_tags, *drop_selectors):
+        for node in tree.css(selector):
+            node.decompose()
+    root = tree.root
+    return title, (root.text(separator="\n", strip=True) if root is not None else "")
+
+
+def _extract_bs4(html: str, drop_tags, drop_selectors) -> tuple[str, str, str]:
+    soup, parser = _soup(html)
+    title_tag = soup.find("title")
+    title = title_tag.get_text(strip=True) if title_tag else ""
+    for tag in soup(list(drop_tags)):
+        tag.decompose()
+    for selector in drop_selectors:
+        for el in soup.select(selector):
+            el.decompose()
+    return title, soup.get_text(separator="\n", strip=True), parser
+
+
+def _soup(html: str):
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    try:
+        return BeautifulSoup(html, "lxml"), "bs4+lxml"
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser"), "bs4"
+
+
+def _lax_text(node) -> str:
+    return node.text(strip=True) if node is not None else ""
+
+
+def _bs4_text(el) -> str:
+    return el.get_text(strip=True) if el is not None else ""
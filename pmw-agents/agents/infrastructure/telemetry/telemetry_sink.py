@@ -0,0 +1,359 @@
+"""
+TelemetrySink — background writer for pipeline events and stage records.
+
+Owns:
+  - Bounded in-memory queues for Redis publishes, vault_events rows,
+    workflow_stages upserts and append-only rows (e.g. llm_call_logs)
+  - The vault_events hash chain per run, kept in memory and seeded from the
+    run's last stored row the first time the run is seen
+  - Flushing by size or time: one COPY for vault rows and per table for
+    appended rows, one multi-row upsert for stage records, one pipelined
+    round-trip for Redis publishes
+  - Draining every queue on close()
+
+Does NOT own:
+  - Event and stage-record shapes — EventService builds those
+  - Connections — uses infra.postgres and infra.redis
+
+Lifecycle:
+    infra.telemetry is instantiated in Infrastructure.__init__. The flush
+    loop starts on the first submit; Infrastructure.close() drains it before
+    the pools are closed.
+
+Never raises — a failed flush is logged and counted, never propagated.
+
+Usage (from EventService):
+    infra.telemetry.publish("pmw:events", json.dumps(event))
+    infra.telemetry.vault_event(run_id, stage_name, event_type, event)
+    infra.telemetry.stage_record(run_id=42, stage_name="stage2.keyword_research", ...)
+    infra.telemetry.insert("llm_call_logs", ("run_id", "model", ...), (42, "gpt-4o", ...))
+    await infra.telemetry.flush()      # force a write (tests, end of run)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict, deque
+
+log = logging.getLogger("pmw.infra.telemetry")
+
+GENESIS_HASH = "0" * 64
+
+# Runs whose chain head is kept in memory; older runs are re-seeded from
+# Postgres if they ever emit again.
+MAX_CHAIN_HEADS = 1024
+
+TERMINAL_STATUSES = ("complete", "failed", "awaiting_restart")
+
+# Insert-only columns — ON CONFLICT never updates them, so when two pending
+# records for the same stage attempt are coalesced the first one's values win.
+_INSERT_ONLY = ("model_used", "prompt_hash")
+
+_VAULT_COLUMNS = ["event_type", "run_id", "stage_name", "payload", "payload_hash", "previous_hash"]
+
+_STAGE_UPSERT = """
+    INSERT INTO workflow_stages
+        (run_id, stage_name, status, attempt_number,
+         score, passed_threshold, output_json, judge_feedback,
+         prompt_hash, model_used,
+         input_tokens, output_tokens, cost_usd, error,
+         completed_at)
+    SELECT r.run_id, r.stage_name, r.status, r.attempt_number,
+           r.score, r.passed_threshold, r.output_json::jsonb, r.judge_feedback::jsonb,
+           r.prompt_hash, r.model_used,
+           r.input_tokens, r.output_tokens, r.cost_usd, r.error,
+           CASE WHEN r.status = ANY($15::text[]) THEN NOW() ELSE NULL END
+    FROM unnest(
+        $1::int[], $2::text[], $3::text[], $4::int[],
+        $5::float8[], $6::bool[], $7::text[], $8::text[],
+        $9::text[], $10::text[],
+        $11::int[], $12::int[], $13::float8[], $14::text[]
+    ) AS r(run_id, stage_name, status, attempt_number,
+           score, passed_threshold, output_json, judge_feedback,
+           prompt_hash, model_used,
+           input_tokens, output_tokens, cost_usd, error)
+    ON CONFLICT (run_id, stage_name, attempt_number)
+    DO UPDATE SET
+        status           = EXCLUDED.status,
+        score            = EXCLUDED.score,
+        passed_threshold = EXCLUDED.passed_threshold,
+        output_json      = EXCLUDED.output_json,
+        judge_feedback   = EXCLUDED.judge_feedback,
+        input_tokens     = EXCLUDED.input_tokens,
+        output_tokens    = EXCLUDED.output_tokens,
+        cost_usd         = EXCLUDED.cost_usd,
+        error            = EXCLUDED.error,
+        completed_at     = EXCLUDED.completed_at
+"""
+
+_STAGE_FIELDS = (
+    "run_id", "stage_name", "status", "attempt_number",
+    "score", "passed_threshold", "output_json", "judge_feedback",
+    "prompt_hash", "model_used",
+    "input_tokens", "output_tokens", "cost_usd", "error",
+)
+
+
+class TelemetrySink:
+
+    def __init__(
+        self,
+        postgres=None,
+        redis=None,
+        max_queue:      int   = 10_000,
+        batch_size:     int   = 200,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self._postgres = postgres
+        self._redis = redis
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+        self._publishes: deque[tuple[str, str]] = deque()
+        # (run_id, stage_name, event_type, payload_json, payload_hash)
+        self._vault: deque[tuple] = deque()
+        # (table, columns, values) — append-only rows, COPY'd per table/columns
+        self._rows: deque[tuple[str, tuple, tuple]] = deque()
+        # (run_id, stage_name, attempt) → latest pending record
+        self._stages: OrderedDict[tuple, dict] = OrderedDict()
+        self._chain_heads: OrderedDict[int, str] = OrderedDict()
+
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._closed = False
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+
+    # ── Submit (fire-and-forget) ───────────────────────────────────────────
+
+    def publish(self, channel: str, message: str) -> None:
+        """Queue a Redis publish."""
+        self._push(self._publishes, (channel, message))
+
+    def vault_event(self, run_id: int | None, stage_name: str, event_type: str, payload: dict) -> None:
+        """
+        Queue an immutable vault_events row. The payload hash is computed now;
+        previous_hash is assigned at flush time, in submission order.
+        """
+        payload_hash = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        self._push(self._vault, (run_id, stage_name, event_type, json.dumps(payload), payload_hash))
+
+    def insert(self, table: str, columns: tuple[str, ...], values: tuple) -> None:
+        """Queue an append-only row for `table`."""
+        self._push(self._rows, (table, columns, values))
+
+    def stage_record(self, **record) -> None:
+        """
+        Queue a workflow_stages upsert. Records for the same stage attempt that
+        are still pending are coalesced — only the latest status is written.
+        """
+        key = (record["run_id"], record["stage_name"], record["attempt_number"])
+        pending = self._stages.pop(key, None)
+        if pending is not None:
+            record.update({col: pending[col] for col in _INSERT_ONLY})
+        elif len(self._stages) >= self._max_queue:
+            self._stages.popitem(last=False)
+            self._count_drop()
+        self._stages[key] = record
+        self._submitted()
+
+    # ── Flushing ───────────────────────────────────────────────────────────
+
+    async def flush(self) -> None:
+        """Write everything queued so far. Never raises."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            while self._publishes or self._vault or self._rows or self._stages:
+                publishes = [self._publishes.popleft()
+                             for _ in range(min(self._batch_size, len(self._publishes)))]
+                vault = [self._vault.popleft()
+                         for _ in range(min(self._batch_size, len(self._vault)))]
+                rows = [self._rows.popleft()
+                        for _ in range(min(self._batch_size, len(self._rows)))]
+                stages = [self._stages.popitem(last=False)[1]
+                          for _ in range(min(self._batch_size, len(self._stages)))]
+
+                self.flushes += 1
+                await asyncio.gather(
+                    self._write_publishes(publishes),
+                    self._write_vault(vault),
+                    self._write_rows(rows),
+                    self._write_stages(stages),
+                )
+
+    async def close(self) -> None:
+        """Stop the flush loop and drain every queue."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            # Not cancel(): a flush in progress has already popped its batch
+            # off the queues, so let the loop finish it and exit on its own
+            self._wake.set()
+            try:
+                await task
+            except Exception as exc:
+                log.warning(f"Telemetry flush loop failed: {exc}")
+        await self.flush()
+        log.info("TelemetrySink drained", extra=self.stats())
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "written":   self.written,
+            "dropped":   self.dropped,
+            "failed":    self.failed,
+            "flushes":   self.flushes,
+            "queued":    len(self._publishes) + len(self._vault) + len(self._rows) + len(self._stages),
+        }
+
+    # ── Internals ──────────────────────────────────────────────────────────
+
+    def _push(self, queue: deque, item: tuple) -> None:
+        if len(queue) >= self._max_queue:
+            queue.popleft()
+            self._count_drop()
+        queue.append(item)
+        self._submitted()
+
+    def _submitted(self) -> None:
+        self.submitted += 1
+        self._ensure_running()
+        if self._wake is not None and (
+            len(self._publishes) >= self._batch_size
+            or len(self._vault) >= self._batch_size
+            or len(self._rows) >= self._batch_size
+            or len(self._stages) >= self._batch_size
+        ):
+            self._wake.set()
+
+    def _count_drop(self) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            log.warning(f"Telemetry queue full — {self.dropped} records dropped so far")
+
+    def _ensure_running(self) -> None:
+        if self._closed or (self._task is not None and not self._task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return   # no loop yet — the next submit (or close) picks it up
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def _write_publishes(self, batch: list[tuple[str, str]]) -> None:
+        if not batch:
+            return
+        try:
+            await self._redis.publish_many(batch)
+            self.written += len(batch)
+        except Exception as exc:
+            self.failed += len(batch)
+            log.warning(
+                "Redis publish failed — events not delivered to dashboard",
+                extra={"count": len(batch), "error": str(exc)},
+            )
+
+    async def _write_vault(self, batch: list[tuple]) -> None:
+        if not batch:
+            return
+        try:
+            heads = await self._load_chain_heads({r[0] for r in batch})
+            records = []
+            for run_id, stage_name, event_type, payload_json, payload_hash in batch:
+                records.append((
+                    event_type, run_id, stage_name, payload_json,
+                    payload_hash, heads.get(run_id, GENESIS_HASH),
+                ))
+                if run_id is not None:
+                    heads[run_id] = payload_hash
+
+            async with self._postgres.connection() as conn:
+                await conn.copy_records_to_table(
+                    "vault_events", records=records, columns=_VAULT_COLUMNS,
+                )
+        except Exception as exc:
+            self.failed += len(batch)
+            log.error(
+                "vault_events write failed",
+                extra={"count": len(batch), "error": str(exc)},
+            )
+            return
+
+        # Advance the chain only once the rows are stored
+        for run_id, head in heads.items():
+            self._chain_heads[run_id] = head
+            self._chain_heads.move_to_end(run_id)
+        while len(self._chain_heads) > MAX_CHAIN_HEADS:
+            self._chain_heads.popitem(last=False)
+        self.written += len(batch)
+
+    async def _load_chain_heads(self, run_ids: set) -> dict:
+        """Current chain head per run — from memory, else the run's last stored row."""
+        heads = {r: self._chain_heads[r] for r in run_ids if r in self._chain_heads}
+        unseen = [r for r in run_ids if r is not None and r not in heads]
+        if unseen:
+            rows = await self._postgres.fetch(
+                """
+                SELECT DISTINCT ON (run_id) run_id, payload_hash
+                FROM vault_events
+                WHERE run_id = ANY($1::int[])
+                ORDER BY run_id, id DESC
+                """,
+                unseen,
+            )
+            heads.update({r["run_id"]: r["payload_hash"] for r in rows})
+        return heads
+
+    async def _write_rows(self, batch: list[tuple[str, tuple, tuple]]) -> None:
+        if not batch:
+            return
+        grouped: dict[tuple[str, tuple], list[tuple]] = {}
+        for table, columns, values in batch:
+            grouped.setdefault((table, columns), []).append(values)
+
+        for (table, columns), records in grouped.items():
+            try:
+                async with self._postgres.connection() as conn:
+                    await conn.copy_records_to_table(table, records=records, columns=list(columns))
+                self.written += len(records)
+            except Exception as exc:
+                self.failed += len(records)
+                log.error(
+                    f"{table} write failed",
+                    extra={"count": len(records), "error": str(exc)},
+                )
+
+    async def _write_stages(self, batch: list[dict]) -> None:
+        if not batch:
+            return
+        try:
+            columns = [[record.get(f) for record in batch] for f in _STAGE_FIELDS]
+            await self._postgres.execute(_STAGE_UPSERT, *columns, list(TERMINAL_STATUSES))
+            self.written += len(batch)
+        except Exception as exc:
+            self.failed += len(batch)
+            log.error(
+                "workflow_stages write failed",
+                extra={"count": len(batch), "error": str(exc)},
+            )
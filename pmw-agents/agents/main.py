@@ -5,7 +5,8 @@ On container start:
   1. Run Alembic migrations
   2. Connect infrastructure (Postgres, Redis, LLM, HTTP)
   3. Recover any stale tasks from previous crash
-  4. Start the continuous pipeline loop (runs every 5 minutes)
+  4. Open the graph runtime (checkpointer pool + compiled graphs, once)
+  5. Start the continuous pipeline loop (runs every 5 minutes)
 """
 import asyncio
 import logging
@@ -55,6 +56,7 @@ async def main() -> None:
     from infrastructure import get_infrastructure
     infra = get_infrastructure()
     await infra.connect()
+    runtime = None
 
     try:
         # 3. Recover any tasks that were in-flight when the last worker died
@@ -67,11 +69,15 @@ async def main() -> None:
         except Exception as exc:
             log.warning(f"Stale task recovery failed (non-fatal): {exc}")
 
-        # 4. Start the continuous pipeline loop
+        # 4. Checkpointer pool + compiled graphs, shared by every cycle
+        from graphs.runtime import GraphRuntime
+        runtime = await GraphRuntime.start()
+
+        # 5. Start the continuous pipeline loop
         #    This runs forever — one cycle every PIPELINE_INTERVAL_SECONDS
         from orchestrator import run_pipeline_loop
         log.info("Starting continuous pipeline loop...")
-        await run_pipeline_loop(triggered_by="scheduler")
+        await run_pipeline_loop(triggered_by="scheduler", runtime=runtime)
 
     except KeyboardInterrupt:
         log.info("Received shutdown signal.")
@@ -81,7 +87,12 @@ async def main() -> None:
         raise
 
     finally:
-        # 5. Always close infrastructure cleanly, even on error
+        # 6. Always close the graph runtime and infrastructure, even on error
+        if runtime is not None:
+            try:
+                await runtime.close()
+            except Exception as exc:
+                log.error(f"GraphRuntime close failed: {exc}")
         await infra.close()
         log.info("PMW Agents shut down.")
 
@@ -12,7 +12,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 # ── Canonical model definitions live in config.models ─────────────────
 # Re-export so agents can still do: from nodes.base import ModelConfig, ModelProvider
@@ -60,6 +60,7 @@ class LLMResult:
     cost_usd:      float
     model:         str
     attempts:      int = 1
+    cached:        bool = False
 
 
 # ── Base Agent ────────────────────────────────────────────────────────
@@ -67,6 +68,22 @@ class LLMResult:
 class BaseAgent(ABC):
     MAX_RETRIES: int = 2
 
+    # ── LLM response cache ────────────────────────────────────────────
+    # Validated responses are cached by prompt content. Stages whose output
+    # must be fresh on every call — judges, and anything feeding a HITL
+    # decision a human may re-run — set CACHE_RESPONSES = False; stages
+    # whose prompts embed fast-moving data set a shorter CACHE_TTL_SECS.
+    CACHE_RESPONSES: bool = True
+    CACHE_TTL_SECS:  int | None = None   # None → settings.LLM_CACHE_DEFAULT_TTL_SECONDS
+
+    # ── Stage data dependencies ───────────────────────────────────────
+    # State keys this stage reads from / writes to. The research stage
+    # scheduler (nodes/research/stage_dag.py) derives the dependency DAG
+    # from these. Keys no stage in the DAG produces (brief, run_id, …)
+    # are treated as always available.
+    INPUT_KEYS:  tuple[str, ...] = ()
+    OUTPUT_KEYS: tuple[str, ...] = ()
+
     def __init__(
         self,
         agent_name:     str,
@@ -87,7 +104,16 @@ class BaseAgent(ABC):
         temperature:   float | None = None,
         system_prompt: str | None = None,
         attempt:       int | None = None,
+        use_cache:     bool | None = None,
+        validate:      Callable[[str], Any] | None = None,
     ) -> LLMResult:
+        """
+        Call the stage's model and return the validated response.
+
+        `validate` replaces validate_output for this call — for checks that
+        depend on the request (e.g. one score per candidate). A response
+        that fails it raises ValueError, is retried, and is never cached.
+        """
         if not self.model_config:
             raise RuntimeError(f"[{self.agent_name}] call_llm() requires model_config")
 
@@ -98,6 +124,16 @@ class BaseAgent(ABC):
         tracker = CostTrackingService()
         temp = temperature if temperature is not None else self.model_config.temperature
 
+        cache_key = None
+        if self._cache_enabled(use_cache):
+            cache_key = infra.llm_cache.make_key(
+                self.model_config.provider.value, self.model_config.model_id,
+                temp, self.model_config.max_tokens, system_prompt, prompt,
+            )
+            cached = await self._from_cache(infra, tracker, cache_key, run_id, validate)
+            if cached is not None:
+                return cached
+
         last_error = None
         total_cost = 0.0
         total_in = 0
@@ -115,20 +151,25 @@ class BaseAgent(ABC):
                 )
 
                 cost = await tracker.record_usage(
-                    run_id        = run_id,
-                    stage_name    = self.stage_name,
-                    attempt       = att,
-                    provider      = self.model_config.provider.value,
-                    model         = self.model_config.model_id,
-                    input_tokens  = response.input_tokens,
-                    output_tokens = response.output_tokens,
+                    run_id             = run_id,
+                    stage_name         = self.stage_name,
+                    attempt            = att,
+                    provider           = self.model_config.provider.value,
+                    model              = self.model_config.model_id,
+                    input_tokens       = response.input_tokens,
+                    output_tokens      = response.output_tokens,
+                    cache_read_tokens  = response.cache_read_tokens,
+                    cache_write_tokens = response.cache_write_tokens,
                 )
 
                 total_cost += cost
                 total_in += response.input_tokens
                 total_out += response.output_tokens
 
-                validated = self.validate_output(response.text)
+                validated = (validate or self.validate_output)(response.text)
+
+                if cache_key:
+                    await infra.llm_cache.set(cache_key, response, ttl=self.CACHE_TTL_SECS)
 
                 return LLMResult(
                     text          = validated if isinstance(validated, str) else json.dumps(validated),
@@ -155,6 +196,57 @@ class BaseAgent(ABC):
 
         raise last_error or RuntimeError("call_llm exhausted retries")
 
+    def _cache_enabled(self, use_cache: bool | None) -> bool:
+        from config.settings import settings
+        if not settings.LLM_CACHE_ENABLED:
+            return False
+        if use_cache is not None:
+            return use_cache
+        return self.CACHE_RESPONSES and self.CACHE_TTL_SECS != 0
+
+    async def _from_cache(
+        self, infra, tracker, cache_key: str, run_id: int,
+        validate: Callable[[str], Any] | None = None,
+    ) -> LLMResult | None:
+        """Serve a validated response from the cache, logged as a zero-cost call."""
+        try:
+            hit = await infra.llm_cache.get(cache_key)
+        except Exception as exc:
+            self.log.debug(f"LLM cache lookup failed: {exc}")
+            return None
+        if hit is None:
+            return None
+
+        try:
+            validated = (validate or self.validate_output)(hit.text)
+        except ValueError as ve:
+            # Validation rules changed since the entry was written
+            self.log.debug(f"Cached response no longer validates: {ve}")
+            await infra.llm_cache.invalidate(cache_key)
+            return None
+
+        await tracker.record_usage(
+            run_id        = run_id,
+            stage_name    = self.stage_name,
+            attempt       = 1,
+            provider      = self.model_config.provider.value,
+            model         = self.model_config.model_id,
+            input_tokens  = hit.input_tokens,
+            output_tokens = hit.output_tokens,
+            cache_hit     = True,
+        )
+        self.log.info("LLM response served from cache")
+
+        return LLMResult(
+            text          = validated if isinstance(validated, str) else json.dumps(validated),
+            input_tokens  = hit.input_tokens,
+            output_tokens = hit.output_tokens,
+            cost_usd      = 0.0,
+            model         = self.model_config.model_id,
+            attempts      = 1,
+            cached        = True,
+        )
+
     def validate_output(self, raw_output: str) -> Any:
         return raw_output
 
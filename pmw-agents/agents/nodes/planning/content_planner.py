@@ -25,13 +25,14 @@ from nodes.base import (
     BaseAgent, JSONOutputMixin, ModelConfig, ModelProvider,
     EventType, FailureConfig,
 )
-from prompts.registry import PromptRegistry
+from prompts.registry import PromptRegistry, RenderedPrompt
 
 log = logging.getLogger("pmw.node.content_planner")
 
 
 class ContentPlanner(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 2
+    CACHE_RESPONSES = False  # a re-plan should produce a fresh plan
 
     def __init__(self):
         super().__init__(
@@ -68,7 +69,7 @@ class ContentPlanner(JSONOutputMixin, BaseAgent):
             # Build the prompt using the correct template
             prompt = self._build_prompt(content_type, bundle, topic, internal_links)
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
 
             plan = json.loads(result.text) if isinstance(result.text, str) else result.text
 
@@ -127,7 +128,7 @@ class ContentPlanner(JSONOutputMixin, BaseAgent):
         bundle: dict,
         topic: dict,
         internal_links: list[dict],
-    ) -> str:
+    ) -> RenderedPrompt:
         """Build the planning prompt from the correct template + research data."""
         brief = bundle.get("brief") or {}
         affiliate = brief.get("affiliate", {})
@@ -171,7 +172,7 @@ class ContentPlanner(JSONOutputMixin, BaseAgent):
             "INTERNAL_LINKS": links_text,
         }
 
-        return PromptRegistry.render(template_key, variables)
+        return PromptRegistry.render_parts(template_key, variables)
 
     # ── Research data summarisers (keep prompts token-efficient) ───────
 
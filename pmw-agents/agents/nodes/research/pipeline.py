@@ -5,13 +5,16 @@ Research Pipeline (v3.0) — content-type-aware stage routing.
   authority       → stages 2, 5 (keyword + competitor only)
   market_commentary → stages 2, 3 (keyword + market only)
 
-Partial bundles are assembled from whichever stages ran.
+Within each route, stages run as a dependency DAG (stage_dag.py): each
+starts as soon as its inputs exist, and after a failure no further stage
+is started. Partial bundles are assembled from whichever stages ran.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Callable
 
 from config.settings import settings
 
@@ -25,26 +28,52 @@ from nodes.research.stage7.tool_loader import ToolLoader
 from nodes.research.stage7.tool_mapping import ToolMapping
 from nodes.research.stage8.arc_coherence import ArcCoherence
 from nodes.research.stage8.bundle_assembler import BundleAssembler
+from nodes.research.stage_dag import run_stage_dag
 
 log = logging.getLogger("pmw.research.pipeline")
 
+# Stage sets per content type. Ordering comes from each stage's
+# INPUT_KEYS / OUTPUT_KEYS, not from this list.
+AFFILIATE_STAGES = (
+    "keyword", "market", "competitor", "factors", "data_fetch",
+    "psychology", "tool_load", "tool_map", "arc",
+)
+AUTHORITY_STAGES  = ("keyword", "competitor")
+COMMENTARY_STAGES = ("keyword", "market")
+
 
 async def research_briefs(
     locked_briefs: list[dict],
     run_id: int,
     triggered_by: str = "scheduler",
+    on_bundle: Callable[[dict], None] | None = None,
 ) -> dict:
+    """
+    Research all locked briefs concurrently. If on_bundle is given it is
+    called with each bundle the moment it completes, so downstream phases
+    can start before the slowest brief finishes.
+    """
     if not locked_briefs:
         return {"completed_bundles": [], "errors": [], "model_usage": []}
 
     concurrency = max(1, settings.BRIEF_CONCURRENCY)
     semaphore = asyncio.Semaphore(concurrency)
 
+    # Warm the shared market snapshots so Stage 3 never waits on price/news
+    from services import services
+    services.market_snapshots.prefetch(run_id, _market_pairs(locked_briefs))
+
     log.info(f"Research pipeline: {len(locked_briefs)} brief(s), concurrency={concurrency}")
 
     async def process_with_limit(brief, index):
         async with semaphore:
-            return await _research_one_brief(brief, index, len(locked_briefs), run_id)
+            result = await _research_one_brief(brief, index, len(locked_briefs), run_id)
+        if on_bundle is not None and result.get("bundle"):
+            try:
+                on_bundle(result["bundle"])
+            except Exception as exc:
+                log.error(f"on_bundle callback failed: {exc}")
+        return result
 
     results = await asyncio.gather(
         *(process_with_limit(b, i) for i, b in enumerate(locked_briefs)),
@@ -62,6 +91,7 @@ async def research_briefs(
         errors.extend(result.get("errors", []))
         usage.extend(result.get("model_usage", []))
 
+    services.market_snapshots.clear_run(run_id)
     log.info(f"Research done: {len(bundles)}/{len(locked_briefs)} completed")
     return {"completed_bundles": bundles, "errors": errors, "model_usage": usage}
 
@@ -125,25 +155,14 @@ async def _research_one_brief(brief, index, total, run_id):
 
 
 async def _run_affiliate_stages(s, stages):
-    """Full research: stages 2,3,5 parallel → 4 → 6a,6b → 7a,7b → 8a."""
-    kw, mkt, comp = await asyncio.gather(
-        stages["keyword"].run(s), stages["market"].run(s), stages["competitor"].run(s),
-    )
-    _merge(s, kw); _merge(s, mkt); _merge(s, comp)
-    if _any_failed(kw, mkt, comp):
-        s["status"] = "failed"; return
-
-    _merge(s, await stages["factors"].run(s))
-    if s.get("status") == "failed": return
+    """
+    Full research: stages 2-8a, scheduled by data dependency. Each stage
+    starts as soon as the stages producing its INPUT_KEYS have finished.
+    """
+    await run_stage_dag(s, {name: stages[name] for name in AFFILIATE_STAGES})
+    if s.get("status") == "failed":
+        return
 
-    _merge(s, await stages["data_fetch"].run(s))
-    _merge(s, await stages["psychology"].run(s))
-    if s.get("status") == "failed": return
-
-    _merge(s, await stages["tool_load"].run(s))
-    _merge(s, await stages["tool_map"].run(s))
-
-    _merge(s, await stages["arc"].run(s))
     arc = s.get("arc_validation") or {}
     if not arc.get("arc_coherent", False):
         s["status"] = "failed"
@@ -152,22 +171,12 @@ async def _run_affiliate_stages(s, stages):
 
 async def _run_authority_stages(s, stages):
     """Authority content: keyword research + competitor analysis only."""
-    kw, comp = await asyncio.gather(
-        stages["keyword"].run(s), stages["competitor"].run(s),
-    )
-    _merge(s, kw); _merge(s, comp)
-    if _any_failed(kw, comp):
-        s["status"] = "failed"
+    await run_stage_dag(s, {name: stages[name] for name in AUTHORITY_STAGES})
 
 
 async def _run_commentary_stages(s, stages):
     """Commentary content: keyword research + market context only."""
-    kw, mkt = await asyncio.gather(
-        stages["keyword"].run(s), stages["market"].run(s),
-    )
-    _merge(s, kw); _merge(s, mkt)
-    if _any_failed(kw, mkt):
-        s["status"] = "failed"
+    await run_stage_dag(s, {name: stages[name] for name in COMMENTARY_STAGES})
 
 
 # ── Bundle assembler needs to handle partial bundles ──────────────────
@@ -179,6 +188,16 @@ async def _run_commentary_stages(s, stages):
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
+def _market_pairs(briefs):
+    """Distinct (asset_class, geography) of briefs whose route runs Stage 3."""
+    pairs = set()
+    for brief in briefs:
+        topic = brief.get("topic", {})
+        if topic.get("content_type", "affiliate") in ("affiliate", "market_commentary"):
+            pairs.add((topic.get("asset_class", "gold"), topic.get("geography", "uk")))
+    return pairs
+
+
 def _merge(state, updates):
     for k, v in updates.items():
         if v is not None or k in ("status", "errors", "model_usage"):
@@ -189,9 +208,6 @@ def _merge(state, updates):
             else:
                 state[k] = v
 
-def _any_failed(*dicts):
-    return any(isinstance(d, dict) and d.get("status") == "failed" for d in dicts)
-
 def _brief_result(s, title, topic_id, run_id, success):
     if not success:
         _release_lock(topic_id, run_id)
@@ -1,7 +1,7 @@
 """
 Stage 1b — AffiliateLoader
 
-Fetches dealers from WordPress, syncs to Postgres, returns all_affiliates.
+Streams dealers from WordPress into Postgres, returns all_affiliates.
 WP fetch and sync failures are non-fatal — falls back to existing Postgres data.
 """
 
@@ -25,21 +25,12 @@ class AffiliateLoader(BaseAgent):
         try:
             from services import services
 
-            # Step 1: Fetch from WordPress (non-fatal)
-            wp_dealers = []
+            # Steps 1-2: Stream WordPress dealers into Postgres page by page (non-fatal)
             try:
-                wp_dealers = await services.affiliates.fetch_from_wordpress(active_only=False)
-                self.log.info(f"Fetched {len(wp_dealers)} dealer(s) from WordPress")
+                synced = await services.affiliates.sync_from_wordpress(active_only=False)
+                self.log.info(f"Synced {synced} dealer(s) from WordPress to Postgres")
             except Exception as exc:
-                self.log.warning(f"WP dealer fetch failed (using Postgres): {exc}")
-
-            # Step 2: Sync to Postgres (non-fatal)
-            if wp_dealers:
-                try:
-                    synced = await services.affiliates.sync_to_postgres(wp_dealers)
-                    self.log.info(f"Synced {synced} dealer(s) to Postgres")
-                except Exception as exc:
-                    self.log.warning(f"Postgres sync failed (using existing data): {exc}")
+                self.log.warning(f"WP dealer sync failed (using Postgres): {exc}")
 
             # Step 3: Load from Postgres (this is the critical step)
             affiliates = await services.affiliates.get_active_affiliates()
@@ -2,12 +2,14 @@
 Stage 1c — BriefBuilder (v3.2 — content_type routing)
 
 Routes by content_type:
-  affiliate       → category match → per-affiliate coherence → lock brief
+  affiliate       → category match → batched coherence → lock brief
   authority       → no affiliate needed → lock brief with empty affiliate section
   market_commentary → optional soft affiliate → lock brief
 
 Pre-LLM category match (zero tokens) filters affiliates before LLM check.
-Compact coherence prompt (~200 input, ~100 output tokens per affiliate).
+Coherence for all candidates is scored in one structured call
+(COHERENCE_BATCH_ENABLED); a malformed batch falls back to the compact
+per-affiliate prompt (~200 input, ~100 output tokens per affiliate).
 """
 
 from __future__ import annotations
@@ -22,7 +24,6 @@ from config.settings import settings
 
 log = logging.getLogger("pmw.node.brief_builder")
 
-INTER_TOPIC_DELAY_SECS = 1.0
 MAX_AFFILIATES_TO_CHECK = 5
 
 
@@ -50,6 +51,9 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
                 max_tokens=512,
             ),
         )
+        # run_id → lock serialising that run's topic-lock claims. Keyed per
+        # run because ResearchGraph shares this agent across concurrent runs.
+        self._lock_guards: dict[int, asyncio.Lock] = {}
 
     async def run(self, state: dict) -> dict:
         run_id = state["run_id"]
@@ -66,59 +70,51 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
 
         from services import services
 
+        # The same topic twice in one run would pass acquire_topic_lock twice
+        # (it ignores locks held by this run), so de-duplicate up front.
+        seen: set = set()
+        topics = []
+        for topic in all_topics:
+            tid = topic.get("id")
+            if tid is not None and tid in seen:
+                continue
+            seen.add(tid)
+            topics.append(topic)
+
+        concurrency = max(1, settings.BRIEF_BUILDER_CONCURRENCY)
+        semaphore = asyncio.Semaphore(concurrency)
+        self.log.info(f"Building {len(topics)} brief(s), concurrency={concurrency}")
+
+        async def build_with_limit(topic):
+            # LLM calls inside are paced by the shared provider rate limiter;
+            # the semaphore only bounds how many topics are in flight.
+            async with semaphore:
+                return await self._build_topic(topic, all_affiliates, run_id, services)
+
+        try:
+            results = await asyncio.gather(*(build_with_limit(t) for t in topics))
+        finally:
+            # Created lazily on this run's loop; agents outlive event loops
+            self._lock_guards.pop(run_id, None)
+
         locked = []
         review = []
         all_usage = []
         total_in, total_out = 0, 0
 
-        for i, topic in enumerate(all_topics):
-            title = topic.get("title", "Untitled")
-            content_type = topic.get("content_type", "affiliate")
+        for result in results:
+            if result["status"] == "passed":
+                locked.append(result["brief"])
+            elif result["status"] != "skipped":
+                review.append(result.get("review_item", {}))
 
-            if i > 0:
-                await asyncio.sleep(INTER_TOPIC_DELAY_SECS)
-
-            try:
-                if content_type in ("authority", "market_commentary"):
-                    result = await self._process_non_affiliate(
-                        topic, all_affiliates, run_id, services, content_type,
-                    )
-                else:
-                    if not all_affiliates:
-                        result = {
-                            "status": "needs_review",
-                            "reason": "No affiliates available for affiliate content",
-                            "review_item": {"topic": topic, "reason": "No affiliates"},
-                            "topic": topic, "usage_list": [],
-                        }
-                    else:
-                        result = await self._process_affiliate(
-                            topic, all_affiliates, run_id, services,
-                        )
-
-                if result["status"] == "passed":
-                    locked.append(result["brief"])
-                    self.log.info(f"✓ '{title}' [{content_type}] → locked")
-                elif result["status"] == "skipped":
-                    self.log.info(f"⊘ '{title}' → skipped")
-                else:
-                    review.append(result.get("review_item", {}))
-                    self.log.info(f"⚠ '{title}' → {result.get('reason', '?')}")
-
-                for u in result.get("usage_list", []):
-                    all_usage.append(u)
-                    total_in += u.get("input_tokens", 0)
-                    total_out += u.get("output_tokens", 0)
-
-                if result["status"] in ("passed", "needs_review"):
-                    await self._save_to_db(run_id, result)
-
-            except Exception as exc:
-                self.log.error(f"✗ '{title}' → error: {exc}")
-                review.append({"topic": topic, "reason": str(exc), "status": "needs_review"})
+            for u in result.get("usage_list", []):
+                all_usage.append(u)
+                total_in += u.get("input_tokens", 0)
+                total_out += u.get("output_tokens", 0)
 
         total_cost = sum(u.get("cost_usd", 0) for u in all_usage)
-        output = {"locked": len(locked), "review": len(review), "total": len(all_topics)}
+        output = {"locked": len(locked), "review": len(review), "total": len(topics)}
 
         await self._write_stage(
             run_id, "complete", passed=len(locked) > 0, output=output,
@@ -133,6 +129,56 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
             "status": "complete" if state.get("status") != "failed" else "failed",
         }
 
+    async def _build_topic(self, topic, all_affiliates, run_id, services):
+        """Route, score and persist one topic. Never raises."""
+        title = topic.get("title", "Untitled")
+        content_type = topic.get("content_type", "affiliate")
+
+        try:
+            if content_type in ("authority", "market_commentary"):
+                result = await self._process_non_affiliate(
+                    topic, all_affiliates, run_id, services, content_type,
+                )
+            elif not all_affiliates:
+                result = {
+                    "status": "needs_review",
+                    "reason": "No affiliates available for affiliate content",
+                    "review_item": {"topic": topic, "reason": "No affiliates"},
+                    "topic": topic, "usage_list": [],
+                }
+            else:
+                result = await self._process_affiliate(
+                    topic, all_affiliates, run_id, services,
+                )
+
+            if result["status"] == "passed":
+                self.log.info(f"✓ '{title}' [{content_type}] → locked")
+            elif result["status"] == "skipped":
+                self.log.info(f"⊘ '{title}' → skipped")
+            else:
+                self.log.info(f"⚠ '{title}' → {result.get('reason', '?')}")
+
+            if result["status"] in ("passed", "needs_review"):
+                await self._save_to_db(run_id, result)
+            return result
+
+        except Exception as exc:
+            self.log.error(f"✗ '{title}' → error: {exc}")
+            return {
+                "status": "needs_review", "topic": topic, "usage_list": [],
+                "review_item": {"topic": topic, "reason": str(exc), "status": "needs_review"},
+            }
+
+    async def _acquire_lock(self, services, tid, run_id) -> bool:
+        """
+        Serialise lock claims within this run. acquire_topic_lock's
+        check-then-claim updates this run's own workflow_runs row, so
+        concurrent claims from the same run are taken one at a time.
+        """
+        guard = self._lock_guards.setdefault(run_id, asyncio.Lock())
+        async with guard:
+            return await services.workflows.acquire_topic_lock(topic_wp_id=tid, run_id=run_id)
+
     # ── Non-affiliate topics (authority, commentary) ──────────────────
 
     async def _process_non_affiliate(self, topic, all_affiliates, run_id, services, content_type):
@@ -143,7 +189,7 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
         """
         tid = topic.get("id")
 
-        acquired = await services.workflows.acquire_topic_lock(topic_wp_id=tid, run_id=run_id)
+        acquired = await self._acquire_lock(services, tid, run_id)
         if not acquired:
             return {"status": "skipped", "topic": topic, "usage_list": []}
 
@@ -204,24 +250,8 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
             f"checking top {len(candidates)}"
         )
 
-        # Phase 2: per-affiliate coherence
-        results = []
-        usage_list = []
-
-        for aff in candidates:
-            try:
-                score, rationale, usage = await self._coherence_check(topic, aff, run_id)
-                results.append({
-                    "affiliate": aff, "coherence_score": score,
-                    "rationale": rationale, "passed": score >= settings.COHERENCE_THRESHOLD,
-                })
-                usage_list.append(usage)
-            except Exception as exc:
-                self.log.warning(f"  {aff['name']}: coherence failed: {exc}")
-                results.append({
-                    "affiliate": aff, "coherence_score": 0.0,
-                    "rationale": str(exc), "passed": False,
-                })
+        # Phase 2: coherence — one batched call, per-affiliate on fallback
+        results, usage_list = await self._score_candidates(topic, candidates, run_id)
 
         passed = sorted([r for r in results if r["passed"]],
                         key=lambda r: r["coherence_score"], reverse=True)
@@ -241,7 +271,7 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
                 "usage_list": usage_list,
             }
 
-        acquired = await services.workflows.acquire_topic_lock(topic_wp_id=tid, run_id=run_id)
+        acquired = await self._acquire_lock(services, tid, run_id)
         if not acquired:
             return {"status": "skipped", "topic": topic, "usage_list": usage_list}
 
@@ -321,7 +351,109 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
             aff["_rank_score"] = (commission * 10) + (min(cookies, 90) / 90 * 0.3)
         return sorted(matched, key=lambda a: a["_rank_score"], reverse=True)
 
-    # ── Coherence check (compact prompt) ──────────────────────────────
+    # ── Coherence scoring ─────────────────────────────────────────────
+
+    async def _score_candidates(self, topic, candidates, run_id):
+        """
+        Score every candidate affiliate for a topic. Uses a single batched
+        LLM call when enabled; falls back to one call per affiliate if the
+        batch fails or its response does not cover every candidate.
+        """
+        usage_list = []
+
+        if settings.COHERENCE_BATCH_ENABLED and len(candidates) > 1:
+            try:
+                scored, usage = await self._batch_coherence_check(topic, candidates, run_id)
+                usage_list.append(usage)
+                return [
+                    self._coherence_result(aff, score, rationale)
+                    for aff, (score, rationale) in zip(candidates, scored)
+                ], usage_list
+            except Exception as exc:
+                self.log.warning(
+                    f"  batched coherence failed — falling back to per-affiliate: {exc}"
+                )
+
+        results = []
+        for aff in candidates:
+            try:
+                score, rationale, usage = await self._coherence_check(topic, aff, run_id)
+                results.append(self._coherence_result(aff, score, rationale))
+                usage_list.append(usage)
+            except Exception as exc:
+                self.log.warning(f"  {aff['name']}: coherence failed: {exc}")
+                results.append({
+                    "affiliate": aff, "coherence_score": 0.0,
+                    "rationale": str(exc), "passed": False,
+                })
+        return results, usage_list
+
+    @staticmethod
+    def _coherence_result(affiliate, score, rationale):
+        return {
+            "affiliate": affiliate, "coherence_score": score,
+            "rationale": rationale, "passed": score >= settings.COHERENCE_THRESHOLD,
+        }
+
+    async def _batch_coherence_check(self, topic, candidates, run_id):
+        """
+        One structured call scoring all candidates. Returns ([(score, rationale)]
+        in candidate order, usage). Raises ValueError if any candidate is
+        missing or has an out-of-range score — the caller falls back.
+        """
+        lines = [
+            f"[{i}] {aff.get('name', '')} — Offers: {(aff.get('value_prop') or '')[:100]} "
+            f"| Assets: {(aff.get('asset_classes') or '')[:60]}"
+            for i, aff in enumerate(candidates, 1)
+        ]
+        prompt = (
+            "Score how well EACH affiliate fits this article topic. "
+            "Return JSON: {\"scores\": [{\"id\": <affiliate number>, "
+            "\"score\": 0.0-1.0, \"rationale\": \"1 sentence\"}]} "
+            "with exactly one entry per affiliate.\n\n"
+            f"TOPIC: {topic.get('title', '')}\n"
+            f"Keyword: {topic.get('target_keyword', '')}\n"
+            f"Asset: {topic.get('asset_class', '')} | Geo: {topic.get('geography', 'uk')}\n\n"
+            "AFFILIATES:\n" + "\n".join(lines) + "\n\n"
+            "0.8+ = direct fit. 0.4-0.7 = loose. <0.4 = poor."
+        )
+        def complete(raw: str) -> dict:
+            # An incomplete response fails validation, so it is never cached
+            data = self.validate_output(raw)
+            self._batch_scores(data, len(candidates))
+            return data
+
+        result = await self.call_llm(prompt, run_id, validate=complete)
+        data = json.loads(result.text) if isinstance(result.text, str) else result.text
+
+        return self._batch_scores(data, len(candidates)), {
+            "stage": f"{self.stage_name}.{topic.get('id')}.batch",
+            "model": self.model_config.model_id,
+            "input_tokens": result.input_tokens,
+            "output_tokens": result.output_tokens,
+            "cost_usd": result.cost_usd,
+        }
+
+    @staticmethod
+    def _batch_scores(data: dict, count: int) -> list[tuple[float, str]]:
+        """
+        [(score, rationale)] in candidate order from a batch response.
+        Raises ValueError if any candidate is missing or out of range.
+        """
+        by_id = {}
+        for entry in data.get("scores") or []:
+            try:
+                idx = int(entry["id"])
+                score = float(entry["score"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 1 <= idx <= count and 0.0 <= score <= 1.0:
+                by_id[idx] = (score, str(entry.get("rationale", "")))
+
+        missing = [i for i in range(1, count + 1) if i not in by_id]
+        if missing:
+            raise ValueError(f"batch response missing affiliates {missing}")
+        return [by_id[i] for i in range(1, count + 1)]
 
     async def _coherence_check(self, topic, affiliate, run_id):
         prompt = (
@@ -347,8 +479,8 @@ class BriefBuilder(JSONOutputMixin, BaseAgent):
 
     def validate_output(self, raw_output: str) -> dict:
         data = super().validate_output(raw_output)
-        if "score" not in data:
-            raise ValueError("Missing 'score'")
+        if "score" not in data and not isinstance(data.get("scores"), list):
+            raise ValueError("Missing 'score' / 'scores'")
         return data
 
     # ── DB + helpers ──────────────────────────────────────────────────
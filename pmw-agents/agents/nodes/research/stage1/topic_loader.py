@@ -2,17 +2,23 @@
 Stage 1a — TopicLoader (v3.0)
 
 Smart sync:
-  - First run (empty Postgres): full WP fetch → batch sync
-  - Subsequent runs: load from Postgres, check WP for new topics only
+  - First run (empty Postgres): full WP fetch → batch sync, page by page
+  - Subsequent runs: upsert only topics modified in WP since the stored
+    high-water mark (new and edited)
+  - Every WP_TOPIC_RECONCILE_SECS: archive topics no longer published in WP
+  - WP topics are streamed one GraphQL page at a time, so sync memory
+    stays bounded by the page size however many topics exist
   - Syncs content_type field from WordPress
-  - Skips exhausted topics (all affiliates failed in prior runs)
-  - Caps at 100 topics
+  - Picks the batch in one indexed SQL query (TopicService.pick_batch):
+    active, unlocked, not exhausted (all affiliates failed in prior runs),
+    outside the cooldown, by priority then least-run; caps at 100 topics
   - Batch upsert for efficiency
 """
 
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 
 from nodes.base import BaseAgent, EventType
 from infrastructure import get_infrastructure
@@ -45,52 +51,35 @@ class TopicLoader(BaseAgent):
             if known_ids:
                 self.log.info(f"{len(known_ids)} topics in Postgres — loading locally")
                 try:
-                    new_topics = await services.topics.get_new_topics_only(known_ids)
-                    if new_topics:
-                        await self._batch_sync(new_topics)
-                        self.log.info(f"Synced {len(new_topics)} new topic(s)")
+                    synced = await self._sync_from_wordpress(known_ids)
+                    if synced:
+                        self.log.info(f"Synced {synced} new/changed topic(s)")
                 except Exception as exc:
-                    self.log.warning(f"WP new-topic check failed (non-fatal): {exc}")
-
-                all_topics = await services.topics.load_from_postgres()
+                    self.log.warning(f"WP topic sync failed (non-fatal): {exc}")
             else:
                 self.log.info("Empty Postgres — full WP fetch")
-                wp_topics = await services.topics.get_eligible_topics()
-                if not wp_topics:
+                synced = await self._sync_from_wordpress(known_ids)
+                if not synced:
                     return await self._fail(state, run_id, "No published topics in WordPress")
-                await self._batch_sync(wp_topics)
-                all_topics = wp_topics
-
-            if not all_topics:
-                return await self._fail(state, run_id, "No topics available")
-
-            # Cap
-            if len(all_topics) > MAX_TOPICS:
-                self.log.info(f"Capping {len(all_topics)} → {MAX_TOPICS}")
-                all_topics = all_topics[:MAX_TOPICS]
-
-            # Filter locked
-            unlocked = await services.topics.filter_locked_topics(all_topics)
-            if not unlocked:
-                return await self._fail(state, run_id, f"All {len(all_topics)} topic(s) locked")
-
-            # Filter exhausted (affiliate topics where all affiliates failed coherence)
-            eligible = await self._filter_exhausted(unlocked)
+                self.log.info(f"Synced {synced} topic(s) from WordPress")
 
-            # Batch select with cooldown
+            # ── Pick: one indexed query (active, unlocked, not exhausted,
+            #    outside cooldown, priority / least-run order) ─────────
             batch_size = settings.TOPICS_PER_RUN or MAX_TOPICS
-            batch = await services.topics.select_batch(eligible, batch_size)
+            batch = await services.topics.pick_batch(
+                batch_size,
+                claim_run_id=run_id if settings.TOPIC_PICKER_CLAIM else None,
+            )
 
             if not batch:
-                self.log.info("No topics eligible after cooldown")
+                if not await services.topics.count_active():
+                    return await self._fail(state, run_id, "No topics available")
+                self.log.info("No topics eligible (locked, exhausted or cooling down)")
                 await self._write_stage(run_id, "complete", passed=False,
-                                        output={"count": 0, "reason": "cooldown"})
+                                        output={"count": 0, "reason": "none_eligible"})
                 return {"all_topics": [], "status": "complete", "current_stage": self.stage_name}
 
-            self.log.info(
-                f"Selected {len(batch)} topic(s) "
-                f"({len(eligible)} eligible, {len(unlocked)} unlocked, {len(all_topics)} total)"
-            )
+            self.log.info(f"Selected {len(batch)} topic(s) (batch size {batch_size})")
 
             output = {
                 "count": len(batch),
@@ -105,157 +94,152 @@ class TopicLoader(BaseAgent):
         except Exception as exc:
             return await self._fail(state, run_id, str(exc))
 
-    # ── Batch sync ─────────────────────────────────────────────────────
+    # ── WordPress → Postgres sync ──────────────────────────────────────
 
-    async def _batch_sync(self, topics: list[dict]) -> None:
-        """Batch upsert topics to Postgres including content_type."""
-        if not topics:
-            return
-        infra = get_infrastructure()
-
-        # Check if content_type column exists (migration 010)
-        has_content_type = await self._column_exists("topics", "content_type")
+    async def _sync_from_wordpress(self, known_ids: list[int]) -> int:
+        """
+        Upsert new and edited WP topics; returns how many were upserted.
 
-        args_list = []
-        for t in topics:
-            args = (
-                t["id"],
-                t.get("title", ""),
-                t.get("target_keyword", ""),
-                t.get("summary", ""),
-                t.get("include_keywords", ""),
-                t.get("exclude_keywords", ""),
-                t.get("asset_class", ""),
-                t.get("product_type", ""),
-                t.get("geography", "uk"),
-                t.get("is_buy_side", False),
-                t.get("intent_stage", "consideration"),
-                t.get("priority", 5),
-                t.get("schedule_cron", ""),
-                t.get("agent_status", "idle"),
-                t.get("last_run_at") or None,
-                t.get("run_count", 0),
-                t.get("last_run_id") or None,
-                t.get("last_wp_post_id") or None,
-                t.get("wp_category_id") or None,
-                t.get("affiliate_page_id") or None,
-            )
-            if has_content_type:
-                args = args + (t.get("content_type", "affiliate"),)
-            args_list.append(args)
-
-        if has_content_type:
-            sql = """
-                INSERT INTO topics (
-                    id, topic_name, target_keyword, summary,
-                    include_keywords, exclude_keywords, asset_class, product_type,
-                    geography, is_buy_side, intent_stage, priority, schedule_cron,
-                    agent_status, last_run_at, run_count, last_run_id,
-                    last_wp_post_id, wp_category_id, affiliate_page_id, content_type
-                ) VALUES (
-                    $1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,
-                    $15::timestamptz,$16,$17,$18,$19,$20,$21
-                )
-                ON CONFLICT (id) DO UPDATE SET
-                    topic_name=EXCLUDED.topic_name, target_keyword=EXCLUDED.target_keyword,
-                    summary=EXCLUDED.summary, include_keywords=EXCLUDED.include_keywords,
-                    exclude_keywords=EXCLUDED.exclude_keywords, asset_class=EXCLUDED.asset_class,
-                    product_type=EXCLUDED.product_type, geography=EXCLUDED.geography,
-                    is_buy_side=EXCLUDED.is_buy_side, intent_stage=EXCLUDED.intent_stage,
-                    priority=EXCLUDED.priority, schedule_cron=EXCLUDED.schedule_cron,
-                    content_type=EXCLUDED.content_type
-            """
-        else:
-            sql = """
-                INSERT INTO topics (
-                    id, topic_name, target_keyword, summary,
-                    include_keywords, exclude_keywords, asset_class, product_type,
-                    geography, is_buy_side, intent_stage, priority, schedule_cron,
-                    agent_status, last_run_at, run_count, last_run_id,
-                    last_wp_post_id, wp_category_id, affiliate_page_id
-                ) VALUES (
-                    $1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,
-                    $15::timestamptz,$16,$17,$18,$19,$20
-                )
-                ON CONFLICT (id) DO UPDATE SET
-                    topic_name=EXCLUDED.topic_name, target_keyword=EXCLUDED.target_keyword,
-                    summary=EXCLUDED.summary, asset_class=EXCLUDED.asset_class,
-                    product_type=EXCLUDED.product_type, geography=EXCLUDED.geography,
-                    priority=EXCLUDED.priority
-            """
+        Full fetch when Postgres is empty or no high-water mark is stored
+        yet, otherwise only topics modified since the mark. Before
+        migration 014 there is nowhere to keep a mark, so only unseen IDs
+        are synced (the pre-incremental behaviour).
+        """
+        from services import services
+        topics = services.topics
+        infra = get_infrastructure()
 
-        try:
-            await infra.postgres.executemany(sql, args_list)
-        except Exception as exc:
-            self.log.warning(f"Batch sync failed, trying one-by-one: {exc}")
-            for args in args_list:
-                try:
-                    await infra.postgres.execute(sql, *args)
-                except Exception as inner:
-                    log.warning(f"Topic sync failed for WP ID {args[0]}: {inner}")
+        if not infra.schema.wp_sync_state:
+            source = (topics.iter_new_topics_only(known_ids) if known_ids
+                      else topics.iter_eligible_topics())
+            synced = 0
+            async for page in source:
+                await self._batch_sync(page)
+                synced += len(page)
+            return synced
+
+        sync_state = await topics.get_sync_state()
+        mark = sync_state["mark"] if sync_state else None
+        full = mark is None or not known_ids
+        if full:
+            mark = None
+        source = topics.iter_eligible_topics() if full else topics.iter_changed_topics(mark)
+
+        synced = 0
+        # (modified_gmt, id) of every topic synced / failed this pass. The
+        # mark is set once all pages are in, short of the earliest failure.
+        done: list[dict] = []
+        failed: list[dict] = []
+        async for page in source:
+            failed_ids = set(await self._batch_sync(page))
+            for t in page:
+                key = {"id": t["id"], "modified_gmt": t.get("modified_gmt")}
+                (failed if t["id"] in failed_ids else done).append(key)
+            synced += len(page) - len(failed_ids)
+        mark = topics.high_water(mark, done, before=topics.earliest(failed))
+
+        # Deletions never appear as modifications — reconcile periodically.
+        now = datetime.now(timezone.utc)
+        reconciled_at = sync_state["reconciled_at"] if sync_state else None
+        reconciled = None
+        if not known_ids:
+            reconciled = now            # nothing in Postgres could be stale
+        elif reconciled_at is None or (now - reconciled_at).total_seconds() >= settings.WP_TOPIC_RECONCILE_SECS:
+            try:
+                await topics.reconcile_deleted()
+                reconciled = now
+            except Exception as exc:
+                self.log.warning(f"Topic deletion reconcile failed (non-fatal): {exc}")
+
+        await topics.save_sync_state(mark, reconciled_at=reconciled)
+        self.log.info(
+            f"{'Full' if full else 'Incremental'} topic sync: {synced} upserted",
+            extra={"mark": str(mark) if mark else None},
+        )
+        return synced
 
-    # ── Exhausted topic filter ─────────────────────────────────────────
+    # ── Batch sync ─────────────────────────────────────────────────────
 
-    async def _filter_exhausted(self, topics: list[dict]) -> list[dict]:
+    # WP-owned fields refreshed on every sync; run-tracking columns
+    # (agent_status, last_run_at, run_count, ...) are only set on insert.
+    _SYNC_UPDATE_COLS = [
+        "topic_name", "target_keyword", "summary", "include_keywords",
+        "exclude_keywords", "asset_class", "product_type", "geography",
+        "is_buy_side", "intent_stage", "priority", "schedule_cron", "status",
+    ]
+    # Pre-migration 010 sync refreshed only these
+    _SYNC_UPDATE_COLS_LEGACY = [
+        "topic_name", "target_keyword", "summary", "asset_class",
+        "product_type", "geography", "priority", "status",
+    ]
+
+    async def _batch_sync(self, topics: list[dict]) -> list[int]:
         """
-        Remove affiliate topics where ALL affiliates have failed coherence
-        in prior runs. Authority/commentary topics are never exhausted.
+        Bulk upsert topics to Postgres (one COPY + merge) including
+        content_type. Returns the WP IDs that failed to upsert.
         """
         if not topics:
             return []
-
-        # Only check affiliate topics
-        affiliate_ids = [
-            t["id"] for t in topics
-            if t.get("content_type", "affiliate") == "affiliate"
-        ]
-        if not affiliate_ids:
-            return topics
-
         infra = get_infrastructure()
-        try:
-            rows = await infra.postgres.fetch(
-                """
-                SELECT topic_wp_id
-                FROM topic_briefs
-                WHERE topic_wp_id = ANY($1::int[])
-                GROUP BY topic_wp_id
-                HAVING COUNT(*) FILTER (WHERE status = 'passed') = 0
-                   AND COUNT(*) > 0
-                """,
-                affiliate_ids,
-            )
-            exhausted = {r["topic_wp_id"] for r in rows}
 
-            if exhausted:
-                self.log.info(f"Filtered {len(exhausted)} exhausted affiliate topic(s)")
-                from services import services
-                for tid in exhausted:
-                    try:
-                        await services.topics.mark_topic_failed(
-                            tid, "All affiliates failed coherence in prior runs"
-                        )
-                    except Exception:
-                        pass
+        # Check if content_type column exists (migration 010)
+        has_content_type = infra.schema.topics_content_type
 
-            return [t for t in topics if t["id"] not in exhausted]
+        rows = []
+        for t in topics:
+            row = {
+                "id":                t["id"],
+                "topic_name":        t.get("title", ""),
+                "target_keyword":    t.get("target_keyword", ""),
+                "summary":           t.get("summary", ""),
+                "include_keywords":  t.get("include_keywords", ""),
+                "exclude_keywords":  t.get("exclude_keywords", ""),
+                "asset_class":       t.get("asset_class", ""),
+                "product_type":      t.get("product_type", ""),
+                "geography":         t.get("geography", "uk"),
+                "is_buy_side":       bool(t.get("is_buy_side", False)),
+                "intent_stage":      t.get("intent_stage", "consideration"),
+                "priority":          5 if t.get("priority") is None else int(t["priority"]),
+                "schedule_cron":     t.get("schedule_cron", ""),
+                "agent_status":      t.get("agent_status", "idle"),
+                "last_run_at":       self._as_datetime(t.get("last_run_at")),
+                "run_count":         int(t.get("run_count") or 0),
+                "last_run_id":       t.get("last_run_id") or None,
+                "last_wp_post_id":   t.get("last_wp_post_id") or None,
+                "wp_category_id":    t.get("wp_category_id") or None,
+                "affiliate_page_id": t.get("affiliate_page_id") or None,
+                "status":            "active",
+            }
+            if has_content_type:
+                row["content_type"] = t.get("content_type", "affiliate")
+            rows.append(row)
+
+        update_cols = (self._SYNC_UPDATE_COLS + ["content_type"] if has_content_type
+                       else self._SYNC_UPDATE_COLS_LEGACY)
+        outcomes = await infra.postgres.bulk_upsert(
+            "topics", rows, conflict_cols=["id"], update_cols=update_cols,
+            isolate_failures=True,
+        )
+        failed = [r["id"] for r, outcome in zip(rows, outcomes) if outcome == "failed"]
+        if failed:
+            log.warning(f"Topic sync failed for WP ID(s) {failed}")
+        return failed
 
-        except Exception as exc:
-            self.log.warning(f"Exhausted check failed (non-fatal): {exc}")
-            return topics
+    @staticmethod
+    def _as_datetime(value) -> datetime | None:
+        """WP meta timestamps arrive as ISO strings (or ''); COPY needs datetimes."""
+        if not value:
+            return None
+        if isinstance(value, datetime):
+            return value
+        try:
+            dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
     # ── Helpers ─────────────────────────────────────────────────────────
 
-    async def _column_exists(self, table: str, column: str) -> bool:
-        infra = get_infrastructure()
-        try:
-            return bool(await infra.postgres.fetchval(
-                "SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name=$1 AND column_name=$2)",
-                table, column,
-            ))
-        except Exception:
-            return False
-
     @staticmethod
     def _count_by_type(topics: list[dict]) -> dict:
         counts = {}
@@ -23,6 +23,8 @@ log = logging.getLogger("pmw.node.keyword_research")
 
 class KeywordResearch(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 2
+    INPUT_KEYS  = ()
+    OUTPUT_KEYS = ("keyword_research",)
 
     def __init__(self):
         super().__init__(
@@ -52,16 +54,16 @@ class KeywordResearch(JSONOutputMixin, BaseAgent):
         try:
             serp_bundle = await self._fetch_serp_data(topic)
 
-            prompt = PromptRegistry.render("stage2_keyword_serp", {
+            prompt = PromptRegistry.render_parts("stage2_keyword_serp", {
                 "TARGET_KEYWORD": topic.get("target_keyword", ""),
                 "INTENT_STAGE": topic.get("intent_stage", "consideration"),
                 "ASSET_CLASS": topic.get("asset_class", ""),
                 "GEOGRAPHY": topic.get("geography", "uk"),
                 "SERP_JSON": json.dumps(serp_bundle, default=str),
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             output = json.loads(result.text) if isinstance(result.text, str) else result.text
             output["serp_bundle"] = serp_bundle
 
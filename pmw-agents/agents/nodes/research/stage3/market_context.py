@@ -1,14 +1,14 @@
 """
 Stage 3 — MarketContext (model-config patched)
 
-Pre-LLM: Parallel spot price + price trends + recent news fetch
-Algorithmic: Market stance derivation (no LLM needed)
+Pre-LLM: Shared per-cycle MarketSnapshot (spot price, 30/90d trends,
+         asset news) — fetched once per asset class + geography
+Algorithmic: Market stance derivation (computed with the snapshot)
 LLM: Market context synthesis for article writing
 """
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
 
@@ -19,6 +19,9 @@ from prompts.registry import PromptRegistry
 
 class MarketContext(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 2
+    CACHE_TTL_SECS = 3_600   # prompt embeds live prices/news
+    INPUT_KEYS  = ()
+    OUTPUT_KEYS = ("market_context",)
 
     def __init__(self):
         super().__init__(
@@ -46,19 +49,13 @@ class MarketContext(JSONOutputMixin, BaseAgent):
         try:
             from services import services
 
-            spot_price, trend_30d, trend_90d, news = await asyncio.gather(
-                services.market.get_spot_price(asset_class, geography),
-                services.market.get_price_trend(asset_class, days=30, geography=geography),
-                services.market.get_price_trend(asset_class, days=90, geography=geography),
-                services.market.get_recent_news(keyword, geography, days_back=30),
-            )
-
-            stance_data = services.market.derive_market_stance(
-                price_data=spot_price, trend_30d=trend_30d,
-                trend_90d=trend_90d, news_articles=news,
-            )
+            snapshot = await services.market_snapshots.get(run_id, asset_class, geography)
+            spot_price = snapshot.spot_price
+            trend_30d, trend_90d = snapshot.trend_30d, snapshot.trend_90d
+            news = snapshot.news
+            stance_data = snapshot.stance
 
-            prompt = PromptRegistry.render("stage3_market_synthesis", {
+            prompt = PromptRegistry.render_parts("stage3_market_synthesis", {
                 "ASSET_CLASS": asset_class,
                 "GEOGRAPHY": geography,
                 "TARGET_KEYWORD": keyword,
@@ -68,9 +65,9 @@ class MarketContext(JSONOutputMixin, BaseAgent):
                 ),
                 "NEWS_JSON": json.dumps(news[:10], default=str),
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             llm_output = json.loads(result.text) if isinstance(result.text, str) else result.text
 
             market_context = {
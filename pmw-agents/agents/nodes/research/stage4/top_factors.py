@@ -12,6 +12,8 @@ from prompts.registry import PromptRegistry
 
 class TopFactors(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 3
+    INPUT_KEYS  = ("keyword_research", "market_context")
+    OUTPUT_KEYS = ("top_factors",)
 
     def __init__(self):
         super().__init__(
@@ -33,7 +35,7 @@ class TopFactors(JSONOutputMixin, BaseAgent):
         await self._write_stage_record(run_id, status="running", attempt=1)
 
         try:
-            prompt = PromptRegistry.render("stage4_top_factors", {
+            prompt = PromptRegistry.render_parts("stage4_top_factors", {
                 "TOPIC_TITLE": topic.get("title", ""),
                 "TARGET_KEYWORD": topic.get("target_keyword", ""),
                 "ASSET_CLASS": topic.get("asset_class", ""),
@@ -43,9 +45,9 @@ class TopFactors(JSONOutputMixin, BaseAgent):
                 "MARKET_CONTEXT_JSON": json.dumps(market_context, default=str),
                 "KEYWORD_RESEARCH_JSON": json.dumps(keyword_research, default=str),
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             output = json.loads(result.text) if isinstance(result.text, str) else result.text
 
             await self._emit_event(EventType.STAGE_COMPLETE, run_id, {"cost_usd": result.cost_usd})
@@ -12,6 +12,8 @@ from prompts.registry import PromptRegistry
 
 class CompetitorAnalysis(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 3
+    INPUT_KEYS  = ()
+    OUTPUT_KEYS = ("competitor_analysis",)
 
     def __init__(self):
         super().__init__(
@@ -51,15 +53,15 @@ class CompetitorAnalysis(JSONOutputMixin, BaseAgent):
                     "available": page.get("available", False),
                 })
 
-            prompt = PromptRegistry.render("stage5_competitor_analysis", {
+            prompt = PromptRegistry.render_parts("stage5_competitor_analysis", {
                 "TARGET_KEYWORD": topic.get("target_keyword", ""),
                 "ASSET_CLASS": topic.get("asset_class", ""),
                 "AFFILIATE_NAME": primary.get("name", ""),
                 "COMPETITOR_JSON": json.dumps(competitor_data, default=str),
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             output = json.loads(result.text) if isinstance(result.text, str) else result.text
 
             await self._emit_event(EventType.STAGE_COMPLETE, run_id, {"cost_usd": result.cost_usd})
@@ -20,6 +20,9 @@ from nodes.base import BaseAgent, EventType
 
 
 class DataFetcher(BaseAgent):
+    INPUT_KEYS  = ("keyword_research",)
+    OUTPUT_KEYS = ("raw_sources_cache_key",)
+
     def __init__(self):
         super().__init__(
             agent_name="data_fetcher",
@@ -12,6 +12,8 @@ from prompts.registry import PromptRegistry
 
 class PsychologySynthesis(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 3
+    INPUT_KEYS  = ("raw_sources_cache_key",)
+    OUTPUT_KEYS = ("buyer_psychology",)
 
     def __init__(self):
         super().__init__(
@@ -41,7 +43,7 @@ class PsychologySynthesis(JSONOutputMixin, BaseAgent):
                 raw_sources = {"reddit": [], "mse": [], "paa": [], "affiliate_faq": {}}
 
             faq_data = raw_sources.get("affiliate_faq", {})
-            prompt = PromptRegistry.render("stage6b_buyer_psychology", {
+            prompt = PromptRegistry.render_parts("stage6b_buyer_psychology", {
                 "TOPIC_TITLE": topic.get("title", ""),
                 "AFFILIATE_NAME": primary.get("name", ""),
                 "FAQ_URL": primary.get("faq_url", ""),
@@ -50,9 +52,9 @@ class PsychologySynthesis(JSONOutputMixin, BaseAgent):
                 "PAA_JSON": json.dumps(raw_sources.get("paa", []), default=str),
                 "FAQ_TEXT": faq_data.get("content", "") if isinstance(faq_data, dict) else "",
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             output = json.loads(result.text) if isinstance(result.text, str) else result.text
 
             await self._emit_event(EventType.STAGE_COMPLETE, run_id, {"cost_usd": result.cost_usd})
@@ -14,6 +14,9 @@ from nodes.base import BaseAgent, EventType
 
 
 class ToolLoader(BaseAgent):
+    INPUT_KEYS  = ()
+    OUTPUT_KEYS = ("available_tools",)
+
     def __init__(self):
         super().__init__(
             agent_name="tool_loader",
@@ -12,6 +12,13 @@ from prompts.registry import PromptRegistry
 
 class ToolMapping(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 2
+    INPUT_KEYS  = (
+        "available_tools",
+        "keyword_research",
+        "top_factors",
+        "buyer_psychology",
+    )
+    OUTPUT_KEYS = ("tool_mapping",)
 
     def __init__(self):
         super().__init__(
@@ -39,7 +46,7 @@ class ToolMapping(JSONOutputMixin, BaseAgent):
             return {"tool_mapping": output, "current_stage": "stage7.tool_mapping"}
 
         try:
-            prompt = PromptRegistry.render("stage7_tool_mapping", {
+            prompt = PromptRegistry.render_parts("stage7_tool_mapping", {
                 "TOPIC_TITLE": topic.get("title", ""),
                 "TARGET_KEYWORD": topic.get("target_keyword", ""),
                 "ASSET_CLASS": topic.get("asset_class", ""),
@@ -49,9 +56,9 @@ class ToolMapping(JSONOutputMixin, BaseAgent):
                 "TOP_FACTORS_JSON": json.dumps(top_factors, default=str),
                 "KEYWORD_RESEARCH_JSON": json.dumps(keyword_research, default=str),
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             output = json.loads(result.text) if isinstance(result.text, str) else result.text
 
             await self._write_stage_record(
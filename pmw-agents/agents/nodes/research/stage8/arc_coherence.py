@@ -12,6 +12,16 @@ from prompts.registry import PromptRegistry
 
 class ArcCoherence(JSONOutputMixin, BaseAgent):
     MAX_RETRIES = 1
+    CACHE_RESPONSES = False  # a judge feeding HITL — a re-run must re-judge
+    INPUT_KEYS  = (
+        "keyword_research",
+        "market_context",
+        "top_factors",
+        "competitor_analysis",
+        "buyer_psychology",
+        "tool_mapping",
+    )
+    OUTPUT_KEYS = ("arc_validation",)
 
     def __init__(self):
         super().__init__(
@@ -38,7 +48,7 @@ class ArcCoherence(JSONOutputMixin, BaseAgent):
         await self._write_stage_record(run_id, status="running", attempt=1)
 
         try:
-            prompt = PromptRegistry.render("stage8a_arc_coherence", {
+            prompt = PromptRegistry.render_parts("stage8a_arc_coherence", {
                 "BRIEF_JSON": json.dumps(brief, default=str),
                 "KEYWORD_JSON": json.dumps(keyword_research, default=str),
                 "MARKET_JSON": json.dumps(market_context, default=str),
@@ -47,9 +57,9 @@ class ArcCoherence(JSONOutputMixin, BaseAgent):
                 "PSYCHOLOGY_JSON": json.dumps(buyer_psychology, default=str),
                 "TOOLS_JSON": json.dumps(tool_mapping, default=str),
             })
-            prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            prompt_hash = hashlib.sha256(prompt.text.encode()).hexdigest()[:16]
 
-            result = await self.call_llm(prompt, run_id)
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
             output = json.loads(result.text) if isinstance(result.text, str) else result.text
 
             arc_coherent = output.get("arc_coherent", False)
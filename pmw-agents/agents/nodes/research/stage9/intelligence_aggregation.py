@@ -6,7 +6,9 @@ Its failure does NOT block the research pipeline.
 
 Three steps:
   1. Append this run's data to affiliate_intelligence_runs (append-only ledger)
-  2. Rebuild affiliate_intelligence_summary (atomic upsert from all runs)
+  2. Update affiliate_intelligence_summary — after migration 016 step 1
+     already applied this run's counter delta and returned the summary;
+     older schemas rebuild it from all runs (atomic upsert)
   3. Update WP affiliate intelligence page from the summary
 
 Design: Every operation is atomic. No read-modify-write.
@@ -63,7 +65,7 @@ class IntelligenceAggregation(BaseAgent):
 
             # ── 1. Append this run to the raw ledger ──────────────────
             try:
-                await services.affiliates.append_intelligence_run(
+                summary = await services.affiliates.append_intelligence_run(
                     affiliate_id=affiliate_id,
                     run_id=run_id,
                     data={
@@ -87,13 +89,14 @@ class IntelligenceAggregation(BaseAgent):
                 )
                 return {"intelligence_write_result": results}
 
-            # ── 2. Rebuild the aggregate summary ──────────────────────
+            # ── 2. Update the aggregate summary ───────────────────────
             try:
-                summary = await services.affiliates.rebuild_intelligence_summary(affiliate_id)
+                if summary is None:
+                    summary = await services.affiliates.rebuild_intelligence_summary(affiliate_id)
                 results["summary_updated"] = True
                 results["total_runs"] = summary.get("total_runs", 0)
                 log.info(
-                    f"Intelligence summary rebuilt: {summary.get('total_runs', 0)} total runs",
+                    f"Intelligence summary updated: {summary.get('total_runs', 0)} total runs",
                     extra={"run_id": run_id, "affiliate_id": affiliate_id},
                 )
             except Exception as exc:
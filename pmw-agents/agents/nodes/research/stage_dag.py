@@ -0,0 +1,193 @@
+"""
+Stage DAG scheduler — runs research stages as soon as their inputs exist.
+
+Owns:
+  - Building the dependency DAG from each stage's INPUT_KEYS / OUTPUT_KEYS
+  - Starting every stage the moment all of its producers have succeeded
+  - Stopping at the first failure: once a stage fails no new stage is
+    started (the brief is already failed); stages already running finish
+    and the rest are reported as skipped
+  - Per-stage timing and the brief's critical path
+
+Does NOT own:
+  - Which stages run for a content type — pipeline.py picks the set
+  - Stage-level retries — each BaseAgent handles its own
+
+Each stage runs on a snapshot of the shared brief state taken when it
+starts, with empty errors/model_usage lists, so concurrent stages never
+see each other's partial writes and only their own additions are merged.
+
+Usage (from pipeline._run_affiliate_stages):
+    report = await run_stage_dag(s, {"keyword": KeywordResearch(), ...})
+    report.critical_path   # ["keyword", "factors", "tool_map", "arc"]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+
+log = logging.getLogger("pmw.research.stage_dag")
+
+FAILED_STATUSES = ("failed", "hitl")
+
+
+@dataclass
+class StageTiming:
+    start:  float            # seconds since the DAG started
+    end:    float
+    status: str              # "complete" | "failed"
+
+    @property
+    def secs(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class DagReport:
+    wall_secs:     float = 0.0
+    timings:       dict[str, StageTiming] = field(default_factory=dict)
+    failed:        list[str] = field(default_factory=list)
+    skipped:       list[str] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.failed and not self.skipped
+
+    def to_dict(self) -> dict:
+        return {
+            "wall_secs":     round(self.wall_secs, 3),
+            "critical_path": self.critical_path,
+            "failed":        self.failed,
+            "skipped":       self.skipped,
+            "stages": {
+                name: {"start": round(t.start, 3), "secs": round(t.secs, 3), "status": t.status}
+                for name, t in self.timings.items()
+            },
+        }
+
+
+def build_dependencies(stages: dict) -> dict[str, set[str]]:
+    """
+    Map each stage name to the names of the stages producing its inputs.
+    Raises ValueError on duplicate producers or a dependency cycle.
+    """
+    producers: dict[str, str] = {}
+    for name, stage in stages.items():
+        for key in getattr(stage, "OUTPUT_KEYS", ()):
+            if key in producers:
+                raise ValueError(f"'{key}' produced by both {producers[key]} and {name}")
+            producers[key] = name
+
+    deps = {
+        name: {producers[k] for k in getattr(stage, "INPUT_KEYS", ()) if k in producers} - {name}
+        for name, stage in stages.items()
+    }
+
+    # Kahn's algorithm — anything left unordered is on a cycle
+    remaining = {n: set(d) for n, d in deps.items()}
+    while True:
+        ready = [n for n, d in remaining.items() if not d]
+        if not ready:
+            break
+        for n in ready:
+            del remaining[n]
+        for d in remaining.values():
+            d.difference_update(ready)
+    if remaining:
+        raise ValueError(f"Stage dependency cycle among: {sorted(remaining)}")
+    return deps
+
+
+async def run_stage_dag(state: dict, stages: dict) -> DagReport:
+    """
+    Run all stages against the shared brief state, merging each stage's
+    updates as it finishes. After a failure no further stage is started.
+    Sets state["status"] = "failed" if any stage failed or was skipped;
+    the report is also stored as state["stage_timing"].
+    """
+    # Local import — pipeline imports this module
+    from nodes.research.pipeline import _merge
+
+    deps = build_dependencies(stages)
+    report = DagReport()
+    t0 = time.monotonic()
+
+    pending = set(stages)
+    running: dict[asyncio.Task, str] = {}
+    succeeded: set[str] = set()
+    started: dict[str, float] = {}
+
+    async def run_one(name: str) -> dict:
+        snapshot = {**state, "errors": [], "model_usage": []}
+        return await stages[name].run(snapshot)
+
+    try:
+        while True:
+            # Don't spend tokens on a brief that has already failed
+            ready = [] if report.failed else [n for n in pending if deps[n] <= succeeded]
+            for name in ready:
+                pending.discard(name)
+                started[name] = time.monotonic() - t0
+                running[asyncio.create_task(run_one(name))] = name
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                try:
+                    updates = task.result() or {}
+                except Exception as exc:
+                    log.error(f"Stage '{name}' raised: {exc}", exc_info=True)
+                    updates = {"status": "failed",
+                               "errors": [{"stage": name, "error": str(exc)}]}
+
+                _merge(state, updates)
+                ok = updates.get("status") not in FAILED_STATUSES
+                report.timings[name] = StageTiming(
+                    start=started[name], end=time.monotonic() - t0,
+                    status="complete" if ok else "failed",
+                )
+                if ok:
+                    succeeded.add(name)
+                else:
+                    report.failed.append(name)
+    except BaseException:
+        for task in running:
+            task.cancel()
+        raise
+
+    # Whatever never started came after (or depended on) a failure
+    report.skipped = sorted(pending)
+    if report.skipped:
+        log.warning(f"Skipped after stage failure: {report.skipped}")
+    if not report.succeeded:
+        state["status"] = "failed"
+
+    report.wall_secs = time.monotonic() - t0
+    report.critical_path = _critical_path(report.timings, deps)
+    state["stage_timing"] = report.to_dict()
+
+    log.info(
+        f"Stage DAG done in {report.wall_secs:.1f}s | "
+        f"critical path: {' → '.join(report.critical_path)}"
+    )
+    return report
+
+
+def _critical_path(timings: dict[str, StageTiming], deps: dict[str, set[str]]) -> list[str]:
+    """Walk back from the last stage to finish, always via the latest-finishing producer."""
+    if not timings:
+        return []
+    path = [max(timings, key=lambda n: timings[n].end)]
+    while True:
+        producers = [d for d in deps[path[-1]] if d in timings]
+        if not producers:
+            break
+        path.append(max(producers, key=lambda n: timings[n].end))
+    return list(reversed(path))
@@ -3,6 +3,8 @@
 Orchestrator for running workflows in a continuous loop.
 
 Runs the pipeline every PIPELINE_INTERVAL_SECONDS (default 300 = 5 minutes).
+The checkpointer pool and compiled graphs live in a GraphRuntime that is
+created once (by main.py, or by the loop itself) and reused every cycle.
 Each cycle:
   1. Creates a new workflow_runs row (status=pending)
   2. Sets status=running before invoking the graph
@@ -18,9 +20,13 @@ import logging
 import argparse
 import os
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from db.run import create_workflow_run
 
+if TYPE_CHECKING:
+    from graphs.runtime import GraphRuntime
+
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("pmw.orchestrator")
 
@@ -28,22 +34,29 @@ log = logging.getLogger("pmw.orchestrator")
 PIPELINE_INTERVAL_SECONDS = int(os.environ.get("PIPELINE_INTERVAL_SECONDS", "300"))
 
 
-async def run_single_workflow(triggered_by: str = "scheduler") -> bool:
+async def run_single_workflow(
+    triggered_by: str = "scheduler",
+    runtime: "GraphRuntime | None" = None,
+) -> bool:
     """
-    Run a single workflow cycle.
+    Run a single workflow cycle on `runtime`'s shared graphs. Without a
+    runtime (one-off CLI runs) a temporary one is started and closed.
 
     Returns True if the workflow completed successfully, False otherwise.
     Does NOT raise — all errors are caught and logged.
     """
-    from graphs.main_graph import MainGraph
+    from graphs.runtime import GraphRuntime
     from infrastructure import get_infrastructure
 
     run_id = None
-    graph = None
+    owned_runtime = None
 
     try:
+        # 0. Pick up any migration applied since the schema was introspected
+        await get_infrastructure().schema.refresh_if_migrated()
+
         # 1. Create workflow_runs row — status='pending'
-        run_id = create_workflow_run(triggered_by=triggered_by)
+        run_id = await create_workflow_run(triggered_by=triggered_by)
         log.info(f"Created workflow run | run_id={run_id}")
 
         # 2. Set status='running' BEFORE invoking the graph
@@ -58,10 +71,11 @@ async def run_single_workflow(triggered_by: str = "scheduler") -> bool:
         )
         log.info(f"Workflow run {run_id} → status=running")
 
-        # 3. Build and run the graph
-        graph = await MainGraph.create()
+        # 3. Run the graph — compiled once per worker, not per cycle
+        if runtime is None:
+            runtime = owned_runtime = await GraphRuntime.start()
 
-        result = await graph.run({
+        result = await runtime.run({
             "run_id": run_id,
             "triggered_by": triggered_by,
         })
@@ -130,26 +144,39 @@ async def run_single_workflow(triggered_by: str = "scheduler") -> bool:
         return False
 
     finally:
-        # Clean up graph resources if they exist
-        if graph and hasattr(graph, 'close'):
+        if owned_runtime is not None:
             try:
-                await graph.close()
-            except Exception:
-                pass
+                await owned_runtime.close()
+            except Exception as exc:
+                log.warning(f"GraphRuntime close failed: {exc}")
 
 
-async def run_pipeline_loop(triggered_by: str = "scheduler") -> None:
+async def run_pipeline_loop(
+    triggered_by: str = "scheduler",
+    runtime: "GraphRuntime | None" = None,
+) -> None:
     """
     Continuous pipeline loop. Runs a workflow cycle every PIPELINE_INTERVAL_SECONDS.
 
     The loop never exits unless the process is killed.
     Individual cycle failures are logged but do not stop the loop.
+    Every cycle reuses `runtime`; if none is given, the loop starts one and
+    closes it when the loop exits.
     """
     log.info(
         f"Pipeline loop starting | interval={PIPELINE_INTERVAL_SECONDS}s "
         f"({PIPELINE_INTERVAL_SECONDS // 60}m) | triggered_by={triggered_by}"
     )
 
+    if runtime is None:
+        from graphs.runtime import GraphRuntime
+        runtime = await GraphRuntime.start()
+        try:
+            await run_pipeline_loop(triggered_by, runtime)
+        finally:
+            await runtime.close()
+        return
+
     cycle = 0
     while True:
         cycle += 1
@@ -158,7 +185,7 @@ async def run_pipeline_loop(triggered_by: str = "scheduler") -> None:
         log.info(f"━━━ Pipeline cycle {cycle} starting at {cycle_start.isoformat()} ━━━")
 
         try:
-            success = await run_single_workflow(triggered_by=triggered_by)
+            success = await run_single_workflow(triggered_by=triggered_by, runtime=runtime)
             status = "succeeded" if success else "failed"
         except Exception as exc:
             # This should not happen (run_single_workflow catches everything)
@@ -171,6 +198,14 @@ async def run_pipeline_loop(triggered_by: str = "scheduler") -> None:
             f"━━━ Pipeline cycle {cycle} {status} in {elapsed:.1f}s | "
             f"next cycle in {PIPELINE_INTERVAL_SECONDS}s ━━━"
         )
+        from infrastructure import get_infrastructure
+        infra = get_infrastructure()
+        log.info("Connection pools", extra=infra.pools.stats())
+        log.info("Outbound HTTP", extra=infra.http.stats())
+        log.info("Coalesced requests", extra={
+            client.flights.name: client.flights.stats()
+            for client in (infra.price, infra.news, infra.reddit, infra.serp)
+        })
 
         # Sleep until next cycle
         await asyncio.sleep(PIPELINE_INTERVAL_SECONDS)
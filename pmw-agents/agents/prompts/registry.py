@@ -2,11 +2,31 @@
 # agents/prompts/registry.py
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from string import Template
 
 PROMPT_DIR = Path(__file__).parent / "templates"
 
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    """
+    A rendered template, kept as separate system/user parts.
+
+    The system part is the static instruction block — identical on every
+    call for a template — so sending it as the system prompt lets providers
+    cache that prefix once it is long enough (LLMClient decides).
+    .text is the legacy single-string form.
+    """
+    system: str
+    user: str
+
+    @property
+    def text(self) -> str:
+        return f"{self.system}\n\n{self.user}"
+
+
 class PromptRegistry:
     """Loads and renders prompt templates from YAML/JSON files."""
     
@@ -23,8 +43,15 @@ class PromptRegistry:
         return cls._cache[template_key]
     
     @classmethod
-    def render(cls, template_key: str, variables: dict) -> str:
-        """Load template and substitute {{VAR}} placeholders."""
+    def render_parts(cls, template_key: str, variables: dict) -> RenderedPrompt:
+        """
+        Load template and substitute {{VAR}} placeholders, keeping the
+        system and user parts separate.
+
+        Usage:
+            prompt = PromptRegistry.render_parts("stage2_keyword_serp", {...})
+            result = await self.call_llm(prompt.user, run_id, system_prompt=prompt.system)
+        """
         tmpl = cls.get(template_key)
         system = tmpl.get("system", "")
         user = tmpl.get("user", "")
@@ -34,4 +61,9 @@ class PromptRegistry:
             system = system.replace(placeholder, str(value))
             user = user.replace(placeholder, str(value))
         
-        return f"{system}\n\n{user}"
\ No newline at end of file
+        return RenderedPrompt(system=system, user=user)
+
+    @classmethod
+    def render(cls, template_key: str, variables: dict) -> str:
+        """Load template and substitute {{VAR}} placeholders into one string."""
+        return cls.render_parts(template_key, variables).text
\ No newline at end of file
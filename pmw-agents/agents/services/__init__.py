@@ -13,6 +13,7 @@ from services.topic_service import TopicService
 from services.affiliate_service import AffiliateService
 from services.serp_service import SerpService
 from services.market_service import MarketService
+from services.market_snapshot_service import MarketSnapshotService
 from services.buyer_service import BuyerResearchService
 from services.competitor_service import CompetitorService
 from services.tools_service import ToolsService
@@ -30,6 +31,7 @@ class ServiceContainer:
         self.affiliates       = AffiliateService()
         self.serp             = SerpService()
         self.market           = MarketService()
+        self.market_snapshots = MarketSnapshotService()
         self.buyer            = BuyerResearchService()
         self.competitors      = CompetitorService()
         self.tools            = ToolsService()
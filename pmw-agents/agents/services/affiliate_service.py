@@ -6,7 +6,9 @@ Owns:
   - Loading active affiliates from Postgres
   - Scoring affiliates against a topic (geo × 0.4 + product × 0.4 + commission × 0.2)
   - Appending intelligence runs (append-only ledger)
-  - Rebuilding aggregate intelligence summary (atomic upsert)
+  - Incremental intelligence counters (affiliate_intelligence_counters):
+    each run adds its delta and rewrites the summary in one transaction
+  - Rebuilding counters + summary from the full ledger (repair tool)
 
 Does NOT own:
   - Affiliate CRUD (WordPress dealer CPT admin UI owns that)
@@ -33,6 +35,34 @@ from infrastructure import get_infrastructure
 
 log = logging.getLogger("pmw.services.affiliate")
 
+# Summary top-N per counter kind
+_INTEL_TOP_N = {"objection": 8, "motivation": 6, "phrase": 20, "paa": 15}
+
+# pg_advisory_xact_lock namespace — serialises counter updates per affiliate
+_INTEL_LOCK_NS = 9020
+
+# Ledger columns the summary's latest_* fields are read from
+_LATEST_COLUMNS = "ran_at, spot_price_gbp, price_trend_pct_30d, market_stance, top_factors_json"
+
+_INSERT_RUN_SQL = """
+    INSERT INTO affiliate_intelligence_runs (
+        affiliate_id, run_id, topic_id, asset_class, geography,
+        spot_price_gbp, price_trend_pct_30d, price_trend_pct_90d,
+        market_stance, emotional_trigger,
+        top_factors_json,
+        objections_json, motivations_json, verbatim_phrases,
+        paa_questions, source_quality,
+        compliance_review_required
+    ) VALUES (
+        $1, $2, $3, $4, $5,
+        $6, $7, $8, $9, $10,
+        $11::jsonb,
+        $12::jsonb, $13::jsonb, $14::jsonb,
+        $15::jsonb, $16, $17
+    )
+    ON CONFLICT (run_id, affiliate_id) DO NOTHING
+"""
+
 
 class AffiliateService:
     """Stateless service — WordPress + Postgres access via get_infrastructure()."""
@@ -51,7 +81,6 @@ class AffiliateService:
             dealers = await infra.wordpress.query_dealers(
                 status="PUBLISH",
                 active_only=active_only,
-                first=100,
             )
             log.info(f"Fetched {len(dealers)} dealer(s) from WordPress")
             return dealers
@@ -59,6 +88,22 @@ class AffiliateService:
             log.error(f"Failed to fetch dealers from WordPress: {exc}")
             raise
 
+    async def sync_from_wordpress(self, active_only: bool = False) -> int:
+        """
+        Stream dealer pages from WordPress straight into Postgres, so only
+        one GraphQL page of dealers is held in memory at a time.
+        Raises on WordPress errors; pages already synced stay synced.
+
+        Returns number of dealers synced.
+        """
+        infra = get_infrastructure()
+        synced = fetched = 0
+        async for page in infra.wordpress.iter_dealers(status="PUBLISH", active_only=active_only):
+            fetched += len(page)
+            synced += await self.sync_to_postgres(page)
+        log.info(f"Streamed {synced}/{fetched} dealer(s) from WordPress to Postgres")
+        return synced
+
     async def sync_to_postgres(self, wp_dealers: list[dict]) -> int:
         """
         Upsert WordPress dealer data into the Postgres affiliates table.
@@ -70,104 +115,68 @@ class AffiliateService:
             return 0
 
         infra = get_infrastructure()
-        synced = 0
 
         # Check which columns exist (handles pre/post migration 007)
-        has_new_columns = await self._check_new_columns_exist()
+        has_new_columns = infra.schema.affiliates_wp_sync
 
+        valid = []
         for d in wp_dealers:
-            wp_id = d.get("wp_dealer_id")
-            if not wp_id:
+            if not d.get("wp_dealer_id"):
                 log.warning(f"Dealer missing wp_dealer_id, skipping: {d.get('name')}")
                 continue
+            valid.append(d)
 
-            try:
-                if has_new_columns:
-                    await self._upsert_full(infra, d, wp_id)
-                else:
-                    await self._upsert_basic(infra, d, wp_id)
-                synced += 1
-            except Exception as exc:
-                log.warning(
-                    f"Affiliate sync failed for WP dealer ID {wp_id} "
-                    f"({d.get('name')}): {exc}"
-                )
-
-        log.info(f"Synced {synced}/{len(wp_dealers)} dealer(s) to Postgres")
+        if has_new_columns:
+            synced = await self._upsert_full(infra, valid)
+        else:
+            synced = 0
+            for d in valid:
+                try:
+                    await self._upsert_basic(infra, d, d["wp_dealer_id"])
+                    synced += 1
+                except Exception as exc:
+                    log.warning(
+                        f"Affiliate sync failed for WP dealer ID {d['wp_dealer_id']} "
+                        f"({d.get('name')}): {exc}"
+                    )
+
+        log.debug(f"Synced {synced}/{len(wp_dealers)} dealer(s) to Postgres")
         return synced
 
-    async def _check_new_columns_exist(self) -> bool:
-        """Check if migration 007 columns exist on the affiliates table."""
-        infra = get_infrastructure()
-        try:
-            result = await infra.postgres.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_name = 'affiliates'
-                    AND column_name = 'wp_dealer_id'
-                )
-                """
-            )
-            return bool(result)
-        except Exception:
-            return False
-
-    async def _upsert_full(self, infra, d: dict, wp_id: int) -> None:
-        """Upsert with all columns (post-migration 007)."""
-        await infra.postgres.execute(
-            """
-            INSERT INTO affiliates (
-                wp_dealer_id, name, partner_key, url, value_prop,
-                commission_type, commission_rate, cookie_days,
-                geo_focus, min_transaction, faq_url,
-                asset_classes, product_types,
-                buy_side, sell_side, intent_stages,
-                active
-            ) VALUES (
-                $1, $2, $3, $4, $5,
-                $6, $7, $8,
-                $9, $10, $11,
-                $12, $13,
-                $14, $15, $16,
-                $17
-            )
-            ON CONFLICT (wp_dealer_id) DO UPDATE SET
-                name             = EXCLUDED.name,
-                partner_key      = EXCLUDED.partner_key,
-                url              = EXCLUDED.url,
-                value_prop       = EXCLUDED.value_prop,
-                commission_type  = EXCLUDED.commission_type,
-                commission_rate  = EXCLUDED.commission_rate,
-                cookie_days      = EXCLUDED.cookie_days,
-                geo_focus        = EXCLUDED.geo_focus,
-                min_transaction  = EXCLUDED.min_transaction,
-                faq_url          = EXCLUDED.faq_url,
-                asset_classes    = EXCLUDED.asset_classes,
-                product_types    = EXCLUDED.product_types,
-                buy_side         = EXCLUDED.buy_side,
-                sell_side        = EXCLUDED.sell_side,
-                intent_stages    = EXCLUDED.intent_stages,
-                active           = EXCLUDED.active
-            """,
-            wp_id,
-            d.get("name", ""),
-            d.get("partner_key", ""),
-            d.get("url", ""),
-            d.get("value_prop", ""),
-            d.get("commission_type", ""),
-            float(d.get("commission_rate", 0) or 0),
-            int(d.get("cookie_days", 0) or 0),
-            d.get("geo_focus", ""),
-            float(d.get("min_transaction", 0) or 0),
-            d.get("faq_url", ""),
-            d.get("asset_classes", ""),
-            d.get("product_types", ""),
-            bool(d.get("buy_side", True)),
-            bool(d.get("sell_side", False)),
-            d.get("intent_stages", ""),
-            bool(d.get("active", True)),
+    async def _upsert_full(self, infra, dealers: list[dict]) -> int:
+        """
+        Bulk upsert with all columns (post-migration 007), keyed on
+        wp_dealer_id — one COPY + merge for the whole page of dealers.
+        """
+        rows = [
+            {
+                "wp_dealer_id":    d["wp_dealer_id"],
+                "name":            d.get("name", ""),
+                "partner_key":     d.get("partner_key", ""),
+                "url":             d.get("url", ""),
+                "value_prop":      d.get("value_prop", ""),
+                "commission_type": d.get("commission_type", ""),
+                "commission_rate": float(d.get("commission_rate", 0) or 0),
+                "cookie_days":     int(d.get("cookie_days", 0) or 0),
+                "geo_focus":       d.get("geo_focus", ""),
+                "min_transaction": float(d.get("min_transaction", 0) or 0),
+                "faq_url":         d.get("faq_url", ""),
+                "asset_classes":   d.get("asset_classes", ""),
+                "product_types":   d.get("product_types", ""),
+                "buy_side":        bool(d.get("buy_side", True)),
+                "sell_side":       bool(d.get("sell_side", False)),
+                "intent_stages":   d.get("intent_stages", ""),
+                "active":          bool(d.get("active", True)),
+            }
+            for d in dealers
+        ]
+        outcomes = await infra.postgres.bulk_upsert(
+            "affiliates", rows, conflict_cols=["wp_dealer_id"], isolate_failures=True,
         )
+        for r, outcome in zip(rows, outcomes):
+            if outcome == "failed":
+                log.warning(f"Affiliate sync failed for WP dealer ID {r['wp_dealer_id']} ({r['name']})")
+        return sum(1 for o in outcomes if o in ("inserted", "updated"))
 
     async def _upsert_basic(self, infra, d: dict, wp_id: int) -> None:
         """
@@ -232,9 +241,7 @@ class AffiliateService:
         Convenience: fetch WP → sync Postgres → return active affiliates.
         This is the primary method called by the affiliate_loader node.
         """
-        wp_dealers = await self.fetch_from_wordpress(active_only=False)
-        if wp_dealers:
-            await self.sync_to_postgres(wp_dealers)
+        await self.sync_from_wordpress(active_only=False)
         return await self.get_active_affiliates()
 
     # ══════════════════════════════════════════════════════════════════════
@@ -250,7 +257,7 @@ class AffiliateService:
         and adapts the SELECT accordingly.
         """
         infra = get_infrastructure()
-        has_new_columns = await self._check_new_columns_exist()
+        has_new_columns = infra.schema.affiliates_wp_sync
 
         if has_new_columns:
             rows = await infra.postgres.fetch(
@@ -294,7 +301,7 @@ class AffiliateService:
     async def get_affiliate_by_wp_id(self, wp_dealer_id: int) -> dict | None:
         """Fetch a single affiliate by its WordPress dealer post ID."""
         infra = get_infrastructure()
-        has_new = await self._check_new_columns_exist()
+        has_new = infra.schema.affiliates_wp_sync
         if not has_new:
             return None
         row = await infra.postgres.fetchrow(
@@ -415,8 +422,15 @@ class AffiliateService:
         affiliate_id: int,
         run_id: int,
         data: dict,
-    ) -> None:
-        """INSERT INTO affiliate_intelligence_runs (append-only ledger)."""
+    ) -> dict | None:
+        """
+        INSERT INTO affiliate_intelligence_runs (append-only ledger).
+
+        After migration 016 the same transaction adds this run's delta to
+        affiliate_intelligence_counters and rewrites the summary from the
+        counters, so the cost is O(new run) — the summary is returned.
+        On older schemas returns None; call rebuild_intelligence_summary().
+        """
         infra = get_infrastructure()
 
         topic = data.get("topic", {})
@@ -425,25 +439,7 @@ class AffiliateService:
         psych = data.get("psychology", {})
         kw = data.get("keywords", {})
 
-        await infra.postgres.execute(
-            """
-            INSERT INTO affiliate_intelligence_runs (
-                affiliate_id, run_id, topic_id, asset_class, geography,
-                spot_price_gbp, price_trend_pct_30d, price_trend_pct_90d,
-                market_stance, emotional_trigger,
-                top_factors_json,
-                objections_json, motivations_json, verbatim_phrases,
-                paa_questions, source_quality,
-                compliance_review_required
-            ) VALUES (
-                $1, $2, $3, $4, $5,
-                $6, $7, $8, $9, $10,
-                $11::jsonb,
-                $12::jsonb, $13::jsonb, $14::jsonb,
-                $15::jsonb, $16, $17
-            )
-            ON CONFLICT (run_id, affiliate_id) DO NOTHING
-            """,
+        args = (
             affiliate_id,
             run_id,
             topic.get("id"),
@@ -462,11 +458,266 @@ class AffiliateService:
             psych.get("source_quality", {}).get("data_richness", "low"),
             psych.get("any_section_requires_review", False),
         )
-        log.info("Intelligence run appended", extra={"affiliate_id": affiliate_id, "run_id": run_id})
+
+        if not infra.schema.affiliate_intel_counters:
+            await infra.postgres.execute(_INSERT_RUN_SQL, *args)
+            log.info("Intelligence run appended", extra={"affiliate_id": affiliate_id, "run_id": run_id})
+            return None
+
+        async with infra.postgres.transaction() as conn:
+            await conn.execute("SELECT pg_advisory_xact_lock($1, $2)", _INTEL_LOCK_NS, affiliate_id)
+            run = await conn.fetchrow(f"{_INSERT_RUN_SQL} RETURNING {_LATEST_COLUMNS}", *args)
+            current = await conn.fetchrow(
+                """
+                SELECT total_runs, first_run_at, incremental
+                FROM affiliate_intelligence_summary
+                WHERE affiliate_id = $1
+                """,
+                affiliate_id,
+            )
+
+            if current is None or not current["incremental"]:
+                # First run since migration 016 — seed the counters from the ledger once
+                summary = await self._rebuild_counters(conn, affiliate_id)
+            elif run is None:
+                # Run already in the ledger (retried stage) — its counts are in too
+                latest = await conn.fetchrow(
+                    f"""
+                    SELECT {_LATEST_COLUMNS} FROM affiliate_intelligence_runs
+                    WHERE affiliate_id = $1
+                    ORDER BY ran_at DESC, id DESC LIMIT 1
+                    """,
+                    affiliate_id,
+                )
+                summary = await self._write_summary(
+                    conn, affiliate_id, current["total_runs"], current["first_run_at"], latest,
+                )
+            else:
+                await self._apply_counters(conn, affiliate_id, _count_items([(
+                    run["ran_at"],
+                    psych.get("objections", []),
+                    psych.get("motivations", []),
+                    psych.get("verbatim_phrases", []),
+                    kw.get("paa_questions", []),
+                )]))
+                summary = await self._write_summary(
+                    conn, affiliate_id, current["total_runs"] + 1,
+                    current["first_run_at"] or run["ran_at"], run,
+                )
+
+        log.info(
+            "Intelligence run appended",
+            extra={"affiliate_id": affiliate_id, "run_id": run_id, "total_runs": summary.get("total_runs", 0)},
+        )
+        return summary
 
     async def rebuild_intelligence_summary(self, affiliate_id: int) -> dict:
         """
         Rebuild affiliate_intelligence_summary from all runs in the ledger.
+
+        Repair tool: after migration 016 this also recomputes the affiliate's
+        counters from scratch (one transaction), which re-enables the
+        incremental path in append_intelligence_run().
+        """
+        infra = get_infrastructure()
+        if not infra.schema.affiliate_intel_counters:
+            return await self._rebuild_summary_legacy(affiliate_id)
+
+        async with infra.postgres.transaction() as conn:
+            await conn.execute("SELECT pg_advisory_xact_lock($1, $2)", _INTEL_LOCK_NS, affiliate_id)
+            summary = await self._rebuild_counters(conn, affiliate_id)
+
+        if not summary:
+            log.warning(f"No intelligence runs found for affiliate {affiliate_id}")
+        else:
+            log.info("Intelligence summary rebuilt", extra={"affiliate_id": affiliate_id, "total_runs": summary["total_runs"]})
+        return summary
+
+    async def _rebuild_counters(self, conn, affiliate_id: int) -> dict:
+        """Recount every ledger run into the counters, then write the summary."""
+        rows = await conn.fetch(
+            f"""
+            SELECT {_LATEST_COLUMNS}, objections_json, motivations_json,
+                   verbatim_phrases, paa_questions
+            FROM affiliate_intelligence_runs
+            WHERE affiliate_id = $1
+            ORDER BY ran_at, id
+            """,
+            affiliate_id,
+        )
+        await conn.execute("DELETE FROM affiliate_intelligence_counters WHERE affiliate_id = $1", affiliate_id)
+        if not rows:
+            return {}
+
+        await self._apply_counters(conn, affiliate_id, _count_items(
+            (
+                r["ran_at"],
+                _json_list(r["objections_json"]),
+                _json_list(r["motivations_json"]),
+                _json_list(r["verbatim_phrases"]),
+                _json_list(r["paa_questions"]),
+            )
+            for r in rows
+        ))
+        return await self._write_summary(conn, affiliate_id, len(rows), rows[0]["ran_at"], rows[-1])
+
+    @staticmethod
+    async def _apply_counters(conn, affiliate_id: int, items: list[dict]) -> None:
+        """Add one batch of counter deltas in a single statement."""
+        if not items:
+            return
+        await conn.execute(
+            """
+            INSERT INTO affiliate_intelligence_counters AS c (
+                affiliate_id, kind, item_key, label, run_count,
+                first_seen, sources, compliance_review_required
+            )
+            SELECT $1, d.kind, d.item_key, d.label, d.n,
+                   d.first_seen, d.sources, d.compliance
+            FROM jsonb_to_recordset($2::jsonb) AS d(
+                kind text, item_key text, label text, n int,
+                first_seen timestamptz, sources jsonb, compliance boolean
+            )
+            ON CONFLICT (affiliate_id, kind, item_key) DO UPDATE SET
+                run_count = c.run_count + EXCLUDED.run_count,
+                sources   = (
+                    SELECT COALESCE(jsonb_agg(DISTINCT s), '[]'::jsonb)
+                    FROM jsonb_array_elements(c.sources || EXCLUDED.sources) AS s
+                )
+            """,
+            affiliate_id,
+            json.dumps(items),
+        )
+
+    async def _write_summary(
+        self,
+        conn,
+        affiliate_id: int,
+        total_runs: int,
+        first_run_at,
+        latest,
+    ) -> dict:
+        """Upsert the summary row from the counters' top-N and the latest run."""
+        rows = await conn.fetch(
+            """
+            SELECT k.kind, c.label, c.run_count, c.first_seen,
+                   c.sources, c.compliance_review_required
+            FROM unnest($2::text[], $3::int[]) AS k(kind, n)
+            CROSS JOIN LATERAL (
+                SELECT item_key, label, run_count, first_seen,
+                       sources, compliance_review_required
+                FROM affiliate_intelligence_counters
+                WHERE affiliate_id = $1 AND kind = k.kind
+                ORDER BY run_count DESC, first_seen, item_key
+                LIMIT k.n
+            ) c
+            ORDER BY k.kind, c.run_count DESC, c.first_seen, c.item_key
+            """,
+            affiliate_id,
+            list(_INTEL_TOP_N),
+            list(_INTEL_TOP_N.values()),
+        )
+        top: dict[str, list] = {kind: [] for kind in _INTEL_TOP_N}
+        for r in rows:
+            top[r["kind"]].append(r)
+
+        has_pending = await conn.fetchval(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM affiliate_intelligence_runs
+                WHERE affiliate_id = $1
+                  AND compliance_review_required
+                  AND compliance_reviewed_at IS NULL
+            )
+            """,
+            affiliate_id,
+        )
+        aff = await conn.fetchrow("SELECT name, partner_key FROM affiliates WHERE id = $1", affiliate_id)
+        partner_key = (
+            aff["partner_key"]
+            or (aff["name"] or "").lower().replace(" ", "-")
+            if aff else "unknown"
+        )
+
+        summary = {
+            "affiliate_id": affiliate_id,
+            "total_runs": total_runs,
+            "first_run_at": _to_iso(first_run_at),
+            "last_run_at": _to_iso(latest["ran_at"]),
+            "latest_spot_price_gbp": _as_float(latest["spot_price_gbp"]),
+            "latest_price_trend_30d": _as_float(latest["price_trend_pct_30d"]),
+            "latest_market_stance": latest["market_stance"],
+            "latest_ran_at": _to_iso(latest["ran_at"]),
+            "top_objections": [
+                {
+                    "objection": r["label"], "run_count": r["run_count"],
+                    "sources": _json_list(r["sources"]),
+                    "compliance_review_required": r["compliance_review_required"],
+                }
+                for r in top["objection"]
+            ],
+            "top_motivations": [
+                {"motivation": r["label"], "run_count": r["run_count"]} for r in top["motivation"]
+            ],
+            "verbatim_pool": [
+                {"phrase": r["label"], "first_seen": _to_iso(r["first_seen"]), "run_count": r["run_count"]}
+                for r in top["phrase"]
+            ],
+            "paa_pool": [
+                {"question": r["label"], "run_count": r["run_count"]} for r in top["paa"]
+            ],
+            "latest_factors": _json_list(latest["top_factors_json"]),
+            "has_pending_review": bool(has_pending),
+        }
+
+        await conn.execute(
+            """
+            INSERT INTO affiliate_intelligence_summary (
+                affiliate_id, partner_key,
+                total_runs, first_run_at, last_run_at,
+                latest_spot_price_gbp, latest_price_trend_30d,
+                latest_market_stance, latest_ran_at,
+                top_objections_json, top_motivations_json,
+                verbatim_pool_json, paa_pool_json,
+                latest_factors_json, has_pending_review,
+                incremental, updated_at
+            ) VALUES (
+                $1, $2, $3, $4, $5,
+                $6, $7, $8, $5,
+                $9::jsonb, $10::jsonb, $11::jsonb, $12::jsonb,
+                $13::jsonb, $14, TRUE, NOW()
+            )
+            ON CONFLICT (affiliate_id) DO UPDATE SET
+                partner_key            = EXCLUDED.partner_key,
+                total_runs             = EXCLUDED.total_runs,
+                first_run_at           = EXCLUDED.first_run_at,
+                last_run_at            = EXCLUDED.last_run_at,
+                latest_spot_price_gbp  = EXCLUDED.latest_spot_price_gbp,
+                latest_price_trend_30d = EXCLUDED.latest_price_trend_30d,
+                latest_market_stance   = EXCLUDED.latest_market_stance,
+                latest_ran_at          = EXCLUDED.latest_ran_at,
+                top_objections_json    = EXCLUDED.top_objections_json,
+                top_motivations_json   = EXCLUDED.top_motivations_json,
+                verbatim_pool_json     = EXCLUDED.verbatim_pool_json,
+                paa_pool_json          = EXCLUDED.paa_pool_json,
+                latest_factors_json    = EXCLUDED.latest_factors_json,
+                has_pending_review     = EXCLUDED.has_pending_review,
+                incremental            = TRUE,
+                updated_at             = NOW()
+            """,
+            affiliate_id, partner_key,
+            total_runs, first_run_at, latest["ran_at"],
+            summary["latest_spot_price_gbp"], summary["latest_price_trend_30d"],
+            summary["latest_market_stance"],
+            json.dumps(summary["top_objections"]), json.dumps(summary["top_motivations"]),
+            json.dumps(summary["verbatim_pool"]), json.dumps(summary["paa_pool"]),
+            json.dumps(summary["latest_factors"]), summary["has_pending_review"],
+        )
+        return summary
+
+    async def _rebuild_summary_legacy(self, affiliate_id: int) -> dict:
+        """
+        Pre-016 rebuild: recount every run in Python on every call.
         Uses atomic UPSERT — no read-modify-write race condition.
         """
         infra = get_infrastructure()
@@ -631,4 +882,55 @@ class AffiliateService:
             "SELECT * FROM affiliate_intelligence_summary WHERE affiliate_id = $1",
             affiliate_id,
         )
-        return dict(row) if row else None
\ No newline at end of file
+        return dict(row) if row else None
+
+
+def _count_items(runs) -> list[dict]:
+    """
+    Counter deltas from (ran_at, objections, motivations, phrases, questions)
+    tuples, oldest run first — the first occurrence supplies label and first_seen.
+    """
+    items: dict[tuple[str, str], dict] = {}
+
+    def add(kind: str, key: str, label: str, ran_at, source: str | None = None, compliance: bool = False) -> None:
+        if not key:
+            return
+        item = items.get((kind, key))
+        if item is None:
+            item = items[(kind, key)] = {
+                "kind": kind, "item_key": key, "label": label, "n": 0,
+                "first_seen": _to_iso(ran_at), "sources": [], "compliance": bool(compliance),
+            }
+        item["n"] += 1
+        if source is not None and source not in item["sources"]:
+            item["sources"].append(source)
+
+    for ran_at, objections, motivations, phrases, questions in runs:
+        for obj in objections:
+            add("objection", (obj.get("objection") or "").strip().lower(), obj.get("objection"),
+                ran_at, obj.get("source", ""), obj.get("compliance_review_required", False))
+        for mot in motivations:
+            add("motivation", (mot.get("motivation") or "").strip().lower(), mot.get("motivation"), ran_at)
+        for phrase in phrases:
+            add("phrase", " ".join(phrase.lower().split()), phrase, ran_at)
+        for q in questions:
+            add("paa", " ".join(q.lower().split()), q, ran_at)
+
+    return list(items.values())
+
+
+def _json_list(value) -> list:
+    """asyncpg returns jsonb as text."""
+    if isinstance(value, str):
+        return json.loads(value or "[]")
+    return value or []
+
+
+def _to_iso(value) -> str | None:
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _as_float(value) -> float | None:
+    return float(value) if value is not None else None
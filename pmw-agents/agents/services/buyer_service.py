@@ -2,9 +2,10 @@
 BuyerResearchService — fetch buyer psychology sources for Stage 6.
 
 Owns:
-  - Reddit thread search via infra.reddit
-  - MoneySavingExpert forum search via infra.http + BeautifulSoup
-  - Affiliate FAQ page fetch via infra.http + BeautifulSoup
+  - Reddit thread search via infra.reddit, with top comments on the
+    highest-scoring posts
+  - MoneySavingExpert forum search via infra.http + infra.html
+  - Affiliate FAQ page fetch via infra.http + infra.html
   - Redis caching of fetched sources (1h TTL)
 
 Does NOT own:
@@ -25,6 +26,7 @@ import json
 import logging
 from typing import Any
 
+from config.settings import settings
 from infrastructure import get_infrastructure
 
 log = logging.getLogger("pmw.services.buyer")
@@ -52,7 +54,9 @@ class BuyerResearchService:
         Search Reddit for buyer discussions matching the keyword.
 
         Uses infra.reddit.search() which handles the Reddit JSON API,
-        subreddit allow-list enforcement, and response parsing.
+        subreddit allow-list enforcement, and response parsing. The
+        geography's subreddits are searched concurrently, so this takes
+        about as long as the slowest one.
 
         Args:
             keyword: Search query (e.g. "gold ISA UK").
@@ -60,7 +64,8 @@ class BuyerResearchService:
             limit: Max posts per subreddit.
 
         Returns:
-            List of post dicts with title, selftext, score, url, source.
+            List of post dicts with title, selftext, score, url, source;
+            the top REDDIT_EXPAND_COMMENTS posts also carry top_comments.
         """
         infra = get_infrastructure()
         subreddits = GEO_SUBREDDITS.get(geography.lower(), GEO_SUBREDDITS["uk"])
@@ -68,9 +73,11 @@ class BuyerResearchService:
         try:
             posts = await infra.reddit.search(
                 query=keyword,
-                subreddits=subreddits[:3],  # Cap at 3 subs to stay within rate limits
+                subreddits=subreddits,  # RedditClient paces requests to reddit.com
                 limit=limit,
                 time_filter="year",
+                expand_comments=settings.REDDIT_EXPAND_COMMENTS,
+                comments_per_post=settings.REDDIT_COMMENTS_PER_POST,
             )
             log.info(f"Reddit: {len(posts)} posts for '{keyword}'")
             return posts
@@ -88,7 +95,7 @@ class BuyerResearchService:
         """
         Search MoneySavingExpert forums for UK buyer discussions.
 
-        Scrapes the MSE search results page using BS4.
+        Scrapes the MSE search results page (parsed via infra.html).
         MSE uses Vanilla forum software with standard HTML patterns.
 
         Returns:
@@ -103,38 +110,37 @@ class BuyerResearchService:
                 url,
                 params=params,
                 headers={"User-Agent": "Mozilla/5.0 (compatible; PMW-Research/1.0)"},
+                cache=True,
             )
             html = resp.text
         except Exception as exc:
             log.warning(f"MSE fetch failed: {exc}")
             return []
 
-        # Parse with BeautifulSoup
+        # Parse off the event loop
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-
-            results = []
             # MSE search results use .searchResult or similar patterns
-            for item in soup.select(".searchResult, .DiscussionLink, .Result")[:max_results]:
-                title_el = item.select_one("a, .Title, .title")
-                excerpt_el = item.select_one(".Excerpt, .excerpt, .Body, .blurb")
-
-                title = title_el.get_text(strip=True) if title_el else ""
-                excerpt = excerpt_el.get_text(strip=True)[:500] if excerpt_el else ""
-
-                if title:
-                    results.append({
-                        "title": title,
-                        "excerpt": excerpt,
-                        "source": "moneysavingexpert",
-                    })
+            items = await infra.html.select(
+                html,
+                ".searchResult, .DiscussionLink, .Result",
+                {"title": "a, .Title, .title", "excerpt": ".Excerpt, .excerpt, .Body, .blurb"},
+                limit=max_results,
+            )
+            results = [
+                {
+                    "title": item["title"],
+                    "excerpt": item["excerpt"][:500],
+                    "source": "moneysavingexpert",
+                }
+                for item in items
+                if item["title"]
+            ]
 
             log.info(f"MSE: {len(results)} threads for '{keyword}'")
             return results
 
         except ImportError:
-            log.error("BeautifulSoup not installed — MSE parsing unavailable")
+            log.error("No HTML parser installed — MSE parsing unavailable")
             return []
         except Exception as exc:
             log.warning(f"MSE parse failed: {exc}")
@@ -146,7 +152,7 @@ class BuyerResearchService:
         """
         Fetch and extract text from the affiliate's FAQ/help page.
 
-        Uses BS4 to strip navigation, headers, footers, and scripts.
+        Strips navigation, headers, footers, and scripts via infra.html.
         Truncates to ~3000 words to stay within prompt budget.
 
         Args:
@@ -168,6 +174,7 @@ class BuyerResearchService:
             resp = await infra.http.get(
                 faq_url,
                 headers={"User-Agent": "PMW-Research-Agent/1.0"},
+                cache=True,
             )
             html = resp.text
         except Exception as exc:
@@ -175,32 +182,26 @@ class BuyerResearchService:
             return {"content": "", "source": faq_url, "available": False}
 
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Remove non-content elements
-            for tag in soup(["nav", "header", "footer", "script", "style", "aside", "form"]):
-                tag.decompose()
-
-            text = soup.get_text(separator="\n", strip=True)
-
-            # Truncate to ~3000 words
-            words = text.split()
-            truncated = " ".join(words[:3000])
+            # Remove non-content elements, truncate to ~3000 words
+            page = await infra.html.extract(
+                html,
+                drop_tags=("nav", "header", "footer", "script", "style", "aside", "form"),
+                max_words=3000,
+            )
 
             log.info(
-                f"Affiliate FAQ fetched: {len(words)} words (truncated to {min(len(words), 3000)})",
+                f"Affiliate FAQ fetched: {page['total_words']} words (truncated to {page['word_count']})",
                 extra={"url": faq_url},
             )
 
             return {
-                "content": truncated,
+                "content": page["text"],
                 "source": faq_url,
                 "available": True,
             }
 
         except ImportError:
-            log.error("BeautifulSoup not installed — FAQ parsing unavailable")
+            log.error("No HTML parser installed — FAQ parsing unavailable")
             return {"content": "", "source": faq_url, "available": False}
         except Exception as exc:
             log.warning(f"FAQ parse failed: {exc}", extra={"url": faq_url})
@@ -3,8 +3,8 @@ CompetitorService — fetch competitor page content for Stage 5.
 
 Owns:
   - Fetching competitor URLs via infra.http
-  - Extracting main body text with BeautifulSoup
-  - Stripping nav, header, footer, sidebar, ads
+  - Extracting main body text via infra.html (off the event loop)
+  - Choosing what to strip: nav, header, footer, sidebar, ads
   - Truncating to 5000 words per page
 
 Does NOT own:
@@ -28,6 +28,17 @@ log = logging.getLogger("pmw.services.competitor")
 MAX_WORDS = 5000
 REQUEST_TIMEOUT = 15.0
 
+# Non-content elements removed before text extraction
+DROP_TAGS = (
+    "nav", "header", "footer", "script", "style",
+    "aside", "form", "iframe", "noscript",
+)
+DROP_SELECTORS = (
+    ".sidebar", ".ad", ".advertisement", ".social-share",
+    ".comments", ".related-posts", "#sidebar", "#comments",
+    "[role='navigation']", "[role='complementary']",
+)
+
 
 class CompetitorService:
     """Stateless service — HTTP access via get_infrastructure()."""
@@ -38,7 +49,7 @@ class CompetitorService:
 
         Steps:
           1. GET the URL via infra.http
-          2. Parse with BeautifulSoup
+          2. Parse in infra.html's worker pool (byte-capped)
           3. Remove nav, header, footer, script, style, aside, sidebar
           4. Extract text, truncate to 5000 words
 
@@ -66,6 +77,7 @@ class CompetitorService:
                         "+https://preciousmarketwatch.com)"
                     ),
                 },
+                cache=True,
             )
             html = resp.text
         except Exception as exc:
@@ -80,55 +92,28 @@ class CompetitorService:
 
         # Parse and extract
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Extract title
-            title_tag = soup.find("title")
-            title = title_tag.get_text(strip=True) if title_tag else ""
-
-            # Remove non-content elements
-            for tag in soup([
-                "nav", "header", "footer", "script", "style",
-                "aside", "form", "iframe", "noscript",
-            ]):
-                tag.decompose()
-
-            # Also remove common sidebar/ad classes
-            for selector in [
-                ".sidebar", ".ad", ".advertisement", ".social-share",
-                ".comments", ".related-posts", "#sidebar", "#comments",
-                "[role='navigation']", "[role='complementary']",
-            ]:
-                for el in soup.select(selector):
-                    el.decompose()
-
-            # Extract and clean text
-            text = soup.get_text(separator="\n", strip=True)
-
-            # Remove excessive blank lines
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
-            text = "\n".join(lines)
-
-            # Truncate to MAX_WORDS
-            words = text.split()
-            truncated = " ".join(words[:MAX_WORDS])
-            word_count = min(len(words), MAX_WORDS)
+            page = await infra.html.extract(
+                html,
+                drop_tags=DROP_TAGS,
+                drop_selectors=DROP_SELECTORS,
+                max_words=MAX_WORDS,
+            )
 
             log.debug(
-                f"Competitor page extracted: {word_count} words from {url}",
+                f"Competitor page extracted: {page['word_count']} words from {url}",
+                extra={"parser": page["parser"], "capped": page["capped"]},
             )
 
             return {
                 "url": url,
-                "title": title[:200],
-                "word_count": word_count,
-                "text": truncated,
+                "title": page["title"][:200],
+                "word_count": page["word_count"],
+                "text": page["text"],
                 "available": True,
             }
 
         except ImportError:
-            log.error("BeautifulSoup not installed — competitor parsing unavailable")
+            log.error("No HTML parser installed — competitor parsing unavailable")
             return {"url": url, "title": "", "word_count": 0, "text": "", "available": False}
         except Exception as exc:
             log.warning(f"Competitor page parse failed: {url}", extra={"error": str(exc)})
@@ -2,8 +2,10 @@
 CostTrackingService — record LLM usage and calculate costs.
 
 Flat and focused: one method to record, one to read.
-Writes to llm_call_logs table. Reads prices from model_prices
-table with hard-coded fallback.
+Queues llm_call_logs rows on infra.telemetry (written in batches).
+Prices come from infra.model_prices — an in-memory table of
+model_prices + config/pricing.py — with hard-coded fallback.
+Response-cache hits are logged with cache_hit = TRUE and zero cost.
 """
 
 from __future__ import annotations
@@ -13,6 +15,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from config.pricing import CACHE_READ_MULTIPLIER, CACHE_WRITE_MULTIPLIER
 from infrastructure import get_infrastructure
 
 log = logging.getLogger("pmw.services.cost_tracking")
@@ -29,9 +32,6 @@ class CostTrackingService:
         "deepseek-chat":      {"input": 0.00014, "output": 0.00028},
     }
 
-    # Cached column name detection (avoids querying information_schema every call)
-    _column_name: str | None = None
-
     async def record_usage(
         self,
         run_id: int,
@@ -42,14 +42,31 @@ class CostTrackingService:
         input_tokens: int,
         output_tokens: int,
         timestamp: datetime | None = None,
+        cache_hit: bool = False,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
-        """Record usage and return cost in USD. Never raises."""
+        """
+        Record usage and return cost in USD. Never raises.
+
+        cache_hit=True records a response served from LLMResponseCache:
+        the original token counts are kept (so savings can be reported)
+        but the cost is zero.
+
+        cache_read_tokens / cache_write_tokens are provider prompt-cache
+        tokens (not included in input_tokens), billed at the provider's
+        cache multipliers from config.pricing.
+        """
         timestamp = timestamp or datetime.utcnow()
         infra = get_infrastructure()
 
-        price = await self._get_price(provider, model, timestamp)
-        cost = round(
+        price = self._get_price(infra, provider, model, timestamp)
+        read_rate = price["input"] * CACHE_READ_MULTIPLIER.get(provider, 1.0)
+        write_rate = price["input"] * CACHE_WRITE_MULTIPLIER.get(provider, 1.0)
+        cost = 0.0 if cache_hit else round(
             (input_tokens / 1_000) * price["input"]
+            + (cache_read_tokens / 1_000) * read_rate
+            + (cache_write_tokens / 1_000) * write_rate
             + (output_tokens / 1_000) * price["output"],
             6,
         )
@@ -57,19 +74,19 @@ class CostTrackingService:
         snapshot = json.dumps({
             "provider": provider, "model": model,
             "input_rate": price["input"], "output_rate": price["output"],
+            "cache_read_rate": read_rate, "cache_write_rate": write_rate,
+            "price_source": price.get("source", "fallback"),
         })
 
         try:
-            col = await self._get_attempt_column(infra)
-            await infra.postgres.execute(
-                f"""
-                INSERT INTO llm_call_logs
-                    (run_id, stage_name, {col}, provider, model,
-                     input_tokens, output_tokens, cost_usd, price_snapshot, called_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9::jsonb, $10)
-                """,
-                run_id, stage_name, attempt, provider, model,
-                input_tokens, output_tokens, cost, snapshot, timestamp,
+            infra.telemetry.insert(
+                "llm_call_logs",
+                ("run_id", "stage_name", infra.schema.llm_attempt_column, "provider", "model",
+                 "input_tokens", "output_tokens", "cost_usd", "price_snapshot", "called_at",
+                 "cache_hit", "cache_read_tokens", "cache_write_tokens"),
+                (run_id, stage_name, attempt, provider, model,
+                 input_tokens, output_tokens, cost, snapshot, timestamp,
+                 cache_hit, cache_read_tokens, cache_write_tokens),
             )
         except Exception as exc:
             log.error(f"llm_call_logs write failed: {exc}",
@@ -79,48 +96,15 @@ class CostTrackingService:
 
     async def get_run_cost(self, run_id: int) -> float:
         infra = get_infrastructure()
+        await infra.telemetry.flush()      # include rows still queued
         val = await infra.postgres.fetchval(
             "SELECT COALESCE(SUM(cost_usd), 0) FROM llm_call_logs WHERE run_id = $1",
             run_id,
         )
         return float(val or 0)
 
-    async def _get_price(self, provider: str, model: str, ts: datetime) -> dict:
-        infra = get_infrastructure()
-        try:
-            row = await infra.postgres.fetchrow(
-                """
-                SELECT input_rate_per_1k, output_rate_per_1k
-                FROM model_prices
-                WHERE provider = $1 AND model = $2
-                  AND effective_from <= $3
-                  AND (effective_to IS NULL OR effective_to > $3)
-                ORDER BY effective_from DESC LIMIT 1
-                """,
-                provider, model, ts,
-            )
-            if row:
-                return {"input": float(row["input_rate_per_1k"]),
-                        "output": float(row["output_rate_per_1k"])}
-        except Exception:
-            pass
-        fb = self._FALLBACK_PRICES.get(model, {"input": 0.001, "output": 0.002})
-        return fb
-
-    async def _get_attempt_column(self, infra) -> str:
-        """Detect whether column is 'attempt' (pre-008) or 'attempt_number' (post-008)."""
-        if self._column_name:
-            return self._column_name
-        try:
-            exists = await infra.postgres.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_name = 'llm_call_logs' AND column_name = 'attempt_number'
-                )
-                """
-            )
-            self._column_name = "attempt_number" if exists else "attempt"
-        except Exception:
-            self._column_name = "attempt"
-        return self._column_name
\ No newline at end of file
+    def _get_price(self, infra, provider: str, model: str, ts: datetime) -> dict:
+        price = infra.model_prices.lookup(provider, model, ts)
+        if price:
+            return price
+        return self._FALLBACK_PRICES.get(model, {"input": 0.001, "output": 0.002})
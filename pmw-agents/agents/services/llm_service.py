@@ -179,13 +179,15 @@ class LLMService:
 
         # ── Record cost immediately ────────────────────────────────────
         cost_usd = await CostTrackingService().record_usage(
-            run_id        = run_id,
-            stage_name    = stage_name,
-            attempt       = attempt,
-            provider      = model_config.provider.value,
-            model         = model_config.model_id,
-            input_tokens  = response.input_tokens,
-            output_tokens = response.output_tokens,
+            run_id             = run_id,
+            stage_name         = stage_name,
+            attempt            = attempt,
+            provider           = model_config.provider.value,
+            model              = model_config.model_id,
+            input_tokens       = response.input_tokens,
+            output_tokens      = response.output_tokens,
+            cache_read_tokens  = response.cache_read_tokens,
+            cache_write_tokens = response.cache_write_tokens,
         )
 
         # ── Close LangSmith span ──────────────────────────────────────
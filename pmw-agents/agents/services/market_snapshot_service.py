@@ -0,0 +1,134 @@
+"""
+MarketSnapshotService — one market snapshot per (run, asset class, geography).
+
+Owns:
+  - Computing spot price, 30/90-day trends, asset news and the derived
+    market stance once per (run_id, asset_class, geography)
+  - Single-flight: concurrent briefs for the same key await the same task
+  - Prefetching snapshots for a cycle's briefs before Stage 3 needs them
+  - Dropping a run's snapshots when its research phase ends
+
+Does NOT own:
+  - Price / news access and stance rules — MarketService does that
+  - Keyword-specific LLM synthesis — Stage 3 MarketContext does that
+
+Unlike most services this one holds state: in-flight and completed
+snapshot tasks, bounded to MAX_ENTRIES and scoped to a run.
+
+Usage:
+    from services import services
+    services.market_snapshots.prefetch(run_id, [("gold", "uk"), ("silver", "us")])
+    snap = await services.market_snapshots.get(run_id, "gold", "uk")
+    snap.spot_price, snap.trend_30d, snap.stance["market_stance"]
+    services.market_snapshots.clear_run(run_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable
+
+log = logging.getLogger("pmw.services.market_snapshot")
+
+MAX_ENTRIES = 64
+NEWS_DAYS_BACK = 30
+
+
+@dataclass
+class MarketSnapshot:
+    asset_class: str
+    geography:   str
+    spot_price:  dict
+    trend_30d:   dict
+    trend_90d:   dict
+    news:        list[dict]
+    stance:      dict
+    fetched_at:  str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+class MarketSnapshotService:
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        # (run_id, asset_class, geography) → Task[MarketSnapshot]
+        self._tasks: OrderedDict[tuple, asyncio.Task] = OrderedDict()
+        self.fetches = 0
+        self.shared = 0
+
+    @staticmethod
+    def _key(run_id: int, asset_class: str, geography: str) -> tuple:
+        return (run_id, (asset_class or "gold").lower().strip(), (geography or "uk").lower().strip())
+
+    async def get(self, run_id: int, asset_class: str, geography: str = "uk") -> MarketSnapshot:
+        """
+        Return the snapshot for this run/asset/geography, computing it at most
+        once. Failed computations are not kept, so the next caller retries.
+        """
+        task = self._task_for(self._key(run_id, asset_class, geography))
+        # shield: a cancelled brief must not cancel the snapshot others await
+        return await asyncio.shield(task)
+
+    def prefetch(self, run_id: int, pairs: Iterable[tuple[str, str]]) -> None:
+        """Start snapshot computation for each (asset_class, geography) without waiting."""
+        for asset_class, geography in pairs:
+            self._task_for(self._key(run_id, asset_class, geography))
+
+    def clear_run(self, run_id: int) -> None:
+        """Drop a run's snapshots (called when its research phase finishes)."""
+        for key in [k for k in self._tasks if k[0] == run_id]:
+            task = self._tasks.pop(key)
+            if not task.done():
+                task.cancel()
+
+    def stats(self) -> dict:
+        return {"fetches": self.fetches, "shared": self.shared, "entries": len(self._tasks)}
+
+    # ── Internals ──────────────────────────────────────────────────────────
+
+    def _task_for(self, key: tuple) -> asyncio.Task:
+        task = self._tasks.get(key)
+        if task is not None:
+            self.shared += 1
+            self._tasks.move_to_end(key)
+            return task
+
+        self.fetches += 1
+        task = asyncio.get_running_loop().create_task(self._compute(key[1], key[2]))
+        task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+        self._tasks[key] = task
+        while len(self._tasks) > self._max_entries:
+            _, evicted = self._tasks.popitem(last=False)
+            if not evicted.done():
+                evicted.cancel()
+        return task
+
+    def _on_done(self, key: tuple, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is not None:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+    @staticmethod
+    async def _compute(asset_class: str, geography: str) -> MarketSnapshot:
+        from services import services
+
+        market = services.market
+        spot_price, trend_30d, trend_90d, news = await asyncio.gather(
+            market.get_spot_price(asset_class, geography),
+            market.get_price_trend(asset_class, days=30, geography=geography),
+            market.get_price_trend(asset_class, days=90, geography=geography),
+            market.get_recent_news(f"{asset_class} price", geography, days_back=NEWS_DAYS_BACK),
+        )
+        stance = market.derive_market_stance(
+            price_data=spot_price, trend_30d=trend_30d,
+            trend_90d=trend_90d, news_articles=news,
+        )
+        log.info(f"Market snapshot computed: {asset_class}/{geography} → {stance.get('market_stance')}")
+        return MarketSnapshot(
+            asset_class=asset_class, geography=geography,
+            spot_price=spot_price, trend_30d=trend_30d, trend_90d=trend_90d,
+            news=news, stance=stance,
+        )
@@ -2,7 +2,7 @@
 SerpService — SERP research via infra.serp (SerpAPI).
 
 Owns:
-  - Orchestrating organic + PAA + related search calls
+  - Reading organic + PAA + related views from one shared SerpSnapshot
   - Applying keyword include/exclude filters from topic meta
   - Returning a structured SerpBundle for downstream agents
   - Extracting competitor URLs for Stage 5
@@ -48,10 +48,13 @@ class SerpService:
         """
         Run a full SERP research pass for a keyword.
 
-        Calls:
-          1. infra.serp.organic_results() — top 10 organic results
-          2. infra.serp.people_also_ask() — PAA questions
-          3. infra.serp.related_searches() — related queries
+        Fetches a single infra.serp.snapshot() and reads three views from it:
+          1. organic_results() — top 10 organic results
+          2. people_also_ask() — PAA questions
+          3. related_searches() — related queries
+
+        The snapshot is cached by SerpClient, so Stage 5's
+        get_competitor_urls() for the same keyword costs no extra request.
 
         Then applies include/exclude keyword filters and returns a
         structured SerpBundle.
@@ -73,24 +76,15 @@ class SerpService:
         include_set = self._parse_keyword_list(include_keywords)
         exclude_set = self._parse_keyword_list(exclude_keywords)
 
-        # Fetch all SERP data
-        try:
-            organic = await infra.serp.organic_results(keyword, gl=gl, num=10)
-        except Exception as exc:
-            log.warning(f"Organic results fetch failed: {exc}")
-            organic = []
-
+        # Fetch all SERP data in one request
         try:
-            paa = await infra.serp.people_also_ask(keyword, gl=gl)
+            snap = await infra.serp.snapshot(keyword, gl=gl, num=10)
+            organic = snap.organic_results()
+            paa = snap.people_also_ask()
+            related = snap.related_searches()
         except Exception as exc:
-            log.warning(f"PAA fetch failed: {exc}")
-            paa = []
-
-        try:
-            related = await infra.serp.related_searches(keyword, gl=gl)
-        except Exception as exc:
-            log.warning(f"Related searches fetch failed: {exc}")
-            related = []
+            log.warning(f"SERP snapshot fetch failed: {exc}")
+            organic, paa, related = [], [], []
 
         # Apply exclude filter to organic results
         if exclude_set:
@@ -149,6 +143,9 @@ class SerpService:
         """
         Fetch top-ranking competitor URLs for a keyword.
 
+        Reads the same cached SerpSnapshot as research_keyword(), so running
+        Stage 2 and Stage 5 for one keyword costs a single SerpAPI request.
+
         Returns:
             List of dicts with url, title, snippet, position.
             Own domain is excluded.
@@ -157,7 +154,8 @@ class SerpService:
         gl = self._geo_to_gl(geography)
 
         try:
-            organic = await infra.serp.organic_results(keyword, gl=gl, num=10)
+            snap = await infra.serp.snapshot(keyword, gl=gl, num=10)
+            organic = snap.organic_results()
         except Exception as exc:
             log.error(f"Competitor URL fetch failed: {exc}")
             return []
@@ -15,10 +15,11 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 import socket
 from datetime import datetime, timezone
 
+from infrastructure import get_infrastructure
+
 log = logging.getLogger("pmw.task_queue_service")
 
 STREAM_PREFIX = "pmw:tasks:"
@@ -28,30 +29,15 @@ STALE_MINUTES = 10
 
 class TaskQueueService:
 
-    def __init__(self):
-        self._redis = None
-        self._pool = None
-
     # ── Infrastructure ────────────────────────────────────────────────────
+    # Both come from infra.pools, so the queue shares the worker's
+    # connection budget instead of opening its own pool / Redis client.
 
     def _get_redis(self):
-        if self._redis is None:
-            import redis.asyncio as aioredis
-            self._redis = aioredis.from_url(
-                os.environ.get("REDIS_URL", "redis://localhost:6379"),
-                decode_responses=True,
-            )
-        return self._redis
+        return get_infrastructure().redis
 
     async def _get_pool(self):
-        if self._pool is None:
-            import asyncpg
-            self._pool = await asyncpg.create_pool(
-                os.environ["DATABASE_URL"].replace("postgresql+asyncpg://", "postgresql://"),
-                min_size=1,
-                max_size=5,
-            )
-        return self._pool
+        return await get_infrastructure().pools.asyncpg()
 
     def _stream_key(self, workflow_slug: str) -> str:
         return f"{STREAM_PREFIX}{workflow_slug}"
@@ -85,11 +71,8 @@ class TaskQueueService:
             redis = self._get_redis()
             stream_key = self._stream_key(workflow_slug)
 
-            # Ensure consumer group exists
-            try:
-                await redis.xgroup_create(stream_key, CONSUMER_GROUP, id="0", mkstream=True)
-            except Exception:
-                pass  # group already exists
+            # Ensure consumer group exists (BUSYGROUP is ignored by the client)
+            await redis.xgroup_create(stream_key, CONSUMER_GROUP, mkstream=True)
 
             stream_id = await redis.xadd(
                 stream_key,
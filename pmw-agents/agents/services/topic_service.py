@@ -1,176 +1,350 @@
 """
-TopicService — fetch topics, filter locks, select batch, track status.
+TopicService — fetch topics, sync them, pick a batch, track status.
 
 All status tracking lives in Postgres only. WordPress is read-only
 (source of truth for topic definitions, never written to by the pipeline).
 
+Incremental sync (migration 014): wp_sync_state holds the (modified_gmt,
+post id) high-water mark of the newest topic already upserted, so each
+cycle asks WordPress only for topics changed since then. Deletions and
+unpublishes don't show up as changes, so reconcile_deleted() compares
+topic IDs against WordPress every WP_TOPIC_RECONCILE_SECS.
+
 Usage:
     from services import services
+    batch    = await services.topics.pick_batch(limit=10)   # one SQL round-trip
     topics   = await services.topics.get_eligible_topics()
-    unlocked = await services.topics.filter_locked_topics(topics)
-    batch    = await services.topics.select_batch(unlocked, batch_size=10)
+    async for page in services.topics.iter_eligible_topics():   # streaming
+        ...
+    async for page in services.topics.iter_changed_topics(mark): # incremental
+        ...
 """
 
 from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
 
 from infrastructure import get_infrastructure
 from config.settings import settings
 
 log = logging.getLogger("pmw.services.topic")
 
+SYNC_RESOURCE = "pmw_topic"
+
+# (modified_gmt, WordPress post id) of the newest topic already synced
+SyncMark = tuple[datetime, int]
+
 
 class TopicService:
 
     # ── Fetch from WordPress ───────────────────────────────────────────
 
-    async def get_eligible_topics(self) -> list[dict]:
-        """Fetch published pmw_topic posts from WordPress via GraphQL."""
+    async def iter_eligible_topics(self) -> AsyncIterator[list[dict]]:
+        """
+        Stream published pmw_topic posts from WordPress, one page at a time.
+        Raises on WordPress errors — callers decide whether that is fatal.
+        """
         infra = get_infrastructure()
+        async for page in infra.wordpress.iter_topics(status="PUBLISH"):
+            yield [self._flatten(raw) for raw in page]
+
+    async def get_eligible_topics(self) -> list[dict]:
+        """Fetch every published pmw_topic post from WordPress via GraphQL."""
+        topics: list[dict] = []
         try:
-            raw_topics = await infra.wordpress.query_topics(status="PUBLISH", first=100)
+            async for page in self.iter_eligible_topics():
+                topics.extend(page)
         except Exception as exc:
             log.error(f"Failed to fetch topics from WordPress: {exc}")
             return []
 
-        topics = []
-        for raw in raw_topics:
-            meta = raw.get("meta", {})
-            topics.append({
-                "id":               raw.get("id"),
-                "title":            raw.get("title", {}).get("rendered", ""),
-                "target_keyword":   meta.get("pmw_target_keyword", ""),
-                "summary":          meta.get("pmw_summary", ""),
-                "include_keywords": meta.get("pmw_include_keywords", ""),
-                "exclude_keywords": meta.get("pmw_exclude_keywords", ""),
-                "asset_class":      meta.get("pmw_asset_class", ""),
-                "product_type":     meta.get("pmw_product_type", ""),
-                "geography":        meta.get("pmw_geography", "uk"),
-                "is_buy_side":      meta.get("pmw_is_buy_side", False),
-                "intent_stage":     meta.get("pmw_intent_stage", "consideration"),
-                "priority":         meta.get("pmw_priority", 5),
-                "schedule_cron":    meta.get("pmw_schedule_cron", ""),
-                "last_run_at":      meta.get("pmw_last_run_at", ""),
-                "run_count":        meta.get("pmw_run_count", 0),
-                "last_run_id":      meta.get("pmw_last_run_id", 0),
-                "last_wp_post_id":  meta.get("pmw_last_wp_post_id", 0),
-                "wp_category_id":   meta.get("pmw_wp_category_id", 0),
-                "affiliate_page_id": meta.get("pmw_affiliate_page_id", 0),
-            })
-
         log.info(f"Fetched {len(topics)} eligible topics from WordPress")
         return topics
 
+    async def iter_new_topics_only(self, known_wp_ids: list[int]) -> AsyncIterator[list[dict]]:
+        """Stream only topics from WP not already in Postgres, page by page."""
+        known_set = set(known_wp_ids)
+        async for page in self.iter_eligible_topics():
+            new = [t for t in page if t["id"] not in known_set]
+            if new:
+                yield new
+
     async def get_new_topics_only(self, known_wp_ids: list[int]) -> list[dict]:
         """Fetch only topics from WP not already in Postgres."""
-        all_topics = await self.get_eligible_topics()
-        known_set = set(known_wp_ids)
-        new = [t for t in all_topics if t["id"] not in known_set]
+        new: list[dict] = []
+        async for page in self.iter_new_topics_only(known_wp_ids):
+            new.extend(page)
         if new:
             log.info(f"Found {len(new)} new topic(s) not yet in Postgres")
         return new
 
+    async def iter_changed_topics(self, since: SyncMark) -> AsyncIterator[list[dict]]:
+        """
+        Stream published topics modified after the `since` high-water mark.
+        WordPress filters by day (from the day before, to absorb the site's
+        UTC offset); the exact (modified_gmt, id) cut is applied here.
+        """
+        infra = get_infrastructure()
+        modified_since = (since[0] - timedelta(days=1)).date()
+        async for page in infra.wordpress.iter_topics(
+            status="PUBLISH", modified_since=modified_since,
+        ):
+            changed = [
+                t for t in (self._flatten(raw) for raw in page)
+                if t["modified_gmt"] is None or (t["modified_gmt"], t["id"]) > since
+            ]
+            if changed:
+                yield changed
+
+    @staticmethod
+    def high_water(
+        mark: SyncMark | None,
+        topics: list[dict],
+        before: SyncMark | None = None,
+    ) -> SyncMark | None:
+        """
+        Advance `mark` past every topic in `topics` that has a modified time,
+        but never to or past `before` (the earliest topic that failed to
+        sync), so that topic is fetched again next time.
+        """
+        for t in topics:
+            if t.get("modified_gmt") is None:
+                continue
+            key = (t["modified_gmt"], t["id"])
+            if before is not None and key >= before:
+                continue
+            if mark is None or key > mark:
+                mark = key
+        return mark
+
+    @staticmethod
+    def earliest(topics: list[dict]) -> SyncMark | None:
+        """The lowest (modified_gmt, id) among `topics`, or None."""
+        return min(
+            ((t["modified_gmt"], t["id"]) for t in topics if t.get("modified_gmt") is not None),
+            default=None,
+        )
+
+    @staticmethod
+    def _parse_gmt(value) -> datetime | None:
+        """WPGraphQL modifiedGmt ('2026-01-31T09:15:00', no offset) → aware UTC."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(str(value).replace("Z", "")).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _flatten(cls, raw: dict) -> dict:
+        meta = raw.get("meta", {})
+        return {
+            "id":               raw.get("id"),
+            "modified_gmt":     cls._parse_gmt(raw.get("modified_gmt")),
+            "title":            raw.get("title", {}).get("rendered", ""),
+            "target_keyword":   meta.get("pmw_target_keyword", ""),
+            "summary":          meta.get("pmw_summary", ""),
+            "content_type":     meta.get("pmw_content_type", "affiliate"),
+            "include_keywords": meta.get("pmw_include_keywords", ""),
+            "exclude_keywords": meta.get("pmw_exclude_keywords", ""),
+            "asset_class":      meta.get("pmw_asset_class", ""),
+            "product_type":     meta.get("pmw_product_type", ""),
+            "geography":        meta.get("pmw_geography", "uk"),
+            "is_buy_side":      meta.get("pmw_is_buy_side", False),
+            "intent_stage":     meta.get("pmw_intent_stage", "consideration"),
+            "priority":         meta.get("pmw_priority", 5),
+            "schedule_cron":    meta.get("pmw_schedule_cron", ""),
+            "last_run_at":      meta.get("pmw_last_run_at", ""),
+            "run_count":        meta.get("pmw_run_count", 0),
+            "last_run_id":      meta.get("pmw_last_run_id", 0),
+            "last_wp_post_id":  meta.get("pmw_last_wp_post_id", 0),
+            "wp_category_id":   meta.get("pmw_wp_category_id", 0),
+            "affiliate_page_id": meta.get("pmw_affiliate_page_id", 0),
+        }
+
     # ── Load from Postgres ─────────────────────────────────────────────
 
-    async def load_from_postgres(self) -> list[dict]:
-        """Load topics directly from Postgres topics table."""
+    _TOPIC_COLUMNS = """
+        t.id, t.topic_name as title, t.target_keyword, t.summary,
+        t.include_keywords, t.exclude_keywords, t.asset_class,
+        t.product_type, t.geography, t.is_buy_side, t.intent_stage,
+        t.priority, t.schedule_cron, t.agent_status, t.last_run_at,
+        t.run_count, t.last_run_id, t.last_wp_post_id,
+        t.wp_category_id, t.affiliate_page_id
+    """
+
+    async def pick_batch(
+        self,
+        limit: int,
+        cooldown_hours: int | None = None,
+        claim_run_id: int | None = None,
+    ) -> list[dict]:
+        """
+        The next `limit` eligible topics, in one indexed query: active, not
+        locked by a running workflow, not exhausted (an affiliate topic
+        whose every brief failed), outside the cooldown, ordered by
+        priority then least-run.
+
+        With claim_run_id, the picked rows are locked FOR UPDATE SKIP
+        LOCKED and stamped (agent_status='running', last_run_at=NOW()) in
+        the same statement, so a concurrent worker can't pick them too.
+        Without it, an empty pick falls back to ignoring the cooldown.
+        """
         infra = get_infrastructure()
-        rows = await infra.postgres.fetch(
-            """
-            SELECT id, topic_name as title, target_keyword, summary,
-                   include_keywords, exclude_keywords, asset_class,
-                   product_type, geography, is_buy_side, intent_stage,
-                   priority, schedule_cron, agent_status, last_run_at,
-                   run_count, last_run_id, last_wp_post_id,
-                   wp_category_id, affiliate_page_id
-            FROM topics
-            WHERE status = 'active'
-            ORDER BY priority, run_count
+        hours = settings.TOPIC_COOLDOWN_HOURS if cooldown_hours is None else cooldown_hours
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        has_content_type = infra.schema.topics_content_type
+        content_type = ", t.content_type" if has_content_type else ""
+        # Before migration 010 every topic is an affiliate topic
+        affiliate_only = "t.content_type = 'affiliate' AND" if has_content_type else ""
+
+        pick = f"""
+            SELECT t.id
+            FROM topics t
+            WHERE t.status = 'active'
+              AND ($2::timestamptz IS NULL OR t.last_run_at IS NULL OR t.last_run_at <= $2)
+              AND NOT EXISTS (
+                  SELECT 1 FROM workflow_runs r
+                  WHERE r.topic_id = t.id
+                    AND r.status = 'running'
+                    AND r.lock_expires_at > NOW()
+              )
+              AND NOT (
+                  {affiliate_only}
+                  EXISTS (SELECT 1 FROM topic_briefs b WHERE b.topic_wp_id = t.id)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM topic_briefs b
+                      WHERE b.topic_wp_id = t.id AND b.status = 'passed'
+                  )
+              )
+            ORDER BY t.priority, t.run_count, t.id
+            LIMIT $1
+        """
+
+        if claim_run_id is not None:
+            rows = await infra.postgres.fetch(
+                f"""
+                UPDATE topics t SET
+                    agent_status = 'running',
+                    last_run_id  = $3,
+                    last_run_at  = NOW()
+                WHERE t.id IN ({pick} FOR UPDATE OF t SKIP LOCKED)
+                RETURNING {self._TOPIC_COLUMNS}{content_type}
+                """,
+                limit, cutoff, claim_run_id,
+            )
+        else:
+            query = f"""
+                SELECT {self._TOPIC_COLUMNS}{content_type}
+                FROM topics t
+                WHERE t.id IN ({pick})
+                ORDER BY t.priority, t.run_count, t.id
             """
-        )
-        topics = []
-        for r in rows:
-            d = dict(r)
-            if d.get("last_run_at") and hasattr(d["last_run_at"], "isoformat"):
-                d["last_run_at"] = d["last_run_at"].isoformat()
-            else:
-                d["last_run_at"] = str(d.get("last_run_at", "")) if d.get("last_run_at") else ""
-            topics.append(d)
+            rows = await infra.postgres.fetch(query, limit, cutoff)
+            if not rows and hours > 0:
+                log.warning("All eligible topics run within the cooldown — ignoring it")
+                rows = await infra.postgres.fetch(query, limit, None)
+
+        topics = [self._row_to_topic(r) for r in rows]
+        if claim_run_id is not None:
+            # RETURNING order is unspecified — restore the pick order
+            topics.sort(key=lambda t: (t["priority"] is None, t["priority"] or 0,
+                                       t["run_count"] is None, t["run_count"] or 0, t["id"]))
         return topics
 
+    async def count_active(self) -> int:
+        infra = get_infrastructure()
+        return await infra.postgres.fetchval("SELECT COUNT(*) FROM topics WHERE status = 'active'")
+
+    @staticmethod
+    def _row_to_topic(r) -> dict:
+        d = dict(r)
+        if d.get("last_run_at") and hasattr(d["last_run_at"], "isoformat"):
+            d["last_run_at"] = d["last_run_at"].isoformat()
+        else:
+            d["last_run_at"] = str(d.get("last_run_at", "")) if d.get("last_run_at") else ""
+        return d
+
     async def get_known_topic_ids(self) -> list[int]:
         """Return list of WP post IDs already synced to Postgres."""
         infra = get_infrastructure()
         rows = await infra.postgres.fetch("SELECT id FROM topics")
         return [r["id"] for r in rows]
 
-    # ── Filter locked topics ───────────────────────────────────────────
-
-    async def filter_locked_topics(self, topics: list[dict]) -> list[dict]:
-        """Remove topics with active Postgres locks."""
-        if not topics:
-            return []
+    # ── Incremental sync state (wp_sync_state) ─────────────────────────
 
+    async def get_sync_state(self) -> dict | None:
+        """
+        {"mark": SyncMark | None, "reconciled_at": datetime | None} for
+        pmw_topic, or None before the first recorded sync (or migration 014).
+        """
         infra = get_infrastructure()
-        topic_ids = [t["id"] for t in topics]
+        if not infra.schema.wp_sync_state:
+            return None
+        row = await infra.postgres.fetchrow(
+            "SELECT modified_gmt, last_id, reconciled_at FROM wp_sync_state WHERE resource = $1",
+            SYNC_RESOURCE,
+        )
+        if row is None:
+            return None
+        mark = (row["modified_gmt"], row["last_id"]) if row["modified_gmt"] is not None else None
+        return {"mark": mark, "reconciled_at": row["reconciled_at"]}
 
-        rows = await infra.postgres.fetch(
+    async def save_sync_state(
+        self, mark: SyncMark | None, reconciled_at: datetime | None = None,
+    ) -> None:
+        """Record the high-water mark (and reconciliation time, if given)."""
+        infra = get_infrastructure()
+        if not infra.schema.wp_sync_state:
+            return
+        await infra.postgres.execute(
             """
-            SELECT DISTINCT topic_id FROM workflow_runs
-            WHERE topic_id = ANY($1::int[])
-              AND status = 'running'
-              AND lock_expires_at > NOW()
+            INSERT INTO wp_sync_state (resource, modified_gmt, last_id, reconciled_at, updated_at)
+            VALUES ($1, $2, $3, $4, NOW())
+            ON CONFLICT (resource) DO UPDATE SET
+                modified_gmt  = COALESCE(EXCLUDED.modified_gmt, wp_sync_state.modified_gmt),
+                last_id       = COALESCE(EXCLUDED.last_id, wp_sync_state.last_id),
+                reconciled_at = COALESCE(EXCLUDED.reconciled_at, wp_sync_state.reconciled_at),
+                updated_at    = NOW()
             """,
-            topic_ids,
+            SYNC_RESOURCE,
+            mark[0] if mark else None,
+            mark[1] if mark else None,
+            reconciled_at,
         )
-        locked_ids = {r["topic_id"] for r in rows}
-        unlocked = [t for t in topics if t["id"] not in locked_ids]
 
-        if locked_ids:
-            log.info(f"Filtered out {len(locked_ids)} locked topic(s)")
-
-        return unlocked
-
-    # ── Batch selection ────────────────────────────────────────────────
-
-    async def select_batch(
-        self, candidates: list[dict], batch_size: int = 0,
-    ) -> list[dict]:
+    async def reconcile_deleted(self) -> int:
         """
-        Select the best N topics from candidates.
-        Excludes topics run in the last 24 hours.
-        Sorts by priority (lower = higher), then least-run.
+        Archive active Postgres topics that are no longer published in
+        WordPress (deleted, trashed or unpublished). Only IDs are fetched.
+        Returns the number archived; archived topics that are republished
+        come back through the modified-since sync.
         """
-        if not candidates:
-            return []
-
-        now = datetime.now(timezone.utc)
-        cooldown = now - timedelta(hours=24)
-
-        eligible = []
-        for t in candidates:
-            last_run = t.get("last_run_at", "")
-            if last_run:
-                try:
-                    last_dt = datetime.fromisoformat(str(last_run).replace("Z", "+00:00"))
-                    if last_dt > cooldown:
-                        continue
-                except (ValueError, TypeError):
-                    pass
-            eligible.append(t)
-
-        if not eligible:
-            log.warning("All candidates run in last 24h — using full list")
-            eligible = candidates
-
-        eligible.sort(key=lambda t: (t.get("priority", 5), t.get("run_count", 0)))
+        infra = get_infrastructure()
+        wp_ids: list[int] = []
+        async for page in infra.wordpress.iter_topic_ids(status="PUBLISH"):
+            wp_ids.extend(page)
 
-        if batch_size > 0:
-            eligible = eligible[:batch_size]
+        if not wp_ids:
+            # An empty catalogue is far more likely a WP/auth problem than
+            # every topic being deleted — never archive everything.
+            log.warning("Deletion reconcile skipped — WordPress returned no topic IDs")
+            return 0
 
-        return eligible
+        rows = await infra.postgres.fetch(
+            """
+            UPDATE topics SET status = 'archived'
+            WHERE status = 'active' AND id <> ALL($1::int[])
+            RETURNING id
+            """,
+            wp_ids,
+        )
+        if rows:
+            log.info(f"Archived {len(rows)} topic(s) no longer published in WordPress",
+                     extra={"topic_ids": [r["id"] for r in rows]})
+        return len(rows)
 
     # ── Postgres-only status tracking ──────────────────────────────────
     #
@@ -0,0 +1,81 @@
+"""Tests for MainGraph pipelined research → planning → generation hand-off."""
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from agents.graphs.phase_result import PhaseResult
+
+
+def _bundle(i):
+    return {"topic": {"id": i, "title": f"Topic {i}"}}
+
+
+class _FakeResearch:
+    """Emits bundle 1 immediately and bundle 2 only after a delay."""
+
+    def __init__(self, events):
+        self.events = events
+
+    async def run(self, input_data, on_bundle=None):
+        on_bundle(_bundle(1))
+        self.events.append("bundle1_ready")
+        await asyncio.sleep(0.05)
+        self.events.append("research_done")
+        on_bundle(_bundle(2))
+        return PhaseResult(run_id=1, status="complete",
+                           output=[_bundle(1), _bundle(2)], cost_usd=1.0)
+
+
+class _FakePhase:
+    def __init__(self, name, events):
+        self.name, self.events, self.threads = name, events, []
+
+    async def run(self, input_data):
+        self.threads.append(input_data["thread_key"])
+        self.events.append(f"{self.name}:{input_data['research_bundle']['topic']['id']}")
+        return PhaseResult(run_id=1, status="complete", output={"wp_post_id": 99}, cost_usd=0.5)
+
+
+def _graph(events):
+    from agents.graphs.main_graph import MainGraph
+
+    graph = MainGraph.__new__(MainGraph)
+    graph._research = _FakeResearch(events)
+    graph._planning = _FakePhase("plan", events)
+    graph._generation = _FakePhase("gen", events)
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_first_bundle_is_generated_before_research_finishes():
+    events = []
+    graph = _graph(events)
+    settings = SimpleNamespace(PIPELINED_EXECUTION=True,
+                               PLANNING_CONCURRENCY=2, GENERATION_CONCURRENCY=1)
+
+    with patch("agents.graphs.main_graph.settings", settings):
+        out = await graph._research_node({"run_id": 1, "errors": [], "total_cost_usd": 0.0})
+
+    assert events.index("gen:1") < events.index("research_done")
+    assert len(out["planning_results"]) == 2
+    assert len(out["generation_results"]) == 2
+    assert out["total_cost_usd"] == pytest.approx(3.0)
+    assert graph._planning.threads == [1, 2]
+    assert graph._route_after_research(out) == "done"
+
+
+@pytest.mark.asyncio
+async def test_planning_failure_skips_generation_for_that_bundle():
+    events = []
+    graph = _graph(events)
+
+    async def failing_plan(input_data):
+        return PhaseResult(run_id=1, status="failed", output=None, errors=[{"error": "x"}])
+
+    graph._planning.run = failing_plan
+    outcome = await graph._process_bundle(1, _bundle(7))
+
+    assert outcome["planned"] is None and outcome["generated"] is None
+    assert outcome["errors"][0]["phase"] == "planning"
+    assert not any(e.startswith("gen") for e in events)
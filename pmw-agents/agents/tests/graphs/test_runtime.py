@@ -0,0 +1,50 @@
+"""Tests for GraphRuntime — one checkpointer and compiled graph per worker."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agents.graphs.phase_result import PhaseResult
+
+
+@pytest.mark.asyncio
+async def test_graphs_compiled_once_and_reused_across_cycles():
+    from agents.graphs.runtime import GraphRuntime
+
+    checkpointer = MagicMock()
+    main_graph = MagicMock()
+    main_graph.run = AsyncMock(return_value=PhaseResult(run_id=1, status="complete",
+                                                         output=None, cost_usd=0.0))
+
+    with patch("agents.graphs.runtime.open_checkpointer",
+               AsyncMock(return_value=checkpointer)) as open_cp, \
+         patch("graphs.main_graph.MainGraph.create_with_checkpointer",
+               AsyncMock(return_value=main_graph)) as compile_graph:
+        runtime = await GraphRuntime.start()
+        for run_id in (1, 2, 3):
+            await runtime.run({"run_id": run_id})
+        await runtime.close()
+        await runtime.close()                     # idempotent
+
+    assert open_cp.await_count == 1
+    compile_graph.assert_awaited_once_with(checkpointer)
+    assert main_graph.run.await_count == 3
+    assert runtime.cycles == 3
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_uses_shared_psycopg_pool():
+    from agents.graphs import runtime as rt
+
+    pool = MagicMock()
+    infra = MagicMock()
+    infra.pools.psycopg = AsyncMock(return_value=pool)
+    saver = MagicMock()
+    saver.setup = AsyncMock()
+
+    with patch.object(rt, "get_infrastructure", return_value=infra), \
+         patch.object(rt, "AsyncPostgresSaver", return_value=saver) as saver_cls:
+        checkpointer = await rt.open_checkpointer()
+
+    assert checkpointer is saver
+    saver_cls.assert_called_once_with(pool)
+    saver.setup.assert_awaited_once()
+    pool.close.assert_not_called()              # PoolManager owns the pool
@@ -0,0 +1,166 @@
+"""Tests for per-host circuit breakers and deadline budgets in HTTPClient."""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from agents.infrastructure.http.circuit_breaker import BreakerPolicy, BreakerRegistry
+from agents.infrastructure.http.http_client import CircuitOpenError, HTTPClient
+from agents.infrastructure.http.response_cache import HTTPResponseCache
+
+
+def _client(handler, cache=None, **policy):
+    client = HTTPClient(
+        cache=cache,
+        breakers=BreakerRegistry(default=BreakerPolicy(**{"min_calls": 3, "window": 5, **policy})),
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _open_for(breaker, secs):
+    """Pretend the breaker opened `secs` ago."""
+    breaker._opened_at = time.monotonic() - secs
+
+
+@pytest.mark.asyncio
+async def test_failing_host_opens_and_fails_fast_for_every_caller():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        if request.url.host == "down.example":
+            return httpx.Response(503)
+        return httpx.Response(200, text="ok")
+
+    client = _client(handler)
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("https://down.example/x", coalesce=False)
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://down.example/x", coalesce=False)
+    assert calls.count("down.example") == 3
+
+    # Other hosts are unaffected
+    assert (await client.get("https://up.example/y")).text == "ok"
+    stats = client.stats()["breakers"]
+    assert stats["down.example"]["state"] == "open"
+    assert stats["down.example"]["rejected"] == 1
+    assert stats["up.example"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_on_success_and_reopens_on_failure():
+    healthy = {"up": False}
+
+    def handler(request):
+        return httpx.Response(200 if healthy["up"] else 500)
+
+    client = _client(handler, open_secs=30)
+    breaker = client.breakers.get("flaky.example")
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("https://flaky.example/", coalesce=False)
+    assert breaker.state == "open"
+
+    # Probe fails → open again (a fresh open period)
+    _open_for(breaker, 31)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("https://flaky.example/", coalesce=False)
+    assert breaker.state == "open" and breaker.opens == 2
+
+    # Only one probe at a time while half-open
+    _open_for(breaker, 31)
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.abandon()
+
+    healthy["up"] = True
+    resp = await client.get("https://flaky.example/", coalesce=False)
+    assert resp.status_code == 200
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_deadline_budget_bounds_the_call_and_counts_as_failure():
+    async def handler(request):
+        await asyncio.sleep(1.0)
+        return httpx.Response(200)
+
+    client = _client(handler)
+    started = time.monotonic()
+    with pytest.raises(httpx.TimeoutException):
+        await client.get("https://slow.example/", deadline=0.05)
+    assert time.monotonic() - started < 0.5
+    assert client.stats()["breakers"]["slow.example"]["error_rate"] == 1.0
+
+
+def test_slow_p95_opens_the_breaker():
+    breaker = BreakerRegistry(default=BreakerPolicy(min_latency_calls=4, slow_p95_secs=2.0)).get("slow.example")
+    for latency in (0.1, 0.2, 0.3):
+        breaker.record(True, latency)
+    assert breaker.state == "closed"
+    breaker.record(True, 5.0)
+    assert breaker.state == "open"
+
+
+def test_host_policies_from_json_override_defaults():
+    registry = BreakerRegistry.from_json(
+        '{"api.example": {"deadline_secs": 3, "open_secs": 90, "bogus": 1}}',
+        open_secs=10.0,
+    )
+    assert registry.get("api.example").policy.deadline_secs == 3
+    assert registry.get("api.example").policy.open_secs == 90
+    assert registry.get("other.example").policy.open_secs == 10.0
+    assert registry.get("forums.moneysavingexpert.com").policy.deadline_secs == 8.0
+    assert BreakerRegistry.from_json("not json").get("x").policy == BreakerPolicy()
+
+
+def test_one_slow_call_in_a_short_window_does_not_open():
+    breaker = BreakerRegistry().get("api.example")
+    for latency in (0.3, 0.4, 0.5, 0.6):
+        breaker.record(True, latency)
+    breaker.record(True, 9.0)                 # p95 of 5 calls is just this call
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_serpapi_is_not_opened_by_slow_answers_or_429s():
+    def handler(request):
+        return httpx.Response(429)
+
+    client = HTTPClient(breakers=BreakerRegistry())
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    serp = client.breakers.get("serpapi.com")
+    for _ in range(25):
+        serp.record(True, 12.0)
+    for _ in range(10):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("https://serpapi.com/search", coalesce=False)
+
+    assert serp.state == "closed"
+    assert client.breakers.get("www.goldapi.io").policy.slow_p95_secs is None
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_stale_cached_copy():
+    def handler(request):
+        return httpx.Response(200, text="cached page")
+
+    client = _client(handler, cache=HTTPResponseCache(backend="memory", host_ttls={"*": 60}))
+    await client.get("https://mse.example/search", cache=True)
+    key = client.cache.make_key("https://mse.example/search")
+    entry = await client.cache.get(key)
+    entry.expires_at = time.time() - 1
+    await client.cache.put(key, entry)
+    breaker = client.breakers.get("mse.example")
+    breaker._open("test")
+
+    resp = await client.get("https://mse.example/search", cache=True)
+
+    assert resp.text == "cached page"
+    assert client.cache.stale_served == 1
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://mse.example/other", cache=True)
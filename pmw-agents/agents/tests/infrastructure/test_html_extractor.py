@@ -0,0 +1,136 @@
+"""Tests for HTMLExtractor — off-loop text and field extraction."""
+import pytest
+
+pytest.importorskip("bs4")
+
+from agents.infrastructure.parsing import html_extractor
+from agents.infrastructure.parsing.html_extractor import HTMLExtractor
+
+PAGE = """
+<html><head><title> Gold ISA guide </title><style>p {}</style></head>
+<body>
+  <nav>Home | Prices</nav>
+  <article><h1>Buying gold</h1><p>Gold ISAs hold   physical bullion.</p></article>
+  <div class="sidebar">Subscribe now</div>
+  <footer>(c) 2026</footer>
+</body></html>
+"""
+
+LISTING = """
+<div class="Result"><a>Is gold a good ISA?</a><div class="Excerpt">Thinking about it</div></div>
+<div class="Result"><a>Best bullion dealer</a></div>
+<div class="Result"><span>no title</span></div>
+"""
+
+
+@pytest.mark.asyncio
+async def test_extract_strips_boilerplate_and_counts_words():
+    extractor = HTMLExtractor(max_workers=0)
+
+    page = await extractor.extract(PAGE, drop_selectors=(".sidebar",), max_words=5)
+
+    assert page["title"] == "Gold ISA guide"
+    assert page["text"] == "Gold ISA guide Buying gold"
+    assert page["word_count"] == 5 and page["total_words"] == 10
+    assert not page["capped"]
+
+
+@pytest.mark.asyncio
+async def test_byte_cap_applies_before_parsing():
+    extractor = HTMLExtractor(max_workers=0, max_bytes=64)
+
+    page = await extractor.extract("<p>" + "gold " * 100 + "</p>")
+
+    assert page["capped"] and page["total_words"] < 20
+    assert extractor.stats()["capped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_select_returns_fields_per_item():
+    extractor = HTMLExtractor(max_workers=0)
+
+    rows = await extractor.select(LISTING, ".Result", {"title": "a", "excerpt": ".Excerpt"}, limit=2)
+
+    assert rows == [
+        {"title": "Is gold a good ISA?", "excerpt": "Thinking about it"},
+        {"title": "Best bullion dealer", "excerpt": ""},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bs4_fallback_matches_when_selectolax_missing(monkeypatch):
+    def no_selectolax(*args):
+        raise ImportError("selectolax")
+
+    monkeypatch.setattr(html_extractor, "_extract_selectolax", no_selectolax)
+    page = await HTMLExtractor(max_workers=0).extract(PAGE, drop_selectors=(".sidebar",))
+
+    assert page["parser"].startswith("bs4")
+    assert page["text"].split("\n") == ["Gold ISA guide", "Buying gold", "Gold ISAs hold   physical bullion."]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_extraction():
+    extractor = HTMLExtractor(max_workers=1)
+    try:
+        page = await extractor.extract(PAGE)
+    finally:
+        await extractor.close()
+
+    assert page["title"] == "Gold ISA guide"
+    assert extractor.stats()["extracted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_recycles_the_worker_pool():
+    import asyncio
+    import time
+
+    extractor = HTMLExtractor(max_workers=1, timeout=1.0)
+    pool = extractor._get_pool()
+    workers = []
+    recycle = extractor._recycle
+
+    def spy(p):
+        workers.extend(p._processes.values())
+        recycle(p)
+
+    extractor._recycle = spy
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await extractor._run(time.sleep, 60)
+
+        assert workers
+        for proc in workers:
+            proc.join(timeout=5)
+        assert all(not proc.is_alive() for proc in workers)
+        assert extractor._pool is None
+        assert extractor.stats()["recycled"] == 1
+
+        extractor._timeout = 60.0
+        page = await extractor.extract(PAGE)
+        assert page["title"] == "Gold ISA guide"
+        assert extractor._pool is not pool
+    finally:
+        await extractor.close()
+
+
+@pytest.mark.asyncio
+async def test_calls_queued_behind_a_slow_page_are_not_timed_out():
+    import asyncio
+    import time
+
+    extractor = HTMLExtractor(max_workers=1, timeout=3.0)
+    await extractor.extract(PAGE)                  # warm the worker up
+    try:
+        slow, *fast = await asyncio.gather(
+            extractor._run(time.sleep, 60),
+            *(extractor.extract(PAGE) for _ in range(3)),
+            return_exceptions=True,
+        )
+    finally:
+        await extractor.close()
+
+    assert isinstance(slow, asyncio.TimeoutError)
+    assert [page["title"] for page in fast] == ["Gold ISA guide"] * 3
+    assert extractor.stats()["recycled"] == 1
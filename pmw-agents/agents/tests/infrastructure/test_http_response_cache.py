@@ -0,0 +1,131 @@
+"""Tests for HTTPClient.get(cache=True) — HTTPResponseCache hits and revalidation."""
+import time
+
+import httpx
+import pytest
+
+from agents.infrastructure.http.http_client import HTTPClient
+from agents.infrastructure.http.response_cache import HTTPResponseCache
+
+
+def _client(handler, backend="memory", **cache_kwargs):
+    client = HTTPClient(cache=HTTPResponseCache(backend=backend, **cache_kwargs))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_a_request():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, text="<html>page</html>", headers={"ETag": '"v1"'})
+
+    client = _client(handler)
+    first = await client.get("https://example.com/a", params={"q": "gold"}, cache=True)
+    second = await client.get("https://example.com/a", params={"q": "gold"}, cache=True)
+
+    assert len(calls) == 1
+    assert second.text == first.text == "<html>page</html>"
+    assert client.stats()["cache"]["hits"] == 1
+    assert client.stats()["cache"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_into_a_304():
+    seen = []
+
+    def handler(request):
+        seen.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text="body", headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"})
+
+    client = _client(handler, host_ttls={"*": 60})
+    await client.get("https://example.com/faq", cache=True)
+    key = client.cache.make_key("https://example.com/faq")
+    entry = await client.cache.get(key)
+    entry.expires_at = time.time() - 1
+    await client.cache.put(key, entry)
+
+    resp = await client.get("https://example.com/faq", cache=True)
+
+    assert resp.status_code == 200 and resp.text == "body"
+    assert seen[1]["if-modified-since"] == "Mon, 01 Jan 2026 00:00:00 GMT"
+    assert client.cache.revalidated == 1
+    assert (await client.cache.get(key)).fresh
+
+
+@pytest.mark.asyncio
+async def test_uncached_calls_and_oversized_bodies_bypass_the_cache():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, content=b"x" * 2048)
+
+    client = _client(handler, max_entry_bytes=1024)
+    await client.get("https://example.com/big", cache=True)
+    await client.get("https://example.com/big", cache=True)
+    await client.get("https://example.com/big")
+
+    assert len(calls) == 3
+    assert client.cache.uncacheable == 2 and client.cache.stores == 0
+
+
+def test_host_ttls_match_parent_domains_and_zero_disables():
+    cache = HTTPResponseCache(backend="memory", host_ttls={"reddit.com": 0, "*": 100})
+
+    assert cache.ttl_for("www.reddit.com") == 0
+    assert cache.ttl_for("news.google.com") == 900
+    assert cache.ttl_for("example.org") == 100
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = HTTPResponseCache(backend="memory", max_entries=2)
+    for key in ("a", "b"):
+        cache._memory_put(key, key * 10)
+    cache._memory_get("a")
+    cache._memory_put("c", "c" * 10)
+
+    assert list(cache._memory) == ["a", "c"]
+    assert cache._memory_bytes == 20
+
+
+@pytest.mark.asyncio
+async def test_disk_backend_round_trips_and_evicts_to_budget(tmp_path):
+    def handler(request):
+        return httpx.Response(200, content=b"y" * 600, headers={"ETag": '"d"'})
+
+    client = _client(handler, backend="disk", directory=str(tmp_path), disk_max_bytes=1500)
+
+    await client.get("https://example.com/1", cache=True)
+    await client.get("https://example.com/2", cache=True)
+    files = list(tmp_path.iterdir())
+
+    assert len(files) == 1                     # each entry ~1 KB; budget holds one
+    client.cache._memory.clear()
+    assert await client.cache.get(client.cache.make_key("https://example.com/2")) is not None
+
+
+def test_disk_store_bookkeeping_survives_concurrent_puts(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from agents.infrastructure.http.response_cache import KEY_PREFIX, _DiskStore
+
+    store = _DiskStore(str(tmp_path), max_bytes=20_000)
+
+    def work(i):
+        key = f"{KEY_PREFIX}{i % 40}"
+        store.put(key, "z" * 500, ex=60)
+        store.get(key)
+        if i % 7 == 0:
+            store.delete(key)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(work, range(2_000)))
+
+    on_disk = {p.name: p.stat().st_size for p in tmp_path.iterdir()}
+    assert dict(store._index) == on_disk
+    assert store._bytes == sum(on_disk.values()) <= 20_000
@@ -0,0 +1,107 @@
+"""Tests for LLMClient.generate — rate-limit reservations and retries."""
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("tenacity")
+
+from agents.infrastructure.llm.llm_client import LLMClient, RawLLMResponse
+from agents.infrastructure.llm.rate_limiter import LLMRateLimiter, RateLimits
+
+
+class RateLimitError(Exception):
+    status_code = 429
+    response = None
+
+
+def _response(output_tokens=300):
+    return RawLLMResponse(text="ok", input_tokens=10, output_tokens=output_tokens,
+                          model="m", provider="anthropic")
+
+
+def _client():
+    client = LLMClient(rate_limiter=LLMRateLimiter({"anthropic": RateLimits(rpm=100)}))
+    client._anthropic_client = object()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_429_is_fed_to_the_limiter_and_retried():
+    client = _client()
+    client._call_anthropic = AsyncMock(side_effect=[RateLimitError(), _response()])
+    limiter = client.rate_limiter.for_model("anthropic", "m")
+    limiter.on_rate_limited = lambda retry_after: setattr(limiter, "rate_limited", limiter.rate_limited + 1)
+
+    response = await client.generate("anthropic", "m", "hi", max_tokens=4096)
+
+    assert response.text == "ok"
+    assert client._call_anthropic.await_count == 2
+    assert limiter.rate_limited == 1
+    assert limiter.stats()["admitted"] == 2          # one reservation per attempt
+
+
+@pytest.mark.asyncio
+async def test_transport_retries_reuse_one_reservation(monkeypatch):
+    client = _client()
+    client._call_anthropic = AsyncMock(side_effect=[ConnectionError(), _response()])
+    monkeypatch.setattr(type(client)._dispatch.retry, "sleep", AsyncMock())
+
+    await client.generate("anthropic", "m", "hi", max_tokens=4096)
+
+    assert client._call_anthropic.await_count == 2
+    assert client.rate_limiter.for_model("anthropic", "m").stats()["admitted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_other_errors_release_and_raise():
+    client = _client()
+    client._call_anthropic = AsyncMock(side_effect=ValueError("bad request"))
+
+    with pytest.raises(ValueError):
+        await client.generate("anthropic", "m", "hi")
+    assert client._call_anthropic.await_count == 1
+
+
+class _AnthropicResponse:
+    def __init__(self):
+        self.content = [type("Block", (), {"text": "ok"})()]
+        self.usage = type("Usage", (), {"input_tokens": 10, "output_tokens": 5,
+                                        "cache_read_input_tokens": 0,
+                                        "cache_creation_input_tokens": 0})()
+
+
+def _anthropic_sdk():
+    raw = type("Raw", (), {"headers": {}, "parse": lambda self: _AnthropicResponse()})()
+    sdk = type("SDK", (), {})()
+    sdk.messages = type("Messages", (), {})()
+    sdk.messages.with_raw_response = type("Raw", (), {})()
+    sdk.messages.with_raw_response.create = AsyncMock(return_value=raw)
+    return sdk
+
+
+@pytest.mark.asyncio
+async def test_long_system_prefix_is_marked_cacheable():
+    client = _client()
+    client._anthropic_client = _anthropic_sdk()
+    system = "x" * 4 * 1100
+
+    await client.generate("anthropic", "claude-sonnet-4-6", "hi", system_prompt=system)
+
+    kwargs = client._anthropic_client.messages.with_raw_response.create.await_args.kwargs
+    assert kwargs["system"] == [{"type": "text", "text": system,
+                                 "cache_control": {"type": "ephemeral"}}]
+    assert kwargs["messages"] == [{"role": "user", "content": "hi"}]
+
+
+@pytest.mark.asyncio
+async def test_short_system_prefix_is_sent_without_cache_control():
+    client = _client()
+    client._anthropic_client = _anthropic_sdk()
+
+    await client.generate("anthropic", "claude-sonnet-4-6", "hi", system_prompt="Be brief.")
+    # Haiku's minimum is higher — 1100 tokens is not enough
+    await client.generate("anthropic", "claude-haiku-4-5", "hi", system_prompt="x" * 4 * 1100)
+
+    calls = client._anthropic_client.messages.with_raw_response.create.await_args_list
+    assert calls[0].kwargs["system"] == "Be brief."
+    assert isinstance(calls[1].kwargs["system"], str)
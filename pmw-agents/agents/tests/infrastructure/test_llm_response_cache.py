@@ -0,0 +1,79 @@
+"""Tests for LLMResponseCache — content-addressed LLM response reuse."""
+import pytest
+from unittest.mock import AsyncMock
+
+from agents.infrastructure.cache.llm_response_cache import LLMResponseCache
+from agents.infrastructure.llm.llm_client import RawLLMResponse
+
+
+def _response(text='{"score": 0.9}'):
+    return RawLLMResponse(text=text, input_tokens=200, output_tokens=50,
+                          model="claude-sonnet-4-6", provider="anthropic")
+
+
+def _key(**overrides):
+    args = dict(provider="anthropic", model="claude-sonnet-4-6", temperature=0.2,
+                max_tokens=4096, system_prompt=None, prompt="Score this topic.")
+    args.update(overrides)
+    return LLMResponseCache.make_key(**args)
+
+
+def test_key_changes_with_every_request_parameter():
+    """Any sampling/model/prompt difference must produce a different key."""
+    base = _key()
+    assert _key() == base
+    assert _key(model="claude-opus-4-6") != base
+    assert _key(temperature=0.3) != base
+    assert _key(max_tokens=512) != base
+    assert _key(system_prompt="You are a judge.") != base
+    assert _key(prompt="Score that topic.") != base
+
+
+@pytest.mark.asyncio
+async def test_memory_round_trip():
+    cache = LLMResponseCache()
+    await cache.set(_key(), _response())
+
+    hit = await cache.get(_key())
+
+    assert hit.text == '{"score": 0.9}'
+    assert hit.input_tokens == 200
+    assert cache.stats()["hits_memory"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_oldest_entry():
+    cache = LLMResponseCache(max_entries=2)
+    for prompt in ("a", "b", "c"):
+        await cache.set(_key(prompt=prompt), _response())
+
+    assert await cache.get(_key(prompt="a")) is None
+    assert await cache.get(_key(prompt="c")) is not None
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_serves_other_workers(mock_redis):
+    """A miss in memory falls through to Redis and promotes the entry."""
+    writer = LLMResponseCache(redis=mock_redis)
+    await writer.set(_key(), _response(), ttl=600)
+    payload = mock_redis.set.call_args[0][1]
+    assert mock_redis.set.call_args.kwargs["ex"] == 600
+
+    mock_redis.get = AsyncMock(return_value=payload)
+    reader = LLMResponseCache(redis=mock_redis)
+    hit = await reader.get(_key())
+
+    assert hit.output_tokens == 50
+    assert reader.stats()["hits_redis"] == 1
+    assert await reader.get(_key()) is not None
+    assert reader.stats()["hits_memory"] == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_is_not_stored(mock_redis):
+    mock_redis.get = AsyncMock(return_value=None)
+    cache = LLMResponseCache(redis=mock_redis)
+    await cache.set(_key(), _response(), ttl=0)
+
+    assert await cache.get(_key()) is None
+    mock_redis.set.assert_not_called()
@@ -0,0 +1,70 @@
+"""Tests for ModelPriceTable — interval-indexed in-memory price lookup."""
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agents.infrastructure.database.model_price_table import ModelPriceTable
+
+
+def _row(model, start, end, input_rate, output_rate, provider="anthropic"):
+    return {"provider": provider, "model": model,
+            "input_rate_per_1k": input_rate, "output_rate_per_1k": output_rate,
+            "effective_from": start, "effective_to": end}
+
+
+def _table(rows):
+    pg = MagicMock()
+    pg.fetch = AsyncMock(return_value=rows)
+    return ModelPriceTable(pg, refresh_secs=3600), pg
+
+
+@pytest.mark.asyncio
+async def test_lookup_picks_interval_in_effect():
+    jan = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    jun = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    table, pg = _table([
+        _row("m", jan, jun, 0.002, 0.010),
+        _row("m", jun, None, 0.001, 0.005),
+    ])
+    await table.load()
+
+    assert table.lookup("anthropic", "m", datetime(2026, 3, 1))["input"] == 0.002
+    assert table.lookup("anthropic", "m", datetime(2026, 7, 1))["input"] == 0.001
+    assert table.lookup("anthropic", "m", datetime(2025, 7, 1)) is None
+    assert pg.fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_config_prices_back_up_missing_db_rows():
+    table, _ = _table([])
+    await table.load()
+
+    price = table.lookup("anthropic", "claude-sonnet-4-6", datetime(2026, 9, 1))
+
+    assert price == {"input": 0.003, "output": 0.015, "source": "config"}
+    assert table.lookup("anthropic", "unknown-model") is None
+
+
+@pytest.mark.asyncio
+async def test_load_failure_keeps_previous_table():
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    table, pg = _table([_row("m", start, None, 0.004, 0.02)])
+    await table.load()
+    pg.fetch.side_effect = RuntimeError("db down")
+
+    await table.load()
+
+    assert table.lookup("anthropic", "m", datetime(2026, 2, 1))["source"] == "db"
+
+
+@pytest.mark.asyncio
+async def test_stale_table_refreshes_in_background():
+    table, pg = _table([])
+    await table.load()
+    table.invalidate()
+
+    table.lookup("anthropic", "m")
+    await table._refresh_task
+
+    assert pg.fetch.await_count == 2
@@ -0,0 +1,86 @@
+"""Tests for PoolManager — one connection budget across asyncpg, psycopg and Redis."""
+import asyncio
+import sys
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agents.infrastructure.database.pool_manager import PoolBudget, PoolManager
+
+
+def test_budget_split_between_asyncpg_and_psycopg():
+    budget = PoolBudget.split(total=20, checkpoint_share=0.3, redis_max=10)
+    assert (budget.asyncpg_max, budget.psycopg_max, budget.redis_max) == (14, 6, 10)
+    assert budget.asyncpg_max + budget.psycopg_max == 20
+
+    tiny = PoolBudget.split(total=1, checkpoint_share=0.9, redis_max=0)
+    assert tiny.asyncpg_max >= 2 and tiny.psycopg_max >= 1 and tiny.redis_max == 1
+
+
+def test_stats_before_connect_report_zero_usage():
+    pools = PoolManager("postgresql://x/y", PoolBudget.split(10, 0.5, 4))
+    stats = pools.stats()
+    assert stats["asyncpg"] == {"in_use": 0, "open": 0, "max": 5, "utilisation": 0.0}
+    assert stats["psycopg"]["max"] == 5
+    assert stats["redis"]["max"] == 4
+
+
+def test_stats_read_live_pools():
+    pools = PoolManager("postgresql://x/y", PoolBudget.split(10, 0.5, 4))
+    pools.postgres._pool = MagicMock(get_size=lambda: 4, get_idle_size=lambda: 1)
+    pools._psycopg = MagicMock(get_stats=lambda: {"pool_size": 2, "pool_available": 2,
+                                                  "requests_waiting": 0})
+    stats = pools.stats()
+    assert stats["asyncpg"]["in_use"] == 3
+    assert stats["asyncpg"]["utilisation"] == 0.6
+    assert stats["psycopg"]["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_psycopg_pool_opened_once_under_concurrency():
+    pool = MagicMock()
+    pool.open = AsyncMock()
+    pool.close = AsyncMock()
+    pool_cls = MagicMock(return_value=pool)
+    fake_pool_mod = types.SimpleNamespace(AsyncConnectionPool=pool_cls)
+    fake_rows = types.SimpleNamespace(dict_row=object())
+
+    pools = PoolManager("postgres://u@h/db", PoolBudget.split(10, 0.3, 4))
+    with patch.dict(sys.modules, {"psycopg_pool": fake_pool_mod,
+                                  "psycopg": types.ModuleType("psycopg"),
+                                  "psycopg.rows": fake_rows}):
+        results = await asyncio.gather(*(pools.psycopg() for _ in range(5)))
+
+    assert all(r is pool for r in results)
+    pool_cls.assert_called_once()
+    assert pool_cls.call_args.kwargs["max_size"] == 3
+    assert pool_cls.call_args.kwargs["conninfo"].startswith("postgresql://")
+    pool.open.assert_awaited_once()
+
+    await pools._close_psycopg()
+    pool.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_redis_uses_a_blocking_pool_sized_to_the_budget():
+    pool = MagicMock()
+    blocking = MagicMock()
+    blocking.from_url = MagicMock(return_value=pool)
+    client = MagicMock()
+    client.ping = AsyncMock()
+    fake_redis = types.ModuleType("redis.asyncio")
+    fake_redis.BlockingConnectionPool = blocking
+    fake_redis.Redis = MagicMock(return_value=client)
+    fake_pkg = types.ModuleType("redis")
+    fake_pkg.asyncio = fake_redis
+
+    pools = PoolManager("postgresql://x/y", PoolBudget.split(10, 0.5, 4), redis_pool_timeout=3.0)
+    with patch.dict(sys.modules, {"redis": fake_pkg, "redis.asyncio": fake_redis}):
+        await pools.redis.connect()
+
+    kwargs = blocking.from_url.call_args.kwargs
+    assert kwargs["max_connections"] == 4
+    assert kwargs["timeout"] == 3.0
+    fake_redis.Redis.assert_called_once_with(connection_pool=pool)
+    client.ping.assert_awaited_once()
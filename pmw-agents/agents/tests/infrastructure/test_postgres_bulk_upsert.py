@@ -0,0 +1,74 @@
+"""Tests for PostgresClient.bulk_upsert — COPY into a temp table + one merge."""
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agents.infrastructure.database.postgres_client import PostgresClient
+
+
+def _client(returned=None, copy_error=None):
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.copy_records_to_table = AsyncMock(side_effect=copy_error)
+    conn.fetch = AsyncMock(return_value=returned or [])
+
+    client = PostgresClient(dsn="postgresql://u@h/db")
+
+    @asynccontextmanager
+    async def transaction():
+        yield conn
+
+    client.transaction = transaction
+    return client, conn
+
+
+@pytest.mark.asyncio
+async def test_rows_copied_once_and_merged_in_one_statement():
+    client, conn = _client(returned=[
+        {"wp_dealer_id": 1, "_bulk_inserted": True},
+        {"wp_dealer_id": 2, "_bulk_inserted": False},
+    ])
+    rows = [
+        {"wp_dealer_id": 1, "name": "A"},
+        {"wp_dealer_id": 2, "name": "B-old"},
+        {"wp_dealer_id": 2, "name": "B"},           # duplicate key — last one wins
+    ]
+
+    outcomes = await client.bulk_upsert("affiliates", rows, conflict_cols=["wp_dealer_id"])
+
+    assert outcomes == ["inserted", "skipped", "updated"]
+    copy = conn.copy_records_to_table.await_args
+    assert copy.args == ("_bulk_affiliates",)
+    assert copy.kwargs["columns"] == ["wp_dealer_id", "name", "_bulk_ord"]
+    assert copy.kwargs["records"][2] == (2, "B", 2)
+    sql = conn.fetch.await_args.args[0]
+    assert "ON CONFLICT (wp_dealer_id) DO UPDATE SET name = EXCLUDED.name" in sql
+    assert "DISTINCT ON (wp_dealer_id)" in sql
+
+
+@pytest.mark.asyncio
+async def test_isolate_failures_marks_only_bad_rows():
+    client, _ = _client()
+    calls = []
+
+    async def merge(table, rows, conflict_cols, update_cols):
+        calls.append(len(rows))
+        if any(r["id"] == 3 for r in rows):
+            raise ValueError("bad row")
+        return ["inserted"] * len(rows)
+
+    client._bulk_upsert = merge
+    rows = [{"id": i} for i in range(1, 5)]
+
+    outcomes = await client.bulk_upsert("topics", rows, ["id"], isolate_failures=True)
+
+    assert outcomes == ["inserted", "inserted", "failed", "inserted"]
+    assert calls[0] == 4
+
+
+@pytest.mark.asyncio
+async def test_identifiers_are_validated():
+    client, _ = _client()
+    with pytest.raises(ValueError):
+        await client.bulk_upsert("topics; DROP TABLE x", [{"id": 1}], ["id"])
@@ -0,0 +1,153 @@
+"""Tests for PriceHistoryStore / PriceSeries and PriceClient.get_historical's local path."""
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from agents.infrastructure.external.price_client import PriceClient
+from agents.infrastructure.external.price_history import PriceHistoryStore, PriceSeries
+
+TODAY = date.today()
+
+
+def _daily(days: int, start_price: float = 100.0, step: float = 1.0):
+    return [(TODAY - timedelta(days=days - i), start_price + i * step) for i in range(days + 1)]
+
+
+def test_series_statistics():
+    series = PriceSeries.from_points(_daily(10))
+
+    assert len(series) == 11
+    assert series.trend_pct() == 10.0
+    assert series.high() == 110.0 and series.low() == 100.0
+    assert list(series.moving_average(3)[:2]) == [101.0, 102.0]
+    assert series.volatility_pct() > 0
+    assert series.moving_average(20).size == 0
+
+
+def test_between_and_merge_prefer_newer_values():
+    series = PriceSeries.from_points(_daily(10))
+    window = series.between(TODAY - timedelta(days=2), TODAY)
+    assert len(window) == 3
+
+    merged = series.merge(PriceSeries.from_points([(TODAY, 999.0), (TODAY + timedelta(days=1), 1.0)]))
+    assert len(merged) == 12
+    assert merged.between(TODAY, TODAY).prices[0] == 999.0
+
+
+def test_covers_tolerates_weekend_gaps():
+    series = PriceSeries.from_points(_daily(30)[2:-2])
+    assert series.covers(TODAY - timedelta(days=30), TODAY)
+    assert not PriceSeries.from_points(_daily(10)).covers(TODAY - timedelta(days=30), TODAY)
+
+
+@pytest.mark.asyncio
+async def test_store_loads_once_and_merges_upserts(mock_db_pool):
+    mock_db_pool.fetch = AsyncMock(return_value=[
+        {"price_date": d, "price": p} for d, p in _daily(5)
+    ])
+    mock_db_pool.executemany = AsyncMock()
+    store = PriceHistoryStore(mock_db_pool)
+
+    await store.series("gold", "GBP")
+    assert await store.upsert("Gold", "gbp", [(TODAY + timedelta(days=1), 200.0)], source="t") == 1
+    series = await store.series("gold", "GBP")
+
+    assert mock_db_pool.fetch.await_count == 1
+    assert series.last_date() == TODAY + timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_get_historical_answers_locally_when_covered(mock_db_pool):
+    mock_db_pool.fetch = AsyncMock(return_value=[
+        {"price_date": d, "price": p} for d, p in _daily(30)
+    ])
+    client = PriceClient(http=AsyncMock(), history=PriceHistoryStore(mock_db_pool))
+
+    result = await client.get_historical("gold", days=30, geography="uk")
+
+    assert result["source"] == "local"
+    assert result["trend_pct"] == 30.0
+    client._http.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_historical_fetches_only_missing_days(mock_db_pool):
+    stored = _daily(30)[:-10]                     # last 10 days missing
+    mock_db_pool.fetch = AsyncMock(return_value=[{"price_date": d, "price": p} for d, p in stored])
+    mock_db_pool.executemany = AsyncMock()
+    client = PriceClient(http=AsyncMock(), history=PriceHistoryStore(mock_db_pool))
+    client._metal_price_key = "k"
+
+    missing = _daily(30)[-10:]
+    client.fetch_timeframe = AsyncMock(return_value=missing)
+
+    result = await client.get_historical("gold", days=30, geography="uk")
+
+    client.fetch_timeframe.assert_awaited_once_with("gold", "GBP", missing[0][0], TODAY)
+    assert result["source"] == "local"
+    assert result["data_points"] == 31
+
+
+def test_sparse_series_is_not_covered():
+    start = TODAY - timedelta(days=30)
+    endpoints = PriceSeries.from_points([(start, 100.0), (TODAY, 110.0)])
+    every_fifth = PriceSeries.from_points(_daily(30)[::5])
+    assert not endpoints.covers(start, TODAY)
+    assert not every_fifth.covers(start, TODAY)
+    assert endpoints.missing_ranges(start, TODAY) == [
+        (start + timedelta(days=1), TODAY - timedelta(days=1)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_historical_fills_holes_in_a_sparse_series(mock_db_pool):
+    start = TODAY - timedelta(days=30)
+    mock_db_pool.fetch = AsyncMock(return_value=[
+        {"price_date": start, "price": 100.0}, {"price_date": TODAY, "price": 130.0},
+    ])
+    mock_db_pool.executemany = AsyncMock()
+    client = PriceClient(http=AsyncMock(), history=PriceHistoryStore(mock_db_pool))
+    client._metal_price_key = "k"
+    client.fetch_timeframe = AsyncMock(return_value=_daily(30)[1:-1])
+
+    result = await client.get_historical("gold", days=30, geography="uk")
+
+    client.fetch_timeframe.assert_awaited_once_with(
+        "gold", "GBP", start + timedelta(days=1), TODAY - timedelta(days=1),
+    )
+    assert result["source"] == "local"
+    assert result["data_points"] == 31
+
+
+@pytest.mark.asyncio
+async def test_endpoint_fallback_is_not_stored(mock_db_pool):
+    mock_db_pool.fetch = AsyncMock(return_value=[])
+    mock_db_pool.executemany = AsyncMock()
+    client = PriceClient(http=AsyncMock(), history=PriceHistoryStore(mock_db_pool))
+    client._metal_price_key = "k"
+    client.fetch_timeframe = AsyncMock(return_value=[])
+    client._fetch_historical_metalprice = AsyncMock(return_value={
+        "trend_pct": 5.0, "period_days": 30, "start_price": 100.0,
+        "end_price": 105.0, "high": None, "low": None,
+    })
+
+    result = await client.get_historical("gold", days=30, geography="uk")
+
+    assert result["trend_pct"] == 5.0
+    mock_db_pool.executemany.assert_not_called()
+
+
+def test_gaps_find_history_missing_before_recent_spot_prices():
+    since = TODAY - timedelta(days=60)
+    spot_only = PriceSeries.from_points(_daily(2))
+    assert spot_only.gaps(since, TODAY) == [(since, TODAY - timedelta(days=3))]
+
+    full = PriceSeries.from_points(_daily(60)[:20] + _daily(60)[22:])     # 2-day hole
+    holed = PriceSeries.from_points(_daily(60)[:20] + _daily(60)[30:])    # 10-day hole
+    assert full.gaps(since, TODAY) == []
+    assert holed.gaps(since, TODAY) == [
+        (since + timedelta(days=20), since + timedelta(days=29)),
+    ]
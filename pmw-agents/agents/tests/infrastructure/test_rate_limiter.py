@@ -0,0 +1,156 @@
+"""Tests for LLMRateLimiter — per-provider/model token buckets."""
+import asyncio
+
+import pytest
+
+from agents.infrastructure.llm.rate_limiter import (
+    DEFAULT_LIMITS,
+    DEFAULT_OUTPUT_ESTIMATE,
+    LLMRateLimiter,
+    ModelRateLimiter,
+    RateLimits,
+    estimate_tokens,
+    is_transient_error,
+    retry_after_secs,
+)
+
+
+def test_estimate_tokens_counts_all_parts():
+    assert estimate_tokens("a" * 400) == 101
+    assert estimate_tokens("a" * 400, None, "b" * 400) == 201
+
+
+@pytest.mark.asyncio
+async def test_acquire_within_budget_does_not_wait():
+    limiter = ModelRateLimiter("anthropic/m", RateLimits(rpm=10, input_tpm=1_000, output_tpm=1_000))
+
+    await limiter.acquire(input_tokens=100, output_tokens=100)
+
+    stats = limiter.stats()
+    assert stats["admitted"] == 1
+    assert stats["budgets"]["rpm"]["available"] == 9
+    assert stats["budgets"]["input_tpm"]["available"] == 900
+
+
+@pytest.mark.asyncio
+async def test_settle_refunds_unused_output_reservation():
+    limiter = ModelRateLimiter("anthropic/m", RateLimits(output_tpm=10_000))
+
+    reservation = await limiter.acquire(input_tokens=0, output_tokens=4_096)
+    limiter.settle(reservation, input_tokens=0, output_tokens=96)
+
+    assert limiter.stats()["budgets"]["output_tpm"]["available"] >= 9_900
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_queues_callers_in_order():
+    # 600 rpm → one request every 0.1s once the bucket is drained
+    limiter = ModelRateLimiter("openai/m", RateLimits(rpm=600))
+    for bucket in limiter._buckets.values():
+        bucket.level = 0.0
+
+    order: list[int] = []
+
+    async def call(i: int):
+        await limiter.acquire(input_tokens=0, output_tokens=0)
+        order.append(i)
+
+    await asyncio.gather(*(call(i) for i in range(3)))
+
+    assert order == [0, 1, 2]
+    assert limiter.stats()["waited_secs"] > 0
+
+
+def test_headers_adapt_capacity_and_remaining():
+    limiter = ModelRateLimiter("anthropic/m", RateLimits(rpm=50, input_tpm=30_000))
+
+    limiter.observe_headers({
+        "anthropic-ratelimit-requests-limit":          "4000",
+        "anthropic-ratelimit-input-tokens-limit":      "400000",
+        "anthropic-ratelimit-input-tokens-remaining":  "1000",
+        "anthropic-ratelimit-output-tokens-limit":     "80000",
+    })
+
+    budgets = limiter.stats()["budgets"]
+    assert budgets["rpm"]["capacity"] == 4_000
+    assert budgets["input_tpm"]["capacity"] == 400_000
+    assert budgets["input_tpm"]["available"] <= 1_001
+    assert budgets["output_tpm"]["capacity"] == 80_000
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_pauses_admission():
+    limiter = ModelRateLimiter("anthropic/m", RateLimits())
+    limiter.on_rate_limited(0.05)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await limiter.acquire(input_tokens=10, output_tokens=10)
+
+    assert loop.time() - started >= 0.04
+    assert limiter.stats()["rate_limited"] == 1
+
+
+def test_registry_is_per_provider_and_model():
+    registry = LLMRateLimiter.from_json('{"anthropic": {"rpm": 7}}')
+
+    a = registry.for_model("anthropic", "claude-sonnet-4-6")
+    assert registry.for_model("Anthropic", "claude-sonnet-4-6") is a
+    assert registry.for_model("anthropic", "claude-opus-4-6") is not a
+    assert a.stats()["budgets"]["rpm"]["capacity"] == 7
+
+
+def test_invalid_override_json_falls_back_to_defaults():
+    registry = LLMRateLimiter.from_json("{not json")
+    assert registry.for_model("anthropic", "m").stats()["budgets"]["rpm"]["capacity"] == DEFAULT_LIMITS["anthropic"].rpm
+
+
+def test_retry_after_from_provider_error():
+    class _Resp:
+        headers = {"retry-after": "12"}
+
+    class _Err(Exception):
+        status_code = 429
+        response = _Resp()
+
+    assert retry_after_secs(_Err()) == 12.0
+    assert retry_after_secs(ValueError()) is None
+
+
+@pytest.mark.asyncio
+async def test_output_is_reserved_at_the_learned_average_not_max_tokens():
+    limiter = ModelRateLimiter("anthropic/m", RateLimits(output_tpm=8_000))
+    assert limiter.output_estimate(4_096) == min(4_096, int(DEFAULT_OUTPUT_ESTIMATE * 1.25))
+    assert limiter.output_estimate(200) == 200
+
+    reservation = await limiter.acquire(input_tokens=0, output_tokens=limiter.output_estimate(4_096))
+    limiter.settle(reservation, input_tokens=0, output_tokens=400)
+    assert limiter.output_estimate(4_096) == 500
+
+    # Several 4096-max_tokens calls are admitted at once on an 8k output budget
+    for _ in range(5):
+        await asyncio.wait_for(
+            limiter.acquire(input_tokens=0, output_tokens=limiter.output_estimate(4_096)), 0.1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_release_does_not_skew_the_output_average():
+    limiter = ModelRateLimiter("anthropic/m", RateLimits(output_tpm=8_000))
+    limiter.release(await limiter.acquire(input_tokens=0, output_tokens=100))
+    assert limiter.stats()["output_avg"] is None
+
+
+def test_transient_errors_exclude_rate_limits():
+    class _Err(Exception):
+        def __init__(self, status):
+            self.status_code = status
+
+    class APIConnectionError(Exception):
+        pass
+
+    assert is_transient_error(ConnectionError())
+    assert is_transient_error(APIConnectionError())
+    assert is_transient_error(_Err(529))
+    assert not is_transient_error(_Err(429))
+    assert not is_transient_error(_Err(400))
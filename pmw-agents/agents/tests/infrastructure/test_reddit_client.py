@@ -0,0 +1,109 @@
+"""Tests for RedditClient.search — concurrent subreddits, dedupe, comment expansion."""
+import asyncio
+import time
+
+import pytest
+
+from agents.infrastructure.external.reddit_client import RedditClient
+
+
+def _post(post_id, sub, score):
+    return {"data": {"id": post_id, "title": f"t-{post_id}", "score": score,
+                     "subreddit": sub, "permalink": f"/r/{sub}/comments/{post_id}/"}}
+
+
+class _Resp:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class _FakeHTTP:
+    """Answers search and comment URLs after `delay`, tracking concurrency."""
+
+    def __init__(self, listings, comments=None, delay=0.1):
+        self.listings = listings
+        self.comments = comments or {}
+        self.delay = delay
+        self.urls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, params=None, headers=None):
+        self.urls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        sub = url.split("/r/")[1].split("/")[0]
+        if "/comments/" in url:
+            post_id = url.rsplit("/", 1)[1].removesuffix(".json")
+            children = [{"data": c} for c in self.comments.get(post_id, [])]
+            return _Resp([{}, {"data": {"children": children}}])
+        if sub not in self.listings:
+            raise ConnectionError("boom")
+        return _Resp({"data": {"children": self.listings[sub]}})
+
+
+@pytest.mark.asyncio
+async def test_subreddits_are_fetched_concurrently_and_deduplicated():
+    http = _FakeHTTP({
+        "Gold":           [_post("a", "Gold", 10), _post("shared", "Gold", 50)],
+        "PreciousMetals": [_post("shared", "Gold", 55), _post("b", "PreciousMetals", 30)],
+        "Silverbugs":     [_post("c", "Silverbugs", 5)],
+    })
+    client = RedditClient(http=http, max_concurrency=4, min_interval=0.0)
+
+    started = time.monotonic()
+    posts = await client.search("gold isa", subreddits=["Gold", "PreciousMetals", "Silverbugs"])
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.25          # ≈ one call, not three
+    assert [p["id"] for p in posts] == ["shared", "b", "a", "c"]
+    assert posts[0]["score"] == 55
+
+
+@pytest.mark.asyncio
+async def test_politeness_limit_and_failed_subreddit():
+    http = _FakeHTTP({"Gold": [_post("a", "Gold", 1)]}, delay=0.05)
+    client = RedditClient(http=http, max_concurrency=2, min_interval=0.0)
+
+    posts = await client.search(
+        "silver", subreddits=["Gold", "PreciousMetals", "Silverbugs", "UKInvesting"],
+    )
+
+    assert http.max_in_flight == 2
+    assert [p["id"] for p in posts] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_top_posts_are_expanded_with_comments():
+    http = _FakeHTTP(
+        {"Gold": [_post("hi", "Gold", 90), _post("mid", "Gold", 40), _post("lo", "Gold", 1)]},
+        comments={
+            "hi":  [{"id": "c1", "body": "ok", "score": 2}, {"id": "c2", "body": "great", "score": 9},
+                    {"id": "c3", "body": "[deleted]", "score": 50}],
+            "mid": [{"id": "c4", "body": "meh", "score": 1}],
+        },
+    )
+    client = RedditClient(http=http, min_interval=0.0)
+
+    posts = await client.search("gold", subreddits=["Gold"], expand_comments=2, comments_per_post=1)
+
+    assert [c["id"] for c in posts[0]["top_comments"]] == ["c2"]
+    assert [c["id"] for c in posts[1]["top_comments"]] == ["c4"]
+    assert "top_comments" not in posts[2]
+    assert sum("/comments/" in u for u in http.urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_subreddit_is_rejected_before_any_request():
+    http = _FakeHTTP({})
+    client = RedditClient(http=http)
+    with pytest.raises(ValueError):
+        await client.search("gold", subreddits=["Gold", "wallstreetbets"])
+    assert http.urls == []
@@ -0,0 +1,68 @@
+"""Tests for SchemaCapabilities — one-shot schema introspection."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agents.infrastructure.database.schema_capabilities import SchemaCapabilities
+
+COLUMNS = [
+    ("topics", "id"), ("topics", "content_type"),
+    ("affiliates", "id"), ("affiliates", "wp_dealer_id"),
+    ("llm_call_logs", "attempt_number"),
+    ("alembic_version", "version_num"),
+]
+
+
+def _postgres(columns=COLUMNS, revision="012"):
+    pg = MagicMock()
+    pg.fetch = AsyncMock(return_value=[{"table_name": t, "column_name": c} for t, c in columns])
+    pg.fetchval = AsyncMock(return_value=revision)
+    return pg
+
+
+@pytest.mark.asyncio
+async def test_flags_answer_from_one_introspection():
+    pg = _postgres()
+    schema = SchemaCapabilities(pg)
+    await schema.load()
+
+    assert schema.topics_content_type and schema.affiliates_wp_sync
+    assert schema.llm_attempt_column == "attempt_number"
+    assert schema.has_table("topics") and not schema.has_table("missing")
+    assert schema.revision == "012"
+    assert pg.fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_pre_migration_schema_and_unloaded_defaults():
+    schema = SchemaCapabilities(_postgres(columns=[("affiliates", "id"), ("llm_call_logs", "attempt")]))
+    assert not schema.affiliates_wp_sync          # nothing loaded yet
+
+    await schema.load()
+    assert not schema.affiliates_wp_sync
+    assert schema.llm_attempt_column == "attempt"
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_after_revision_changes():
+    pg = _postgres()
+    schema = SchemaCapabilities(pg)
+    await schema.load()
+
+    assert await schema.refresh_if_migrated() is False
+    pg.fetchval.return_value = "013"
+    assert await schema.refresh_if_migrated() is True
+    assert schema.revision == "013"
+    assert pg.fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_failure_is_swallowed():
+    pg = _postgres()
+    pg.fetch.side_effect = RuntimeError("db down")
+    schema = SchemaCapabilities(pg)
+
+    await schema.load()
+
+    assert not schema.loaded
+    assert not schema.has_column("topics", "id")
@@ -0,0 +1,71 @@
+"""Tests for SerpClient snapshots — one SerpAPI request per query."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from agents.infrastructure.external.serp_client import SerpClient, SerpSnapshot
+
+
+RAW_SERP = {
+    "organic_results": [
+        {"position": 1, "title": "Best Gold ISAs", "link": "https://a.example/isa", "snippet": "..."},
+        {"position": 2, "title": "Gold ISA guide", "link": "https://b.example/guide", "snippet": "..."},
+    ],
+    "related_questions": [{"question": "Is a gold ISA worth it?"}],
+    "related_searches": [{"query": "gold isa rates"}, {"query": ""}],
+}
+
+
+@pytest.fixture
+def client():
+    response = MagicMock()
+    response.json = MagicMock(return_value=RAW_SERP)
+    http = AsyncMock()
+    http.get = AsyncMock(return_value=response)
+    return SerpClient(http=http, api_key="test-key")
+
+
+@pytest.mark.asyncio
+async def test_section_helpers_share_one_request(client):
+    """organic/PAA/related for the same query should hit SerpAPI once."""
+    organic = await client.organic_results("best gold isa uk", gl="uk")
+    paa = await client.people_also_ask("best gold isa uk", gl="uk")
+    related = await client.related_searches("best gold isa uk", gl="uk")
+
+    assert client._http.get.await_count == 1
+    assert [r["position"] for r in organic] == [1, 2]
+    assert paa[0]["question"] == "Is a gold ISA worth it?"
+    assert related == ["gold isa rates"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_snapshots_are_coalesced(client):
+    """Concurrent callers for the same key await a single in-flight fetch."""
+    snaps = await asyncio.gather(*(client.snapshot("best gold isa uk") for _ in range(5)))
+
+    assert client._http.get.await_count == 1
+    assert all(s is snaps[0] for s in snaps)
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_is_refetched(client):
+    """Snapshots older than the TTL trigger a fresh request."""
+    client._snapshot_ttl = 0
+    await client.snapshot("best gold isa uk")
+    await client.snapshot("best gold isa uk")
+
+    assert client._http.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached(client):
+    """A failed request must not poison the snapshot cache."""
+    response = client._http.get.return_value
+    client._http.get = AsyncMock(side_effect=[ConnectionError("down"), response])
+
+    with pytest.raises(ConnectionError):
+        await client.snapshot("best gold isa uk")
+    snap = await client.snapshot("best gold isa uk")
+
+    assert isinstance(snap, SerpSnapshot)
+    assert client._http.get.await_count == 2
@@ -0,0 +1,101 @@
+"""Tests for SingleFlight — coalescing identical in-flight requests."""
+import asyncio
+
+import httpx
+import pytest
+
+from agents.infrastructure.http.http_client import HTTPClient
+from agents.infrastructure.http.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight("test")
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"price": 1850}
+
+    results = await asyncio.gather(*(flights.do("gold", fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert flights.stats() == {"calls": 1, "coalesced": 4, "failures": 0, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter_and_is_not_kept():
+    flights = SingleFlight("test")
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    results = await asyncio.gather(*(flights.do("k", boom) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+    async def ok():
+        return "fresh"
+
+    assert await flights.do("k", ok) == "fresh"
+    assert flights.failures == 1 and flights.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flights = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("k", slow))
+    second = asyncio.ensure_future(flights.do("k", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_http_client_coalesces_identical_gets_only():
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"ok": True})
+
+    client = HTTPClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await asyncio.gather(
+        client.get("https://example.com/s", params={"q": "gold"}),
+        client.get("https://example.com/s", params={"q": "gold"}),
+        client.get("https://example.com/s", params={"q": "silver"}),
+        client.get("https://example.com/s", params={"q": "gold"}, coalesce=False),
+    )
+
+    assert len(calls) == 3
+    assert client.stats()["coalesced"]["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_log_does_not_leak_the_key(caplog):
+    flights = SingleFlight("http")
+    key = ("https://serpapi.com/search?q=gold&api_key=SECRET", (), False, None)
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+
+    with caplog.at_level("DEBUG", logger="pmw.infra.single_flight"):
+        await asyncio.gather(flights.do(key, fetch), flights.do(key, fetch))
+
+    record = next(r for r in caplog.records if "coalesced" in r.getMessage())
+    assert "SECRET" not in str(record.__dict__)
+    assert len(record.key) == 12
@@ -0,0 +1,175 @@
+"""Tests for TelemetrySink — batched vault / stage / Redis writes."""
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agents.infrastructure.telemetry.telemetry_sink import (
+    GENESIS_HASH,
+    TERMINAL_STATUSES,
+    TelemetrySink,
+)
+
+
+def _postgres(heads=None):
+    conn = MagicMock()
+    conn.copy_records_to_table = AsyncMock()
+    pg = MagicMock()
+    pg.fetch = AsyncMock(return_value=[
+        {"run_id": run_id, "payload_hash": h} for run_id, h in (heads or {}).items()
+    ])
+    pg.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def connection():
+        yield conn
+
+    pg.connection = connection
+    pg.conn = conn
+    return pg
+
+
+def _copied(pg):
+    return [r for call in pg.conn.copy_records_to_table.await_args_list
+            for r in call.kwargs["records"]]
+
+
+@pytest.mark.asyncio
+async def test_vault_chain_seeded_once_then_kept_in_memory():
+    pg = _postgres(heads={7: "a" * 64})
+    sink = TelemetrySink(postgres=pg, redis=AsyncMock())
+
+    sink.vault_event(7, "stage2", "stage.started", {"n": 1})
+    sink.vault_event(8, "stage2", "stage.started", {"n": 2})
+    await sink.flush()
+    sink.vault_event(7, "stage2", "stage.complete", {"n": 3})
+    await sink.flush()
+
+    rows = _copied(pg)
+    assert pg.fetch.await_count == 1
+    assert rows[0][5] == "a" * 64            # seeded from Postgres
+    assert rows[1][5] == GENESIS_HASH        # run 8 has no stored events
+    assert rows[2][5] == rows[0][4]          # chained to run 7's previous row
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_copy_does_not_advance_chain():
+    pg = _postgres()
+    pg.conn.copy_records_to_table.side_effect = [RuntimeError("db down"), None]
+    sink = TelemetrySink(postgres=pg, redis=AsyncMock())
+
+    sink.vault_event(1, "s", "e", {"n": 1})
+    await sink.flush()
+    sink.vault_event(1, "s", "e", {"n": 2})
+    await sink.flush()
+
+    assert sink.failed == 1
+    assert _copied(pg)[-1][5] == GENESIS_HASH
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_stage_records_coalesce_into_one_upsert():
+    pg = _postgres()
+    sink = TelemetrySink(postgres=pg, redis=AsyncMock())
+
+    base = dict(run_id=1, stage_name="stage2", attempt_number=1, score=None,
+                passed_threshold=None, output_json=None, judge_feedback=None,
+                prompt_hash="p1", input_tokens=0, output_tokens=0, cost_usd=0.0, error=None)
+    sink.stage_record(**base, status="running", model_used="haiku")
+    sink.stage_record(**{**base, "prompt_hash": "p2"}, status="complete", model_used="sonnet")
+    sink.stage_record(**{**base, "stage_name": "stage3"}, status="running", model_used="haiku")
+    await sink.flush()
+
+    assert pg.execute.await_count == 1
+    args = pg.execute.await_args.args[1:]
+    assert args[1] == ["stage2", "stage3"]
+    assert args[2] == ["complete", "running"]
+    assert args[8] == ["p1", "p1"]           # insert-only column keeps the first value
+    assert args[9] == ["haiku", "haiku"]
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_publishes_are_pipelined_and_drained_on_close():
+    redis = AsyncMock()
+    sink = TelemetrySink(postgres=_postgres(), redis=redis, flush_interval=60)
+
+    for i in range(3):
+        sink.publish("pmw:events", f"m{i}")
+    await sink.close()
+
+    redis.publish_many.assert_awaited_once_with(
+        [("pmw:events", "m0"), ("pmw:events", "m1"), ("pmw:events", "m2")]
+    )
+    assert sink.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest():
+    redis = AsyncMock()
+    sink = TelemetrySink(postgres=_postgres(), redis=redis, max_queue=2, flush_interval=60)
+
+    for i in range(3):
+        sink.publish("c", f"m{i}")
+    await sink.close()
+
+    assert sink.dropped == 1
+    redis.publish_many.assert_awaited_once_with([("c", "m1"), ("c", "m2")])
+
+
+@pytest.mark.asyncio
+async def test_appended_rows_are_copied_per_table():
+    pg = _postgres()
+    sink = TelemetrySink(postgres=pg, redis=AsyncMock())
+
+    cols = ("run_id", "model", "cost_usd")
+    sink.insert("llm_call_logs", cols, (1, "gpt-4o", 0.01))
+    sink.insert("llm_call_logs", cols, (1, "gpt-4o", 0.02))
+    await sink.flush()
+
+    call = pg.conn.copy_records_to_table.await_args
+    assert call.args == ("llm_call_logs",)
+    assert call.kwargs["columns"] == list(cols)
+    assert len(call.kwargs["records"]) == 2
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_close_during_a_slow_flush_loses_nothing():
+    started = asyncio.Event()
+
+    async def slow_publish(batch):
+        started.set()
+        await asyncio.sleep(0.1)
+
+    redis = AsyncMock()
+    redis.publish_many.side_effect = slow_publish
+    pg = _postgres()
+    sink = TelemetrySink(postgres=pg, redis=redis, batch_size=2, flush_interval=60)
+
+    sink.publish("c", "m0")
+    sink.publish("c", "m1")           # fills a batch → wakes the flush loop
+    await started.wait()
+    sink.insert("llm_call_logs", ("run_id",), (1,))
+    await sink.close()
+
+    assert sink.stats()["written"] == 3
+    assert sink.stats()["queued"] == 0
+    assert sink.failed == 0
+    assert len(_copied(pg)) == 1
+
+
+@pytest.mark.asyncio
+async def test_terminal_statuses_are_a_bound_parameter():
+    pg = _postgres()
+    sink = TelemetrySink(postgres=pg, redis=AsyncMock())
+    sink.stage_record(run_id=1, stage_name="s", attempt_number=1, status="complete")
+    await sink.flush()
+
+    sql, *args = pg.execute.await_args.args
+    assert "ANY($15::text[])" in sql
+    assert args[-1] == list(TERMINAL_STATUSES)
+    await sink.close()
@@ -0,0 +1,67 @@
+"""Tests for WordpressClient cursor pagination."""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agents.infrastructure.owned.wordpress.wp_db_client import WordpressClient
+
+
+def _page(ids, cursor=None):
+    return {"dealers": {
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+        "nodes": [{"databaseId": i, "title": f"Dealer {i}",
+                   "pmwAffiliateActive": i % 2 == 0} for i in ids],
+    }}
+
+
+@pytest.mark.asyncio
+async def test_follows_cursors_until_last_page():
+    client = WordpressClient("https://wp.test", "u", "p", page_size=2)
+    client.execute = AsyncMock(side_effect=[_page([1, 2], "c1"), _page([3, 4], "c2"), _page([5])])
+
+    pages = [page async for page in client.iter_dealers(active_only=False)]
+
+    assert [[d["wp_dealer_id"] for d in p] for p in pages] == [[1, 2], [3, 4], [5]]
+    afters = [c.kwargs["variables"]["after"] for c in client.execute.await_args_list]
+    assert afters == [None, "c1", "c2"]
+    assert all(c.kwargs["variables"]["first"] == 2 for c in client.execute.await_args_list)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_query_dealers_collects_every_page():
+    client = WordpressClient("https://wp.test", "u", "p", page_size=2)
+    client.execute = AsyncMock(side_effect=[_page([1, 2], "c1"), _page([3, 4], "c2"), _page([5])])
+
+    dealers = await client.query_dealers(active_only=True)
+
+    assert [d["wp_dealer_id"] for d in dealers] == [2, 4]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched_and_cancelled_on_early_exit():
+    client = WordpressClient("https://wp.test", "u", "p")
+    second_page = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def execute(query, variables=None):
+        if variables["after"] is None:
+            return _page([1], "c1")
+        second_page.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client.execute = execute
+    pages = client.iter_dealers(active_only=False)
+    first = await pages.__anext__()
+    await asyncio.wait_for(second_page.wait(), 1)   # requested before we asked for it
+    await pages.aclose()
+
+    assert cancelled.is_set()                       # prefetch cancelled and awaited, not left pending
+    assert first[0]["wp_dealer_id"] == 1
+    await client.close()
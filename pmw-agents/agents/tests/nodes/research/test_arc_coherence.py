@@ -69,4 +69,9 @@ async def test_arc_coherence_fail_triggers_hitl(sample_research_state):
         result = await agent.run(sample_research_state)
 
     assert result.get("hitl_required") is True
-    assert result["arc_validation"]["passed"] is False
\ No newline at end of file
+    assert result["arc_validation"]["passed"] is False
+
+def test_arc_coherence_never_serves_a_cached_verdict():
+    from agents.nodes.research.stage8.arc_coherence import ArcCoherence
+
+    assert ArcCoherence.CACHE_RESPONSES is False
@@ -0,0 +1,164 @@
+"""Tests for Stage 1c BriefBuilder — batched affiliate coherence."""
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from agents.nodes.base import LLMResult
+
+TOPIC = {"id": 42, "title": "Best gold ISAs", "target_keyword": "gold isa",
+         "asset_class": "gold", "geography": "uk"}
+
+AFFILIATES = [
+    {"id": 1, "name": "BullionVault", "value_prop": "Buy gold bullion", "asset_classes": "gold"},
+    {"id": 2, "name": "RoyalMint", "value_prop": "Gold coins", "asset_classes": "gold"},
+    {"id": 3, "name": "SilverCo", "value_prop": "Silver bars", "asset_classes": "silver"},
+]
+
+
+def _llm(payload):
+    return LLMResult(text=json.dumps(payload), input_tokens=300, output_tokens=120,
+                     cost_usd=0.002, model="claude-sonnet-4-6", attempts=1)
+
+
+@pytest.mark.asyncio
+async def test_batch_scores_all_candidates_in_one_call():
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    batch = _llm({"scores": [
+        {"id": 1, "score": 0.9, "rationale": "Direct fit"},
+        {"id": 2, "score": 0.7, "rationale": "Good fit"},
+        {"id": 3, "score": 0.2, "rationale": "Wrong metal"},
+    ]})
+
+    with patch.object(builder, "call_llm", new_callable=AsyncMock, return_value=batch) as call:
+        results, usage = await builder._score_candidates(TOPIC, AFFILIATES, run_id=1)
+
+    assert call.await_count == 1
+    assert [r["coherence_score"] for r in results] == [0.9, 0.7, 0.2]
+    assert [r["passed"] for r in results] == [True, True, False]
+    assert len(usage) == 1 and usage[0]["stage"].endswith(".42.batch")
+
+
+@pytest.mark.asyncio
+async def test_malformed_batch_falls_back_to_per_affiliate_calls():
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    responses = [
+        _llm({"scores": [{"id": 1, "score": 0.9, "rationale": "only one"}]}),  # incomplete
+        _llm({"score": 0.8, "rationale": "a"}),
+        _llm({"score": 0.5, "rationale": "b"}),
+        _llm({"score": 0.1, "rationale": "c"}),
+    ]
+
+    with patch.object(builder, "call_llm", new_callable=AsyncMock, side_effect=responses) as call:
+        results, usage = await builder._score_candidates(TOPIC, AFFILIATES, run_id=1)
+
+    assert call.await_count == 4
+    assert [r["coherence_score"] for r in results] == [0.8, 0.5, 0.1]
+    assert len(usage) == 3
+
+
+@pytest.mark.asyncio
+async def test_single_candidate_skips_batch_prompt():
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    with patch.object(builder, "call_llm", new_callable=AsyncMock,
+                      return_value=_llm({"score": 0.75, "rationale": "ok"})) as call:
+        results, _ = await builder._score_candidates(TOPIC, AFFILIATES[:1], run_id=1)
+
+    assert call.await_count == 1
+    assert "EACH affiliate" not in call.await_args.args[0]
+    assert results[0]["coherence_score"] == 0.75
+
+
+def test_validate_output_accepts_batch_shape():
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    assert builder.validate_output('{"scores": []}') == {"scores": []}
+    with pytest.raises(ValueError):
+        builder.validate_output('{"rationale": "no score"}')
+
+
+@pytest.mark.asyncio
+async def test_run_builds_topics_concurrently_and_dedupes():
+    import asyncio
+    from types import SimpleNamespace
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    in_flight, peak = 0, 0
+
+    async def fake_build(topic, all_affiliates, run_id, services):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"status": "passed", "brief": {"topic": topic}, "usage_list": []}
+
+    topics = [{"id": i, "title": f"T{i}"} for i in range(6)] + [{"id": 0, "title": "T0 dup"}]
+    state = {"run_id": 1, "all_topics": topics, "all_affiliates": []}
+
+    with patch.object(builder, "_build_topic", side_effect=fake_build) as build, \
+         patch.object(builder, "_emit_event", new_callable=AsyncMock), \
+         patch.object(builder, "_write_stage", new_callable=AsyncMock), \
+         patch("agents.nodes.research.stage1.brief_builder.settings",
+               SimpleNamespace(BRIEF_BUILDER_CONCURRENCY=3)):
+        result = await builder.run(state)
+
+    assert build.call_count == 6
+    assert 1 < peak <= 3
+    assert [b["topic"]["id"] for b in result["locked_briefs"]] == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_lock_claims_are_serialised_within_a_run():
+    import asyncio
+    from types import SimpleNamespace
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    active: dict[int, int] = {1: 0, 2: 0}
+    overlap = False
+    concurrent_runs = False
+
+    async def acquire(topic_wp_id, run_id):
+        nonlocal overlap, concurrent_runs
+        active[run_id] += 1
+        overlap = overlap or active[run_id] > 1
+        concurrent_runs = concurrent_runs or all(active.values())
+        await asyncio.sleep(0.01)
+        active[run_id] -= 1
+        return True
+
+    services = SimpleNamespace(workflows=SimpleNamespace(acquire_topic_lock=acquire))
+    results = await asyncio.gather(*(
+        builder._acquire_lock(services, i, run_id) for i in range(4) for run_id in (1, 2)
+    ))
+
+    assert all(results)
+    assert not overlap                 # serialised within a run …
+    assert concurrent_runs             # … but runs don't wait for each other
+
+
+@pytest.mark.asyncio
+async def test_incomplete_batch_is_rejected_before_it_can_be_cached():
+    from agents.nodes.research.stage1.brief_builder import BriefBuilder
+
+    builder = BriefBuilder()
+    with patch.object(builder, "call_llm", new_callable=AsyncMock,
+                      side_effect=ValueError("stop")) as call:
+        with pytest.raises(ValueError):
+            await builder._batch_coherence_check(TOPIC, AFFILIATES, run_id=1)
+
+    complete = call.await_args.kwargs["validate"]
+    incomplete = json.dumps({"scores": [{"id": 1, "score": 0.9, "rationale": "only one"}]})
+    with pytest.raises(ValueError, match="missing affiliates"):
+        complete(incomplete)
+    assert complete(json.dumps({"scores": [
+        {"id": i, "score": 0.5, "rationale": ""} for i in (1, 2, 3)
+    ]}))["scores"]
@@ -0,0 +1,96 @@
+"""Tests for the research stage DAG scheduler."""
+import asyncio
+import pytest
+
+from agents.nodes.research.stage_dag import build_dependencies, run_stage_dag
+
+
+class _Stage:
+    def __init__(self, inputs=(), outputs=(), delay=0.0, fail=False, log=None, name=""):
+        self.INPUT_KEYS, self.OUTPUT_KEYS = tuple(inputs), tuple(outputs)
+        self.delay, self.fail, self.log, self.name = delay, fail, log, name
+
+    async def run(self, state):
+        self.log.append(("start", self.name))
+        for key in self.INPUT_KEYS:
+            assert state.get(key) is not None, f"{self.name} started before {key}"
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.name))
+        if self.fail:
+            return {"status": "failed", "errors": [{"stage": self.name, "error": "boom"}]}
+        return {**{k: self.name for k in self.OUTPUT_KEYS},
+                "model_usage": [{"stage": self.name, "cost_usd": 0.01}]}
+
+
+def _stages(log, **overrides):
+    spec = {
+        "keyword":    dict(outputs=["keyword_research"], delay=0.01),
+        "market":     dict(outputs=["market_context"], delay=0.05),
+        "data_fetch": dict(inputs=["keyword_research"], outputs=["raw_sources_cache_key"], delay=0.01),
+        "factors":    dict(inputs=["keyword_research", "market_context"], outputs=["top_factors"]),
+        "tool_load":  dict(outputs=["available_tools"]),
+    }
+    for name, extra in overrides.items():
+        spec[name] = {**spec[name], **extra}
+    return {name: _Stage(name=name, log=log, **kw) for name, kw in spec.items()}
+
+
+def test_dependencies_follow_declared_keys():
+    deps = build_dependencies(_stages([]))
+    assert deps["factors"] == {"keyword", "market"}
+    assert deps["data_fetch"] == {"keyword"}
+    assert deps["tool_load"] == set()
+
+
+def test_cycle_is_rejected():
+    log = []
+    stages = {"a": _Stage(inputs=["y"], outputs=["x"], log=log),
+              "b": _Stage(inputs=["x"], outputs=["y"], log=log)}
+    with pytest.raises(ValueError, match="cycle"):
+        build_dependencies(stages)
+
+
+@pytest.mark.asyncio
+async def test_stage_starts_as_soon_as_its_inputs_are_ready():
+    log = []
+    state = {"run_id": 1, "errors": [], "model_usage": []}
+
+    report = await run_stage_dag(state, _stages(log))
+
+    # data_fetch only needs keyword — it must not wait for the slow market stage
+    assert log.index(("start", "data_fetch")) < log.index(("end", "market"))
+    assert report.succeeded
+    assert report.critical_path == ["market", "factors"]
+    assert len(state["model_usage"]) == 5          # one per stage, no duplication
+    assert state["stage_timing"]["critical_path"] == ["market", "factors"]
+
+
+@pytest.mark.asyncio
+async def test_failure_skips_dependents_and_lets_running_stages_finish():
+    log = []
+    state = {"run_id": 1, "errors": [], "model_usage": []}
+
+    report = await run_stage_dag(state, _stages(log, keyword={"fail": True}))
+
+    assert report.failed == ["keyword"]
+    assert report.skipped == ["data_fetch", "factors"]
+    assert ("start", "factors") not in log
+    assert ("end", "tool_load") in log
+    assert state["status"] == "failed"
+    assert state["errors"][0]["stage"] == "keyword"
+
+
+@pytest.mark.asyncio
+async def test_no_stage_starts_after_a_failure():
+    log = []
+    state = {"run_id": 1, "errors": [], "model_usage": []}
+    # tool_load is independent of keyword but only becomes ready after it fails
+    stages = _stages(log, keyword={"fail": True},
+                     tool_load={"inputs": ["market_context"], "delay": 0.0})
+
+    report = await run_stage_dag(state, stages)
+
+    assert report.failed == ["keyword"]
+    assert ("end", "market") in log                 # already running — allowed to finish
+    assert ("start", "tool_load") not in log
+    assert report.skipped == ["data_fetch", "factors", "tool_load"]
@@ -31,4 +31,56 @@ async def test_topic_loader_sets_status_failed_when_no_topics(sample_research_st
         result = await loader.run(sample_research_state)
 
     assert result["status"] == "failed"
-    assert len(result["errors"]) > 0
\ No newline at end of file
+    assert len(result["errors"]) > 0
+
+@pytest.mark.asyncio
+async def test_sync_mark_does_not_pass_a_failed_topic():
+    """A topic whose upsert failed must be fetched again on the next sync."""
+    import sys
+    from datetime import datetime, timezone
+    from agents.nodes.research.stage1 import topic_loader as module
+    from agents.services.topic_service import TopicService
+
+    def t(wp_id, hour):
+        return {"id": wp_id, "modified_gmt": datetime(2026, 3, 10, hour, tzinfo=timezone.utc)}
+
+    async def changed(mark):
+        yield [t(1, 9), t(2, 10)]
+        yield [t(3, 11), t(4, 12)]
+
+    topics = MagicMock()
+    topics.get_sync_state = AsyncMock(return_value={
+        "mark": (datetime(2026, 3, 10, 8, tzinfo=timezone.utc), 9),
+        "reconciled_at": datetime.now(timezone.utc),
+    })
+    topics.iter_changed_topics = changed
+    topics.high_water = TopicService.high_water
+    topics.earliest = TopicService.earliest
+    topics.save_sync_state = AsyncMock()
+    infra = MagicMock()
+    infra.schema.wp_sync_state = True
+
+    loader = module.TopicLoader()
+    loader._batch_sync = AsyncMock(side_effect=[[], [3]])
+    with patch.object(module, "get_infrastructure", return_value=infra), \
+         patch.dict(sys.modules, {"services": MagicMock(services=MagicMock(topics=topics))}):
+        synced = await loader._sync_from_wordpress(known_ids=[1, 2])
+
+    assert synced == 3
+    mark = topics.save_sync_state.await_args.args[0]
+    assert mark == (datetime(2026, 3, 10, 10, tzinfo=timezone.utc), 2)
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_keeps_priority_zero():
+    from agents.nodes.research.stage1 import topic_loader as module
+
+    infra = MagicMock()
+    infra.schema.topics_content_type = True
+    infra.postgres.bulk_upsert = AsyncMock(return_value=["inserted", "inserted"])
+
+    with patch.object(module, "get_infrastructure", return_value=infra):
+        await module.TopicLoader()._batch_sync([{"id": 1, "priority": 0}, {"id": 2}])
+
+    rows = infra.postgres.bulk_upsert.await_args.args[1]
+    assert [r["priority"] for r in rows] == [0, 5]
@@ -0,0 +1,25 @@
+"""Tests for PromptRegistry.render_parts — separate system/user parts."""
+from agents.prompts.registry import PromptRegistry, RenderedPrompt
+
+
+def test_render_parts_keeps_the_static_system_prefix():
+    template = PromptRegistry.get("stage2_keyword_serp")
+    variables = {"target_keyword": "gold isa", "intent_stage": "awareness",
+                 "asset_class": "gold", "geography": "uk", "serp_json": "[]"}
+
+    a = PromptRegistry.render_parts("stage2_keyword_serp", variables)
+    b = PromptRegistry.render_parts("stage2_keyword_serp", {**variables, "target_keyword": "silver"})
+
+    assert a.system == b.system == template["system"]
+    assert "Target keyword: gold isa" in a.user
+    assert "Target keyword: silver" in b.user
+    assert "{{" not in a.user
+
+
+def test_render_is_the_joined_parts(monkeypatch):
+    monkeypatch.setitem(PromptRegistry._cache, "t", {"system": "S {{X}}", "user": "U {{X}}"})
+
+    parts = PromptRegistry.render_parts("t", {"x": 1})
+
+    assert parts == RenderedPrompt(system="S 1", user="U 1")
+    assert PromptRegistry.render("t", {"x": 1}) == "S 1\n\nU 1"
@@ -0,0 +1,112 @@
+"""Tests for AffiliateService incremental intelligence aggregation."""
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agents.services.affiliate_service import AffiliateService, _count_items
+
+RAN_AT = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _run_row(**overrides):
+    return {"ran_at": RAN_AT, "spot_price_gbp": 1850, "price_trend_pct_30d": 2.5,
+            "market_stance": "bullish", "top_factors_json": "[]", **overrides}
+
+
+def _infra(current=None, inserted=True, ledger=()):
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.fetchval = AsyncMock(return_value=False)
+    conn.fetchrow = AsyncMock(side_effect=[
+        _run_row() if inserted else None,          # ledger insert RETURNING
+        current,                                   # summary row
+        {"name": "Gold Co", "partner_key": "gold-co"},
+    ])
+    conn.fetch = AsyncMock(side_effect=[list(ledger), []])
+
+    @asynccontextmanager
+    async def transaction():
+        yield conn
+
+    infra = MagicMock()
+    infra.schema.affiliate_intel_counters = True
+    infra.postgres.transaction = transaction
+    return infra, conn
+
+
+def _executed(conn, fragment):
+    return [c.args for c in conn.execute.await_args_list if fragment in c.args[0]]
+
+
+DATA = {"psychology": {
+    "objections": [{"objection": "Too expensive ", "source": "reddit"}],
+    "verbatim_phrases": ["Is  it SAFE"],
+}}
+
+
+@pytest.mark.asyncio
+async def test_new_run_applies_only_its_delta():
+    infra, conn = _infra(current={"total_runs": 41, "first_run_at": RAN_AT, "incremental": True})
+
+    with patch("agents.services.affiliate_service.get_infrastructure", return_value=infra):
+        summary = await AffiliateService().append_intelligence_run(3, 99, DATA)
+
+    (_, _, payload), = _executed(conn, "affiliate_intelligence_counters AS c")
+    items = {(i["kind"], i["item_key"]): i for i in json.loads(payload)}
+    assert set(items) == {("objection", "too expensive"), ("phrase", "is it safe")}
+    assert items[("objection", "too expensive")]["sources"] == ["reddit"]
+    assert not _executed(conn, "DELETE FROM affiliate_intelligence_counters")
+    assert conn.fetch.await_count == 1                   # top-N only, no ledger scan
+    assert summary["total_runs"] == 42
+    assert summary["latest_spot_price_gbp"] == 1850.0
+
+
+@pytest.mark.asyncio
+async def test_first_incremental_run_seeds_counters_from_ledger():
+    ledger = [
+        _run_row(objections_json='[{"objection": "Fees", "source": "a"}]', motivations_json="[]",
+                 verbatim_phrases="[]", paa_questions="[]"),
+        _run_row(objections_json='[{"objection": "fees", "source": "b"}]', motivations_json="[]",
+                 verbatim_phrases="[]", paa_questions="[]"),
+    ]
+    infra, conn = _infra(current=None, ledger=ledger)
+
+    with patch("agents.services.affiliate_service.get_infrastructure", return_value=infra):
+        summary = await AffiliateService().append_intelligence_run(3, 99, DATA)
+
+    assert _executed(conn, "DELETE FROM affiliate_intelligence_counters")
+    (_, _, payload), = _executed(conn, "affiliate_intelligence_counters AS c")
+    (item,) = json.loads(payload)
+    assert item["label"] == "Fees" and item["n"] == 2 and item["sources"] == ["a", "b"]
+    assert summary["total_runs"] == 2
+    upsert, = _executed(conn, "INSERT INTO affiliate_intelligence_summary")
+    assert "incremental            = TRUE" in upsert[0]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_run_is_not_counted_twice():
+    infra, conn = _infra(current={"total_runs": 5, "first_run_at": RAN_AT, "incremental": True},
+                         inserted=False)
+    conn.fetchrow.side_effect = [None, {"total_runs": 5, "first_run_at": RAN_AT, "incremental": True},
+                                 _run_row(), {"name": "Gold Co", "partner_key": None}]
+
+    with patch("agents.services.affiliate_service.get_infrastructure", return_value=infra):
+        summary = await AffiliateService().append_intelligence_run(3, 99, DATA)
+
+    assert not _executed(conn, "affiliate_intelligence_counters AS c")
+    assert summary["total_runs"] == 5
+
+
+def test_count_items_keeps_oldest_label_and_counts_each_occurrence():
+    old, new = datetime(2026, 1, 1), datetime(2026, 2, 1)
+    items = _count_items([
+        (old, [], [{"motivation": "Inflation hedge"}], ["Gold is safe"], []),
+        (new, [], [{"motivation": " inflation HEDGE"}], ["gold  is SAFE"], ["Is gold safe?"]),
+    ])
+    by_kind = {i["kind"]: i for i in items}
+    assert by_kind["motivation"]["label"] == "Inflation hedge" and by_kind["motivation"]["n"] == 2
+    assert by_kind["phrase"]["first_seen"] == old.isoformat()
+    assert by_kind["paa"]["n"] == 1
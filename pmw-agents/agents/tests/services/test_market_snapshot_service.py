@@ -0,0 +1,77 @@
+"""Tests for MarketSnapshotService — shared per-cycle market data."""
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agents.services.market_snapshot_service import MarketSnapshotService
+
+
+def _market(delay=0.01):
+    async def spot(asset, geo):
+        await asyncio.sleep(delay)
+        return {"price_gbp": 2000.0, "asset": asset}
+
+    market = MagicMock()
+    market.get_spot_price = AsyncMock(side_effect=spot)
+    market.get_price_trend = AsyncMock(return_value={"trend_pct": 3.0})
+    market.get_recent_news = AsyncMock(return_value=[{"title": "Gold rally"}])
+    market.derive_market_stance = MagicMock(return_value={"market_stance": "steady_hold"})
+    return market
+
+
+@pytest.fixture
+def market():
+    m = _market()
+    with patch("services.services", SimpleNamespace(market=m)):
+        yield m
+
+
+@pytest.mark.asyncio
+async def test_concurrent_briefs_share_one_fetch(market):
+    svc = MarketSnapshotService()
+
+    snaps = await asyncio.gather(*(svc.get(1, "gold", "uk") for _ in range(10)))
+
+    assert all(s is snaps[0] for s in snaps)
+    assert market.get_spot_price.await_count == 1
+    assert market.get_price_trend.await_count == 2
+    assert market.get_recent_news.await_count == 1
+    assert market.derive_market_stance.call_count == 1
+    assert svc.stats()["fetches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_are_per_asset_geography_and_run(market):
+    svc = MarketSnapshotService()
+
+    await svc.get(1, "gold", "uk")
+    await svc.get(1, "Gold", "UK ")
+    await svc.get(1, "silver", "uk")
+    await svc.get(2, "gold", "uk")
+
+    assert market.get_spot_price.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_then_clear_run(market):
+    svc = MarketSnapshotService()
+
+    svc.prefetch(1, [("gold", "uk"), ("silver", "us")])
+    await svc.get(1, "gold", "uk")
+    assert market.get_spot_price.await_count == 2
+
+    svc.clear_run(1)
+    assert svc.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_is_not_cached(market):
+    svc = MarketSnapshotService()
+    market.get_recent_news.side_effect = [RuntimeError("down"), []]
+
+    with pytest.raises(RuntimeError):
+        await svc.get(1, "gold", "uk")
+    snap = await svc.get(1, "gold", "uk")
+
+    assert snap.news == []
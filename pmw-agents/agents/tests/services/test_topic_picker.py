@@ -0,0 +1,59 @@
+"""Tests for TopicService.pick_batch — SQL-side topic selection."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agents.services.topic_service import TopicService
+
+
+def _row(topic_id, priority, run_count=0):
+    return {"id": topic_id, "title": f"T{topic_id}", "priority": priority,
+            "run_count": run_count, "last_run_at": None, "content_type": "affiliate"}
+
+
+def _infra(*results):
+    infra = MagicMock()
+    infra.schema.topics_content_type = True
+    infra.postgres.fetch = AsyncMock(side_effect=list(results))
+    return infra
+
+
+@pytest.mark.asyncio
+async def test_one_query_applies_every_filter():
+    infra = _infra([_row(1, 1), _row(2, 3)])
+
+    with patch("agents.services.topic_service.get_infrastructure", return_value=infra):
+        batch = await TopicService().pick_batch(limit=10, cooldown_hours=24)
+
+    assert [t["id"] for t in batch] == [1, 2]
+    assert infra.postgres.fetch.await_count == 1
+    sql, limit, cutoff = infra.postgres.fetch.await_args.args
+    assert limit == 10 and cutoff is not None
+    for clause in ("status = 'active'", "lock_expires_at > NOW()", "topic_briefs",
+                   "t.content_type = 'affiliate'", "ORDER BY t.priority, t.run_count, t.id"):
+        assert clause in sql
+    assert "SKIP LOCKED" not in sql
+
+
+@pytest.mark.asyncio
+async def test_cooldown_ignored_when_nothing_else_is_eligible():
+    infra = _infra([], [_row(3, 2)])
+
+    with patch("agents.services.topic_service.get_infrastructure", return_value=infra):
+        batch = await TopicService().pick_batch(limit=5)
+
+    assert [t["id"] for t in batch] == [3]
+    assert infra.postgres.fetch.await_args_list[1].args[2] is None
+
+
+@pytest.mark.asyncio
+async def test_claim_locks_and_stamps_in_one_statement():
+    infra = _infra([_row(8, 5), _row(7, 1), _row(9, 5, run_count=0), _row(4, None)])
+
+    with patch("agents.services.topic_service.get_infrastructure", return_value=infra):
+        batch = await TopicService().pick_batch(limit=4, claim_run_id=42)
+
+    sql, limit, cutoff, run_id = infra.postgres.fetch.await_args.args
+    assert sql.lstrip().startswith("UPDATE topics")
+    assert "FOR UPDATE OF t SKIP LOCKED" in sql and run_id == 42
+    assert [t["id"] for t in batch] == [7, 8, 9, 4]     # pick order restored
@@ -0,0 +1,84 @@
+"""Tests for TopicService incremental (modified-since) WordPress sync."""
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agents.services.topic_service import TopicService
+
+
+def _raw(wp_id, modified):
+    return {"id": wp_id, "modified_gmt": modified, "title": {"rendered": f"T{wp_id}"}, "meta": {}}
+
+
+def _infra(pages=None, id_pages=None):
+    async def iter_topics(**kwargs):
+        for page in pages or []:
+            yield page
+
+    async def iter_topic_ids(**kwargs):
+        for page in id_pages or []:
+            yield page
+
+    infra = MagicMock()
+    infra.wordpress.iter_topics = MagicMock(side_effect=iter_topics)
+    infra.wordpress.iter_topic_ids = MagicMock(side_effect=iter_topic_ids)
+    infra.postgres.fetch = AsyncMock(return_value=[])
+    return infra
+
+
+@pytest.mark.asyncio
+async def test_changed_topics_filtered_to_exact_high_water_mark():
+    mark = (datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc), 5)
+    infra = _infra(pages=[[
+        _raw(4, "2026-03-10T11:00:00"),     # before the mark — already synced
+        _raw(5, "2026-03-10T12:00:00"),     # the mark itself
+        _raw(6, "2026-03-10T12:00:00"),     # same instant, higher id
+        _raw(2, "2026-03-11T08:30:00"),     # edited later
+    ]])
+
+    with patch("agents.services.topic_service.get_infrastructure", return_value=infra):
+        pages = [p async for p in TopicService().iter_changed_topics(mark)]
+
+    changed = [t["id"] for p in pages for t in p]
+    assert changed == [6, 2]
+    assert infra.wordpress.iter_topics.call_args.kwargs["modified_since"] == date(2026, 3, 9)
+    assert TopicService.high_water(mark, pages[0]) == (
+        datetime(2026, 3, 11, 8, 30, tzinfo=timezone.utc), 2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconcile_archives_topics_missing_from_wordpress():
+    infra = _infra(id_pages=[[1, 2], [3]])
+    infra.postgres.fetch = AsyncMock(return_value=[{"id": 9}])
+
+    with patch("agents.services.topic_service.get_infrastructure", return_value=infra):
+        archived = await TopicService().reconcile_deleted()
+
+    assert archived == 1
+    sql, ids = infra.postgres.fetch.await_args.args
+    assert "archived" in sql and ids == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_never_archives_everything_on_empty_catalogue():
+    infra = _infra(id_pages=[])
+
+    with patch("agents.services.topic_service.get_infrastructure", return_value=infra):
+        archived = await TopicService().reconcile_deleted()
+
+    assert archived == 0
+    infra.postgres.fetch.assert_not_awaited()
+
+
+def test_high_water_stops_short_of_the_earliest_failure():
+    t = lambda wp_id, hour: {"id": wp_id, "modified_gmt": datetime(2026, 3, 10, hour, tzinfo=timezone.utc)}
+    failed = [t(7, 11), t(3, 14)]
+    before = TopicService.earliest(failed)
+
+    assert before == (datetime(2026, 3, 10, 11, tzinfo=timezone.utc), 7)
+    assert TopicService.high_water(None, [t(1, 9), t(2, 10), t(5, 12)], before=before) == (
+        datetime(2026, 3, 10, 10, tzinfo=timezone.utc), 2,
+    )
+    assert TopicService.earliest([{"id": 1, "modified_gmt": None}]) is None